@@ -71,6 +71,7 @@ bytes [#bytes]_                          binary         both
 """
 from __future__ import annotations
 
+import array
 import datetime
 import itertools
 import os
@@ -88,6 +89,7 @@ from typing import (
     BinaryIO,
     Callable,
     Generator,
+    Iterable,
     Iterator,
     Mapping,
     MutableMapping,
@@ -203,7 +205,10 @@ __all__ = [
     "gen_list_name",
     "encode",
     "decode",
+    "compile_encoder",
+    "CompiledEncoder",
     "decode_all",
+    "decode_columns",
     "decode_iter",
     "decode_file_iter",
     "is_valid",
@@ -1018,6 +1023,31 @@ if _USE_C:
     _dict_to_bson = _cbson._dict_to_bson
 
 
+def _dict_to_bson_compiled(
+    doc: Any, keys: Tuple[str, ...], names: Tuple[bytes, ...], opts: CodecOptions[Any]
+) -> bytes:
+    """Encode a top-level document using the element names of `keys`."""
+    if not isinstance(doc, dict) or len(doc) - ("_id" in doc) != len(keys):
+        return _dict_to_bson(doc, False, opts)
+    elements = []
+    if "_id" in doc:
+        elements.append(_name_value_to_bson(b"_id\x00", doc["_id"], False, opts))
+    i = 0
+    for key, value in doc.items():
+        if key == "_id":
+            continue
+        if key != keys[i]:
+            return _dict_to_bson(doc, False, opts)
+        elements.append(_name_value_to_bson(names[i], value, False, opts))
+        i += 1
+    encoded = b"".join(elements)
+    return _PACK_INT(len(encoded) + 5) + encoded + b"\x00"
+
+
+if _USE_C:
+    _dict_to_bson_compiled = _cbson._dict_to_bson_compiled
+
+
 _CODEC_OPTIONS_TYPE_ERROR = TypeError("codec_options must be an instance of CodecOptions")
 
 
@@ -1050,6 +1080,73 @@ def encode(
     return _dict_to_bson(document, check_keys, codec_options)
 
 
+class CompiledEncoder:
+    """Encodes documents that share the same keys, created by
+    :func:`compile_encoder`.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("__keys", "__names")
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.__keys = tuple(key for key in keys if key != "_id")
+        for key in self.__keys:
+            if not isinstance(key, str):
+                raise InvalidDocument(f"documents must have only string keys, key was {key!r}")
+        self.__names = tuple(_make_name(key) for key in self.__keys)
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """The keys, other than ``_id``, of the documents this encoder is
+        compiled for.
+        """
+        return self.__keys
+
+    def encode(
+        self, document: Mapping[str, Any], codec_options: CodecOptions[Any] = DEFAULT_CODEC_OPTIONS
+    ) -> bytes:
+        """Encode a document to BSON.
+
+        Equivalent to :func:`encode`, but the names of the compiled keys are
+        not re-encoded and their values are not checked for a custom BSON
+        type before their Python type. Documents with different keys are
+        encoded by :func:`encode`.
+
+        :param document: mapping type representing a document
+        :param codec_options: An instance of
+            :class:`~bson.codec_options.CodecOptions`.
+        """
+        if not isinstance(codec_options, CodecOptions):
+            raise _CODEC_OPTIONS_TYPE_ERROR
+        return _dict_to_bson_compiled(document, self.__keys, self.__names, codec_options)
+
+    def __repr__(self) -> str:
+        return f"CompiledEncoder({list(self.__keys)!r})"
+
+
+def compile_encoder(template: Union[Mapping[str, Any], Iterable[str]]) -> CompiledEncoder:
+    """Compile an encoder for documents with the same keys as `template`.
+
+    Documents are encoded faster when they are a :class:`dict` with exactly
+    the same keys as `template`, in the same order, other than ``_id`` which
+    is always encoded first. Other documents are encoded as by
+    :func:`encode`::
+
+      >>> encoder = bson.compile_encoder(["x", "y"])
+      >>> encoder.encode({"x": 1, "y": "a"}) == bson.encode({"x": 1, "y": "a"})
+      True
+
+    The encoder can be passed to
+    :meth:`~pymongo.collection.Collection.insert_many`.
+
+    :param template: A document, or the keys of the documents to encode.
+
+    .. versionadded:: 4.9
+    """
+    return CompiledEncoder(template)
+
+
 @overload
 def decode(data: _ReadableBuffer, codec_options: None = None) -> dict[str, Any]:
     ...
@@ -1173,6 +1270,257 @@ def decode_all(
     return _decode_all(data, codec_options)
 
 
+# Column kinds supported by decode_columns mapped to the typecode of the
+# array.array holding their values, or None for ObjectId columns which are
+# packed into a bytearray. The kind numbers match _cbsonmodule.c.
+_COLUMN_KINDS: dict[str, Tuple[int, Optional[str]]] = {
+    "int32": (0, "i"),
+    "int64": (1, "q"),
+    "double": (2, "d"),
+    "bool": (3, "B"),
+    "datetime": (4, "q"),
+    "objectid": (5, None),
+}
+_COLUMN_KIND_NAMES = list(_COLUMN_KINDS)
+_COLUMN_STRUCTS = [
+    struct.Struct("=i"),
+    struct.Struct("=q"),
+    struct.Struct("=d"),
+    struct.Struct("=B"),
+    struct.Struct("=q"),
+    struct.Struct("12s"),
+]
+_COLUMN_ACCEPTED_TYPES: list[dict[int, Callable[[Any, int], Any]]] = [
+    # int32
+    {16: lambda data, pos: _UNPACK_INT_FROM(data, pos)[0]},
+    # int64
+    {
+        16: lambda data, pos: _UNPACK_INT_FROM(data, pos)[0],
+        18: lambda data, pos: _UNPACK_LONG_FROM(data, pos)[0],
+    },
+    # double
+    {
+        1: lambda data, pos: _UNPACK_FLOAT_FROM(data, pos)[0],
+        16: lambda data, pos: float(_UNPACK_INT_FROM(data, pos)[0]),
+        18: lambda data, pos: float(_UNPACK_LONG_FROM(data, pos)[0]),
+    },
+    # bool
+    {8: lambda data, pos: _get_boolean(data, None, pos, None, None, None)[0]},
+    # datetime
+    {9: lambda data, pos: _UNPACK_LONG_FROM(data, pos)[0]},
+    # objectid
+    {7: lambda data, pos: bytes(data[pos : pos + 12])},
+]
+# Size of the fixed length BSON values, keyed by element type.
+_FIXED_VALUE_SIZES = {
+    1: 8,
+    6: 0,
+    7: 12,
+    8: 1,
+    9: 8,
+    10: 0,
+    16: 4,
+    17: 8,
+    18: 8,
+    19: 16,
+    127: 0,
+    255: 0,
+}
+
+
+def _element_value_size(data: Any, position: int, obj_end: int, element_type: int) -> int:
+    """Return the size of the BSON value of `element_type` at `position`."""
+    size = _FIXED_VALUE_SIZES.get(element_type)
+    if size is None:
+        if element_type in (2, 12, 13, 14):
+            # String, DBPointer, Code and Symbol start with a string.
+            length = _UNPACK_INT_FROM(data, position)[0]
+            if length < 1:
+                raise InvalidBSON("invalid string length")
+            size = 4 + length + (12 if element_type == 12 else 0)
+        elif element_type in (3, 4, 15):
+            size = _UNPACK_INT_FROM(data, position)[0]
+            if size < 5:
+                raise InvalidBSON("invalid object size")
+        elif element_type == 5:
+            length = _UNPACK_INT_FROM(data, position)[0]
+            if length < 0:
+                raise InvalidBSON("invalid binary length")
+            size = 5 + length
+        elif element_type == 11:
+            # Regex pattern and options are two C strings.
+            end = data.index(b"\x00", data.index(b"\x00", position, obj_end) + 1, obj_end)
+            size = end + 1 - position
+        else:
+            raise InvalidBSON(f"Detected unknown BSON type {chr(element_type).encode()!r}")
+    if position + size > obj_end:
+        raise InvalidBSON("bad value size")
+    return size
+
+
+def _index_elements(
+    data: Any, position: int, obj_end: int, unicode_decode_error_handler: str
+) -> dict[str, int]:
+    """Map the name of each element from `position` up to `obj_end` to its offset."""
+    index: dict[str, int] = {}
+    try:
+        while position < obj_end:
+            element_type = data[position]
+            name_end = data.index(b"\x00", position + 1, obj_end)
+            name = _utf_8_decode(data[position + 1 : name_end], unicode_decode_error_handler, True)[
+                0
+            ]
+            index[name] = position
+            position = name_end + 1 + _element_value_size(data, name_end + 1, obj_end, element_type)
+    except InvalidBSON:
+        raise
+    except Exception:
+        # Change exception type to InvalidBSON but preserve traceback.
+        _, exc_value, exc_tb = sys.exc_info()
+        raise InvalidBSON(str(exc_value)).with_traceback(exc_tb) from None
+    if position != obj_end:
+        raise InvalidBSON("bad object or element length")
+    return index
+
+
+if _USE_C:
+    _index_elements = _cbson._index_elements
+
+
+def _decode_columns(data: Any, fields: Sequence[Tuple[bytes, int]]) -> list[Tuple[bytes, bytes]]:
+    """Decode the `fields` of every document in `data` into packed columns.
+
+    Returns a list of (values, null mask) buffers in the same order as `fields`.
+    """
+    data, view = get_data_and_view(data)
+    data_len = len(data)
+    index = {name: i for i, (name, _) in enumerate(fields)}
+    packers = [_COLUMN_STRUCTS[kind] for _, kind in fields]
+    values = [bytearray() for _ in fields]
+    masks = [bytearray() for _ in fields]
+    position = 0
+    row = 0
+    try:
+        while position < data_len:
+            if data_len - position < 5:
+                raise InvalidBSON("not enough data for a BSON document")
+            obj_size = _UNPACK_INT_FROM(data, position)[0]
+            if obj_size < 5:
+                raise InvalidBSON("invalid message size")
+            if data_len - position < obj_size:
+                raise InvalidBSON("objsize too large")
+            obj_end = position + obj_size - 1
+            if data[obj_end] != 0:
+                raise InvalidBSON("bad eoo")
+            # Every row starts out null.
+            for i, packer in enumerate(packers):
+                values[i].extend(bytes(packer.size))
+                masks[i].append(1)
+            element = position + 4
+            while element < obj_end:
+                element_type = data[element]
+                name_end = data.index(b"\x00", element + 1, obj_end)
+                value_pos = name_end + 1
+                size = _element_value_size(data, value_pos, obj_end, element_type)
+                col = index.get(bytes(data[element + 1 : name_end]))
+                if col is not None:
+                    packer = packers[col]
+                    if element_type in (6, 10):
+                        # Undefined and null.
+                        start = row * packer.size
+                        values[col][start : start + packer.size] = bytes(packer.size)
+                        masks[col][row] = 1
+                    else:
+                        kind = fields[col][1]
+                        getter = _COLUMN_ACCEPTED_TYPES[kind].get(element_type)
+                        if getter is None:
+                            raise TypeError(
+                                f"cannot decode BSON type {element_type} for field "
+                                f"'{fields[col][0].decode('utf-8', 'replace')}' into column "
+                                f"type '{_COLUMN_KIND_NAMES[kind]}'"
+                            )
+                        packer.pack_into(values[col], row * packer.size, getter(data, value_pos))
+                        masks[col][row] = 0
+                element = value_pos + size
+            position += obj_size
+            row += 1
+    except (InvalidBSON, TypeError):
+        raise
+    except Exception:
+        # Change exception type to InvalidBSON but preserve traceback.
+        _, exc_value, exc_tb = sys.exc_info()
+        raise InvalidBSON(str(exc_value)).with_traceback(exc_tb) from None
+    return [(bytes(v), bytes(m)) for v, m in zip(values, masks)]
+
+
+if _USE_C:
+    _decode_columns = _cbson._decode_columns
+
+
+def decode_columns(data: _ReadableBuffer, schema: Mapping[str, str]) -> dict[str, Tuple[Any, Any]]:
+    """Decode top-level fields of BSON documents into typed columns.
+
+    `data` must be a bytes-like object implementing the buffer protocol that
+    provides concatenated, valid, BSON-encoded documents, such as a batch
+    returned by :meth:`~pymongo.collection.Collection.find_raw_batches`.
+    `schema` maps each field name to one of the column types:
+
+    ============ ================================ =========================
+    Column type  Accepted BSON types              Values
+    ============ ================================ =========================
+    ``int32``    int32                            :class:`array.array` ``i``
+    ``int64``    int32, int64                     :class:`array.array` ``q``
+    ``double``   double, int32, int64             :class:`array.array` ``d``
+    ``bool``     boolean                          :class:`array.array` ``B``
+    ``datetime`` UTC datetime                     :class:`array.array` ``q``
+                                                  of milliseconds since the
+                                                  Unix epoch
+    ``objectid`` ObjectId                         :class:`bytearray` of
+                                                  12 bytes per document
+    ============ ================================ =========================
+
+    Returns a dict mapping each field name to a ``(values, mask)`` tuple with
+    one entry per document. ``mask`` is a :class:`bytearray` that is ``1`` for
+    documents where the field is missing, null, or undefined (their value is
+    zero) and ``0`` otherwise. Documents are walked once without creating
+    Python objects for their fields.
+
+    The columns expose the buffer protocol so they can be wrapped by NumPy
+    without copying::
+
+      >>> values, mask = bson.decode_columns(batch, {"ts": "datetime"})["ts"]
+      >>> numpy.ma.masked_array(
+      ...     numpy.frombuffer(values, "datetime64[ms]"), numpy.frombuffer(mask, bool)
+      ... )
+
+    :param data: BSON data
+    :param schema: A mapping of top-level field names to column types.
+
+    :raises: :exc:`TypeError` if a field contains a BSON type that cannot be
+        stored in its column.
+
+    .. versionadded:: 4.9
+    """
+    fields = []
+    for name, column_type in schema.items():
+        if column_type not in _COLUMN_KINDS:
+            raise ValueError(
+                f"unknown column type {column_type!r} for field {name!r}, must be one of "
+                f"{', '.join(_COLUMN_KINDS)}"
+            )
+        fields.append((name.encode("utf-8"), _COLUMN_KINDS[column_type][0]))
+    result: dict[str, Tuple[Any, Any]] = {}
+    for name, (values, mask) in zip(schema, _decode_columns(data, tuple(fields))):
+        typecode = _COLUMN_KINDS[schema[name]][1]
+        if typecode is None:
+            column: Any = bytearray(values)
+        else:
+            column = array.array(typecode)
+            column.frombytes(values)
+        result[name] = (column, bytearray(mask))
+    return result
+
+
 def _decode_selective(
     rawdoc: Any, fields: Any, codec_options: CodecOptions[_DocumentType]
 ) -> _DocumentType:
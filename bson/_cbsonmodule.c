@@ -1841,6 +1841,180 @@ static PyObject* _cbson_dict_to_bson(PyObject* self, PyObject* args) {
     return result;
 }
 
+/* Write `value` if its type is exactly bool, int, float, NoneType, str or
+ * dict. These types never have a _type_marker, so the lookup done by
+ * write_element_to_buffer can be skipped.
+ *
+ * Returns 1 on success, 0 on failure, or -1 if `value` must be written by
+ * write_element_to_buffer instead. */
+static int _write_builtin_element(PyObject* self, buffer_t buffer,
+                                  int type_byte, PyObject* value,
+                                  const codec_options_t* options) {
+    PyTypeObject* type = Py_TYPE(value);
+
+    if (type == &PyBool_Type) {
+        const char c = (value == Py_True) ? 0x01 : 0x00;
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x08;
+        return buffer_write_bytes(buffer, &c, 1);
+    } else if (type == &PyLong_Type) {
+        const long long long_long_value = PyLong_AsLongLong(value);
+        if (long_long_value == -1 && PyErr_Occurred()) {
+            /* Let write_element_to_buffer handle the overflow. */
+            PyErr_Clear();
+            return -1;
+        }
+        if (-2147483648LL <= long_long_value && long_long_value <= 2147483647LL) {
+            *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x10;
+            return buffer_write_int32(buffer, (int32_t)long_long_value);
+        }
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x12;
+        return buffer_write_int64(buffer, (int64_t)long_long_value);
+    } else if (type == &PyFloat_Type) {
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x01;
+        return buffer_write_double(buffer, PyFloat_AS_DOUBLE(value));
+    } else if (value == Py_None) {
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x0A;
+        return 1;
+    } else if (type == &PyUnicode_Type) {
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x02;
+        return write_unicode(buffer, value);
+    } else if (type == &PyDict_Type) {
+        int result;
+        if (Py_EnterRecursiveCall(" while encoding an object to BSON ")) {
+            return 0;
+        }
+        *(pymongo_buffer_get_buffer(buffer) + type_byte) = 0x03;
+        result = write_dict(self, buffer, value, 0, options, 0);
+        Py_LeaveRecursiveCall();
+        return result;
+    }
+    return -1;
+}
+
+static int _key_equals(PyObject* key, PyObject* other) {
+    return key == other ||
+        (PyUnicode_CheckExact(key) && PyUnicode_Compare(key, other) == 0);
+}
+
+/* Return 1 if the keys of `dict`, other than _id, are `keys` in order. */
+static int _compiled_keys_match(PyObject* dict, PyObject* keys, PyObject* _id_str) {
+    Py_ssize_t pos = 0;
+    Py_ssize_t i = 0;
+    Py_ssize_t n_keys = PyTuple_GET_SIZE(keys);
+    PyObject* key;
+    PyObject* value;
+
+    while (PyDict_Next(dict, &pos, &key, &value)) {
+        if (i < n_keys && _key_equals(key, PyTuple_GET_ITEM(keys, i))) {
+            i++;
+        } else if (!_key_equals(key, _id_str)) {
+            return 0;
+        }
+    }
+    return i == n_keys;
+}
+
+/* Encode a top-level document with the element names precompiled by
+ * bson.compile_encoder. `names` holds the encoded name of each of `keys`,
+ * including its null terminator. Documents that are not a dict with exactly
+ * those keys are encoded by write_dict. */
+static PyObject* _cbson_dict_to_bson_compiled(PyObject* self, PyObject* args) {
+    PyObject* dict;
+    PyObject* keys;
+    PyObject* names;
+    PyObject* options_obj;
+    PyObject* result = NULL;
+    codec_options_t options;
+    buffer_t buffer;
+    struct module_state *state = GETSTATE(self);
+    if (!state) {
+        return NULL;
+    }
+
+    if (!(PyArg_ParseTuple(args, "OO!O!O", &dict, &PyTuple_Type, &keys,
+                           &PyTuple_Type, &names, &options_obj) &&
+            convert_codec_options(self, options_obj, &options))) {
+        return NULL;
+    }
+    if (PyTuple_GET_SIZE(keys) != PyTuple_GET_SIZE(names)) {
+        destroy_codec_options(&options);
+        PyErr_SetString(PyExc_ValueError, "keys and names must be the same length");
+        return NULL;
+    }
+    buffer = pymongo_buffer_new();
+    if (!buffer) {
+        destroy_codec_options(&options);
+        return NULL;
+    }
+
+    if (!PyDict_CheckExact(dict) || !_compiled_keys_match(dict, keys, state->_id_str)) {
+        if (!write_dict(self, buffer, dict, 0, &options, 1)) {
+            goto done;
+        }
+    } else {
+        Py_ssize_t pos = 0;
+        Py_ssize_t i = 0;
+        Py_ssize_t n_keys = PyTuple_GET_SIZE(keys);
+        PyObject* key;
+        PyObject* value;
+        PyObject* _id;
+        char zero = 0;
+        int length_location = pymongo_buffer_save_space(buffer, 4);
+        if (length_location == -1) {
+            goto done;
+        }
+        /* PyDict_GetItem returns a borrowed reference. */
+        _id = PyDict_GetItem(dict, state->_id_str);
+        if (_id && !write_pair(self, buffer, "_id", 3, _id, 0, &options, 1)) {
+            goto done;
+        }
+        while (PyDict_Next(dict, &pos, &key, &value)) {
+            PyObject* name;
+            int type_byte;
+            int status;
+
+            if (i == n_keys || !_key_equals(key, PyTuple_GET_ITEM(keys, i))) {
+                /* This is _id, which was already written. */
+                continue;
+            }
+            name = PyTuple_GET_ITEM(names, i++);
+            if (!PyBytes_Check(name)) {
+                PyErr_SetString(PyExc_TypeError, "names must be bytes");
+                goto done;
+            }
+            type_byte = pymongo_buffer_save_space(buffer, 1);
+            if (type_byte == -1) {
+                goto done;
+            }
+            if (!buffer_write_bytes(buffer, PyBytes_AS_STRING(name),
+                                    (int)PyBytes_GET_SIZE(name))) {
+                goto done;
+            }
+            status = _write_builtin_element(self, buffer, type_byte, value, &options);
+            if (status == -1) {
+                status = write_element_to_buffer(self, buffer, type_byte, value,
+                                                 0, &options, 0, 0);
+            }
+            if (!status) {
+                goto done;
+            }
+        }
+        if (!buffer_write_bytes(buffer, &zero, 1)) {
+            goto done;
+        }
+        buffer_write_int32_at_position(
+            buffer, length_location,
+            (int32_t)(pymongo_buffer_get_position(buffer) - length_location));
+    }
+
+    result = Py_BuildValue("y#", pymongo_buffer_get_buffer(buffer),
+                           (Py_ssize_t)pymongo_buffer_get_position(buffer));
+done:
+    destroy_codec_options(&options);
+    pymongo_buffer_free(buffer);
+    return result;
+}
+
 /*
  * Hook for optional decoding BSON documents to DBRef.
  */
@@ -3022,9 +3196,2533 @@ done:
 }
 
 
+/* Column kinds for _cbson_decode_columns. These must match _COLUMN_KINDS in
+ * bson/__init__.py. */
+#define COLUMN_INT32 0
+#define COLUMN_INT64 1
+#define COLUMN_DOUBLE 2
+#define COLUMN_BOOL 3
+#define COLUMN_DATETIME 4
+#define COLUMN_OBJECTID 5
+
+static const int column_widths[] = {4, 8, 8, 1, 8, 12};
+static const char* column_names[] = {
+    "int32", "int64", "double", "bool", "datetime", "objectid"};
+
+typedef struct {
+    const char* name;
+    Py_ssize_t name_length;
+    int kind;
+    buffer_t values;
+    buffer_t mask;
+} column_t;
+
+static void _set_invalid_bson(const char* message) {
+    PyObject* InvalidBSON = _error("InvalidBSON");
+    if (InvalidBSON) {
+        PyErr_SetString(InvalidBSON, message);
+        Py_DECREF(InvalidBSON);
+    }
+}
+
+/* Get the size of the value of an element of type `type` that starts at
+ * `position`, without decoding it. `max` is the position of the enclosing
+ * document's terminating null byte.
+ *
+ * Returns -1 and sets InvalidBSON if the value is malformed. */
+static Py_ssize_t _element_value_size(const char* string, Py_ssize_t position,
+                                      Py_ssize_t max, unsigned char type) {
+    int32_t length;
+    Py_ssize_t size;
+    const char* end;
+
+    switch (type) {
+    case 6:
+    case 10:
+    case 127:
+    case 255:
+        size = 0;
+        break;
+    case 8:
+        size = 1;
+        break;
+    case 16:
+        size = 4;
+        break;
+    case 1:
+    case 9:
+    case 17:
+    case 18:
+        size = 8;
+        break;
+    case 7:
+        size = 12;
+        break;
+    case 19:
+        size = 16;
+        break;
+    case 2:
+    case 12:
+    case 13:
+    case 14:
+        /* String, DBPointer, Code and Symbol start with a string. */
+        if (max - position < 4) {
+            goto invalid;
+        }
+        memcpy(&length, string + position, 4);
+        length = (int32_t)BSON_UINT32_FROM_LE(length);
+        if (length < 1) {
+            goto invalid;
+        }
+        size = 4 + (Py_ssize_t)length + (type == 12 ? 12 : 0);
+        break;
+    case 3:
+    case 4:
+    case 15:
+        if (max - position < 4) {
+            goto invalid;
+        }
+        memcpy(&length, string + position, 4);
+        length = (int32_t)BSON_UINT32_FROM_LE(length);
+        if (length < BSON_MIN_SIZE) {
+            goto invalid;
+        }
+        size = length;
+        break;
+    case 5:
+        if (max - position < 4) {
+            goto invalid;
+        }
+        memcpy(&length, string + position, 4);
+        length = (int32_t)BSON_UINT32_FROM_LE(length);
+        if (length < 0) {
+            goto invalid;
+        }
+        size = 5 + (Py_ssize_t)length;
+        break;
+    case 11:
+        /* Regex pattern and options are two C strings. */
+        end = memchr(string + position, 0, max - position);
+        if (!end) {
+            goto invalid;
+        }
+        end = memchr(end + 1, 0, max - (end + 1 - string));
+        if (!end) {
+            goto invalid;
+        }
+        size = end + 1 - (string + position);
+        break;
+    default:
+        {
+            PyObject* InvalidBSON = _error("InvalidBSON");
+            if (InvalidBSON) {
+                PyErr_Format(InvalidBSON, "Detected unknown BSON type b'\\x%02x'", type);
+                Py_DECREF(InvalidBSON);
+            }
+            return -1;
+        }
+    }
+    if (size > max - position) {
+        goto invalid;
+    }
+    return size;
+invalid:
+    _set_invalid_bson("bad value size");
+    return -1;
+}
+
+/* Store the value of an element of type `type` in the current row of
+ * `column`. Returns 0 and sets an exception on failure. */
+static int _store_column_value(column_t* column, unsigned char type,
+                               const char* value) {
+    int width = column_widths[column->kind];
+    char* out = pymongo_buffer_get_buffer(column->values) +
+                pymongo_buffer_get_position(column->values) - width;
+    char* mask = pymongo_buffer_get_buffer(column->mask) +
+                 pymongo_buffer_get_position(column->mask) - 1;
+    int32_t i32;
+    int64_t i64;
+    double d;
+
+    if (type == 6 || type == 10) {
+        /* Undefined and null. */
+        memset(out, 0, width);
+        *mask = 1;
+        return 1;
+    }
+    switch (column->kind) {
+    case COLUMN_INT32:
+        if (type != 16) {
+            goto mismatch;
+        }
+        memcpy(&i32, value, 4);
+        i32 = (int32_t)BSON_UINT32_FROM_LE(i32);
+        memcpy(out, &i32, 4);
+        break;
+    case COLUMN_INT64:
+    case COLUMN_DOUBLE:
+        if (type == 16) {
+            memcpy(&i32, value, 4);
+            i64 = (int32_t)BSON_UINT32_FROM_LE(i32);
+        } else if (type == 18) {
+            memcpy(&i64, value, 8);
+            i64 = (int64_t)BSON_UINT64_FROM_LE(i64);
+        } else if (type == 1 && column->kind == COLUMN_DOUBLE) {
+            memcpy(&d, value, 8);
+            d = BSON_DOUBLE_FROM_LE(d);
+            memcpy(out, &d, 8);
+            break;
+        } else {
+            goto mismatch;
+        }
+        if (column->kind == COLUMN_DOUBLE) {
+            d = (double)i64;
+            memcpy(out, &d, 8);
+        } else {
+            memcpy(out, &i64, 8);
+        }
+        break;
+    case COLUMN_BOOL:
+        if (type != 8) {
+            goto mismatch;
+        }
+        if (value[0] != 0 && value[0] != 1) {
+            PyObject* InvalidBSON = _error("InvalidBSON");
+            if (InvalidBSON) {
+                PyErr_Format(InvalidBSON, "invalid boolean value: %x", (unsigned char)value[0]);
+                Py_DECREF(InvalidBSON);
+            }
+            return 0;
+        }
+        out[0] = value[0];
+        break;
+    case COLUMN_DATETIME:
+        if (type != 9) {
+            goto mismatch;
+        }
+        memcpy(&i64, value, 8);
+        i64 = (int64_t)BSON_UINT64_FROM_LE(i64);
+        memcpy(out, &i64, 8);
+        break;
+    case COLUMN_OBJECTID:
+        if (type != 7) {
+            goto mismatch;
+        }
+        memcpy(out, value, 12);
+        break;
+    }
+    *mask = 0;
+    return 1;
+mismatch:
+    {
+        PyObject* name = PyUnicode_DecodeUTF8(column->name, column->name_length, "replace");
+        if (name) {
+            PyErr_Format(PyExc_TypeError,
+                         "cannot decode BSON type %d for field '%U' into column type '%s'",
+                         (int)type, name, column_names[column->kind]);
+            Py_DECREF(name);
+        }
+    }
+    return 0;
+}
+
+static PyObject* _cbson_decode_columns(PyObject* self, PyObject* args) {
+    int32_t size;
+    Py_ssize_t total_size;
+    Py_ssize_t position = 0;
+    Py_ssize_t n_columns = 0;
+    Py_ssize_t i;
+    const char* string;
+    PyObject* bson;
+    PyObject* fields;
+    PyObject* result = NULL;
+    column_t* columns = NULL;
+    Py_buffer view = {0};
+
+    if (!PyArg_ParseTuple(args, "OO!", &bson, &PyTuple_Type, &fields)) {
+        return NULL;
+    }
+    if (!_get_buffer(bson, &view)) {
+        return NULL;
+    }
+    total_size = view.len;
+    string = (char*)view.buf;
+
+    n_columns = PyTuple_GET_SIZE(fields);
+    columns = PyMem_Calloc(n_columns ? n_columns : 1, sizeof(column_t));
+    if (!columns) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (i = 0; i < n_columns; i++) {
+        if (!PyArg_ParseTuple(PyTuple_GET_ITEM(fields, i), "y#i",
+                              &columns[i].name, &columns[i].name_length,
+                              &columns[i].kind)) {
+            goto done;
+        }
+        if (columns[i].kind < COLUMN_INT32 || columns[i].kind > COLUMN_OBJECTID) {
+            PyErr_SetString(PyExc_ValueError, "invalid column kind");
+            goto done;
+        }
+        columns[i].values = pymongo_buffer_new();
+        columns[i].mask = pymongo_buffer_new();
+        if (!columns[i].values || !columns[i].mask) {
+            goto done;
+        }
+    }
+
+    while (position < total_size) {
+        Py_ssize_t obj_end;
+        Py_ssize_t element;
+
+        if (total_size - position < BSON_MIN_SIZE) {
+            _set_invalid_bson("not enough data for a BSON document");
+            goto done;
+        }
+        memcpy(&size, string + position, 4);
+        size = (int32_t)BSON_UINT32_FROM_LE(size);
+        if (size < BSON_MIN_SIZE) {
+            _set_invalid_bson("invalid message size");
+            goto done;
+        }
+        if (total_size - position < size) {
+            _set_invalid_bson("objsize too large");
+            goto done;
+        }
+        obj_end = position + size - 1;
+        if (string[obj_end]) {
+            _set_invalid_bson("bad eoo");
+            goto done;
+        }
+
+        /* Every row starts out null. */
+        for (i = 0; i < n_columns; i++) {
+            int width = column_widths[columns[i].kind];
+            buffer_position offset = pymongo_buffer_save_space(columns[i].values, width);
+            if (offset == -1) {
+                goto done;
+            }
+            memset(pymongo_buffer_get_buffer(columns[i].values) + offset, 0, width);
+            offset = pymongo_buffer_save_space(columns[i].mask, 1);
+            if (offset == -1) {
+                goto done;
+            }
+            pymongo_buffer_get_buffer(columns[i].mask)[offset] = 1;
+        }
+
+        element = position + 4;
+        while (element < obj_end) {
+            unsigned char type = (unsigned char)string[element];
+            const char* name = string + element + 1;
+            const char* name_end = memchr(name, 0, obj_end - element - 1);
+            Py_ssize_t name_length;
+            Py_ssize_t value_position;
+            Py_ssize_t value_size;
+
+            if (!name_end) {
+                _set_invalid_bson("bad eoo");
+                goto done;
+            }
+            name_length = name_end - name;
+            value_position = name_end + 1 - string;
+            value_size = _element_value_size(string, value_position, obj_end, type);
+            if (value_size < 0) {
+                goto done;
+            }
+            for (i = 0; i < n_columns; i++) {
+                if (columns[i].name_length == name_length &&
+                        !memcmp(columns[i].name, name, name_length)) {
+                    if (!_store_column_value(&columns[i], type, string + value_position)) {
+                        goto done;
+                    }
+                    break;
+                }
+            }
+            element = value_position + value_size;
+        }
+        position += size;
+    }
+
+    if (!(result = PyList_New(n_columns))) {
+        goto done;
+    }
+    for (i = 0; i < n_columns; i++) {
+        PyObject* column = Py_BuildValue(
+            "(y#y#)",
+            pymongo_buffer_get_buffer(columns[i].values),
+            (Py_ssize_t)pymongo_buffer_get_position(columns[i].values),
+            pymongo_buffer_get_buffer(columns[i].mask),
+            (Py_ssize_t)pymongo_buffer_get_position(columns[i].mask));
+        if (!column) {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyList_SET_ITEM(result, i, column);
+    }
+done:
+    if (columns) {
+        for (i = 0; i < n_columns; i++) {
+            if (columns[i].values) {
+                pymongo_buffer_free(columns[i].values);
+            }
+            if (columns[i].mask) {
+                pymongo_buffer_free(columns[i].mask);
+            }
+        }
+        PyMem_Free(columns);
+    }
+    PyBuffer_Release(&view);
+    return result;
+}
+
+
+static PyObject* _cbson_index_elements(PyObject* self, PyObject* args) {
+    Py_ssize_t position;
+    Py_ssize_t obj_end;
+    const char* string;
+    const char* errors;
+    PyObject* bson;
+    PyObject* index = NULL;
+
+    if (!PyArg_ParseTuple(args, "O!nns", &PyBytes_Type, &bson, &position,
+                          &obj_end, &errors)) {
+        return NULL;
+    }
+    if (position < 0 || obj_end < position || obj_end >= PyBytes_GET_SIZE(bson)) {
+        PyErr_SetString(PyExc_ValueError, "invalid document bounds");
+        return NULL;
+    }
+    string = PyBytes_AS_STRING(bson);
+    if (!(index = PyDict_New())) {
+        return NULL;
+    }
+
+    while (position < obj_end) {
+        unsigned char type = (unsigned char)string[position];
+        const char* name = string + position + 1;
+        const char* name_end = memchr(name, 0, obj_end - position - 1);
+        Py_ssize_t value_position;
+        Py_ssize_t value_size;
+        PyObject* key;
+        PyObject* offset;
+        int status;
+
+        if (!name_end) {
+            _set_invalid_bson("bad object or element length");
+            goto fail;
+        }
+        value_position = name_end + 1 - string;
+        value_size = _element_value_size(string, value_position, obj_end, type);
+        if (value_size < 0) {
+            goto fail;
+        }
+        if (!(key = PyUnicode_DecodeUTF8(name, name_end - name, errors))) {
+            goto fail;
+        }
+        if (!(offset = PyLong_FromSsize_t(position))) {
+            Py_DECREF(key);
+            goto fail;
+        }
+        status = PyDict_SetItem(index, key, offset);
+        Py_DECREF(key);
+        Py_DECREF(offset);
+        if (status < 0) {
+            goto fail;
+        }
+        position = value_position + value_size;
+    }
+    if (position != obj_end) {
+        _set_invalid_bson("bad object or element length");
+        goto fail;
+    }
+    return index;
+fail:
+    Py_DECREF(index);
+    return NULL;
+}
+
+
+/*
+ * Conversion between BSON and Relaxed or Canonical Extended JSON for
+ * bson.json_util.bson_to_json and bson.json_util.json_to_bson.
+ *
+ * Values are converted directly from one encoding to the other, without
+ * creating Python objects for them. Input that is not handled here, such as
+ * malformed BSON or JSON, legacy Extended JSON, or DBRefs, makes the
+ * converters return None so that json_util falls back to its pure Python
+ * implementation, which also raises the appropriate errors.
+ */
+
+/* Returned by the helpers below to request the pure Python fallback. */
+#define EJSON_FALLBACK 1
+
+#define EJSON_WRITE_LITERAL(buffer, literal) \
+    _ejson_write((buffer), (literal), (Py_ssize_t)(sizeof(literal) - 1))
+
+static const char _ejson_hex_digits[] = "0123456789abcdef";
+static const char _ejson_base64_alphabet[] =
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+
+static int _ejson_write(buffer_t buffer, const char* data, Py_ssize_t size) {
+    if (size > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError, "Document would overflow BSON size limit");
+        return -1;
+    }
+    return pymongo_buffer_write(buffer, data, (int)size) ? -1 : 0;
+}
+
+static int _ejson_write_int64(buffer_t buffer, long long value) {
+    char number[BUF_SIZE];
+    if (LL2STR(number, value) == -1) {
+        return -1;
+    }
+    return _ejson_write(buffer, number, (Py_ssize_t)strlen(number));
+}
+
+/* Write the shortest representation of `value` that round trips, like
+ * float.__repr__. */
+static int _ejson_write_double(buffer_t buffer, double value) {
+    int status;
+    char* repr = PyOS_double_to_string(value, 'r', 0, Py_DTSF_ADD_DOT_0, NULL);
+    if (!repr) {
+        return -1;
+    }
+    status = _ejson_write(buffer, repr, (Py_ssize_t)strlen(repr));
+    PyMem_Free(repr);
+    return status;
+}
+
+/* Decode the UTF-8 sequence at `data`. Returns its length, or 0 if it is
+ * not valid UTF-8. */
+static int _ejson_utf8_decode(const unsigned char* data, Py_ssize_t size,
+                              uint32_t* code_point) {
+    unsigned char c = data[0];
+    uint32_t value;
+    if (c < 0x80) {
+        *code_point = c;
+        return 1;
+    }
+    if (c >= 0xC2 && c <= 0xDF) {
+        if (size < 2 || (data[1] & 0xC0) != 0x80) {
+            return 0;
+        }
+        *code_point = ((uint32_t)(c & 0x1F) << 6) | (data[1] & 0x3F);
+        return 2;
+    }
+    if (c >= 0xE0 && c <= 0xEF) {
+        if (size < 3 || (data[1] & 0xC0) != 0x80 || (data[2] & 0xC0) != 0x80) {
+            return 0;
+        }
+        value = ((uint32_t)(c & 0x0F) << 12) | ((uint32_t)(data[1] & 0x3F) << 6) |
+                (data[2] & 0x3F);
+        if (value < 0x800 || (value >= 0xD800 && value <= 0xDFFF)) {
+            return 0;
+        }
+        *code_point = value;
+        return 3;
+    }
+    if (c >= 0xF0 && c <= 0xF4) {
+        if (size < 4 || (data[1] & 0xC0) != 0x80 || (data[2] & 0xC0) != 0x80 ||
+            (data[3] & 0xC0) != 0x80) {
+            return 0;
+        }
+        value = ((uint32_t)(c & 0x07) << 18) | ((uint32_t)(data[1] & 0x3F) << 12) |
+                ((uint32_t)(data[2] & 0x3F) << 6) | (data[3] & 0x3F);
+        if (value < 0x10000 || value > 0x10FFFF) {
+            return 0;
+        }
+        *code_point = value;
+        return 4;
+    }
+    return 0;
+}
+
+static void _ejson_unicode_escape(char* out, uint32_t code_point) {
+    out[0] = '\\';
+    out[1] = 'u';
+    out[2] = _ejson_hex_digits[(code_point >> 12) & 0xF];
+    out[3] = _ejson_hex_digits[(code_point >> 8) & 0xF];
+    out[4] = _ejson_hex_digits[(code_point >> 4) & 0xF];
+    out[5] = _ejson_hex_digits[code_point & 0xF];
+}
+
+static int _ejson_write_escaped(buffer_t buffer, uint32_t code_point) {
+    char escape[12];
+    switch (code_point) {
+    case '"':
+        return EJSON_WRITE_LITERAL(buffer, "\\\"");
+    case '\\':
+        return EJSON_WRITE_LITERAL(buffer, "\\\\");
+    case '\n':
+        return EJSON_WRITE_LITERAL(buffer, "\\n");
+    case '\r':
+        return EJSON_WRITE_LITERAL(buffer, "\\r");
+    case '\t':
+        return EJSON_WRITE_LITERAL(buffer, "\\t");
+    case '\b':
+        return EJSON_WRITE_LITERAL(buffer, "\\b");
+    case '\f':
+        return EJSON_WRITE_LITERAL(buffer, "\\f");
+    }
+    if (code_point < 0x10000) {
+        _ejson_unicode_escape(escape, code_point);
+        return _ejson_write(buffer, escape, 6);
+    }
+    /* Characters outside the BMP are written as a surrogate pair. */
+    code_point -= 0x10000;
+    _ejson_unicode_escape(escape, 0xD800 | (code_point >> 10));
+    _ejson_unicode_escape(escape + 6, 0xDC00 | (code_point & 0x3FF));
+    return _ejson_write(buffer, escape, 12);
+}
+
+/* Write UTF-8 `string` as a JSON string, escaped like json.dumps does with
+ * ensure_ascii=True. */
+static int _ejson_write_string(buffer_t buffer, const char* string, Py_ssize_t size) {
+    const unsigned char* data = (const unsigned char*)string;
+    Py_ssize_t start = 0;
+    Py_ssize_t i = 0;
+    if (EJSON_WRITE_LITERAL(buffer, "\"")) {
+        return -1;
+    }
+    while (i < size) {
+        uint32_t code_point;
+        int length;
+        int status;
+        if (data[i] >= 0x20 && data[i] < 0x7F && data[i] != '"' && data[i] != '\\') {
+            i++;
+            continue;
+        }
+        if (_ejson_write(buffer, string + start, i - start)) {
+            return -1;
+        }
+        if (!(length = _ejson_utf8_decode(data + i, size - i, &code_point))) {
+            return EJSON_FALLBACK;
+        }
+        if ((status = _ejson_write_escaped(buffer, code_point))) {
+            return status;
+        }
+        i += length;
+        start = i;
+    }
+    if (_ejson_write(buffer, string + start, i - start)) {
+        return -1;
+    }
+    return EJSON_WRITE_LITERAL(buffer, "\"");
+}
+
+static int _ejson_write_base64(buffer_t buffer, const unsigned char* data, Py_ssize_t size) {
+    buffer_position position;
+    char* out;
+    Py_ssize_t i;
+    if (size > (INT_MAX / 4) * 3 - 3) {
+        PyErr_SetString(PyExc_ValueError, "Document would overflow BSON size limit");
+        return -1;
+    }
+    if ((position = pymongo_buffer_save_space(buffer, (int)((size + 2) / 3 * 4))) == -1) {
+        return -1;
+    }
+    out = pymongo_buffer_get_buffer(buffer) + position;
+    for (i = 0; i + 2 < size; i += 3) {
+        uint32_t n = ((uint32_t)data[i] << 16) | ((uint32_t)data[i + 1] << 8) | data[i + 2];
+        *out++ = _ejson_base64_alphabet[n >> 18];
+        *out++ = _ejson_base64_alphabet[(n >> 12) & 0x3F];
+        *out++ = _ejson_base64_alphabet[(n >> 6) & 0x3F];
+        *out++ = _ejson_base64_alphabet[n & 0x3F];
+    }
+    if (i < size) {
+        uint32_t n = (uint32_t)data[i] << 16;
+        if (i + 1 < size) {
+            n |= (uint32_t)data[i + 1] << 8;
+        }
+        *out++ = _ejson_base64_alphabet[n >> 18];
+        *out++ = _ejson_base64_alphabet[(n >> 12) & 0x3F];
+        *out++ = i + 1 < size ? _ejson_base64_alphabet[(n >> 6) & 0x3F] : '=';
+        *out++ = '=';
+    }
+    return 0;
+}
+
+/* Days since the epoch of a date in the proleptic Gregorian calendar. */
+static int64_t _ejson_days_from_civil(int64_t year, unsigned month, unsigned day) {
+    int64_t era;
+    unsigned year_of_era, day_of_year, day_of_era;
+    year -= month <= 2;
+    era = (year >= 0 ? year : year - 399) / 400;
+    year_of_era = (unsigned)(year - era * 400);
+    day_of_year = (153 * (month > 2 ? month - 3 : month + 9) + 2) / 5 + day - 1;
+    day_of_era = year_of_era * 365 + year_of_era / 4 - year_of_era / 100 + day_of_year;
+    return era * 146097 + (int64_t)day_of_era - 719468;
+}
+
+/* The date in the proleptic Gregorian calendar `days` after the epoch. */
+static void _ejson_civil_from_days(int64_t days, int64_t* year, unsigned* month,
+                                   unsigned* day) {
+    int64_t era;
+    unsigned day_of_era, year_of_era, day_of_year, shifted_month;
+    days += 719468;
+    era = (days >= 0 ? days : days - 146096) / 146097;
+    day_of_era = (unsigned)(days - era * 146097);
+    year_of_era = (day_of_era - day_of_era / 1460 + day_of_era / 36524 -
+                   day_of_era / 146096) / 365;
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era / 4 - year_of_era / 100);
+    shifted_month = (5 * day_of_year + 2) / 153;
+    *day = day_of_year - (153 * shifted_month + 2) / 5 + 1;
+    *month = shifted_month < 10 ? shifted_month + 3 : shifted_month - 9;
+    *year = (int64_t)year_of_era + era * 400 + (*month <= 2);
+}
+
+static void _ejson_format_digits(char* out, unsigned value, int width) {
+    while (width--) {
+        out[width] = (char)('0' + value % 10);
+        value /= 10;
+    }
+}
+
+/* Write a non-negative UTC datetime like json_util does in Relaxed mode:
+ * "YYYY-MM-DDTHH:MM:SS[.mmm]Z". */
+static int _ejson_write_iso_date(buffer_t buffer, int64_t millis) {
+    char date[26];
+    int64_t year;
+    unsigned month, day;
+    unsigned fraction = (unsigned)(millis % 1000);
+    unsigned seconds = (unsigned)((millis / 1000) % 86400);
+    int length = 19;
+    _ejson_civil_from_days(millis / 86400000, &year, &month, &day);
+    _ejson_format_digits(date, (unsigned)year, 4);
+    date[4] = '-';
+    _ejson_format_digits(date + 5, month, 2);
+    date[7] = '-';
+    _ejson_format_digits(date + 8, day, 2);
+    date[10] = 'T';
+    _ejson_format_digits(date + 11, seconds / 3600, 2);
+    date[13] = ':';
+    _ejson_format_digits(date + 14, seconds / 60 % 60, 2);
+    date[16] = ':';
+    _ejson_format_digits(date + 17, seconds % 60, 2);
+    if (fraction) {
+        date[19] = '.';
+        _ejson_format_digits(date + 20, fraction, 3);
+        length = 23;
+    }
+    date[length++] = 'Z';
+    return (EJSON_WRITE_LITERAL(buffer, "{\"$date\": \"") ||
+            _ejson_write(buffer, date, length) ||
+            EJSON_WRITE_LITERAL(buffer, "\"}")) ? -1 : 0;
+}
+
+static int32_t _ejson_read_int32(const char* data) {
+    int32_t value;
+    memcpy(&value, data, 4);
+    return (int32_t)BSON_UINT32_FROM_LE(value);
+}
+
+static int64_t _ejson_read_int64(const char* data) {
+    int64_t value;
+    memcpy(&value, data, 8);
+    return (int64_t)BSON_UINT64_FROM_LE(value);
+}
+
+/* Find the BSON string at `position`. Returns its length without the
+ * trailing null byte, or -1 if it is malformed. */
+static Py_ssize_t _ejson_read_bson_string(const char* data, Py_ssize_t position,
+                                          Py_ssize_t end, const char** string) {
+    int32_t length;
+    if (end - position < 5) {
+        return -1;
+    }
+    length = _ejson_read_int32(data + position);
+    if (length < 1 || length > end - position - 4 || data[position + 4 + length - 1]) {
+        return -1;
+    }
+    *string = data + position + 4;
+    return length - 1;
+}
+
+/* The keys of a document, as offsets of their null terminated names from a
+ * base pointer, in an open addressing hash table. The base is passed to each
+ * call because the buffer that holds the names may be reallocated. Documents
+ * with duplicate keys are left to the Python implementation, which keeps the
+ * last value of each key in the position of its first occurrence. */
+#define EJSON_KEYS_SMALL 16
+
+typedef struct {
+    Py_ssize_t* slots;
+    Py_ssize_t capacity;
+    Py_ssize_t count;
+    Py_ssize_t small[EJSON_KEYS_SMALL];
+} ejson_keys_t;
+
+static void _ejson_keys_init(ejson_keys_t* keys) {
+    Py_ssize_t i;
+    keys->slots = keys->small;
+    keys->capacity = EJSON_KEYS_SMALL;
+    keys->count = 0;
+    for (i = 0; i < EJSON_KEYS_SMALL; i++) {
+        keys->small[i] = -1;
+    }
+}
+
+static void _ejson_keys_free(ejson_keys_t* keys) {
+    if (keys->slots != keys->small) {
+        PyMem_Free(keys->slots);
+    }
+}
+
+static size_t _ejson_keys_hash(const char* key, Py_ssize_t size) {
+    /* FNV-1a */
+    size_t hash = 2166136261u;
+    Py_ssize_t i;
+    for (i = 0; i < size; i++) {
+        hash = (hash ^ (unsigned char)key[i]) * 16777619u;
+    }
+    return hash;
+}
+
+/* Find the slot of `key`, or the empty slot where it belongs. */
+static Py_ssize_t _ejson_keys_find(ejson_keys_t* keys, const char* base,
+                                   const char* key, Py_ssize_t size) {
+    Py_ssize_t mask = keys->capacity - 1;
+    Py_ssize_t i = (Py_ssize_t)(_ejson_keys_hash(key, size) & (size_t)mask);
+    while (keys->slots[i] != -1) {
+        const char* other = base + keys->slots[i];
+        if (!memcmp(other, key, size) && !other[size]) {
+            break;
+        }
+        i = (i + 1) & mask;
+    }
+    return i;
+}
+
+/* Add the key of `size` bytes at `offset` from `base`. Returns
+ * EJSON_FALLBACK if the document already has the key, -1 on error, and 0
+ * otherwise. */
+static int _ejson_keys_add(ejson_keys_t* keys, const char* base, Py_ssize_t offset,
+                           Py_ssize_t size) {
+    Py_ssize_t i;
+    if ((keys->count + 1) * 2 > keys->capacity) {
+        Py_ssize_t* old = keys->slots;
+        Py_ssize_t old_capacity = keys->capacity;
+        Py_ssize_t* slots = PyMem_New(Py_ssize_t, old_capacity * 2);
+        if (!slots) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (i = 0; i < old_capacity * 2; i++) {
+            slots[i] = -1;
+        }
+        keys->slots = slots;
+        keys->capacity = old_capacity * 2;
+        for (i = 0; i < old_capacity; i++) {
+            if (old[i] != -1) {
+                const char* key = base + old[i];
+                keys->slots[_ejson_keys_find(keys, base, key, (Py_ssize_t)strlen(key))] = old[i];
+            }
+        }
+        if (old != keys->small) {
+            PyMem_Free(old);
+        }
+    }
+    i = _ejson_keys_find(keys, base, base + offset, size);
+    if (keys->slots[i] != -1) {
+        return EJSON_FALLBACK;
+    }
+    keys->slots[i] = offset;
+    keys->count++;
+    return 0;
+}
+
+typedef struct {
+    PyObject* module;
+    buffer_t buffer;
+    int canonical;
+    int datetime_conversion;
+} ejson_writer_t;
+
+static int _ejson_write_document(ejson_writer_t* writer, const char* data,
+                                 Py_ssize_t position, Py_ssize_t end,
+                                 int is_array, int check_dbref);
+
+static int _ejson_write_oid(buffer_t buffer, const unsigned char* oid) {
+    char hex[24];
+    int i;
+    for (i = 0; i < 12; i++) {
+        hex[2 * i] = _ejson_hex_digits[oid[i] >> 4];
+        hex[2 * i + 1] = _ejson_hex_digits[oid[i] & 0xF];
+    }
+    return (EJSON_WRITE_LITERAL(buffer, "{\"$oid\": \"") ||
+            _ejson_write(buffer, hex, 24) ||
+            EJSON_WRITE_LITERAL(buffer, "\"}")) ? -1 : 0;
+}
+
+static int _ejson_write_regex_options(buffer_t buffer, const char* options) {
+    /* json_util writes the options that Regex supports, in this order. */
+    static const char supported[] = "ilmsux";
+    char flags[sizeof(supported)];
+    int length = 0;
+    int i;
+    for (i = 0; supported[i]; i++) {
+        if (strchr(options, supported[i])) {
+            flags[length++] = supported[i];
+        }
+    }
+    return _ejson_write(buffer, flags, length);
+}
+
+static int _ejson_write_decimal128(ejson_writer_t* writer, const char* bid) {
+    struct module_state *state = GETSTATE(writer->module);
+    PyObject* decimal;
+    PyObject* string;
+    const char* data;
+    Py_ssize_t size;
+    int status = -1;
+    if (!state) {
+        return -1;
+    }
+    decimal = PyObject_CallMethod(state->Decimal128, "from_bid", "y#", bid, (Py_ssize_t)16);
+    if (!decimal) {
+        return -1;
+    }
+    string = PyObject_Str(decimal);
+    Py_DECREF(decimal);
+    if (!string) {
+        return -1;
+    }
+    if ((data = PyUnicode_AsUTF8AndSize(string, &size))) {
+        status = (EJSON_WRITE_LITERAL(writer->buffer, "{\"$numberDecimal\": \"") ||
+                  _ejson_write(writer->buffer, data, size) ||
+                  EJSON_WRITE_LITERAL(writer->buffer, "\"}")) ? -1 : 0;
+    }
+    Py_DECREF(string);
+    return status;
+}
+
+/* Write the value of type `type` at `*position` and advance past it. */
+static int _ejson_write_value(ejson_writer_t* writer, unsigned char type,
+                              const char* data, Py_ssize_t* position, Py_ssize_t end) {
+    buffer_t buffer = writer->buffer;
+    Py_ssize_t pos = *position;
+    Py_ssize_t size;
+    const char* string;
+    int status;
+
+    switch (type) {
+    case 1: {
+        double value;
+        if (end - pos < 8) {
+            return EJSON_FALLBACK;
+        }
+        memcpy(&value, data + pos, 8);
+        value = BSON_DOUBLE_FROM_LE(value);
+        *position = pos + 8;
+        if (Py_IS_NAN(value)) {
+            return EJSON_WRITE_LITERAL(buffer, "{\"$numberDouble\": \"NaN\"}");
+        }
+        if (Py_IS_INFINITY(value)) {
+            return value > 0 ? EJSON_WRITE_LITERAL(buffer, "{\"$numberDouble\": \"Infinity\"}")
+                             : EJSON_WRITE_LITERAL(buffer, "{\"$numberDouble\": \"-Infinity\"}");
+        }
+        if (!writer->canonical) {
+            return _ejson_write_double(buffer, value);
+        }
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$numberDouble\": \"") ||
+                _ejson_write_double(buffer, value) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}")) ? -1 : 0;
+    }
+    case 2:
+    case 13:
+    case 14:
+        /* Symbols are decoded to str. */
+        if ((size = _ejson_read_bson_string(data, pos, end, &string)) < 0) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + 4 + size + 1;
+        if (type != 13) {
+            return _ejson_write_string(buffer, string, size);
+        }
+        if (EJSON_WRITE_LITERAL(buffer, "{\"$code\": ")) {
+            return -1;
+        }
+        if ((status = _ejson_write_string(buffer, string, size))) {
+            return status;
+        }
+        return EJSON_WRITE_LITERAL(buffer, "}");
+    case 3:
+    case 4:
+        if (end - pos < 5) {
+            return EJSON_FALLBACK;
+        }
+        size = _ejson_read_int32(data + pos);
+        if ((status = _ejson_write_document(writer, data, pos, end, type == 4, type == 3))) {
+            return status;
+        }
+        *position = pos + size;
+        return 0;
+    case 5: {
+        int32_t length;
+        unsigned char subtype;
+        char hex[2];
+        if (end - pos < 5) {
+            return EJSON_FALLBACK;
+        }
+        length = _ejson_read_int32(data + pos);
+        subtype = (unsigned char)data[pos + 4];
+        pos += 5;
+        if (length < 0 || length > end - pos) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + length;
+        if (subtype == 2) {
+            /* The old binary subtype repeats the length of the data. */
+            if (length < 4 || _ejson_read_int32(data + pos) != length - 4) {
+                return EJSON_FALLBACK;
+            }
+            pos += 4;
+            length -= 4;
+        }
+        if ((subtype == 3 || subtype == 4) && length != 16) {
+            /* The decoder rejects a UUID that is not 16 bytes. */
+            return EJSON_FALLBACK;
+        }
+        hex[0] = _ejson_hex_digits[subtype >> 4];
+        hex[1] = _ejson_hex_digits[subtype & 0xF];
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$binary\": {\"base64\": \"") ||
+                _ejson_write_base64(buffer, (const unsigned char*)data + pos, length) ||
+                EJSON_WRITE_LITERAL(buffer, "\", \"subType\": \"") ||
+                _ejson_write(buffer, hex, 2) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}}")) ? -1 : 0;
+    }
+    case 6:
+    case 10:
+        /* Undefined is decoded to None. */
+        return EJSON_WRITE_LITERAL(buffer, "null");
+    case 7:
+        if (end - pos < 12) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + 12;
+        return _ejson_write_oid(buffer, (const unsigned char*)data + pos);
+    case 8:
+        if (end - pos < 1 || (data[pos] != 0 && data[pos] != 1)) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + 1;
+        return data[pos] ? EJSON_WRITE_LITERAL(buffer, "true")
+                         : EJSON_WRITE_LITERAL(buffer, "false");
+    case 9: {
+        struct module_state *state = GETSTATE(writer->module);
+        int64_t millis;
+        if (!state) {
+            return -1;
+        }
+        if (end - pos < 8) {
+            return EJSON_FALLBACK;
+        }
+        millis = _ejson_read_int64(data + pos);
+        *position = pos + 8;
+        if (millis < state->min_millis || millis > state->max_millis) {
+            /* These conversions raise or clamp when decoding. */
+            if (writer->datetime_conversion == DATETIME ||
+                writer->datetime_conversion == DATETIME_CLAMP) {
+                return EJSON_FALLBACK;
+            }
+        } else if (!writer->canonical && millis >= 0) {
+            return _ejson_write_iso_date(buffer, millis);
+        }
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$date\": {\"$numberLong\": \"") ||
+                _ejson_write_int64(buffer, (long long)millis) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}}")) ? -1 : 0;
+    }
+    case 11: {
+        const char* pattern = data + pos;
+        const char* pattern_end = memchr(pattern, 0, end - pos);
+        const char* options;
+        const char* options_end;
+        if (!pattern_end) {
+            return EJSON_FALLBACK;
+        }
+        options = pattern_end + 1;
+        if (!(options_end = memchr(options, 0, data + end - options))) {
+            return EJSON_FALLBACK;
+        }
+        *position = options_end + 1 - data;
+        if (EJSON_WRITE_LITERAL(buffer, "{\"$regularExpression\": {\"pattern\": ")) {
+            return -1;
+        }
+        if ((status = _ejson_write_string(buffer, pattern, pattern_end - pattern))) {
+            return status;
+        }
+        return (EJSON_WRITE_LITERAL(buffer, ", \"options\": \"") ||
+                _ejson_write_regex_options(buffer, options) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}}")) ? -1 : 0;
+    }
+    case 12:
+        /* DBPointers are decoded to DBRefs. */
+        if ((size = _ejson_read_bson_string(data, pos, end, &string)) < 0 ||
+            end - pos - 4 - size - 1 < 12) {
+            return EJSON_FALLBACK;
+        }
+        pos += 4 + size + 1;
+        *position = pos + 12;
+        if (EJSON_WRITE_LITERAL(buffer, "{\"$ref\": ")) {
+            return -1;
+        }
+        if ((status = _ejson_write_string(buffer, string, size))) {
+            return status;
+        }
+        return (EJSON_WRITE_LITERAL(buffer, ", \"$id\": ") ||
+                _ejson_write_oid(buffer, (const unsigned char*)data + pos) ||
+                EJSON_WRITE_LITERAL(buffer, "}")) ? -1 : 0;
+    case 15: {
+        int32_t total;
+        Py_ssize_t scope;
+        if (end - pos < 4) {
+            return EJSON_FALLBACK;
+        }
+        total = _ejson_read_int32(data + pos);
+        if (total < 14 || total > end - pos) {
+            return EJSON_FALLBACK;
+        }
+        if ((size = _ejson_read_bson_string(data, pos + 4, pos + total, &string)) < 0) {
+            return EJSON_FALLBACK;
+        }
+        scope = pos + 4 + 4 + size + 1;
+        if (pos + total - scope < 5 || _ejson_read_int32(data + scope) != pos + total - scope) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + total;
+        if (EJSON_WRITE_LITERAL(buffer, "{\"$code\": ")) {
+            return -1;
+        }
+        if ((status = _ejson_write_string(buffer, string, size))) {
+            return status;
+        }
+        if (EJSON_WRITE_LITERAL(buffer, ", \"$scope\": ")) {
+            return -1;
+        }
+        if ((status = _ejson_write_document(writer, data, scope, pos + total, 0, 0))) {
+            return status;
+        }
+        return EJSON_WRITE_LITERAL(buffer, "}");
+    }
+    case 16: {
+        int32_t value;
+        if (end - pos < 4) {
+            return EJSON_FALLBACK;
+        }
+        value = _ejson_read_int32(data + pos);
+        *position = pos + 4;
+        if (!writer->canonical) {
+            return _ejson_write_int64(buffer, value);
+        }
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$numberInt\": \"") ||
+                _ejson_write_int64(buffer, value) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}")) ? -1 : 0;
+    }
+    case 17: {
+        uint32_t increment, time;
+        if (end - pos < 8) {
+            return EJSON_FALLBACK;
+        }
+        increment = (uint32_t)_ejson_read_int32(data + pos);
+        time = (uint32_t)_ejson_read_int32(data + pos + 4);
+        *position = pos + 8;
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$timestamp\": {\"t\": ") ||
+                _ejson_write_int64(buffer, time) ||
+                EJSON_WRITE_LITERAL(buffer, ", \"i\": ") ||
+                _ejson_write_int64(buffer, increment) ||
+                EJSON_WRITE_LITERAL(buffer, "}}")) ? -1 : 0;
+    }
+    case 18: {
+        int64_t value;
+        if (end - pos < 8) {
+            return EJSON_FALLBACK;
+        }
+        value = _ejson_read_int64(data + pos);
+        *position = pos + 8;
+        if (!writer->canonical) {
+            return _ejson_write_int64(buffer, (long long)value);
+        }
+        return (EJSON_WRITE_LITERAL(buffer, "{\"$numberLong\": \"") ||
+                _ejson_write_int64(buffer, (long long)value) ||
+                EJSON_WRITE_LITERAL(buffer, "\"}")) ? -1 : 0;
+    }
+    case 19:
+        if (end - pos < 16) {
+            return EJSON_FALLBACK;
+        }
+        *position = pos + 16;
+        return _ejson_write_decimal128(writer, data + pos);
+    case 255:
+        return EJSON_WRITE_LITERAL(buffer, "{\"$minKey\": 1}");
+    case 127:
+        return EJSON_WRITE_LITERAL(buffer, "{\"$maxKey\": 1}");
+    default:
+        return EJSON_FALLBACK;
+    }
+}
+
+/* Write the document or array at `position`. Subdocuments with a "$ref"
+ * field (`check_dbref`) are decoded to DBRefs, which may reorder their
+ * fields, so they are left to the Python implementation. */
+static int _ejson_write_document(ejson_writer_t* writer, const char* data,
+                                 Py_ssize_t position, Py_ssize_t end,
+                                 int is_array, int check_dbref) {
+    buffer_t buffer = writer->buffer;
+    ejson_keys_t keys;
+    int32_t size;
+    int first = 1;
+    int status = 0;
+
+    if (end - position < 5) {
+        return EJSON_FALLBACK;
+    }
+    size = _ejson_read_int32(data + position);
+    if (size < 5 || size > end - position || data[position + size - 1]) {
+        return EJSON_FALLBACK;
+    }
+    end = position + size - 1;
+    position += 4;
+    if (Py_EnterRecursiveCall(" while converting BSON to Extended JSON")) {
+        return -1;
+    }
+    _ejson_keys_init(&keys);
+    if (_ejson_write(buffer, is_array ? "[" : "{", 1)) {
+        goto error;
+    }
+    while (position < end) {
+        unsigned char type = (unsigned char)data[position++];
+        const char* name = data + position;
+        const char* name_end = memchr(name, 0, end - position);
+        if (!name_end) {
+            status = EJSON_FALLBACK;
+            goto done;
+        }
+        if (!first && EJSON_WRITE_LITERAL(buffer, ", ")) {
+            goto error;
+        }
+        first = 0;
+        if (!is_array) {
+            if (check_dbref && name_end - name == 4 && !memcmp(name, "$ref", 4)) {
+                status = EJSON_FALLBACK;
+                goto done;
+            }
+            if ((status = _ejson_keys_add(&keys, data, name - data, name_end - name))) {
+                goto done;
+            }
+            if ((status = _ejson_write_string(buffer, name, name_end - name))) {
+                goto done;
+            }
+            if (EJSON_WRITE_LITERAL(buffer, ": ")) {
+                goto error;
+            }
+        }
+        position = name_end + 1 - data;
+        if ((status = _ejson_write_value(writer, type, data, &position, end))) {
+            goto done;
+        }
+    }
+    if (position != end) {
+        status = EJSON_FALLBACK;
+        goto done;
+    }
+    if (_ejson_write(buffer, is_array ? "]" : "}", 1)) {
+        goto error;
+    }
+done:
+    _ejson_keys_free(&keys);
+    Py_LeaveRecursiveCall();
+    return status;
+error:
+    status = -1;
+    goto done;
+}
+
+static PyObject* _cbson_bson_to_json(PyObject* self, PyObject* args) {
+    PyObject* bson;
+    PyObject* result = NULL;
+    Py_buffer view;
+    ejson_writer_t writer;
+    int status;
+
+    if (!PyArg_ParseTuple(args, "Opi", &bson, &writer.canonical,
+                          &writer.datetime_conversion)) {
+        return NULL;
+    }
+    if (!_get_buffer(bson, &view)) {
+        return NULL;
+    }
+    writer.module = self;
+    if (!(writer.buffer = pymongo_buffer_new())) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    if (view.len < 5 || _ejson_read_int32(view.buf) != view.len) {
+        status = EJSON_FALLBACK;
+    } else {
+        status = _ejson_write_document(&writer, view.buf, 0, view.len, 0, 0);
+    }
+    if (status == 0) {
+        result = PyUnicode_DecodeASCII(pymongo_buffer_get_buffer(writer.buffer),
+                                       pymongo_buffer_get_position(writer.buffer),
+                                       "strict");
+    } else if (status == EJSON_FALLBACK) {
+        result = Py_None;
+        Py_INCREF(result);
+    }
+    pymongo_buffer_free(writer.buffer);
+    PyBuffer_Release(&view);
+    return result;
+}
+
+typedef struct {
+    PyObject* module;
+    buffer_t buffer;
+    const char* position;
+    const char* end;
+    /* Whether dates outside of the range of datetime are left to the Python
+     * implementation, which raises or clamps them. */
+    int check_datetime_range;
+} ejson_reader_t;
+
+/* The keys that json_util recognizes as type wrappers. */
+enum {
+    EJSON_KEY_NONE,
+    EJSON_KEY_UNSUPPORTED,
+    EJSON_KEY_OID,
+    EJSON_KEY_DATE,
+    EJSON_KEY_NUMBER_INT,
+    EJSON_KEY_NUMBER_LONG,
+    EJSON_KEY_NUMBER_DOUBLE,
+    EJSON_KEY_NUMBER_DECIMAL,
+    EJSON_KEY_BINARY,
+    EJSON_KEY_CODE,
+    EJSON_KEY_TIMESTAMP,
+    EJSON_KEY_REGULAR_EXPRESSION,
+    EJSON_KEY_SYMBOL,
+    EJSON_KEY_MIN_KEY,
+    EJSON_KEY_MAX_KEY,
+    EJSON_KEY_UNDEFINED
+};
+
+static const struct {
+    const char* name;
+    int key;
+} _ejson_wrapper_keys[] = {
+    {"$oid", EJSON_KEY_OID},
+    {"$date", EJSON_KEY_DATE},
+    {"$numberInt", EJSON_KEY_NUMBER_INT},
+    {"$numberLong", EJSON_KEY_NUMBER_LONG},
+    {"$numberDouble", EJSON_KEY_NUMBER_DOUBLE},
+    {"$numberDecimal", EJSON_KEY_NUMBER_DECIMAL},
+    {"$binary", EJSON_KEY_BINARY},
+    {"$code", EJSON_KEY_CODE},
+    {"$timestamp", EJSON_KEY_TIMESTAMP},
+    {"$regularExpression", EJSON_KEY_REGULAR_EXPRESSION},
+    {"$symbol", EJSON_KEY_SYMBOL},
+    {"$minKey", EJSON_KEY_MIN_KEY},
+    {"$maxKey", EJSON_KEY_MAX_KEY},
+    {"$undefined", EJSON_KEY_UNDEFINED},
+    /* DBRefs and legacy Extended JSON. */
+    {"$ref", EJSON_KEY_UNSUPPORTED},
+    {"$regex", EJSON_KEY_UNSUPPORTED},
+    {"$uuid", EJSON_KEY_UNSUPPORTED},
+    {"$dbPointer", EJSON_KEY_UNSUPPORTED},
+    {NULL, EJSON_KEY_NONE}
+};
+
+static int _ejson_wrapper_key(const char* key, int size) {
+    int i;
+    if (!size || key[0] != '$') {
+        return EJSON_KEY_NONE;
+    }
+    for (i = 0; _ejson_wrapper_keys[i].name; i++) {
+        const char* name = _ejson_wrapper_keys[i].name;
+        if ((size_t)size == strlen(name) && !memcmp(key, name, size)) {
+            return _ejson_wrapper_keys[i].key;
+        }
+    }
+    return EJSON_KEY_NONE;
+}
+
+static void _ejson_skip_whitespace(ejson_reader_t* reader) {
+    while (reader->position < reader->end &&
+           (*reader->position == ' ' || *reader->position == '\t' ||
+            *reader->position == '\n' || *reader->position == '\r')) {
+        reader->position++;
+    }
+}
+
+/* Skip whitespace and consume `c`. */
+static int _ejson_expect(ejson_reader_t* reader, char c) {
+    _ejson_skip_whitespace(reader);
+    if (reader->position < reader->end && *reader->position == c) {
+        reader->position++;
+        return 0;
+    }
+    return EJSON_FALLBACK;
+}
+
+/* Skip whitespace and consume `literal` if it is next. */
+static int _ejson_accept(ejson_reader_t* reader, const char* literal) {
+    size_t length = strlen(literal);
+    _ejson_skip_whitespace(reader);
+    if ((size_t)(reader->end - reader->position) >= length &&
+        !memcmp(reader->position, literal, length)) {
+        reader->position += length;
+        return 1;
+    }
+    return 0;
+}
+
+static int _ejson_write_utf8(buffer_t buffer, uint32_t code_point) {
+    char utf8[4];
+    int length;
+    if (code_point < 0x80) {
+        utf8[0] = (char)code_point;
+        length = 1;
+    } else if (code_point < 0x800) {
+        utf8[0] = (char)(0xC0 | (code_point >> 6));
+        utf8[1] = (char)(0x80 | (code_point & 0x3F));
+        length = 2;
+    } else if (code_point < 0x10000) {
+        utf8[0] = (char)(0xE0 | (code_point >> 12));
+        utf8[1] = (char)(0x80 | ((code_point >> 6) & 0x3F));
+        utf8[2] = (char)(0x80 | (code_point & 0x3F));
+        length = 3;
+    } else {
+        utf8[0] = (char)(0xF0 | (code_point >> 18));
+        utf8[1] = (char)(0x80 | ((code_point >> 12) & 0x3F));
+        utf8[2] = (char)(0x80 | ((code_point >> 6) & 0x3F));
+        utf8[3] = (char)(0x80 | (code_point & 0x3F));
+        length = 4;
+    }
+    return _ejson_write(buffer, utf8, length);
+}
+
+static int _ejson_read_hex4(const char* data, uint32_t* value) {
+    int i;
+    *value = 0;
+    for (i = 0; i < 4; i++) {
+        char c = data[i];
+        *value <<= 4;
+        if (c >= '0' && c <= '9') {
+            *value |= (uint32_t)(c - '0');
+        } else if (c >= 'a' && c <= 'f') {
+            *value |= (uint32_t)(c - 'a' + 10);
+        } else if (c >= 'A' && c <= 'F') {
+            *value |= (uint32_t)(c - 'A' + 10);
+        } else {
+            return EJSON_FALLBACK;
+        }
+    }
+    return 0;
+}
+
+/* Skip whitespace and unescape the JSON string that follows into the buffer,
+ * setting `size` to the number of UTF-8 bytes written. */
+static int _ejson_read_string(ejson_reader_t* reader, int* size) {
+    const char* p;
+    const char* run;
+    int start = pymongo_buffer_get_position(reader->buffer);
+    _ejson_skip_whitespace(reader);
+    if (reader->position >= reader->end || *reader->position != '"') {
+        return EJSON_FALLBACK;
+    }
+    p = run = reader->position + 1;
+    while (1) {
+        unsigned char c;
+        if (p >= reader->end) {
+            return EJSON_FALLBACK;
+        }
+        c = (unsigned char)*p;
+        if (c == '"' || c == '\\') {
+            if (_ejson_write(reader->buffer, run, p - run)) {
+                return -1;
+            }
+            if (c == '"') {
+                break;
+            }
+            if (reader->end - p < 2) {
+                return EJSON_FALLBACK;
+            }
+            switch (p[1]) {
+            case '"':
+            case '\\':
+            case '/':
+                if (_ejson_write(reader->buffer, p + 1, 1)) {
+                    return -1;
+                }
+                p += 2;
+                break;
+            case 'b':
+            case 'f':
+            case 'n':
+            case 'r':
+            case 't': {
+                char escaped = p[1] == 'b' ? '\b' : p[1] == 'f' ? '\f' :
+                               p[1] == 'n' ? '\n' : p[1] == 'r' ? '\r' : '\t';
+                if (_ejson_write(reader->buffer, &escaped, 1)) {
+                    return -1;
+                }
+                p += 2;
+                break;
+            }
+            case 'u': {
+                uint32_t code_point, low;
+                if (reader->end - p < 6 || _ejson_read_hex4(p + 2, &code_point)) {
+                    return EJSON_FALLBACK;
+                }
+                p += 6;
+                if (code_point >= 0xD800 && code_point <= 0xDBFF) {
+                    /* Only complete surrogate pairs can be encoded to UTF-8. */
+                    if (reader->end - p < 6 || p[0] != '\\' || p[1] != 'u' ||
+                        _ejson_read_hex4(p + 2, &low) || low < 0xDC00 || low > 0xDFFF) {
+                        return EJSON_FALLBACK;
+                    }
+                    code_point = 0x10000 + ((code_point - 0xD800) << 10) + (low - 0xDC00);
+                    p += 6;
+                } else if (code_point >= 0xDC00 && code_point <= 0xDFFF) {
+                    return EJSON_FALLBACK;
+                }
+                if (_ejson_write_utf8(reader->buffer, code_point)) {
+                    return -1;
+                }
+                break;
+            }
+            default:
+                return EJSON_FALLBACK;
+            }
+            run = p;
+        } else if (c < 0x20) {
+            /* json.loads rejects control characters in strings. */
+            return EJSON_FALLBACK;
+        } else if (c >= 0x80) {
+            uint32_t code_point;
+            int length = _ejson_utf8_decode((const unsigned char*)p, reader->end - p,
+                                            &code_point);
+            if (!length) {
+                return EJSON_FALLBACK;
+            }
+            p += length;
+        } else {
+            p++;
+        }
+    }
+    reader->position = p + 1;
+    *size = pymongo_buffer_get_position(reader->buffer) - start;
+    return 0;
+}
+
+/* Parse a decimal integer string like int() does, without the sign,
+ * whitespace and underscores that only the Python implementation accepts. */
+static int _ejson_parse_int64(const char* data, Py_ssize_t size, int64_t* value) {
+    uint64_t magnitude = 0;
+    uint64_t limit = (uint64_t)INT64_MAX;
+    int negative = 0;
+    Py_ssize_t i = 0;
+    if (size && data[0] == '-') {
+        negative = 1;
+        limit += 1;
+        i = 1;
+    }
+    if (i == size) {
+        return EJSON_FALLBACK;
+    }
+    for (; i < size; i++) {
+        unsigned digit;
+        if (data[i] < '0' || data[i] > '9') {
+            return EJSON_FALLBACK;
+        }
+        digit = (unsigned)(data[i] - '0');
+        if (magnitude > (limit - digit) / 10) {
+            return EJSON_FALLBACK;
+        }
+        magnitude = magnitude * 10 + digit;
+    }
+    if (negative) {
+        *value = magnitude ? -(int64_t)(magnitude - 1) - 1 : 0;
+    } else {
+        *value = (int64_t)magnitude;
+    }
+    return 0;
+}
+
+/* Convert `size` bytes of text to a double like float() does. */
+static int _ejson_parse_double(const char* data, Py_ssize_t size, double* value) {
+    char number[64];
+    char* end;
+    if (size == 0 || size >= (Py_ssize_t)sizeof(number)) {
+        return EJSON_FALLBACK;
+    }
+    memcpy(number, data, size);
+    number[size] = '\0';
+    *value = PyOS_string_to_double(number, &end, NULL);
+    if (*value == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return EJSON_FALLBACK;
+    }
+    return end == number + size ? 0 : EJSON_FALLBACK;
+}
+
+/* Read a JSON number, setting `is_integer` when it has neither a fraction
+ * nor an exponent. */
+static int _ejson_read_number(ejson_reader_t* reader, int* is_integer,
+                              int64_t* integer, double* number) {
+    const char* start;
+    const char* p;
+    _ejson_skip_whitespace(reader);
+    start = p = reader->position;
+    *is_integer = 1;
+    if (p < reader->end && *p == '-') {
+        p++;
+    }
+    if (p >= reader->end || *p < '0' || *p > '9') {
+        return EJSON_FALLBACK;
+    }
+    if (*p == '0') {
+        p++;
+    } else {
+        while (p < reader->end && *p >= '0' && *p <= '9') {
+            p++;
+        }
+    }
+    if (p < reader->end && *p == '.') {
+        p++;
+        if (p >= reader->end || *p < '0' || *p > '9') {
+            return EJSON_FALLBACK;
+        }
+        while (p < reader->end && *p >= '0' && *p <= '9') {
+            p++;
+        }
+        *is_integer = 0;
+    }
+    if (p < reader->end && (*p == 'e' || *p == 'E')) {
+        p++;
+        if (p < reader->end && (*p == '+' || *p == '-')) {
+            p++;
+        }
+        if (p >= reader->end || *p < '0' || *p > '9') {
+            return EJSON_FALLBACK;
+        }
+        while (p < reader->end && *p >= '0' && *p <= '9') {
+            p++;
+        }
+        *is_integer = 0;
+    }
+    reader->position = p;
+    if (*is_integer) {
+        /* Integers that do not fit in 64 bits cannot be encoded. */
+        return _ejson_parse_int64(start, p - start, integer);
+    }
+    return _ejson_parse_double(start, p - start, number);
+}
+
+/* Read a JSON string into the end of the buffer without keeping it there.
+ * `*string` is valid until the next write to the buffer. */
+static int _ejson_read_scratch_string(ejson_reader_t* reader, const char** string,
+                                      int* size) {
+    int start = pymongo_buffer_get_position(reader->buffer);
+    int status = _ejson_read_string(reader, size);
+    if (status) {
+        return status;
+    }
+    *string = pymongo_buffer_get_buffer(reader->buffer) + start;
+    pymongo_buffer_update_position(reader->buffer, start);
+    return 0;
+}
+
+/* Read an object key and the colon that follows it, returning the key in
+ * the same way as _ejson_read_scratch_string. */
+static int _ejson_read_key(ejson_reader_t* reader, const char** key, int* size) {
+    int status = _ejson_read_scratch_string(reader, key, size);
+    if (status) {
+        return status;
+    }
+    return _ejson_expect(reader, ':');
+}
+
+static int _ejson_key_equals(const char* key, int size, const char* name) {
+    return (size_t)size == strlen(name) && !memcmp(key, name, size);
+}
+
+/* Convert an ISO-8601 date like json_util does. Only the formats that
+ * json_util writes are handled here. */
+static int _ejson_parse_iso_date(const char* s, Py_ssize_t size, int64_t* millis) {
+    static const unsigned days_in_month[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+    static const char pattern[] = "dddd-dd-ddTdd:dd:dd";
+    unsigned year, month, day, hour, minute, second;
+    int64_t microsecond = 0;
+    int64_t offset = 0;
+    Py_ssize_t i;
+    if (size < 19) {
+        return EJSON_FALLBACK;
+    }
+    for (i = 0; i < 19; i++) {
+        if (pattern[i] == 'd' ? (s[i] < '0' || s[i] > '9') : s[i] != pattern[i]) {
+            return EJSON_FALLBACK;
+        }
+    }
+#define EJSON_DIGITS2(p) ((unsigned)((p)[0] - '0') * 10 + (unsigned)((p)[1] - '0'))
+    year = EJSON_DIGITS2(s) * 100 + EJSON_DIGITS2(s + 2);
+    month = EJSON_DIGITS2(s + 5);
+    day = EJSON_DIGITS2(s + 8);
+    hour = EJSON_DIGITS2(s + 11);
+    minute = EJSON_DIGITS2(s + 14);
+    second = EJSON_DIGITS2(s + 17);
+    if (year < 1 || month < 1 || month > 12 || day < 1 || hour > 23 || minute > 59 ||
+        second > 59) {
+        return EJSON_FALLBACK;
+    }
+    if (day > days_in_month[month - 1] + (month == 2 && year % 4 == 0 &&
+                                          (year % 100 != 0 || year % 400 == 0))) {
+        return EJSON_FALLBACK;
+    }
+    i = 19;
+    if (i < size && s[i] == '.') {
+        /* Match json_util's int(float(fraction) * 1000000). */
+        Py_ssize_t start = i++;
+        double fraction;
+        while (i < size && s[i] >= '0' && s[i] <= '9') {
+            i++;
+        }
+        if (i == start + 1 || _ejson_parse_double(s + start, i - start, &fraction)) {
+            return EJSON_FALLBACK;
+        }
+        microsecond = (int64_t)(fraction * 1000000);
+        if (microsecond > 999999) {
+            return EJSON_FALLBACK;
+        }
+    }
+    if (i < size && s[i] == 'Z') {
+        i++;
+    } else if (i < size && (s[i] == '+' || s[i] == '-')) {
+        Py_ssize_t remaining = size - i - 1;
+        const char* p = s + i + 1;
+        int j;
+        for (j = 0; j < remaining; j++) {
+            if (!(j == 2 && remaining == 5 ? p[j] == ':' : (p[j] >= '0' && p[j] <= '9'))) {
+                return EJSON_FALLBACK;
+            }
+        }
+        if (remaining == 2) {
+            offset = EJSON_DIGITS2(p) * 3600;
+        } else if (remaining == 4) {
+            offset = EJSON_DIGITS2(p) * 3600 + EJSON_DIGITS2(p + 2) * 60;
+        } else if (remaining == 5) {
+            offset = EJSON_DIGITS2(p) * 3600 + EJSON_DIGITS2(p + 3) * 60;
+        } else {
+            return EJSON_FALLBACK;
+        }
+        if (s[i] == '-') {
+            offset = -offset;
+        }
+        i = size;
+    }
+#undef EJSON_DIGITS2
+    if (i != size) {
+        return EJSON_FALLBACK;
+    }
+    *millis = (_ejson_days_from_civil(year, month, day) * 86400 + hour * 3600 +
+               minute * 60 + second - offset) * 1000 + microsecond / 1000;
+    return 0;
+}
+
+static int _ejson_read_value(ejson_reader_t* reader, unsigned char* type);
+static int _ejson_read_document(ejson_reader_t* reader, int top_level);
+
+static int _ejson_write_int32_at(buffer_t buffer, int position, int64_t value) {
+    if (value > INT32_MAX) {
+        PyErr_SetString(PyExc_ValueError, "Document would overflow BSON size limit");
+        return -1;
+    }
+    buffer_write_int32_at_position(buffer, position, (int32_t)value);
+    return 0;
+}
+
+/* Read a JSON string and write it as a BSON string. */
+static int _ejson_read_json_string(ejson_reader_t* reader) {
+    int size;
+    int status;
+    int length_position = pymongo_buffer_save_space(reader->buffer, 4);
+    if (length_position == -1) {
+        return -1;
+    }
+    if ((status = _ejson_read_string(reader, &size))) {
+        return status;
+    }
+    if (_ejson_write(reader->buffer, "", 1)) {
+        return -1;
+    }
+    return _ejson_write_int32_at(reader->buffer, length_position, (int64_t)size + 1);
+}
+
+static int _ejson_write_integer(buffer_t buffer, int64_t value, unsigned char* type) {
+    if (value >= INT32_MIN && value <= INT32_MAX) {
+        *type = 0x10;
+        return buffer_write_int32(buffer, (int32_t)value) ? 0 : -1;
+    }
+    *type = 0x12;
+    return buffer_write_int64(buffer, value) ? 0 : -1;
+}
+
+static int _ejson_check_date(ejson_reader_t* reader, int64_t millis) {
+    struct module_state *state = GETSTATE(reader->module);
+    if (!state) {
+        return -1;
+    }
+    if (reader->check_datetime_range &&
+        (millis < state->min_millis || millis > state->max_millis)) {
+        return EJSON_FALLBACK;
+    }
+    return 0;
+}
+
+static int _ejson_read_date(ejson_reader_t* reader) {
+    const char* string;
+    int size;
+    int status;
+    int64_t millis;
+    _ejson_skip_whitespace(reader);
+    if (reader->position >= reader->end) {
+        return EJSON_FALLBACK;
+    }
+    if (*reader->position == '"') {
+        if ((status = _ejson_read_scratch_string(reader, &string, &size)) ||
+            (status = _ejson_parse_iso_date(string, size, &millis))) {
+            return status;
+        }
+        /* The Python implementation raises OverflowError for these. */
+        reader->check_datetime_range++;
+        status = _ejson_check_date(reader, millis);
+        reader->check_datetime_range--;
+    } else if (*reader->position == '{') {
+        reader->position++;
+        if ((status = _ejson_read_key(reader, &string, &size))) {
+            return status;
+        }
+        if (!_ejson_key_equals(string, size, "$numberLong")) {
+            return EJSON_FALLBACK;
+        }
+        if ((status = _ejson_read_scratch_string(reader, &string, &size)) ||
+            (status = _ejson_parse_int64(string, size, &millis)) ||
+            (status = _ejson_expect(reader, '}')) ||
+            (status = _ejson_check_date(reader, millis))) {
+            return status;
+        }
+    } else {
+        int is_integer;
+        double number;
+        if ((status = _ejson_read_number(reader, &is_integer, &millis, &number))) {
+            return status;
+        }
+        if (!is_integer) {
+            return EJSON_FALLBACK;
+        }
+        status = _ejson_check_date(reader, millis);
+    }
+    if (status) {
+        return status;
+    }
+    return buffer_write_int64(reader->buffer, millis) ? 0 : -1;
+}
+
+static int _ejson_read_binary(ejson_reader_t* reader) {
+    buffer_t buffer = reader->buffer;
+    int header = pymongo_buffer_get_position(buffer);
+    int data_size = -1;
+    int subtype = -1;
+    int status;
+    int i, j;
+    char* out;
+    if ((status = _ejson_expect(reader, '{'))) {
+        return status;
+    }
+    /* Reserve space for the length, subtype and the length that the old
+     * binary subtype repeats, and decode the data in place after it. */
+    if (pymongo_buffer_save_space(buffer, 9) == -1) {
+        return -1;
+    }
+    for (i = 0; i < 2; i++) {
+        const char* key;
+        const char* string;
+        int size;
+        if (i && (status = _ejson_expect(reader, ','))) {
+            return status;
+        }
+        if ((status = _ejson_read_key(reader, &key, &size))) {
+            return status;
+        }
+        if (_ejson_key_equals(key, size, "base64") && data_size == -1) {
+            uint32_t n = 0;
+            int bits = 0;
+            int padding = 0;
+            int start = pymongo_buffer_get_position(buffer);
+            if ((status = _ejson_read_string(reader, &size))) {
+                return status;
+            }
+            if (size % 4) {
+                return EJSON_FALLBACK;
+            }
+            out = pymongo_buffer_get_buffer(buffer) + start;
+            data_size = 0;
+            for (j = 0; j < size; j++) {
+                char c = out[j];
+                const char* digit;
+                if (c == '=' && j >= size - 2) {
+                    padding++;
+                    continue;
+                }
+                if (padding || !c || !(digit = strchr(_ejson_base64_alphabet, c))) {
+                    return EJSON_FALLBACK;
+                }
+                n = (n << 6) | (uint32_t)(digit - _ejson_base64_alphabet);
+                bits += 6;
+                if (bits >= 8) {
+                    bits -= 8;
+                    out[data_size++] = (char)((n >> bits) & 0xFF);
+                }
+            }
+            pymongo_buffer_update_position(buffer, start + data_size);
+        } else if (_ejson_key_equals(key, size, "subType") && subtype == -1) {
+            if ((status = _ejson_read_scratch_string(reader, &string, &size))) {
+                return status;
+            }
+            if (size < 1 || size > 2) {
+                return EJSON_FALLBACK;
+            }
+            subtype = 0;
+            for (j = 0; j < size; j++) {
+                char c = string[j];
+                subtype <<= 4;
+                if (c >= '0' && c <= '9') {
+                    subtype |= c - '0';
+                } else if (c >= 'a' && c <= 'f') {
+                    subtype |= c - 'a' + 10;
+                } else if (c >= 'A' && c <= 'F') {
+                    subtype |= c - 'A' + 10;
+                } else {
+                    return EJSON_FALLBACK;
+                }
+            }
+        } else {
+            return EJSON_FALLBACK;
+        }
+    }
+    if ((status = _ejson_expect(reader, '}'))) {
+        return status;
+    }
+    out = pymongo_buffer_get_buffer(buffer) + header;
+    if (subtype == 2) {
+        buffer_write_int32_at_position(buffer, header, data_size + 4);
+        buffer_write_int32_at_position(buffer, header + 5, data_size);
+    } else {
+        memmove(out + 5, out + 9, data_size);
+        pymongo_buffer_update_position(buffer, header + 5 + data_size);
+        buffer_write_int32_at_position(buffer, header, data_size);
+    }
+    out[4] = (char)subtype;
+    return 0;
+}
+
+static int _ejson_read_oid(ejson_reader_t* reader) {
+    const char* string;
+    char oid[12];
+    int size;
+    int status;
+    int i;
+    if ((status = _ejson_read_scratch_string(reader, &string, &size))) {
+        return status;
+    }
+    if (size != 24) {
+        return EJSON_FALLBACK;
+    }
+    for (i = 0; i < 24; i++) {
+        char c = string[i];
+        int digit;
+        if (c >= '0' && c <= '9') {
+            digit = c - '0';
+        } else if (c >= 'a' && c <= 'f') {
+            digit = c - 'a' + 10;
+        } else if (c >= 'A' && c <= 'F') {
+            digit = c - 'A' + 10;
+        } else {
+            return EJSON_FALLBACK;
+        }
+        if (i % 2) {
+            oid[i / 2] |= (char)digit;
+        } else {
+            oid[i / 2] = (char)(digit << 4);
+        }
+    }
+    return _ejson_write(reader->buffer, oid, 12);
+}
+
+static int _ejson_read_decimal128(ejson_reader_t* reader) {
+    struct module_state *state = GETSTATE(reader->module);
+    const char* string;
+    PyObject* decimal;
+    PyObject* bid;
+    int size;
+    int status;
+    if (!state) {
+        return -1;
+    }
+    if ((status = _ejson_read_scratch_string(reader, &string, &size))) {
+        return status;
+    }
+    decimal = PyObject_CallFunction(state->Decimal128, "s#", string, (Py_ssize_t)size);
+    if (!decimal) {
+        /* Let the Python implementation raise the error. */
+        PyErr_Clear();
+        return EJSON_FALLBACK;
+    }
+    bid = PyObject_GetAttrString(decimal, "bid");
+    Py_DECREF(decimal);
+    if (!bid) {
+        return -1;
+    }
+    if (!PyBytes_Check(bid) || PyBytes_GET_SIZE(bid) != 16) {
+        Py_DECREF(bid);
+        PyErr_SetString(PyExc_TypeError, "Decimal128.bid must be 16 bytes");
+        return -1;
+    }
+    status = _ejson_write(reader->buffer, PyBytes_AS_STRING(bid), 16);
+    Py_DECREF(bid);
+    return status;
+}
+
+/* Read the rest of a {"$code": ..., "$scope": ...} wrapper after "$code". */
+static int _ejson_read_code(ejson_reader_t* reader, unsigned char* type) {
+    buffer_t buffer = reader->buffer;
+    const char* key;
+    unsigned char scope_type;
+    int size;
+    int status;
+    int start = pymongo_buffer_save_space(buffer, 4);
+    if (start == -1) {
+        return -1;
+    }
+    if ((status = _ejson_read_json_string(reader))) {
+        return status;
+    }
+    _ejson_skip_whitespace(reader);
+    if (reader->position < reader->end && *reader->position == ',') {
+        reader->position++;
+        if ((status = _ejson_read_key(reader, &key, &size))) {
+            return status;
+        }
+        if (!_ejson_key_equals(key, size, "$scope")) {
+            return EJSON_FALLBACK;
+        }
+        if ((status = _ejson_read_value(reader, &scope_type))) {
+            return status;
+        }
+        if (scope_type != 0x03) {
+            return EJSON_FALLBACK;
+        }
+        *type = 0x0F;
+        return _ejson_write_int32_at(
+            buffer, start, (int64_t)pymongo_buffer_get_position(buffer) - start);
+    }
+    /* Drop the space reserved for the size of a code with scope. */
+    size = pymongo_buffer_get_position(buffer) - start - 4;
+    memmove(pymongo_buffer_get_buffer(buffer) + start,
+            pymongo_buffer_get_buffer(buffer) + start + 4, size);
+    pymongo_buffer_update_position(buffer, start + size);
+    *type = 0x0D;
+    return 0;
+}
+
+static int _ejson_read_uint32(ejson_reader_t* reader, uint32_t* value) {
+    int is_integer;
+    int64_t integer;
+    double number;
+    int status = _ejson_read_number(reader, &is_integer, &integer, &number);
+    if (status) {
+        return status;
+    }
+    if (!is_integer || integer < 0 || integer > (int64_t)UINT32_MAX) {
+        return EJSON_FALLBACK;
+    }
+    *value = (uint32_t)integer;
+    return 0;
+}
+
+static int _ejson_read_timestamp(ejson_reader_t* reader) {
+    uint32_t time = 0;
+    uint32_t increment = 0;
+    int seen_time = 0;
+    int seen_increment = 0;
+    int status;
+    int i;
+    if ((status = _ejson_expect(reader, '{'))) {
+        return status;
+    }
+    for (i = 0; i < 2; i++) {
+        const char* key;
+        int size;
+        if (i && (status = _ejson_expect(reader, ','))) {
+            return status;
+        }
+        if ((status = _ejson_read_key(reader, &key, &size))) {
+            return status;
+        }
+        if (_ejson_key_equals(key, size, "t") && !seen_time) {
+            seen_time = 1;
+            status = _ejson_read_uint32(reader, &time);
+        } else if (_ejson_key_equals(key, size, "i") && !seen_increment) {
+            seen_increment = 1;
+            status = _ejson_read_uint32(reader, &increment);
+        } else {
+            status = EJSON_FALLBACK;
+        }
+        if (status) {
+            return status;
+        }
+    }
+    if ((status = _ejson_expect(reader, '}'))) {
+        return status;
+    }
+    /* BSON stores the increment before the time. */
+    if (!buffer_write_int32(reader->buffer, (int32_t)increment) ||
+        !buffer_write_int32(reader->buffer, (int32_t)time)) {
+        return -1;
+    }
+    return 0;
+}
+
+static int _ejson_read_regex(ejson_reader_t* reader) {
+    /* Regex keeps the options that it supports, which BSON stores in this
+     * order. */
+    static const char supported[] = "ilmsux";
+    buffer_t buffer = reader->buffer;
+    char flags[sizeof(supported)];
+    int seen_pattern = 0;
+    int seen_options = 0;
+    int length = 0;
+    int status;
+    int i;
+    if ((status = _ejson_expect(reader, '{'))) {
+        return status;
+    }
+    for (i = 0; i < 2; i++) {
+        const char* key;
+        int size;
+        if (i && (status = _ejson_expect(reader, ','))) {
+            return status;
+        }
+        if ((status = _ejson_read_key(reader, &key, &size))) {
+            return status;
+        }
+        if (_ejson_key_equals(key, size, "pattern") && !seen_pattern) {
+            int start = pymongo_buffer_get_position(buffer);
+            seen_pattern = 1;
+            if ((status = _ejson_read_string(reader, &size))) {
+                return status;
+            }
+            if (memchr(pymongo_buffer_get_buffer(buffer) + start, 0, size)) {
+                return EJSON_FALLBACK;
+            }
+            if (_ejson_write(buffer, "", 1)) {
+                return -1;
+            }
+        } else if (_ejson_key_equals(key, size, "options") && !seen_options) {
+            const char* options;
+            int j;
+            seen_options = 1;
+            if ((status = _ejson_read_scratch_string(reader, &options, &size))) {
+                return status;
+            }
+            for (j = 0; supported[j]; j++) {
+                if (memchr(options, supported[j], size)) {
+                    flags[length++] = supported[j];
+                }
+            }
+        } else {
+            return EJSON_FALLBACK;
+        }
+    }
+    if ((status = _ejson_expect(reader, '}'))) {
+        return status;
+    }
+    flags[length++] = '\0';
+    return _ejson_write(buffer, flags, length);
+}
+
+/* Read the value of the type wrapper `key`, whose key and colon have been
+ * read, up to and including the closing brace of the wrapper. */
+static int _ejson_read_wrapper(ejson_reader_t* reader, int key, unsigned char* type) {
+    buffer_t buffer = reader->buffer;
+    const char* string;
+    int size;
+    int status;
+    switch (key) {
+    case EJSON_KEY_OID:
+        *type = 0x07;
+        status = _ejson_read_oid(reader);
+        break;
+    case EJSON_KEY_DATE:
+        *type = 0x09;
+        status = _ejson_read_date(reader);
+        break;
+    case EJSON_KEY_NUMBER_INT:
+    case EJSON_KEY_NUMBER_LONG: {
+        int64_t value;
+        if ((status = _ejson_read_scratch_string(reader, &string, &size)) ||
+            (status = _ejson_parse_int64(string, size, &value))) {
+            return status;
+        }
+        if (key == EJSON_KEY_NUMBER_INT) {
+            status = _ejson_write_integer(buffer, value, type);
+        } else {
+            *type = 0x12;
+            status = buffer_write_int64(buffer, value) ? 0 : -1;
+        }
+        break;
+    }
+    case EJSON_KEY_NUMBER_DOUBLE: {
+        double value;
+        if ((status = _ejson_read_scratch_string(reader, &string, &size)) ||
+            (status = _ejson_parse_double(string, size, &value))) {
+            return status;
+        }
+        *type = 0x01;
+        status = buffer_write_double(buffer, value) ? 0 : -1;
+        break;
+    }
+    case EJSON_KEY_NUMBER_DECIMAL:
+        *type = 0x13;
+        status = _ejson_read_decimal128(reader);
+        break;
+    case EJSON_KEY_BINARY:
+        *type = 0x05;
+        status = _ejson_read_binary(reader);
+        break;
+    case EJSON_KEY_CODE:
+        status = _ejson_read_code(reader, type);
+        break;
+    case EJSON_KEY_TIMESTAMP:
+        *type = 0x11;
+        status = _ejson_read_timestamp(reader);
+        break;
+    case EJSON_KEY_REGULAR_EXPRESSION:
+        *type = 0x0B;
+        status = _ejson_read_regex(reader);
+        break;
+    case EJSON_KEY_SYMBOL:
+        /* Symbols are decoded to str. */
+        *type = 0x02;
+        status = _ejson_read_json_string(reader);
+        break;
+    case EJSON_KEY_MIN_KEY:
+    case EJSON_KEY_MAX_KEY: {
+        int is_integer;
+        int64_t value;
+        double number;
+        if ((status = _ejson_read_number(reader, &is_integer, &value, &number))) {
+            return status;
+        }
+        if (!is_integer || value != 1) {
+            return EJSON_FALLBACK;
+        }
+        *type = key == EJSON_KEY_MIN_KEY ? 0xFF : 0x7F;
+        break;
+    }
+    case EJSON_KEY_UNDEFINED:
+        /* Undefined is decoded to None. */
+        if (!_ejson_accept(reader, "true")) {
+            return EJSON_FALLBACK;
+        }
+        *type = 0x0A;
+        status = 0;
+        break;
+    default:
+        return EJSON_FALLBACK;
+    }
+    if (status) {
+        return status;
+    }
+    return _ejson_expect(reader, '}');
+}
+
+static int _ejson_read_array(ejson_reader_t* reader) {
+    buffer_t buffer = reader->buffer;
+    int start;
+    long long index = 0;
+    int status = 0;
+    if ((status = _ejson_expect(reader, '['))) {
+        return status;
+    }
+    if ((start = pymongo_buffer_save_space(buffer, 4)) == -1) {
+        return -1;
+    }
+    if (Py_EnterRecursiveCall(" while converting Extended JSON to BSON")) {
+        return -1;
+    }
+    _ejson_skip_whitespace(reader);
+    if (reader->position < reader->end && *reader->position == ']') {
+        reader->position++;
+    } else {
+        while (1) {
+            char name[BUF_SIZE];
+            unsigned char type;
+            int type_position = pymongo_buffer_save_space(buffer, 1);
+            if (type_position == -1 || LL2STR(name, index) == -1 ||
+                _ejson_write(buffer, name, (Py_ssize_t)strlen(name) + 1)) {
+                status = -1;
+                goto done;
+            }
+            if ((status = _ejson_read_value(reader, &type))) {
+                goto done;
+            }
+            pymongo_buffer_get_buffer(buffer)[type_position] = (char)type;
+            index++;
+            _ejson_skip_whitespace(reader);
+            if (reader->position < reader->end && *reader->position == ',') {
+                reader->position++;
+            } else if (reader->position < reader->end && *reader->position == ']') {
+                reader->position++;
+                break;
+            } else {
+                status = EJSON_FALLBACK;
+                goto done;
+            }
+        }
+    }
+    if (_ejson_write(buffer, "", 1) ||
+        _ejson_write_int32_at(buffer, start,
+                              (int64_t)pymongo_buffer_get_position(buffer) - start)) {
+        status = -1;
+    }
+done:
+    Py_LeaveRecursiveCall();
+    return status;
+}
+
+/* Move the "_id" element between `id_start` and `id_end` in front of the
+ * elements that start at `first`, like encoding a top-level document does. */
+static int _ejson_move_id_first(buffer_t buffer, int first, int id_start, int id_end) {
+    char* data = pymongo_buffer_get_buffer(buffer);
+    char* id = PyMem_Malloc(id_end - id_start);
+    if (!id) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    memcpy(id, data + id_start, id_end - id_start);
+    memmove(data + first + (id_end - id_start), data + first, id_start - first);
+    memcpy(data + first, id, id_end - id_start);
+    PyMem_Free(id);
+    return 0;
+}
+
+static int _ejson_read_document(ejson_reader_t* reader, int top_level) {
+    buffer_t buffer = reader->buffer;
+    int start;
+    int id_start = -1;
+    int id_end = -1;
+    int status = 0;
+    ejson_keys_t keys;
+    if ((status = _ejson_expect(reader, '{'))) {
+        return status;
+    }
+    if ((start = pymongo_buffer_save_space(buffer, 4)) == -1) {
+        return -1;
+    }
+    if (Py_EnterRecursiveCall(" while converting Extended JSON to BSON")) {
+        return -1;
+    }
+    _ejson_keys_init(&keys);
+    _ejson_skip_whitespace(reader);
+    if (reader->position < reader->end && *reader->position == '}') {
+        reader->position++;
+    } else {
+        while (1) {
+            unsigned char type;
+            const char* key;
+            int size;
+            int type_position = pymongo_buffer_save_space(buffer, 1);
+            if (type_position == -1) {
+                status = -1;
+                goto done;
+            }
+            if ((status = _ejson_read_string(reader, &size))) {
+                goto done;
+            }
+            key = pymongo_buffer_get_buffer(buffer) + type_position + 1;
+            /* Keys of type wrappers are only handled as the first key. */
+            if (memchr(key, 0, size) || _ejson_wrapper_key(key, size) != EJSON_KEY_NONE) {
+                status = EJSON_FALLBACK;
+                goto done;
+            }
+            if ((status = _ejson_keys_add(&keys, pymongo_buffer_get_buffer(buffer),
+                                          type_position + 1, size))) {
+                goto done;
+            }
+            if (top_level && _ejson_key_equals(key, size, "_id")) {
+                id_start = type_position;
+            }
+            if (_ejson_write(buffer, "", 1)) {
+                status = -1;
+                goto done;
+            }
+            if ((status = _ejson_expect(reader, ':')) ||
+                (status = _ejson_read_value(reader, &type))) {
+                goto done;
+            }
+            pymongo_buffer_get_buffer(buffer)[type_position] = (char)type;
+            if (id_start == type_position) {
+                id_end = pymongo_buffer_get_position(buffer);
+            }
+            _ejson_skip_whitespace(reader);
+            if (reader->position < reader->end && *reader->position == ',') {
+                reader->position++;
+            } else if (reader->position < reader->end && *reader->position == '}') {
+                reader->position++;
+                break;
+            } else {
+                status = EJSON_FALLBACK;
+                goto done;
+            }
+        }
+    }
+    if (id_start > start + 4 &&
+        _ejson_move_id_first(buffer, start + 4, id_start, id_end)) {
+        status = -1;
+        goto done;
+    }
+    if (_ejson_write(buffer, "", 1) ||
+        _ejson_write_int32_at(buffer, start,
+                              (int64_t)pymongo_buffer_get_position(buffer) - start)) {
+        status = -1;
+    }
+done:
+    _ejson_keys_free(&keys);
+    Py_LeaveRecursiveCall();
+    return status;
+}
+
+/* Read an object, which is either a type wrapper or a document. */
+static int _ejson_read_object(ejson_reader_t* reader, unsigned char* type) {
+    const char* start = reader->position;
+    const char* key;
+    int size;
+    int status;
+    int wrapper;
+    if ((status = _ejson_expect(reader, '{'))) {
+        return status;
+    }
+    _ejson_skip_whitespace(reader);
+    if (reader->position < reader->end && *reader->position != '}') {
+        if ((status = _ejson_read_key(reader, &key, &size))) {
+            return status;
+        }
+        wrapper = _ejson_wrapper_key(key, size);
+        if (wrapper == EJSON_KEY_UNSUPPORTED) {
+            return EJSON_FALLBACK;
+        }
+        if (wrapper != EJSON_KEY_NONE) {
+            return _ejson_read_wrapper(reader, wrapper, type);
+        }
+    }
+    reader->position = start;
+    *type = 0x03;
+    return _ejson_read_document(reader, 0);
+}
+
+static int _ejson_read_value(ejson_reader_t* reader, unsigned char* type) {
+    buffer_t buffer = reader->buffer;
+    _ejson_skip_whitespace(reader);
+    if (reader->position >= reader->end) {
+        return EJSON_FALLBACK;
+    }
+    switch (*reader->position) {
+    case '"':
+        *type = 0x02;
+        return _ejson_read_json_string(reader);
+    case '{':
+        return _ejson_read_object(reader, type);
+    case '[':
+        *type = 0x04;
+        return _ejson_read_array(reader);
+    case 't':
+    case 'f':
+        *type = 0x08;
+        if (_ejson_accept(reader, "true")) {
+            return _ejson_write(buffer, "\x01", 1);
+        }
+        if (_ejson_accept(reader, "false")) {
+            return _ejson_write(buffer, "\x00", 1);
+        }
+        return EJSON_FALLBACK;
+    case 'n':
+        *type = 0x0A;
+        return _ejson_accept(reader, "null") ? 0 : EJSON_FALLBACK;
+    default: {
+        int is_integer;
+        int64_t integer;
+        double number;
+        int status;
+        *type = 0x01;
+        /* json.loads accepts these as well as numbers. */
+        if (_ejson_accept(reader, "NaN")) {
+            return buffer_write_double(buffer, Py_NAN) ? 0 : -1;
+        }
+        if (_ejson_accept(reader, "Infinity")) {
+            return buffer_write_double(buffer, Py_HUGE_VAL) ? 0 : -1;
+        }
+        if (_ejson_accept(reader, "-Infinity")) {
+            return buffer_write_double(buffer, -Py_HUGE_VAL) ? 0 : -1;
+        }
+        if ((status = _ejson_read_number(reader, &is_integer, &integer, &number))) {
+            return status;
+        }
+        if (is_integer) {
+            return _ejson_write_integer(buffer, integer, type);
+        }
+        return buffer_write_double(buffer, number) ? 0 : -1;
+    }
+    }
+}
+
+static PyObject* _cbson_json_to_bson(PyObject* self, PyObject* args) {
+    const char* data;
+    Py_ssize_t size;
+    PyObject* result = NULL;
+    ejson_reader_t reader;
+    int status;
+
+    if (!PyArg_ParseTuple(args, "y#p", &data, &size, &reader.check_datetime_range)) {
+        return NULL;
+    }
+    reader.module = self;
+    reader.position = data;
+    reader.end = data + size;
+    if (!(reader.buffer = pymongo_buffer_new())) {
+        return NULL;
+    }
+    status = _ejson_read_document(&reader, 1);
+    if (status == 0) {
+        _ejson_skip_whitespace(&reader);
+        if (reader.position != reader.end) {
+            status = EJSON_FALLBACK;
+        }
+    }
+    if (status == 0) {
+        result = Py_BuildValue("y#", pymongo_buffer_get_buffer(reader.buffer),
+                               (Py_ssize_t)pymongo_buffer_get_position(reader.buffer));
+    } else if (status == EJSON_FALLBACK) {
+        result = Py_None;
+        Py_INCREF(result);
+    }
+    pymongo_buffer_free(reader.buffer);
+    return result;
+}
+
 static PyMethodDef _CBSONMethods[] = {
     {"_dict_to_bson", _cbson_dict_to_bson, METH_VARARGS,
      "convert a dictionary to a string containing its BSON representation."},
+    {"_dict_to_bson_compiled", _cbson_dict_to_bson_compiled, METH_VARARGS,
+     "convert a dictionary with precompiled keys to its BSON representation."},
     {"_bson_to_dict", _cbson_bson_to_dict, METH_VARARGS,
      "convert a BSON string to a SON object."},
     {"_decode_all", _cbson_decode_all, METH_VARARGS,
@@ -3032,6 +5730,14 @@ static PyMethodDef _CBSONMethods[] = {
     {"_element_to_dict", _cbson_element_to_dict, METH_VARARGS,
      "Decode a single key, value pair."},
     {"_array_of_documents_to_buffer", _cbson_array_of_documents_to_buffer, METH_VARARGS, "Convert raw array of documents to a stream of BSON documents"},
+    {"_decode_columns", _cbson_decode_columns, METH_VARARGS,
+     "Decode fields of a sequence of documents into packed columns."},
+    {"_index_elements", _cbson_index_elements, METH_VARARGS,
+     "Map the names of a document's elements to their offsets."},
+    {"_bson_to_json", _cbson_bson_to_json, METH_VARARGS,
+     "Convert a BSON document to Relaxed or Canonical Extended JSON."},
+    {"_json_to_bson", _cbson_json_to_bson, METH_VARARGS,
+     "Convert Relaxed or Canonical Extended JSON to a BSON document."},
     {"_test_long_long_to_str", _test_long_long_to_str, METH_VARARGS, "Test conversion of extreme and common Py_ssize_t values to str."},
     {NULL, NULL, 0, NULL}
 };
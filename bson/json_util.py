@@ -98,6 +98,12 @@ but it will be faster as there is less recursion.
    Extended JSON converter for Python built on top of
    `libbson <https://github.com/mongodb/libbson>`_. `python-bsonjs` works best
    with PyMongo when using :class:`~bson.raw_bson.RawBSONDocument`.
+
+To convert directly between BSON bytes and Relaxed or Canonical Extended
+JSON, use :func:`bson_to_json` and :func:`json_to_bson`. When PyMongo's C
+extension is available they skip creating Python objects for each value.
+:func:`iter_loads` and :func:`iter_dumps` stream files of line-delimited
+Extended JSON into and out of collections with bounded memory.
 """
 from __future__ import annotations
 
@@ -105,12 +111,18 @@ import base64
 import datetime
 import json
 import math
+import os
 import re
 import uuid
+from collections import deque
+from concurrent.futures import Executor, Future
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     Optional,
@@ -121,6 +133,7 @@ from typing import (
     cast,
 )
 
+from bson import _UNPACK_INT_FROM, _USE_C, decode, encode
 from bson.binary import ALL_UUID_SUBTYPES, UUID_SUBTYPE, Binary, UuidRepresentation
 from bson.code import Code
 from bson.codec_options import CodecOptions, DatetimeConversion
@@ -137,11 +150,15 @@ from bson.int64 import Int64
 from bson.max_key import MaxKey
 from bson.min_key import MinKey
 from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
 from bson.regex import Regex
-from bson.son import RE_TYPE
+from bson.son import RE_TYPE, SON
 from bson.timestamp import Timestamp
 from bson.tz_util import utc
 
+if _USE_C:
+    from bson import _cbson  # type: ignore[attr-defined]
+
 _RE_OPT_TABLE = {
     "i": re.I,
     "l": re.L,
@@ -507,6 +524,262 @@ def loads(s: Union[str, bytes, bytearray], *args: Any, **kwargs: Any) -> Any:
     return json.loads(s, *args, **kwargs)
 
 
+def _use_c_json(json_options: JSONOptions) -> bool:
+    """Can the C extension convert with `json_options`?"""
+    registry = json_options.type_registry
+    return (
+        _USE_C
+        and json_options.json_mode != JSONMode.LEGACY
+        and json_options.document_class in (dict, SON)
+        and json_options.uuid_representation == UuidRepresentation.UNSPECIFIED
+        and json_options.unicode_decode_error_handler == "strict"
+        and not (json_options.tz_aware and json_options.tzinfo not in (utc, datetime.timezone.utc))
+        and not registry._decoder_map
+        and not registry._encoder_map
+        and registry._fallback_encoder is None
+    )
+
+
+def bson_to_json(
+    data: Union[bytes, bytearray, memoryview], json_options: JSONOptions = DEFAULT_JSON_OPTIONS
+) -> str:
+    """Convert a BSON document to MongoDB Extended JSON.
+
+    Returns the same string as ``dumps(bson.decode(data, json_options),
+    json_options=json_options)``. With Relaxed or Canonical Extended JSON
+    options the C extension, when available, writes the JSON directly from
+    the BSON bytes.
+
+    :param data: The BSON bytes of a single document.
+    :param json_options: A :class:`JSONOptions` instance used to modify the
+        decoding of BSON and the encoding of MongoDB Extended JSON types.
+        Defaults to :const:`DEFAULT_JSON_OPTIONS`.
+
+    .. versionadded:: 4.9
+    """
+    if _use_c_json(json_options):
+        result = _cbson._bson_to_json(
+            data,
+            json_options.json_mode == JSONMode.CANONICAL,
+            json_options.datetime_conversion,
+        )
+        if result is not None:
+            return result
+    return dumps(decode(data, json_options), json_options=json_options)
+
+
+def json_to_bson(
+    s: Union[str, bytes, bytearray], json_options: JSONOptions = DEFAULT_JSON_OPTIONS
+) -> bytes:
+    """Convert a MongoDB Extended JSON object to a BSON document.
+
+    Returns the same bytes as ``bson.encode(loads(s, json_options=json_options),
+    codec_options=json_options)``. With Relaxed or Canonical Extended JSON
+    options the C extension, when available, writes the BSON directly from
+    the JSON text.
+
+    :param s: The JSON text of a single object.
+    :param json_options: A :class:`JSONOptions` instance used to modify the
+        decoding of MongoDB Extended JSON types and the encoding of BSON.
+        Defaults to :const:`DEFAULT_JSON_OPTIONS`.
+
+    .. versionadded:: 4.9
+    """
+    if _use_c_json(json_options):
+        data: Optional[bytes] = None
+        if isinstance(s, str):
+            try:
+                data = s.encode("utf-8")
+            except UnicodeEncodeError:
+                pass
+        elif json.detect_encoding(s) == "utf-8":
+            data = bytes(s)
+        if data is not None:
+            result = _cbson._json_to_bson(
+                data,
+                json_options.datetime_conversion
+                in (DatetimeConversion.DATETIME, DatetimeConversion.DATETIME_CLAMP),
+            )
+            if result is not None:
+                return result
+    return encode(loads(s, json_options=json_options), codec_options=json_options)
+
+
+# The number of chunks of lines that iter_loads parses ahead with an executor.
+_MAX_PENDING_CHUNKS = 2 * (os.cpu_count() or 1)
+
+
+def _loads_lines(lines: list[Any], json_options: JSONOptions, raw: bool) -> list[Any]:
+    if raw:
+        return [json_to_bson(line, json_options) for line in lines]
+    return [loads(line, json_options=json_options) for line in lines]
+
+
+def _loads_lines_in_worker(lines: list[Any], options: dict[str, Any], raw: bool) -> list[Any]:
+    # JSONOptions cannot be pickled, so workers rebuild it from its options.
+    return _loads_lines(lines, JSONOptions(**options), raw)
+
+
+def _iter_chunks(fp: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    chunk = []
+    for line in fp:
+        if line.strip():
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_loaded(
+    fp: Iterable[Any],
+    json_options: JSONOptions,
+    raw: bool,
+    executor: Optional[Executor],
+    chunk_size: int,
+) -> Iterator[Tuple[Any, int]]:
+    """Yield each document of `fp` with the length of its line."""
+    if executor is None:
+        for chunk in _iter_chunks(fp, chunk_size):
+            yield from zip(_loads_lines(chunk, json_options, raw), map(len, chunk))
+        return
+    options = json_options._options_dict()
+    pending: deque[Tuple[Future, list[int]]] = deque()
+    try:
+        for chunk in _iter_chunks(fp, chunk_size):
+            future = executor.submit(_loads_lines_in_worker, chunk, options, raw)
+            pending.append((future, list(map(len, chunk))))
+            if len(pending) >= _MAX_PENDING_CHUNKS:
+                future, lengths = pending.popleft()
+                yield from zip(future.result(), lengths)
+        while pending:
+            future, lengths = pending.popleft()
+            yield from zip(future.result(), lengths)
+    finally:
+        for future, _ in pending:
+            future.cancel()
+
+
+def iter_loads(
+    fp: Iterable[Union[str, bytes]],
+    json_options: JSONOptions = DEFAULT_JSON_OPTIONS,
+    raw: bool = False,
+    batch_size: Optional[int] = None,
+    max_batch_bytes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 1000,
+) -> Iterator[Any]:
+    """Lazily load the documents of a file of line-delimited MongoDB Extended JSON.
+
+    Only a bounded number of lines are held in memory at once, so files of
+    any size can be imported into a collection batch by batch::
+
+      with open("documents.json") as fp:
+          for batch in json_util.iter_loads(fp, raw=True, batch_size=100000):
+              collection.insert_many(batch)
+
+    Blank lines are skipped.
+
+    :param fp: A text or binary file, or any iterable of lines, containing one
+        Extended JSON object per line.
+    :param json_options: A :class:`JSONOptions` instance used to modify the
+        decoding of MongoDB Extended JSON types. Defaults to
+        :const:`DEFAULT_JSON_OPTIONS`.
+    :param raw: If ``True``, convert each line with :func:`json_to_bson` and
+        yield :class:`~bson.raw_bson.RawBSONDocument` instances, which are
+        inserted without being encoded again. Otherwise yield the documents
+        returned by :func:`loads`.
+    :param batch_size: If given, yield lists of at most this many documents
+        instead of single documents. The server accepts up to
+        ``maxWriteBatchSize`` (100,000 by default) documents per write
+        command; :meth:`~pymongo.collection.Collection.insert_many` splits
+        larger batches into several commands.
+    :param max_batch_bytes: If given, yield lists of documents whose lines
+        add up to at most this many characters (or bytes, for a binary file)
+        instead of single documents, unless a single line is longer. Use it
+        with `batch_size` to bound the memory used by each batch.
+    :param executor: An optional :class:`concurrent.futures.Executor`, such as
+        a :class:`~concurrent.futures.ProcessPoolExecutor`, used to parse
+        chunks of lines concurrently. Documents are still yielded in the
+        order of the file.
+    :param chunk_size: The number of lines submitted to `executor` at a time.
+
+    .. versionadded:: 4.9
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+    docs = _iter_loaded(fp, json_options, raw, executor, chunk_size)
+    if raw:
+        codec_options = json_options.with_options(document_class=RawBSONDocument)
+        docs = ((RawBSONDocument(data, codec_options), length) for data, length in docs)
+    if batch_size is None and max_batch_bytes is None:
+        for doc, _ in docs:
+            yield doc
+        return
+    batch: list[Any] = []
+    batch_bytes = 0
+    for doc, length in docs:
+        if batch and (
+            (batch_size is not None and len(batch) >= batch_size)
+            or (max_batch_bytes is not None and batch_bytes + length > max_batch_bytes)
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(doc)
+        batch_bytes += length
+    if batch:
+        yield batch
+
+
+def iter_dumps(
+    documents: Iterable[Any], fp: IO[str], json_options: JSONOptions = DEFAULT_JSON_OPTIONS
+) -> int:
+    """Write documents to a text file as line-delimited MongoDB Extended JSON.
+
+    `documents` is consumed lazily, so a collection of any size can be
+    exported one batch at a time::
+
+      with open("documents.json", "w") as fp:
+          json_util.iter_dumps(collection.find_raw_batches(), fp)
+
+    Returns the number of documents written.
+
+    :param documents: An iterable of documents, such as a
+        :class:`~pymongo.cursor.Cursor`. Items that are bytes, like the
+        batches returned by a :class:`~pymongo.cursor.RawBatchCursor`, may
+        contain several BSON documents; these and
+        :class:`~bson.raw_bson.RawBSONDocument` instances are converted with
+        :func:`bson_to_json`.
+    :param fp: A text file to write to.
+    :param json_options: A :class:`JSONOptions` instance used to modify the
+        encoding of MongoDB Extended JSON types. Defaults to
+        :const:`DEFAULT_JSON_OPTIONS`.
+
+    .. versionadded:: 4.9
+    """
+    count = 0
+    for item in documents:
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            view = memoryview(item)
+            lines = []
+            position = 0
+            end = len(view)
+            while position < end:
+                size = _UNPACK_INT_FROM(view, position)[0]
+                lines.append(bson_to_json(view[position : position + size], json_options))
+                position += size
+        elif isinstance(item, RawBSONDocument):
+            lines = [bson_to_json(item.raw, json_options)]
+        else:
+            lines = [dumps(item, json_options=json_options)]
+        if lines:
+            fp.write("\n".join(lines) + "\n")
+            count += len(lines)
+    return count
+
+
 def _json_convert(obj: Any, json_options: JSONOptions = DEFAULT_JSON_OPTIONS) -> Any:
     """Recursive helper method that converts BSON types so they can be
     converted into json.
@@ -52,9 +52,9 @@ overhead of decoding or encoding BSON.
 """
 from __future__ import annotations
 
-from typing import Any, ItemsView, Iterator, Mapping, Optional
+from typing import Any, ItemsView, Iterator, Mapping, Optional, Type, TypeVar
 
-from bson import _get_object_size, _raw_to_dict
+from bson import _element_to_dict, _get_object_size, _index_elements, _raw_to_dict
 from bson.codec_options import _RAW_BSON_DOCUMENT_MARKER, CodecOptions
 from bson.codec_options import DEFAULT_CODEC_OPTIONS as DEFAULT
 
@@ -72,6 +72,9 @@ def _inflate_bson(
     return _raw_to_dict(bson_bytes, 4, len(bson_bytes) - 1, codec_options, {}, raw_array=raw_array)
 
 
+_R = TypeVar("_R", bound="RawBSONDocument")
+
+
 class RawBSONDocument(Mapping[str, Any]):
     """Representation for a MongoDB document that provides access to the raw
     BSON bytes that compose it.
@@ -80,8 +83,18 @@ class RawBSONDocument(Mapping[str, Any]):
     RawBSONDocument decode its bytes.
     """
 
-    __slots__ = ("__raw", "__inflated_doc", "__codec_options")
+    __slots__ = (
+        "__raw",
+        "__inflated_doc",
+        "__codec_options",
+        "__buffer",
+        "__offset",
+        "__end",
+        "__index",
+        "__values",
+    )
     _type_marker = _RAW_BSON_DOCUMENT_MARKER
+    _raw_array = False
     __codec_options: CodecOptions[RawBSONDocument]
 
     def __init__(
@@ -111,6 +124,12 @@ class RawBSONDocument(Mapping[str, Any]):
             must be :class:`RawBSONDocument`. The default is
             :attr:`DEFAULT_RAW_BSON_OPTIONS`.
 
+        .. versionchanged:: 4.9
+          Accessing a field by name no longer decodes the whole document.
+          Only the requested value is decoded, using an index of the offsets
+          of the top-level fields. Embedded documents share the bytes of the
+          document that contains them.
+
         .. versionchanged:: 3.8
           :class:`RawBSONDocument` now validates that the ``bson_bytes``
           passed in represent a single bson document.
@@ -119,7 +138,12 @@ class RawBSONDocument(Mapping[str, Any]):
           If a :class:`~bson.codec_options.CodecOptions` is passed in, its
           `document_class` must be :class:`RawBSONDocument`.
         """
-        self.__raw = bson_bytes
+        self.__raw: Optional[bytes] = bson_bytes
+        self.__buffer = bson_bytes
+        self.__offset = 0
+        self.__end = len(bson_bytes) - 1
+        self.__index: Optional[dict[str, int]] = None
+        self.__values: Optional[dict[str, Any]] = None
         self.__inflated_doc: Optional[Mapping[str, Any]] = None
         # Can't default codec_options to DEFAULT_RAW_BSON_OPTIONS in signature,
         # it refers to this class RawBSONDocument.
@@ -134,9 +158,34 @@ class RawBSONDocument(Mapping[str, Any]):
         # Validate the bson object size.
         _get_object_size(bson_bytes, 0, len(bson_bytes))
 
+    @classmethod
+    def _from_buffer(
+        cls: Type[_R],
+        buffer: bytes,
+        offset: int,
+        obj_end: int,
+        codec_options: CodecOptions[RawBSONDocument],
+    ) -> _R:
+        """Create a document from the BSON embedded in `buffer` at `offset`
+        without copying it.
+        """
+        _, end = _get_object_size(buffer, offset, obj_end)
+        doc = cls.__new__(cls)
+        doc.__raw = None
+        doc.__buffer = buffer
+        doc.__offset = offset
+        doc.__end = end
+        doc.__index = None
+        doc.__values = None
+        doc.__inflated_doc = None
+        doc.__codec_options = codec_options
+        return doc
+
     @property
     def raw(self) -> bytes:
         """The raw BSON bytes composing this document."""
+        if self.__raw is None:
+            self.__raw = self.__buffer[self.__offset : self.__end + 1]
         return self.__raw
 
     def items(self) -> ItemsView[str, Any]:
@@ -148,9 +197,42 @@ class RawBSONDocument(Mapping[str, Any]):
         if self.__inflated_doc is None:
             # We already validated the object's size when this document was
             # created, so no need to do that again.
-            self.__inflated_doc = self._inflate_bson(self.__raw, self.__codec_options)
+            self.__inflated_doc = self._inflate_bson(self.raw, self.__codec_options)
         return self.__inflated_doc
 
+    @property
+    def __elements(self) -> dict[str, int]:
+        """The offset of each top-level element, built on first use."""
+        if self.__index is None:
+            if not isinstance(self.__buffer, bytes):
+                self.__buffer = bytes(self.__buffer)
+            self.__index = _index_elements(
+                self.__buffer,
+                self.__offset + 4,
+                self.__end,
+                self.__codec_options.unicode_decode_error_handler or "strict",
+            )
+        return self.__index
+
+    def __decode_element(self, position: int) -> Any:
+        """Decode the value of the element at `position`."""
+        buffer = self.__buffer
+        opts = self.__codec_options
+        document_class = opts.document_class
+        # Embedded documents share this document's buffer.
+        if buffer[position] == 3 and document_class.__init__ is RawBSONDocument.__init__:
+            value_position = buffer.index(b"\x00", position + 1) + 1
+            value: Any = document_class._from_buffer(buffer, value_position, self.__end, opts)
+            if opts.type_registry._decoder_map:
+                custom_decoder = opts.type_registry._decoder_map.get(type(value))
+                if custom_decoder is not None:
+                    value = custom_decoder(value)
+            return value
+        _, value, _ = _element_to_dict(
+            buffer, memoryview(buffer), position, self.__end, opts, raw_array=self._raw_array
+        )
+        return value
+
     @staticmethod
     def _inflate_bson(
         bson_bytes: bytes, codec_options: CodecOptions[RawBSONDocument]
@@ -158,17 +240,34 @@ class RawBSONDocument(Mapping[str, Any]):
         return _inflate_bson(bson_bytes, codec_options)
 
     def __getitem__(self, item: str) -> Any:
-        return self.__inflated[item]
+        if self.__inflated_doc is not None:
+            return self.__inflated_doc[item]
+        if self.__values is None:
+            self.__values = {}
+        elif item in self.__values:
+            return self.__values[item]
+        value = self.__decode_element(self.__elements[item])
+        self.__values[item] = value
+        return value
+
+    def __contains__(self, item: object) -> bool:
+        if self.__inflated_doc is not None:
+            return item in self.__inflated_doc
+        return item in self.__elements
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.__inflated)
+        if self.__inflated_doc is not None:
+            return iter(self.__inflated_doc)
+        return iter(self.__elements)
 
     def __len__(self) -> int:
-        return len(self.__inflated)
+        if self.__inflated_doc is not None:
+            return len(self.__inflated_doc)
+        return len(self.__elements)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, RawBSONDocument):
-            return self.__raw == other.raw
+            return self.raw == other.raw
         return NotImplemented
 
     def __repr__(self) -> str:
@@ -178,6 +277,8 @@ class RawBSONDocument(Mapping[str, Any]):
 class _RawArrayBSONDocument(RawBSONDocument):
     """A RawBSONDocument that only expands sub-documents and arrays when accessed."""
 
+    _raw_array = True
+
     @staticmethod
     def _inflate_bson(
         bson_bytes: bytes, codec_options: CodecOptions[RawBSONDocument]
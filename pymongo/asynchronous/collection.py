@@ -37,6 +37,7 @@ from typing import (
     cast,
 )
 
+from bson import CompiledEncoder
 from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
 from bson.objectid import ObjectId
 from bson.raw_bson import RawBSONDocument
@@ -57,6 +58,11 @@ from pymongo.asynchronous.cursor import (
     AsyncCursor,
     AsyncRawBatchCursor,
 )
+from pymongo.asynchronous.parallel_scan import (
+    _SPLIT_METHODS,
+    AsyncParallelScan,
+    _split_points,
+)
 from pymongo.collation import validate_collation_or_none
 from pymongo.common import _ecoc_coll_name, _esc_coll_name
 from pymongo.errors import (
@@ -886,6 +892,7 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
         bypass_document_validation: bool = False,
         session: Optional[AsyncClientSession] = None,
         comment: Optional[Any] = None,
+        encoder: Optional[CompiledEncoder] = None,
     ) -> InsertManyResult:
         """Insert an iterable of documents.
 
@@ -910,6 +917,9 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
             :class:`~pymongo.asynchronous.client_session.AsyncClientSession`.
         :param comment: A user-provided comment to attach to this
             command.
+        :param encoder: (optional) A :class:`~bson.CompiledEncoder`, created
+            by :func:`bson.compile_encoder`, used to encode `documents` that
+            share the same keys.
 
         :return: An instance of :class:`~pymongo.results.InsertManyResult`.
 
@@ -918,6 +928,9 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
         .. note:: `bypass_document_validation` requires server version
           **>= 3.2**
 
+        .. versionchanged:: 4.9
+           Added ``encoder`` parameter.
+
         .. versionchanged:: 4.1
            Added ``comment`` parameter.
 
@@ -945,6 +958,10 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
                     if "_id" not in document:
                         document["_id"] = ObjectId()  # type: ignore[index]
                     inserted_ids.append(document["_id"])
+                    if encoder is not None:
+                        raw = encoder.encode(document, self.codec_options)
+                        yield (message._INSERT, RawBSONDocument(raw))
+                        continue
                 yield (message._INSERT, document)
 
         write_concern = self._write_concern_for(session)
@@ -1826,6 +1843,22 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
             MongoDB can satisfy the specified sort using an index, or if the
             blocking sort requires less memory than the 100 MiB limit. This
             option is only supported on MongoDB 4.4 and above.
+        :param prefetch: if True, send the getMore for the next batch of
+            results while the application is still iterating over the current
+            batch. Pass this as an alternative to calling
+            :meth:`~pymongo.asynchronous.cursor.AsyncCursor.prefetch` on the cursor.
+        :param prefetch_batches: the number of batches to prefetch. Implies
+            ``prefetch=True`` when greater than ``0``.
+        :param adaptive_batch_size: if True, choose the batch size of each
+            getMore from the size of the documents, the round trip time and
+            how quickly the application iterates over the results. Pass this
+            as an alternative to calling
+            :meth:`~pymongo.asynchronous.cursor.AsyncCursor.adaptive_batch_size`
+            on the cursor.
+        :param max_buffer_bytes: the size in bytes of the BSON of the
+            largest batch of results to decode at once. Larger batches are
+            decoded one document at a time as they are iterated. See
+            :meth:`~pymongo.asynchronous.cursor.AsyncCursor.max_buffer_bytes`.
 
         .. note:: There are a number of caveats to using
           :attr:`~pymongo.cursor.CursorType.EXHAUST` as cursor_type:
@@ -1843,6 +1876,10 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
             connection will be closed and discarded without being returned to
             the connection pool.
 
+        .. versionchanged:: 4.9
+           Added the ``prefetch``, ``prefetch_batches``,
+           ``adaptive_batch_size`` and ``max_buffer_bytes`` options.
+
         .. versionchanged:: 4.0
            Removed the ``modifiers`` option.
            Empty projections (eg {} or []) are passed to the server as-is,
@@ -1928,6 +1965,82 @@ class AsyncCollection(common.BaseObject, Generic[_DocumentType]):
             raise InvalidOperation("find_raw_batches does not support auto encryption")
         return AsyncRawBatchCursor(self, *args, **kwargs)
 
+    async def parallel_scan(
+        self,
+        num_partitions: int,
+        filter: Optional[Mapping[str, Any]] = None,
+        projection: Optional[Union[Mapping[str, Any], Iterable[str]]] = None,
+        raw_batches: bool = False,
+        batch_size: int = 0,
+        max_queued_batches: Optional[int] = None,
+        split_method: str = "sample",
+    ) -> AsyncParallelScan[_DocumentType]:
+        """Read a collection with several concurrent queries, each over a
+        range of ``_id`` values.
+
+        For example, to export a collection with eight concurrent queries::
+
+          async with await db.test.parallel_scan(8, raw_batches=True) as scan:
+              async for batch in scan:
+                  await export(batch)
+              for partition in scan.partitions:
+                  print(partition.index, partition.documents_per_second)
+
+        The ``_id`` values that divide the collection into `num_partitions`
+        ranges are chosen before the scan starts. Each partition then runs a
+        :meth:`find` (or :meth:`find_raw_batches`) concurrently, using its own
+        connection from the pool, and hands its batches to the application
+        through a bounded queue. Documents are returned in no particular
+        order. The :attr:`~pymongo.asynchronous.parallel_scan.AsyncParallelScan.partitions`
+        of the scan report each partition's progress and throughput, which
+        can be used to tune `num_partitions`.
+
+        The split points are numbers, strings, ObjectIds or dates, all of one
+        BSON type. Range queries only match ``_id`` values of that type, so
+        the first partition also reads the documents whose ``_id`` has
+        another type. When the sampled ``_id`` values mix types the scan
+        runs as a single partition.
+
+        :param num_partitions: The number of concurrent queries.
+        :param filter: A query document that selects which documents to
+            include in the result set.
+        :param projection: A list of field names or a dict specifying the
+            fields to include or exclude, as in :meth:`find`.
+        :param raw_batches: If True, return batches of raw BSON documents, as
+            in :meth:`find_raw_batches`, instead of documents.
+        :param batch_size: Limits the number of documents returned in a
+            single batch.
+        :param max_queued_batches: The maximum number of batches read ahead of
+            the application. Defaults to twice `num_partitions`.
+        :param split_method: How to choose the split points. ``"sample"``
+            (the default) picks evenly spaced values from a ``$sample`` of the
+            collection's ``_id`` values. ``"minmax"`` divides the range between
+            the smallest and largest ``_id`` evenly, which suits numeric,
+            date, or :class:`~bson.objectid.ObjectId` values that are evenly
+            distributed; it falls back to ``"sample"`` for other types.
+
+        .. note:: parallel_scan does not support sessions, since a session
+          cannot be used by several concurrent operations.
+
+        .. versionadded:: 4.9
+        """
+        if not isinstance(num_partitions, int) or isinstance(num_partitions, bool):
+            raise TypeError("num_partitions must be an integer")
+        if num_partitions < 1:
+            raise ValueError("num_partitions must be >= 1")
+        if split_method not in _SPLIT_METHODS:
+            raise ValueError(f"split_method must be one of {_SPLIT_METHODS}, not {split_method!r}")
+        if max_queued_batches is None:
+            max_queued_batches = 2 * num_partitions
+        elif not isinstance(max_queued_batches, int) or max_queued_batches < 1:
+            raise ValueError("max_queued_batches must be a positive integer")
+        if raw_batches and self._database.client._encrypter:
+            raise InvalidOperation("find_raw_batches does not support auto encryption")
+        split_points = await _split_points(self, num_partitions, split_method)
+        return AsyncParallelScan(
+            self, split_points, filter, projection, raw_batches, batch_size, max_queued_batches
+        )
+
     async def _count_cmd(
         self,
         session: Optional[AsyncClientSession],
@@ -15,12 +15,18 @@
 """Cursor class to iterate over Mongo query results."""
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import copy
+import functools
 import warnings
 from collections import deque
+from concurrent.futures import Future
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Coroutine,
     Generic,
     Iterable,
     List,
@@ -33,8 +39,9 @@ from typing import (
     overload,
 )
 
-from bson import RE_TYPE, _convert_raw_document_lists_to_streams
+from bson import RE_TYPE, _bson_to_dict, _convert_raw_document_lists_to_streams
 from bson.code import Code
+from bson.raw_bson import RawBSONDocument
 from bson.son import SON
 from pymongo import helpers_shared
 from pymongo.asynchronous.helpers import anext
@@ -43,7 +50,19 @@ from pymongo.common import (
     validate_is_document_type,
     validate_is_mapping,
 )
-from pymongo.cursor_shared import _CURSOR_CLOSED_ERRORS, _QUERY_OPTIONS, CursorType, _Hint, _Sort
+from pymongo.cursor_shared import (
+    _CURSOR_CLOSED_ERRORS,
+    _DEFAULT_MAX_BATCH_BYTES,
+    _PREFETCH_EXECUTOR,
+    _QUERY_OPTIONS,
+    CursorType,
+    _BatchSizeTuner,
+    _CursorBuffer,
+    _Hint,
+    _LazyBatch,
+    _Sort,
+    _validate_adaptive_batch_size,
+)
 from pymongo.errors import ConnectionFailure, InvalidOperation, OperationFailure
 from pymongo.lock import _ALock, _create_lock
 from pymongo.message import (
@@ -55,7 +74,7 @@ from pymongo.message import (
     _RawBatchGetMore,
     _RawBatchQuery,
 )
-from pymongo.response import PinnedResponse
+from pymongo.response import PinnedResponse, Response
 from pymongo.typings import _Address, _CollationIn, _DocumentOut, _DocumentType
 from pymongo.write_concern import validate_boolean
 
@@ -89,9 +108,211 @@ class _ConnectionManager:
             self.conn = None
 
 
+class _GetMorePrefetcher:
+    """Runs up to `depth` getMore commands for a cursor ahead of the application.
+
+    The getMores of a cursor cannot run concurrently, so each prefetched
+    getMore starts after the one before it is done and is skipped once the
+    cursor is exhausted, an earlier getMore failed, or the prefetcher is
+    stopped. `discard` is called with each response that is dropped because
+    the prefetcher was stopped.
+    """
+
+    def __init__(self, depth: int, discard: Optional[Callable[[Response], None]] = None):
+        self.depth = depth
+        self._discard = discard
+        self._pending: deque = deque()
+        self._stopped = False
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def fill(self, run_getmore: Callable[[], Coroutine[Any, Any, Response]]) -> None:
+        """Start getMores until `depth` are pending."""
+        while len(self._pending) < self.depth:
+            previous = self._pending[-1] if self._pending else None
+            self._pending.append(self._start(previous, run_getmore))
+
+    def _start(
+        self, previous: Any, run_getmore: Callable[[], Coroutine[Any, Any, Response]]
+    ) -> Any:
+        if not _IS_SYNC:
+            return asyncio.ensure_future(self._run(previous, run_getmore))
+        # Copy the context for CSOT.
+        context = contextvars.copy_context()
+        if previous is None:
+            return _PREFETCH_EXECUTOR.submit(context.run, self._run, previous, run_getmore)
+        # Submit the getMore once the one before it is done, so that no
+        # executor thread is blocked waiting for another getMore.
+        future: Future = Future()
+
+        def submit(_: Any) -> None:
+            try:
+                started = _PREFETCH_EXECUTOR.submit(context.run, self._run, previous, run_getmore)
+            except Exception as exc:
+                future.set_exception(exc)
+                return
+            started.add_done_callback(functools.partial(_copy_future_state, target=future))
+
+        previous.add_done_callback(submit)
+        return future
+
+    async def _wait(self, pending: Any) -> Optional[Response]:
+        if not _IS_SYNC:
+            return await pending
+        return pending.result()
+
+    async def _run(
+        self, previous: Any, run_getmore: Callable[[], Coroutine[Any, Any, Response]]
+    ) -> Optional[Response]:
+        if previous is not None:
+            try:
+                response = await self._wait(previous)
+            except Exception:
+                return None
+            if response is None or _response_cursor_id(response) == 0:
+                return None
+        if self._stopped:
+            return None
+        return await run_getmore()
+
+    async def next(self) -> Optional[Response]:
+        """Wait for the oldest pending getMore and return its response.
+
+        Returns ``None`` if the getMore was skipped.
+        """
+        return await self._wait(self._pending.popleft())
+
+    async def stop(self) -> None:
+        """Skip the getMores that have not started and wait for the rest."""
+        self._stopped = True
+        while self._pending:
+            try:
+                response = await self._wait(self._pending.popleft())
+            except Exception:
+                continue
+            if response is not None and self._discard is not None:
+                self._discard(response)
+
+    def _discard_done(self, pending: Any) -> None:
+        if not pending.cancelled() and pending.exception() is None:
+            response = pending.result()
+            if response is not None and self._discard is not None:
+                self._discard(response)
+
+    def stop_no_wait(self, callback: Callable[[], None]) -> None:
+        """Skip the getMores that have not started without waiting, and call
+        `callback` once the getMores that have started are done.
+        """
+        self._stopped = True
+        for pending in self._pending:
+            # Drop the responses that will never be iterated, and retrieve
+            # any exception so that it is not reported as unhandled.
+            pending.add_done_callback(self._discard_done)
+        # Each getMore waits for the one before it, so the last is done last.
+        last = self._pending[-1] if self._pending else None
+        self._pending.clear()
+        if last is None or last.done():
+            callback()
+        else:
+            last.add_done_callback(lambda _: callback())
+
+
+def _copy_future_state(source: Future, target: Future) -> None:
+    """Complete `target` with the result or exception of `source`."""
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+    else:
+        target.set_result(source.result())
+
+
+def _response_size(response: Response) -> int:
+    """The number of bytes of documents in a response."""
+    if isinstance(response.data, _OpReply):
+        return len(response.data.documents)
+    return len(response.data.payload_document)
+
+
+def _batch_memory(
+    documents: Sequence[Any], response: Response, raw_batches: bool
+) -> tuple[int, bool]:
+    """The number of bytes a batch counts against the cursor buffer budget,
+    and whether they are counted as raw BSON.
+    """
+    if not documents:
+        return 0, False
+    return _response_size(response), raw_batches or isinstance(documents, _LazyBatch)
+
+
+def _response_batch(response: Response) -> Sequence[Any]:
+    """The batch of documents in a getMore response."""
+    if response.from_command:
+        return response.docs[0]["cursor"]["nextBatch"]
+    return response.docs
+
+
+def _acquire_prefetched(buffer: _CursorBuffer, raw_batches: bool, response: Response) -> None:
+    """Count a prefetched batch against the buffer budget when it is decoded,
+    rather than when the application reaches it.
+    """
+    documents = _response_batch(response)
+    size, raw = _batch_memory(documents, response, raw_batches)
+    if size:
+        buffer.acquire(size, raw, isinstance(documents, _LazyBatch))
+
+
+def _release_prefetched(buffer: _CursorBuffer, raw_batches: bool, response: Response) -> None:
+    """Stop counting a prefetched batch that is dropped without being iterated."""
+    size, raw = _batch_memory(_response_batch(response), response, raw_batches)
+    if size:
+        buffer.release(size, raw)
+
+
+def _unpack_lazy_response(
+    response: _OpMsg, codec_options: CodecOptions, user_fields: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    """Unpack a find or getMore reply, leaving its batch of documents as raw
+    BSON to be decoded one document at a time.
+    """
+    reply = response.raw_response(user_fields=user_fields)[0]
+    _convert_raw_document_lists_to_streams(reply)
+    doc = {}
+    for key, value in reply.items():
+        if key == "cursor":
+            cursor = {}
+            for name, field in value.items():
+                if name in ("firstBatch", "nextBatch"):
+                    cursor[name] = _LazyBatch(field[0] if field else b"", codec_options)
+                else:
+                    cursor[name] = _inflate(field, codec_options)
+            value = cursor  # noqa: PLW2901
+        else:
+            value = _inflate(value, codec_options)  # noqa: PLW2901
+        doc[key] = value
+    return [doc]
+
+
+def _inflate(value: Any, codec_options: CodecOptions) -> Any:
+    """Decode a value of a raw reply with the cursor's codec options."""
+    if isinstance(value, RawBSONDocument):
+        return _bson_to_dict(value.raw, codec_options)
+    return value
+
+
+def _response_cursor_id(response: Response) -> int:
+    if response.from_command:
+        return response.docs[0]["cursor"]["id"]
+    assert isinstance(response.data, _OpReply)
+    return response.data.cursor_id
+
+
 class AsyncCursor(Generic[_DocumentType]):
     _query_class = _Query
     _getmore_class = _GetMore
+    # Whether the batches of this cursor are raw BSON.
+    _holds_raw_batches = False
 
     def __init__(
         self,
@@ -119,6 +340,10 @@ class AsyncCursor(Generic[_DocumentType]):
         session: Optional[AsyncClientSession] = None,
         allow_disk_use: Optional[bool] = None,
         let: Optional[bool] = None,
+        prefetch: bool = False,
+        prefetch_batches: int = 0,
+        adaptive_batch_size: bool = False,
+        max_buffer_bytes: int = 0,
     ) -> None:
         """Create a new cursor.
 
@@ -134,6 +359,7 @@ class AsyncCursor(Generic[_DocumentType]):
         self._exhaust = False
         self._sock_mgr: Any = None
         self._killed = False
+        self._prefetcher: Optional[_GetMorePrefetcher] = None
         self._session: Optional[AsyncClientSession]
 
         if session:
@@ -174,6 +400,16 @@ class AsyncCursor(Generic[_DocumentType]):
             raise TypeError("batch_size must be an integer")
         if batch_size < 0:
             raise ValueError("batch_size must be >= 0")
+        validate_boolean("prefetch", prefetch)
+        if not isinstance(prefetch_batches, int):
+            raise TypeError("prefetch_batches must be an integer")
+        if prefetch_batches < 0:
+            raise ValueError("prefetch_batches must be >= 0")
+        validate_boolean("adaptive_batch_size", adaptive_batch_size)
+        if not isinstance(max_buffer_bytes, int):
+            raise TypeError("max_buffer_bytes must be an integer")
+        if max_buffer_bytes < 0:
+            raise ValueError("max_buffer_bytes must be >= 0")
         # Only set if allow_disk_use is provided by the user, else None.
         if allow_disk_use is not None:
             allow_disk_use = validate_boolean("allow_disk_use", allow_disk_use)
@@ -191,6 +427,11 @@ class AsyncCursor(Generic[_DocumentType]):
         self._skip = skip
         self._limit = limit
         self._batch_size = batch_size
+        self._prefetch_batches = prefetch_batches or int(prefetch)
+        self._batch_tuner: Optional[_BatchSizeTuner] = None
+        if adaptive_batch_size:
+            self._batch_tuner = _BatchSizeTuner(_DEFAULT_MAX_BATCH_BYTES, 1, 0)
+        self._max_buffer_bytes = max_buffer_bytes
         self._ordering = sort and helpers_shared._index_document(sort) or None
         self._max_scan = max_scan
         self._explain = False
@@ -215,7 +456,11 @@ class AsyncCursor(Generic[_DocumentType]):
         # it anytime we change __limit.
         self._empty = False
 
-        self._data: deque = deque()
+        self._data: Union[deque, _LazyBatch] = deque()
+        # The size of the batch in self._data, counted against the client's
+        # maxCursorBufferBytes.
+        self._batch_bytes = 0
+        self._batch_raw = False
         self._address: Optional[_Address] = None
         self._retrieved = 0
 
@@ -267,6 +512,8 @@ class AsyncCursor(Generic[_DocumentType]):
         return self._retrieved
 
     def __del__(self) -> None:
+        if getattr(self, "_batch_bytes", 0):
+            self._release_batch()
         self._die_no_lock()
 
     def clone(self) -> AsyncCursor[_DocumentType]:
@@ -301,6 +548,8 @@ class AsyncCursor(Generic[_DocumentType]):
             "explain",
             "hint",
             "batch_size",
+            "prefetch_batches",
+            "max_buffer_bytes",
             "max_scan",
             "query_flags",
             "collation",
@@ -319,6 +568,8 @@ class AsyncCursor(Generic[_DocumentType]):
         if deepcopy:
             data = self._deepcopy(data)
         base.__dict__.update(data)
+        if self._batch_tuner is not None:
+            base._batch_tuner = self._batch_tuner.copy()
         return base
 
     def _clone_base(self, session: Optional[AsyncClientSession]) -> AsyncCursor:
@@ -486,6 +737,113 @@ class AsyncCursor(Generic[_DocumentType]):
         self._batch_size = batch_size
         return self
 
+    def prefetch(self, batches: int = 1) -> AsyncCursor[_DocumentType]:
+        """Send the getMore for the next `batches` batches of results while
+        the application is still iterating over the current batch.
+
+        Prefetching overlaps the network round trip of each getMore with the
+        processing of the documents already returned, which speeds up long
+        scans such as bulk exports. Each prefetched getMore runs in the
+        background on a connection checked out from the pool (or on the
+        cursor's pinned connection). Prefetched batches are held in memory
+        until they are iterated, and count against the client's
+        ``maxCursorBufferBytes`` budget from the time they are received.
+        Closing the cursor waits for a getMore that is already running.
+
+        Prefetching is ignored for exhaust and tailable cursors and for
+        cursors created with an explicit `session`, since an
+        :class:`~pymongo.asynchronous.client_session.AsyncClientSession`
+        must not be used concurrently. When a `limit` is set, at most one
+        batch is prefetched.
+
+        Raises :exc:`TypeError` if `batches` is not an integer.
+        Raises :exc:`ValueError` if `batches` is less than ``0``.
+        Raises :exc:`~pymongo.errors.InvalidOperation` if this
+        :class:`AsyncCursor` has already been used.
+
+        :param batches: The number of batches to request ahead of the
+            application. ``0`` disables prefetching.
+
+        .. versionadded:: 4.9
+        """
+        if not isinstance(batches, int):
+            raise TypeError("batches must be an integer")
+        if batches < 0:
+            raise ValueError("batches must be >= 0")
+        self._check_okay_to_chain()
+
+        self._prefetch_batches = batches
+        return self
+
+    def adaptive_batch_size(
+        self,
+        max_batch_bytes: int = _DEFAULT_MAX_BATCH_BYTES,
+        min_batch_size: int = 1,
+        max_batch_size: int = 0,
+    ) -> AsyncCursor[_DocumentType]:
+        """Choose the batch size of each getMore from the size of the
+        documents returned so far, the round trip time of each batch and how
+        quickly the application consumes them.
+
+        Batches grow until the application spends little of its time waiting
+        for getMores and shrink when it consumes documents slowly, so that
+        long scans neither wait on many small batches nor hold documents in
+        memory long before they are used. The batch size changes by at most a
+        factor of two per getMore. Until the first batch has been received,
+        :meth:`batch_size` is used.
+
+        Raises :exc:`TypeError` if an argument is not an integer.
+        Raises :exc:`ValueError` if `max_batch_bytes` or `min_batch_size` is
+        less than ``1``, or if `max_batch_size` is negative or less than
+        `min_batch_size`.
+        Raises :exc:`~pymongo.errors.InvalidOperation` if this
+        :class:`AsyncCursor` has already been used.
+
+        :param max_batch_bytes: The approximate maximum size in bytes of the
+            documents requested by each getMore.
+        :param min_batch_size: The minimum number of documents requested by
+            each getMore.
+        :param max_batch_size: The maximum number of documents requested by
+            each getMore. ``0`` means no maximum.
+
+        .. versionadded:: 4.9
+        """
+        self._check_okay_to_chain()
+        self._batch_tuner = _BatchSizeTuner(
+            *_validate_adaptive_batch_size(max_batch_bytes, min_batch_size, max_batch_size)
+        )
+        return self
+
+    def max_buffer_bytes(self, max_bytes: int) -> AsyncCursor[_DocumentType]:
+        """Limits the memory used by each batch of results held by this
+        cursor.
+
+        A batch whose BSON is larger than `max_bytes` is held as raw BSON
+        and each document is decoded as it is iterated, instead of decoding
+        the whole batch as soon as it is received. Batches are also held as
+        raw BSON while the client's ``maxCursorBufferBytes`` budget is
+        exhausted. Command monitoring events for such a batch are published
+        before it is decoded.
+
+        Raises :exc:`TypeError` if `max_bytes` is not an integer.
+        Raises :exc:`ValueError` if `max_bytes` is less than ``0``.
+        Raises :exc:`~pymongo.errors.InvalidOperation` if this
+        :class:`AsyncCursor` has already been used.
+
+        :param max_bytes: The size in bytes of the BSON of the largest batch
+            to decode at once. ``0`` means no limit.
+
+        .. versionadded:: 4.9
+        """
+        if not isinstance(max_bytes, int):
+            raise TypeError("max_bytes must be an integer")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self._check_okay_to_chain()
+
+        self._max_buffer_bytes = max_bytes
+        return self
+
     def skip(self, skip: int) -> AsyncCursor[_DocumentType]:
         """Skips the first `skip` results of this cursor.
 
@@ -887,8 +1245,45 @@ class AsyncCursor(Generic[_DocumentType]):
         user_fields: Optional[Mapping[str, Any]] = None,
         legacy_response: bool = False,
     ) -> Sequence[_DocumentOut]:
+        if (
+            user_fields
+            and not self._explain
+            and isinstance(response, _OpMsg)
+            and not self._collection.database.client._cursor_buffer.fits(
+                len(response.payload_document), self._max_buffer_bytes
+            )
+        ):
+            return _unpack_lazy_response(response, codec_options, user_fields)
         return response.unpack_response(cursor_id, codec_options, user_fields, legacy_response)
 
+    def _hold_batch(
+        self, documents: Sequence[Any], response: Response, prefetched: bool = False
+    ) -> None:
+        """Make `documents` the current batch and account for its memory.
+
+        The memory of a prefetched batch was counted when it was decoded.
+        """
+        self._release_batch()
+        if isinstance(documents, _LazyBatch):
+            self._data = documents
+        else:
+            self._data = deque(documents)
+        self._batch_bytes, self._batch_raw = _batch_memory(
+            documents, response, self._holds_raw_batches
+        )
+        if self._batch_bytes and not prefetched:
+            self._collection.database.client._cursor_buffer.acquire(
+                self._batch_bytes, self._batch_raw, isinstance(documents, _LazyBatch)
+            )
+
+    def _release_batch(self) -> None:
+        """Stop accounting for the memory of the current batch."""
+        if self._batch_bytes:
+            self._collection.database.client._cursor_buffer.release(
+                self._batch_bytes, self._batch_raw
+            )
+            self._batch_bytes = 0
+
     def _get_read_preference(self) -> _ServerMode:
         if self._read_preference is None:
             # Save the read preference for getMore commands.
@@ -1024,9 +1419,21 @@ class AsyncCursor(Generic[_DocumentType]):
             return
 
         cursor_id, address = self._prepare_to_die(already_killed)
-        self._collection.database.client._cleanup_cursor_no_lock(
-            cursor_id, address, self._sock_mgr, self._session, self._explicit_session
+        cleanup = functools.partial(
+            self._collection.database.client._cleanup_cursor_no_lock,
+            cursor_id,
+            address,
+            self._sock_mgr,
+            self._session,
+            self._explicit_session,
         )
+        if self._prefetcher is not None:
+            # Kill the cursor and release its session only once the
+            # getMores that are in flight are done with them.
+            prefetcher, self._prefetcher = self._prefetcher, None
+            prefetcher.stop_no_wait(cleanup)
+        else:
+            cleanup()
         if not self._explicit_session:
             self._session = None
         self._sock_mgr = None
@@ -1039,6 +1446,9 @@ class AsyncCursor(Generic[_DocumentType]):
             # ___init__ did not run to completion (or at all).
             return
 
+        if self._prefetcher is not None:
+            prefetcher, self._prefetcher = self._prefetcher, None
+            await prefetcher.stop()
         cursor_id, address = self._prepare_to_die(already_killed)
         await self._collection.database.client._cleanup_cursor_lock(
             cursor_id,
@@ -1098,9 +1508,14 @@ class AsyncCursor(Generic[_DocumentType]):
             raise InvalidOperation("exhaust cursors do not support auto encryption")
 
         try:
-            response = await client._run_operation(
-                operation, self._unpack_response, address=self._address
-            )
+            response = None
+            if isinstance(operation, _GetMore) and self._prefetcher and self._prefetcher.pending:
+                response = await self._prefetcher.next()
+            prefetched = response is not None
+            if response is None:
+                response = await client._run_operation(
+                    operation, self._unpack_response, address=self._address
+                )
         except OperationFailure as exc:
             if exc.code in _CURSOR_CLOSED_ERRORS or self._exhaust:
                 # Don't send killCursors because the cursor is already closed.
@@ -1146,18 +1561,21 @@ class AsyncCursor(Generic[_DocumentType]):
                         self._dbname, self._collname = ns.split(".", 1)
                 else:
                     documents = cursor["nextBatch"]
-                self._data = deque(documents)
+                self._hold_batch(documents, response, prefetched)
                 self._retrieved += len(documents)
             else:
                 self._id = 0
-                self._data = deque(docs)
+                self._hold_batch(docs, response, prefetched)
                 self._retrieved += len(docs)
         else:
             assert isinstance(response.data, _OpReply)
             self._id = response.data.cursor_id
-            self._data = deque(docs)
+            self._hold_batch(docs, response, prefetched)
             self._retrieved += response.data.number_returned
 
+        if self._batch_tuner is not None:
+            self._batch_tuner.received(len(self._data), _response_size(response), response.duration)
+
         if self._id == 0:
             # Don't wait for garbage collection to call __del__, return the
             # socket and the session to the pool now.
@@ -1173,9 +1591,15 @@ class AsyncCursor(Generic[_DocumentType]):
         self._data is already non-empty. Raises OperationFailure when the
         cursor cannot be refreshed due to an error on the query.
         """
-        if len(self._data) or self._killed:
+        if len(self._data):
             return len(self._data)
+        # The application has consumed the previous batch.
+        self._release_batch()
+        if self._killed:
+            return 0
 
+        if self._batch_tuner is not None:
+            self._batch_tuner.drained()
         if not self._session:
             self._session = self._collection.database.client._ensure_session()
 
@@ -1205,31 +1629,74 @@ class AsyncCursor(Generic[_DocumentType]):
             )
             await self._send_message(q)
         elif self._id:  # Get More
-            if self._limit:
-                limit = self._limit - self._retrieved
-                if self._batch_size:
-                    limit = min(limit, self._batch_size)
-            else:
-                limit = self._batch_size
-            # Exhaust cursors don't send getMore messages.
-            g = self._getmore_class(
-                self._dbname,
-                self._collname,
-                limit,
-                self._id,
-                self._codec_options,
-                self._get_read_preference(),
-                self._session,
-                self._collection.database.client,
-                self._max_await_time_ms,
-                self._sock_mgr,
-                self._exhaust,
-                self._comment,
-            )
-            await self._send_message(g)
+            await self._send_message(self._get_more())
 
+        if self._batch_tuner is not None:
+            self._batch_tuner.delivered(len(self._data))
+        self._maybe_prefetch()
         return len(self._data)
 
+    def _get_more(self) -> _GetMore:
+        batch_size = self._batch_size
+        if self._batch_tuner is not None:
+            batch_size = self._batch_tuner.batch_size(batch_size)
+        if self._limit:
+            limit = self._limit - self._retrieved
+            if batch_size:
+                limit = min(limit, batch_size)
+        else:
+            limit = batch_size
+        # Exhaust cursors don't send getMore messages.
+        return self._getmore_class(
+            self._dbname,
+            self._collname,
+            limit,
+            self._id,
+            self._codec_options,
+            self._get_read_preference(),
+            self._session,
+            self._collection.database.client,
+            self._max_await_time_ms,
+            self._sock_mgr,
+            self._exhaust,
+            self._comment,
+        )
+
+    async def _run_get_more(self) -> Response:
+        client = self._collection.database.client
+        response = await client._run_operation(
+            self._get_more(), self._unpack_response, address=self._address
+        )
+        _acquire_prefetched(client._cursor_buffer, self._holds_raw_batches, response)
+        return response
+
+    def _maybe_prefetch(self) -> None:
+        """Start prefetching the next batches, if enabled for this cursor."""
+        if (
+            not self._prefetch_batches
+            or not self._id
+            or self._killed
+            or self._exhaust
+            or self._query_flags & _QUERY_OPTIONS["tailable_cursor"]
+            # The application's session must not be used concurrently, so
+            # getMores that use it are never sent in the background.
+            or self._explicit_session
+        ):
+            return
+        if self._prefetcher is None:
+            # The limit of each getMore depends on the documents retrieved
+            # by the previous one.
+            depth = 1 if self._limit else self._prefetch_batches
+            self._prefetcher = _GetMorePrefetcher(
+                depth,
+                functools.partial(
+                    _release_prefetched,
+                    self._collection.database.client._cursor_buffer,
+                    self._holds_raw_batches,
+                ),
+            )
+        self._prefetcher.fill(self._run_get_more)
+
     async def rewind(self) -> AsyncCursor[_DocumentType]:
         """Rewind this cursor to its unevaluated state.
 
@@ -1240,11 +1707,14 @@ class AsyncCursor(Generic[_DocumentType]):
         retrieved by this cursor.
         """
         await self.close()
+        self._release_batch()
         self._data = deque()
         self._id = None
         self._address = None
         self._retrieved = 0
         self._killed = False
+        if self._batch_tuner is not None:
+            self._batch_tuner = self._batch_tuner.copy()
 
         return self
 
@@ -1274,6 +1744,8 @@ class AsyncCursor(Generic[_DocumentType]):
             else:
                 for _ in range(min(len(self._data), total)):
                     result.append(self._data.popleft())
+            if not self._data:
+                self._release_batch()
             return True
         else:
             return False
@@ -1324,6 +1796,7 @@ class AsyncRawBatchCursor(AsyncCursor, Generic[_DocumentType]):
 
     _query_class = _RawBatchQuery
     _getmore_class = _RawBatchGetMore
+    _holds_raw_batches = True
 
     def __init__(
         self, collection: AsyncCollection[_DocumentType], *args: Any, **kwargs: Any
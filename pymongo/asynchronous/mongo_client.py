@@ -34,6 +34,7 @@ from __future__ import annotations
 
 import contextlib
 import os
+import time
 import weakref
 from collections import defaultdict
 from typing import (
@@ -66,7 +67,9 @@ from pymongo.asynchronous.client_session import _EmptyServerSession
 from pymongo.asynchronous.command_cursor import AsyncCommandCursor
 from pymongo.asynchronous.settings import TopologySettings
 from pymongo.asynchronous.topology import Topology, _ErrorContext
+from pymongo.cleanup import CleanupStats, _CleanupMetrics
 from pymongo.client_options import ClientOptions
+from pymongo.cursor_shared import CursorBufferStats, _CursorBuffer
 from pymongo.errors import (
     AutoReconnect,
     BulkWriteError,
@@ -84,7 +87,9 @@ from pymongo.errors import (
 from pymongo.lock import _HAS_REGISTER_AT_FORK, _ALock, _create_lock, _release_locks
 from pymongo.logger import _CLIENT_LOGGER, _log_or_warn
 from pymongo.message import _CursorAddress, _GetMore, _Query
-from pymongo.monitoring import ConnectionClosedReason
+from pymongo.metrics import ClientMetrics, CompressionStats, _record_phase
+from pymongo.monitoring import ConnectionClosedReason, EventQueueStats
+from pymongo.ocsp_cache import OCSPCacheStats
 from pymongo.operations import (
     DeleteMany,
     DeleteOne,
@@ -99,6 +104,7 @@ from pymongo.results import ClientBulkWriteResult
 from pymongo.server_selectors import writable_server_selector
 from pymongo.server_type import SERVER_TYPE
 from pymongo.topology_description import TOPOLOGY_TYPE, TopologyDescription
+from pymongo.tracing import _set_address, _span
 from pymongo.typings import (
     ClusterTime,
     _Address,
@@ -299,6 +305,10 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             replaced. Defaults to `None` (no limit).
           - `maxConnecting` (optional): The maximum number of connections that
             each pool can establish concurrently. Defaults to `2`.
+          - `minPoolWarmupRate` (optional): The maximum number of connections
+            per second that each pool opens in the background to reach
+            `minPoolSize`, to avoid a burst of new connections to a server
+            that just became available. Defaults to `None` (no limit).
           - `timeoutMS`: (integer or None) Controls how long (in
             milliseconds) the driver will wait when executing an operation
             (including retry attempts) before raising a timeout error.
@@ -343,6 +353,25 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             establishing a connection.
           - `event_listeners`: a list or tuple of event listeners. See
             :mod:`~pymongo.monitoring` for details.
+          - `eventQueueSize`: (integer) When set, command and connection pool
+            events are delivered to `event_listeners` by a background task
+            instead of by the operation that published them, so that slow
+            listeners do not delay operations. At most this many events wait
+            to be delivered; the oldest are dropped when the queue is full.
+            Defaults to ``None`` (events are delivered synchronously).
+          - `slowOperationThresholdMS`: (integer or float) Commands that take
+            at least this many milliseconds record how long they spent in
+            each step, from server selection to decoding the reply. The
+            breakdown is available as the ``timings`` attribute of
+            :class:`~pymongo.monitoring.CommandSucceededEvent` and
+            :class:`~pymongo.monitoring.CommandFailedEvent`, and in command
+            log messages. ``0`` records every command. Defaults to ``None``
+            (no breakdown).
+          - `tracer`: An OpenTelemetry ``Tracer``, or any object with a
+            compatible ``start_as_current_span`` method, that records spans
+            for operations, server selection, connection checkout and
+            commands. See :mod:`~pymongo.tracing` for details. Defaults to
+            ``None`` (no tracing).
           - `retryWrites`: (boolean) Whether supported write operations
             executed within this AsyncMongoClient will be retried once after a
             network error. Defaults to ``True``.
@@ -409,6 +438,24 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             are -1 through 9. -1 tells the zlib library to use its default
             compression level (usually 6). 0 means no compression. 1 is best
             speed. 9 is best compression. Defaults to -1.
+          - `compressionMinSize`: (integer) Messages smaller than this many
+            bytes are sent uncompressed even when a compressor has been
+            negotiated, since compressing small commands such as a ``find``
+            by ``_id`` or a ``getMore`` costs more CPU than it saves on the
+            wire. Defaults to ``0`` (compress every message).
+          - `adaptiveCompression`: (boolean) If ``True``, track the
+            compression ratio achieved for each command name and send
+            commands that shrink by less than 10% uncompressed. A small
+            sample of those commands is still compressed so that a change in
+            the data is noticed. Defaults to ``False``.
+          - `maxCursorBufferBytes`: (integer) The maximum total size in bytes
+            of the batches of results held as decoded documents by the
+            cursors of this client. A batch that does not fit, or that is
+            larger than the cursor's own
+            :meth:`~pymongo.asynchronous.cursor.AsyncCursor.max_buffer_bytes`,
+            is held as raw BSON and decoded one document at a time as it is
+            iterated. Sizes are measured as BSON; see
+            :attr:`cursor_buffer_stats`. Defaults to ``0`` (no limit).
           - `uuidRepresentation`: The BSON representation to use when encoding
             from and decoding to instances of :class:`~uuid.UUID`. Valid
             values are the strings: "standard", "pythonLegacy", "javaLegacy",
@@ -550,6 +597,15 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             specified on the server certificate.
             ``tlsDisableOCSPEndpointCheck=False`` implies ``tls=True``.
             Defaults to ``False``.
+          - `tlsOCSPCacheSize`: (integer) The maximum number of OCSP responses
+            cached in memory by this client. Defaults to ``1000``.
+          - `tlsOCSPCacheFile`: The path of a SQLite database in which to
+            store OCSP responses until their ``nextUpdate`` time, shared by
+            every process that uses the same path. This spares new processes
+            the OCSP requests already made by others. Responses read from the
+            file are verified again before use, and a new file is only
+            accessible to its owner. See :attr:`ocsp_cache_stats`. Defaults
+            to ``None``.
           - `ssl`: (boolean) Alias for ``tls``.
 
           | **Read Concern options:**
@@ -589,6 +645,12 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
 
         .. seealso:: The MongoDB documentation on `connections <https://dochub.mongodb.org/core/connections>`_.
 
+        .. versionchanged:: 4.9
+           Added the ``compressionMinSize``, ``adaptiveCompression``,
+           ``maxCursorBufferBytes``, ``minPoolWarmupRate``, ``eventQueueSize``,
+           ``slowOperationThresholdMS``, ``tracer``, ``tlsOCSPCacheSize`` and
+           ``tlsOCSPCacheFile`` keyword arguments.
+
         .. versionchanged:: 4.5
            Added the ``serverMonitoringMode`` keyword argument.
 
@@ -835,8 +897,12 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         self._default_database_name = dbase
         self._lock = _ALock(_create_lock())
         self._kill_cursors_queue: list = []
+        self._cleanup_metrics = _CleanupMetrics()
+        self._cursor_buffer = _CursorBuffer(options.max_cursor_buffer_bytes)
 
         self._event_listeners = options.pool_options._event_listeners
+        # Events delivered in the background, see the eventQueueSize option.
+        self._event_queue = self._event_listeners.queue if self._event_listeners else None
         super().__init__(
             options.codec_options,
             options.read_preference,
@@ -905,10 +971,59 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             name="pymongo_kill_cursors_thread",
         )
 
-        # We strongly reference the executor and it weakly references us via
-        # this closure. When the client is freed, stop the executor soon.
-        self_ref: Any = weakref.ref(self, executor.close)
+        async def cleanup_target() -> bool:
+            client = self_ref()
+            if client is None:
+                return False  # Stop the executor.
+            await AsyncMongoClient._process_cleanup(client)
+            return True
+
+        # Kills cursors soon after they are queued, without waiting for
+        # the periodic tasks, which may be busy creating connections.
+        # It sleeps until _close_cursor_soon wakes it instead of checking
+        # for closed cursors every MIN_CURSOR_CLEANUP_INTERVAL.
+        cleanup_executor = periodic_executor.WakeableExecutor(
+            interval=common.KILL_CURSOR_FREQUENCY,
+            min_interval=common.MIN_CURSOR_CLEANUP_INTERVAL,
+            target=cleanup_target,
+            name="pymongo_cleanup_thread",
+        )
+
+        event_queue_executor = None
+        if self._event_queue is not None:
+
+            async def event_queue_target() -> bool:
+                client = self_ref()
+                if client is None:
+                    return False  # Stop the executor.
+                assert client._event_queue is not None
+                client._event_queue.deliver()
+                return True
+
+            # Delivers queued events to listeners soon after they are
+            # published, several at a time.
+            event_queue_executor = periodic_executor.WakeableExecutor(
+                interval=common.EVENTS_QUEUE_FREQUENCY,
+                min_interval=common.MIN_EVENT_QUEUE_INTERVAL,
+                target=event_queue_target,
+                name="pymongo_event_queue_thread",
+            )
+            self._event_queue.wake = event_queue_executor.wake
+
+        def close_executors(dummy: Any) -> None:
+            executor.close()
+            cleanup_executor.close()
+            if event_queue_executor is not None:
+                event_queue_executor.close()
+
+        # We strongly reference the executors and they weakly reference us
+        # via these closures. When the client is freed, stop the executors
+        # soon.
+        self_ref: Any = weakref.ref(self, close_executors)
         self._kill_cursors_executor = executor
+        self._cleanup_executor = cleanup_executor
+        self._event_queue_executor = event_queue_executor
+        self._topology._wake_pool_maintenance = executor.wake
         self._opened = False
 
     def _should_pin_cursor(self, session: Optional[AsyncClientSession]) -> Optional[bool]:
@@ -919,6 +1034,9 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         self._init_background(self._topology._pid)
         # Reset the session pool to avoid duplicate sessions in the child process.
         self._topology._session_pool.reset()
+        # Events queued by the parent are delivered by the parent.
+        if self._event_queue is not None:
+            self._event_queue.clear()
 
     def _duplicate(self, **kwargs: Any) -> AsyncMongoClient:
         args = self._init_kwargs.copy()
@@ -1101,6 +1219,103 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         """
         return self._options
 
+    @property
+    def cleanup_stats(self) -> CleanupStats:
+        """The killCursors and endSessions commands sent by this client to
+        clean up cursors that were not exhausted and server sessions.
+
+        :return: An instance of :class:`~pymongo.cleanup.CleanupStats`.
+
+        .. versionadded:: 4.9
+        """
+        return self._cleanup_metrics.stats(len(self._kill_cursors_queue))
+
+    @property
+    def event_queue_stats(self) -> Optional[EventQueueStats]:
+        """The queue of events delivered to listeners in the background, or
+        ``None`` when this client delivers events synchronously. See the
+        ``eventQueueSize`` option.
+
+        :return: An instance of :class:`~pymongo.monitoring.EventQueueStats`.
+
+        .. versionadded:: 4.9
+        """
+        if self._event_queue is None:
+            return None
+        return self._event_queue.stats()
+
+    @property
+    def ocsp_cache_stats(self) -> Optional[OCSPCacheStats]:
+        """The OCSP response cache of this client, or ``None`` when this
+        client does not check certificate revocation with OCSP.
+
+        :return: An instance of :class:`~pymongo.ocsp_cache.OCSPCacheStats`.
+
+        .. versionadded:: 4.9
+        """
+        cache = getattr(self._options.pool_options._ssl_context, "ocsp_response_cache", None)
+        if cache is None:
+            return None
+        return cache.stats()
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """The wire protocol messages compressed and decompressed by the
+        connections of this client. See the ``compressors`` option.
+
+        :return: An instance of :class:`~pymongo.metrics.CompressionStats`.
+
+        .. versionadded:: 4.9
+        """
+        compression_settings = self._options.pool_options._compression_settings
+        assert compression_settings is not None
+        return compression_settings.metrics.stats()
+
+    @property
+    def cursor_buffer_stats(self) -> CursorBufferStats:
+        """The memory currently held in batches of results by the cursors of
+        this client.
+
+        :return: An instance of :class:`~pymongo.cursor.CursorBufferStats`.
+
+        .. versionadded:: 4.9
+        """
+        return self._cursor_buffer.stats()
+
+    def metrics(self) -> ClientMetrics:
+        """A snapshot of the latencies of the commands run by this client,
+        of connection checkouts and of connection setup, along with this
+        client's other statistics.
+
+        Latencies are recorded for every operation whether or not event
+        listeners are registered::
+
+          >>> metrics = client.metrics()
+          >>> metrics.command("find").percentile(99)
+          0.00134
+
+        :return: An instance of :class:`~pymongo.metrics.ClientMetrics`.
+
+        .. versionadded:: 4.9
+        """
+        (
+            commands,
+            checkout,
+            connection_setup,
+            tls_handshakes,
+        ) = self._options.pool_options._metrics.snapshot()
+        return ClientMetrics(
+            commands,
+            checkout,
+            connection_setup,
+            tls_handshakes,
+            self.compression_stats,
+            self.cleanup_stats,
+            self.cursor_buffer_stats,
+            self.event_queue_stats,
+            self.ocsp_cache_stats,
+        )
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             return self._topology == other._topology
@@ -1180,7 +1395,10 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         conn_mgr: Optional[_ConnectionManager] = None,
     ) -> None:
         """Request that a cursor and/or connection be cleaned up soon."""
-        self._kill_cursors_queue.append((address, cursor_id, conn_mgr))
+        # This is called from __del__, so it must not take any locks.
+        self._kill_cursors_queue.append((address, cursor_id, conn_mgr, time.monotonic()))
+        self._cleanup_metrics.queued(len(self._kill_cursors_queue))
+        self._cleanup_executor.wake()
 
     def _start_session(self, implicit: bool, **kwargs: Any) -> AsyncClientSession:
         server_session = _EmptyServerSession()
@@ -1492,7 +1710,7 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         """
         return await self._server_property("server_type") == SERVER_TYPE.Mongos
 
-    async def _end_sessions(self, session_ids: list[_ServerSession]) -> None:
+    async def _end_sessions(self, session_ids: list[Mapping[str, Any]]) -> None:
         """Send endSessions command(s) with the given session ids."""
         try:
             # Use AsyncConnection.command directly to avoid implicitly creating
@@ -1506,9 +1724,15 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
                 if not conn.supports_sessions:
                     return
 
+                start = time.monotonic()
+                commands = 0
                 for i in range(0, len(session_ids), common._MAX_END_SESSIONS):
                     spec = {"endSessions": session_ids[i : i + common._MAX_END_SESSIONS]}
                     await conn.command("admin", spec, read_preference=read_pref, client=self)
+                    commands += 1
+                self._cleanup_metrics.sessions_ended_in(
+                    len(session_ids), commands, time.monotonic() - start
+                )
         except PyMongoError:
             # Drivers MUST ignore any errors returned by the endSessions
             # command.
@@ -1532,14 +1756,21 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         session_ids = self._topology.pop_all_sessions()
         if session_ids:
             await self._end_sessions(session_ids)
-        # Stop the periodic task thread and then send pending killCursor
-        # requests before closing the topology.
+        # Stop the periodic task and cleanup threads and then send pending
+        # killCursor requests before closing the topology.
         self._kill_cursors_executor.close()
+        self._cleanup_executor.close()
         await self._process_kill_cursors()
         await self._topology.close()
         if self._encrypter:
             # TODO: PYTHON-1921 Encrypted MongoClients cannot be re-opened.
             await self._encrypter.close()
+        # Deliver the events published while closing, after the events that
+        # the executor may be delivering.
+        if self._event_queue_executor is not None:
+            self._event_queue_executor.close()
+            assert self._event_queue is not None
+            self._event_queue.deliver()
 
     if not _IS_SYNC:
         # Add support for contextlib.aclosing.
@@ -1555,6 +1786,9 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
             await self._topology.open()
             async with self._lock:
                 self._kill_cursors_executor.open()
+                self._cleanup_executor.open()
+                if self._event_queue_executor is not None:
+                    self._event_queue_executor.open()
             self._opened = True
         return self._topology
 
@@ -1611,33 +1845,39 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
           - `address` (optional): Address when sending a message
             to a specific server, used for getMore.
         """
-        try:
-            topology = await self._get_topology()
-            if session and not session.in_transaction:
-                await session._transaction.reset()
-            if not address and session:
-                address = session._pinned_address
-            if address:
-                # We're running a getMore or this session is pinned to a mongos.
-                server = await topology.select_server_by_address(
-                    address, operation, operation_id=operation_id
-                )
-                if not server:
-                    raise AutoReconnect("server %s:%s no longer available" % address)  # noqa: UP031
-            else:
-                server = await topology.select_server(
-                    server_selector,
-                    operation,
-                    deprioritized_servers=deprioritized_servers,
-                    operation_id=operation_id,
-                )
-            return server
-        except PyMongoError as exc:
-            # Server selection errors in a transaction are transient.
-            if session and session.in_transaction:
-                exc._add_error_label("TransientTransactionError")
-                await session._unpin()
-            raise
+        self._options.pool_options._metrics.start_operation()
+        started = time.perf_counter_ns()
+        with _span(self._options.pool_options._tracer, "server selection") as span:
+            try:
+                topology = await self._get_topology()
+                if session and not session.in_transaction:
+                    await session._transaction.reset()
+                if not address and session:
+                    address = session._pinned_address
+                if address:
+                    # We're running a getMore or this session is pinned to a mongos.
+                    server = await topology.select_server_by_address(
+                        address, operation, operation_id=operation_id
+                    )
+                    if not server:
+                        raise AutoReconnect("server %s:%s no longer available" % address)  # noqa: UP031
+                else:
+                    server = await topology.select_server(
+                        server_selector,
+                        operation,
+                        deprioritized_servers=deprioritized_servers,
+                        operation_id=operation_id,
+                    )
+            except PyMongoError as exc:
+                # Server selection errors in a transaction are transient.
+                if session and session.in_transaction:
+                    exc._add_error_label("TransientTransactionError")
+                    await session._unpin()
+                raise
+            if span is not None:
+                _set_address(span, server.description.address)
+        _record_phase("selection", started)
+        return server
 
     async def _conn_for_writes(
         self, session: Optional[AsyncClientSession], operation: str
@@ -2001,14 +2241,14 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         # Other threads or the GC may append to the queue concurrently.
         while True:
             try:
-                address, cursor_id, conn_mgr = self._kill_cursors_queue.pop()
+                address, cursor_id, conn_mgr, queued_at = self._kill_cursors_queue.pop()
             except IndexError:
                 break
 
             if conn_mgr:
                 pinned_cursors.append((address, cursor_id, conn_mgr))
             else:
-                address_to_cursor_ids[address].append(cursor_id)
+                address_to_cursor_ids[address].append((cursor_id, queued_at))
 
         for address, cursor_id, conn_mgr in pinned_cursors:
             try:
@@ -2024,22 +2264,43 @@ class AsyncMongoClient(common.BaseObject, Generic[_DocumentType]):
         # Don't re-open topology if it's closed and there's no pending cursors.
         if address_to_cursor_ids:
             topology = await self._get_topology()
-            for address, cursor_ids in address_to_cursor_ids.items():
-                try:
-                    await self._kill_cursors(cursor_ids, address, topology, session=None)
-                except Exception as exc:
-                    if isinstance(exc, InvalidOperation) and self._topology._closed:
-                        raise
+            for address, cursors in address_to_cursor_ids.items():
+                for i in range(0, len(cursors), common._MAX_KILL_CURSORS):
+                    chunk = cursors[i : i + common._MAX_KILL_CURSORS]
+                    try:
+                        await self._kill_cursors(
+                            [cursor_id for cursor_id, _ in chunk], address, topology, session=None
+                        )
+                    except Exception as exc:
+                        if isinstance(exc, InvalidOperation) and self._topology._closed:
+                            raise
+                        else:
+                            helpers_shared._handle_exception()
                     else:
-                        helpers_shared._handle_exception()
+                        now = time.monotonic()
+                        self._cleanup_metrics.cursors_killed_after(
+                            [now - queued_at for _, queued_at in chunk]
+                        )
+
+    # This method is run by a background thread soon after a cursor is queued.
+    async def _process_cleanup(self) -> None:
+        """Process any pending kill cursors requests."""
+        try:
+            await self._process_kill_cursors()
+        except Exception as exc:
+            if isinstance(exc, InvalidOperation) and self._topology._closed:
+                return
+            else:
+                helpers_shared._handle_exception()
 
     # This method is run periodically by a background thread.
     async def _process_periodic_tasks(self) -> None:
-        """Process any pending kill cursors requests and
-        maintain connection pool parameters.
+        """Process any pending kill cursors requests,
+        maintain connection pool parameters and clear stale server sessions.
         """
         try:
             await self._process_kill_cursors()
+            self._topology.clear_stale_sessions()
             await self._topology.update_pool()
         except Exception as exc:
             if isinstance(exc, InvalidOperation) and self._topology._closed:
@@ -2517,6 +2778,8 @@ class _ClientConnectionRetryable(Generic[T]):
         self._deprioritized_servers: list[Server] = []
         self._operation = operation
         self._operation_id = operation_id
+        self._span: Any = None
+        self._retry_attempt = 0
 
     async def run(self) -> T:
         """Runs the supplied func() and attempts a retry
@@ -2525,6 +2788,15 @@ class _ClientConnectionRetryable(Generic[T]):
 
         :return: Result of the func() call
         """
+        with _span(self._client._options.pool_options._tracer, self._operation) as span:
+            if span is not None:
+                span.set_attribute("db.system", "mongodb")
+                span.set_attribute("db.operation.name", self._operation)
+            self._span = span
+            return await self._run()
+
+    async def _run(self) -> T:
+        """Runs the supplied func() and its retries."""
         # Increment the transaction id up front to ensure any retry attempt
         # will use the proper txnNumber, even if server or socket selection
         # fails before the command can be sent.
@@ -2591,6 +2863,15 @@ class _ClientConnectionRetryable(Generic[T]):
 
                 if self._client.topology_description.topology_type == TOPOLOGY_TYPE.Sharded:
                     self._deprioritized_servers.append(self._server)
+                if self._span is not None:
+                    self._retry_attempt += 1
+                    self._span.add_event(
+                        "retry",
+                        {
+                            "pymongo.retry_attempt": self._retry_attempt,
+                            "exception.type": type(exc).__name__,
+                        },
+                    )
 
     def _is_not_eligible_for_retry(self) -> bool:
         """Checks if the exchange is not eligible for retry"""
@@ -44,15 +44,19 @@ from pymongo.errors import (
 )
 from pymongo.logger import _COMMAND_LOGGER, _CommandStatusMessage, _debug_log
 from pymongo.message import _UNPACK_REPLY, _OpMsg, _OpReply
+from pymongo.metrics import _record_phase
 from pymongo.monitoring import _is_speculative_authenticate
 from pymongo.network_layer import (
     _POLL_TIMEOUT,
     _UNPACK_COMPRESSION_HEADER,
     _UNPACK_HEADER,
     BLOCKING_IO_ERRORS,
+    AsyncNetworkingInterface,
+    async_read_message,
     async_sendall,
 )
 from pymongo.socket_checker import _errno_from_exception
+from pymongo.tracing import _set_command_attributes, _span
 
 if TYPE_CHECKING:
     from bson import CodecOptions
@@ -139,6 +143,8 @@ async def command(
 
     publish = listeners is not None and listeners.enabled_for_commands
     start = datetime.datetime.now()
+    # The end of each step of the command, for slow operation timings.
+    marks = [time.perf_counter_ns()]
     if publish:
         speculative_hello = _is_speculative_authenticate(name, spec)
 
@@ -170,6 +176,7 @@ async def command(
 
     if max_bson_size is not None and size > max_bson_size + message._COMMAND_OVERHEAD:
         message._raise_document_too_large(name, size, max_bson_size + message._COMMAND_OVERHEAD)
+    marks.append(time.perf_counter_ns())
     if client is not None:
         if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
             _debug_log(
@@ -199,69 +206,86 @@ async def command(
             service_id=conn.service_id,
         )
 
-    try:
-        await async_sendall(conn.conn, msg)
-        if use_op_msg and unacknowledged:
-            # Unacknowledged, fake a successful command response.
-            reply = None
-            response_doc: _DocumentOut = {"ok": 1}
-        else:
-            reply = await receive_message(conn, request_id)
-            conn.more_to_come = reply.more_to_come
-            unpacked_docs = reply.unpack_response(
-                codec_options=codec_options, user_fields=user_fields
-            )
-
-            response_doc = unpacked_docs[0]
-            if client:
-                await client._process_response(response_doc, session)
-            if check:
-                helpers_shared._check_command_response(
-                    response_doc,
-                    conn.max_wire_version,
-                    allowable_errors,
-                    parse_write_concern_error=parse_write_concern_error,
+    tracer = conn.opts._tracer if client is not None else None
+    with _span(tracer, name) as span:
+        if span is not None:
+            _set_command_attributes(span, name, dbname, request_id, conn)
+        try:
+            await async_sendall(conn.conn, msg)
+            marks.append(time.perf_counter_ns())
+            if use_op_msg and unacknowledged:
+                # Unacknowledged, fake a successful command response.
+                reply = None
+                response_doc: _DocumentOut = {"ok": 1}
+            else:
+                reply = await receive_message(conn, request_id)
+                marks.append(time.perf_counter_ns())
+                conn.more_to_come = reply.more_to_come
+                unpacked_docs = reply.unpack_response(
+                    codec_options=codec_options, user_fields=user_fields
                 )
-    except Exception as exc:
-        duration = datetime.datetime.now() - start
-        if isinstance(exc, (NotPrimaryError, OperationFailure)):
-            failure: _DocumentOut = exc.details  # type: ignore[assignment]
-        else:
-            failure = message._convert_exception(exc)
-        if client is not None:
-            if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
-                _debug_log(
-                    _COMMAND_LOGGER,
-                    clientId=client._topology_settings._topology_id,
-                    message=_CommandStatusMessage.FAILED,
-                    durationMS=duration,
-                    failure=failure,
-                    commandName=next(iter(spec)),
-                    databaseName=dbname,
-                    requestId=request_id,
-                    operationId=request_id,
-                    driverConnectionId=conn.id,
-                    serverConnectionId=conn.server_connection_id,
-                    serverHost=conn.address[0],
-                    serverPort=conn.address[1],
-                    serviceId=conn.service_id,
-                    isServerSideError=isinstance(exc, OperationFailure),
+
+                response_doc = unpacked_docs[0]
+                if client:
+                    await client._process_response(response_doc, session)
+                if check:
+                    helpers_shared._check_command_response(
+                        response_doc,
+                        conn.max_wire_version,
+                        allowable_errors,
+                        parse_write_concern_error=parse_write_concern_error,
+                    )
+                marks.append(time.perf_counter_ns())
+        except Exception as exc:
+            duration = datetime.datetime.now() - start
+            conn.opts._metrics.command(name, conn.address, False, duration.total_seconds())
+            timings = None
+            if client is not None:
+                timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
+            if isinstance(exc, (NotPrimaryError, OperationFailure)):
+                failure: _DocumentOut = exc.details  # type: ignore[assignment]
+            else:
+                failure = message._convert_exception(exc)
+            if client is not None:
+                if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
+                    _debug_log(
+                        _COMMAND_LOGGER,
+                        clientId=client._topology_settings._topology_id,
+                        message=_CommandStatusMessage.FAILED,
+                        durationMS=duration,
+                        failure=failure,
+                        commandName=next(iter(spec)),
+                        databaseName=dbname,
+                        requestId=request_id,
+                        operationId=request_id,
+                        driverConnectionId=conn.id,
+                        serverConnectionId=conn.server_connection_id,
+                        serverHost=conn.address[0],
+                        serverPort=conn.address[1],
+                        serviceId=conn.service_id,
+                        isServerSideError=isinstance(exc, OperationFailure),
+                        timings=timings,
+                    )
+            if publish:
+                assert listeners is not None
+                assert address is not None
+                listeners.publish_command_failure(
+                    duration,
+                    failure,
+                    name,
+                    request_id,
+                    address,
+                    conn.server_connection_id,
+                    service_id=conn.service_id,
+                    database_name=dbname,
+                    timings=timings,
                 )
-        if publish:
-            assert listeners is not None
-            assert address is not None
-            listeners.publish_command_failure(
-                duration,
-                failure,
-                name,
-                request_id,
-                address,
-                conn.server_connection_id,
-                service_id=conn.service_id,
-                database_name=dbname,
-            )
-        raise
+            raise
     duration = datetime.datetime.now() - start
+    conn.opts._metrics.command(name, conn.address, True, duration.total_seconds())
+    timings = None
+    if client is not None:
+        timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
     if client is not None:
         if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
             _debug_log(
@@ -280,6 +304,7 @@ async def command(
                 serverPort=conn.address[1],
                 serviceId=conn.service_id,
                 speculative_authenticate="speculativeAuthenticate" in orig,
+                timings=timings,
             )
     if publish:
         assert listeners is not None
@@ -294,6 +319,7 @@ async def command(
             service_id=conn.service_id,
             speculative_hello=speculative_hello,
             database_name=dbname,
+            timings=timings,
         )
 
     if client and client._encrypter and reply:
@@ -317,6 +343,11 @@ async def receive_message(
             deadline = time.monotonic() + timeout
         else:
             deadline = None
+    if not _IS_SYNC:
+        if isinstance(conn.conn, AsyncNetworkingInterface):
+            return await _receive_message_from_protocol(
+                conn, request_id, deadline, max_message_size
+            )
     # Ignore the response's request id.
     length, _, response_to, op_code = _UNPACK_HEADER(
         await _receive_data_on_socket(conn, 16, deadline)
@@ -334,11 +365,15 @@ async def receive_message(
             f"Message length ({length!r}) is larger than server max "
             f"message size ({max_message_size!r})"
         )
+    data: Union[bytes, memoryview]
     if op_code == 2012:
         op_code, _, compressor_id = _UNPACK_COMPRESSION_HEADER(
             await _receive_data_on_socket(conn, 9, deadline)
         )
-        data = decompress(await _receive_data_on_socket(conn, length - 25, deadline), compressor_id)
+        compressed = await _receive_data_on_socket(conn, length - 25, deadline)
+        started = time.perf_counter_ns()
+        data = decompress(compressed, compressor_id, conn.compression_context)
+        _record_phase("decompress", started)
     else:
         data = await _receive_data_on_socket(conn, length - 16, deadline)
 
@@ -351,6 +386,51 @@ async def receive_message(
     return unpack_reply(data)
 
 
+if not _IS_SYNC:
+
+    async def _receive_message_from_protocol(
+        conn: AsyncConnection,
+        request_id: Optional[int],
+        deadline: Optional[float],
+        max_message_size: int,
+    ) -> Union[_OpReply, _OpMsg]:
+        """Receive a message read by the protocol of an asyncio transport.
+
+        The protocol reads whole messages from the event loop's callbacks.
+        """
+        length, _, response_to, op_code, body = await async_read_message(
+            conn.conn, deadline, conn.cancel_context, max_message_size
+        )
+        # No request_id for exhaust cursor "getMore".
+        if request_id is not None:
+            if request_id != response_to:
+                raise ProtocolError(
+                    f"Got response id {response_to!r} but expected {request_id!r}"
+                )
+        if length <= 16:
+            raise ProtocolError(
+                f"Message length ({length!r}) not longer than standard message header size (16)"
+            )
+        if length > max_message_size:
+            raise ProtocolError(
+                f"Message length ({length!r}) is larger than server max "
+                f"message size ({max_message_size!r})"
+            )
+        data: Union[bytes, memoryview] = body
+        if op_code == 2012:
+            op_code, _, compressor_id = _UNPACK_COMPRESSION_HEADER(body[:9])
+            started = time.perf_counter_ns()
+            data = decompress(body[9:], compressor_id, conn.compression_context)
+            _record_phase("decompress", started)
+        try:
+            unpack_reply = _UNPACK_REPLY[op_code]
+        except KeyError:
+            raise ProtocolError(
+                f"Got opcode {op_code!r} but expected {_UNPACK_REPLY.keys()!r}"
+            ) from None
+        return unpack_reply(data)
+
+
 async def wait_for_read(conn: AsyncConnection, deadline: Optional[float]) -> None:
     """Block until at least one byte is read, or a timeout, or a cancel."""
     sock = conn.conn
@@ -388,10 +468,16 @@ async def wait_for_read(conn: AsyncConnection, deadline: Optional[float]) -> Non
 async def _receive_data_on_socket(
     conn: AsyncConnection, length: int, deadline: Optional[float]
 ) -> memoryview:
-    buf = bytearray(length)
-    mv = memoryview(buf)
-    bytes_read = 0
-    while bytes_read < length:
+    if not _IS_SYNC:
+        # The messages of asyncio transports are read by their protocol instead.
+        assert not isinstance(conn.conn, AsyncNetworkingInterface)
+    receive_buffer = conn.receive_buffer
+    if receive_buffer.buffered >= length:
+        return receive_buffer.consume(length)
+    mv = receive_buffer.reserve(length)
+    # Read as much as the buffer can hold so that the header and the body of
+    # a reply usually arrive in a single recv.
+    while receive_buffer.buffered < length:
         try:
             await wait_for_read(conn, deadline)
             # CSOT: Update timeout. When the timeout has expired perform one
@@ -399,7 +485,7 @@ async def _receive_data_on_socket(
             # the response is actually already buffered on the client.
             if _csot.get_timeout() and deadline is not None:
                 conn.set_conn_timeout(max(deadline - time.monotonic(), 0))
-            chunk_length = conn.conn.recv_into(mv[bytes_read:])
+            chunk_length = conn.conn.recv_into(mv[receive_buffer.end :])
         except BLOCKING_IO_ERRORS:
             raise socket.timeout("timed out") from None
         except OSError as exc:
@@ -409,6 +495,6 @@ async def _receive_data_on_socket(
         if chunk_length == 0:
             raise OSError("connection closed")
 
-        bytes_read += chunk_length
+        receive_buffer.end += chunk_length
 
-    return mv
+    return receive_buffer.consume(length)
@@ -17,6 +17,7 @@ from __future__ import annotations
 import asyncio
 import collections
 import contextlib
+import contextvars
 import functools
 import logging
 import os
@@ -72,17 +73,26 @@ from pymongo.logger import (
     _debug_log,
     _verbose_connection_error_reason,
 )
+from pymongo.metrics import _record_phase
 from pymongo.monitoring import (
     ConnectionCheckOutFailedReason,
     ConnectionClosedReason,
 )
-from pymongo.network_layer import async_sendall
+from pymongo.network_layer import (
+    AsyncNetworkingInterface,
+    _AsyncSocketType,
+    _ReceiveBuffer,
+    _SocketType,
+    async_create_interface,
+    async_sendall,
+)
 from pymongo.pool_options import PoolOptions
 from pymongo.read_preferences import ReadPreference
 from pymongo.server_api import _add_to_command
 from pymongo.server_type import SERVER_TYPE
 from pymongo.socket_checker import SocketChecker
 from pymongo.ssl_support import HAS_SNI, SSLError
+from pymongo.tracing import _set_address, _span
 
 if TYPE_CHECKING:
     from bson import CodecOptions
@@ -120,6 +130,9 @@ except ImportError:
 
 _IS_SYNC = False
 
+# Opens the connections that refill synchronous pools to minPoolSize.
+_CONNECT_EXECUTOR = helpers_shared._SharedExecutor("pymongo-connect")
+
 _MAX_TCP_KEEPIDLE = 120
 _MAX_TCP_KEEPINTVL = 10
 _MAX_TCP_KEEPCNT = 9
@@ -263,7 +276,11 @@ class AsyncConnection:
     """
 
     def __init__(
-        self, conn: Union[socket.socket, _sslConn], pool: Pool, address: tuple[str, int], id: int
+        self,
+        conn: _AsyncSocketType,
+        pool: Pool,
+        address: tuple[str, int],
+        id: int,
     ):
         self.pool_ref = weakref.ref(pool)
         self.conn = conn
@@ -287,6 +304,7 @@ class AsyncConnection:
         self.compression_settings = pool.opts._compression_settings
         self.compression_context: Union[SnappyContext, ZlibContext, ZstdContext, None] = None
         self.socket_checker: SocketChecker = SocketChecker()
+        self.receive_buffer = _ReceiveBuffer()
         self.oidc_token_gen_id: Optional[int] = None
         # Support for mechanism negotiation on the initial handshake.
         self.negotiated_mechs: Optional[list[str]] = None
@@ -298,7 +316,7 @@ class AsyncConnection:
         self.generation = self.pool_gen.get_overall()
         self.ready = False
         self.cancel_context: _CancellationContext = _CancellationContext()
-        self.opts = pool.opts
+        self.opts: PoolOptions = pool.opts
         self.more_to_come: bool = False
         # For load balancer support.
         self.service_id: Optional[ObjectId] = None
@@ -312,6 +330,10 @@ class AsyncConnection:
         self.connect_rtt = 0.0
         self._client_id = pool._client_id
         self.creation_time = time.monotonic()
+        # Whether the TLS handshake resumed a session, None without TLS.
+        self.tls_session_resumed: Optional[bool] = None
+        # The time spent in each phase of this connection's setup.
+        self.handshake_durations: dict[str, float] = {}
 
     def set_conn_timeout(self, timeout: Optional[float]) -> None:
         """Cache last timeout to avoid duplicate calls to conn.settimeout."""
@@ -645,12 +667,20 @@ class AsyncConnection:
             if creds:
                 from pymongo.asynchronous import auth
 
+                start = time.monotonic()
                 await auth.authenticate(creds, self, reauthenticate=reauthenticate)
+                self.handshake_durations["auth"] = time.monotonic() - start
             self.ready = True
             duration = time.monotonic() - self.creation_time
             if self.enabled_for_cmap:
                 assert self.listeners is not None
-                self.listeners.publish_connection_ready(self.address, self.id, duration)
+                self.listeners.publish_connection_ready(
+                    self.address,
+                    self.id,
+                    duration,
+                    self.tls_session_resumed,
+                    self.handshake_durations,
+                )
             if self.enabled_for_logging and _CONNECTION_LOGGER.isEnabledFor(logging.DEBUG):
                 _debug_log(
                     _CONNECTION_LOGGER,
@@ -711,6 +741,10 @@ class AsyncConnection:
 
     def conn_closed(self) -> bool:
         """Return True if we know socket has been closed, False otherwise."""
+        if not _IS_SYNC:
+            if isinstance(self.conn, AsyncNetworkingInterface):
+                # The event loop reads from the socket and closes the transport on EOF.
+                return self.conn.is_closing()
         return self.socket_checker.socket_closed(self.conn)
 
     def send_cluster_time(
@@ -783,14 +817,19 @@ class AsyncConnection:
         )
 
 
-def _create_connection(address: _Address, options: PoolOptions) -> socket.socket:
+def _create_connection(
+    address: _Address, options: PoolOptions, durations: Optional[dict[str, float]] = None
+) -> socket.socket:
     """Given (host, port) and PoolOptions, connect and return a socket object.
 
     Can raise socket.error.
 
     This is a modified version of create_connection from CPython >= 2.7.
+    The time spent resolving and connecting is recorded in `durations`.
     """
     host, port = address
+    if durations is None:
+        durations = {}
 
     # Check if dealing with a unix domain socket
     if host.endswith(".sock"):
@@ -800,7 +839,9 @@ def _create_connection(address: _Address, options: PoolOptions) -> socket.socket
         # SOCK_CLOEXEC not supported for Unix sockets.
         _set_non_inheritable_non_atomic(sock.fileno())
         try:
+            start = time.monotonic()
             sock.connect(host)
+            durations["tcp"] = time.monotonic() - start
             return sock
         except OSError:
             sock.close()
@@ -814,7 +855,11 @@ def _create_connection(address: _Address, options: PoolOptions) -> socket.socket
         family = socket.AF_UNSPEC
 
     err = None
-    for res in socket.getaddrinfo(host, port, family, socket.SOCK_STREAM):
+    start = time.monotonic()
+    addresses = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+    durations["dns"] = time.monotonic() - start
+    start = time.monotonic()
+    for res in addresses:
         af, socktype, proto, dummy, sa = res
         # SOCK_CLOEXEC was new in CPython 3.2, and only available on a limited
         # number of platforms (newer Linux and *BSD). Starting with CPython 3.4
@@ -839,6 +884,7 @@ def _create_connection(address: _Address, options: PoolOptions) -> socket.socket
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, True)
             _set_keepalive_times(sock)
             sock.connect(sa)
+            durations["tcp"] = time.monotonic() - start
             return sock
         except OSError as e:
             err = e
@@ -854,16 +900,120 @@ def _create_connection(address: _Address, options: PoolOptions) -> socket.socket
         raise OSError("getaddrinfo failed")
 
 
+async def _connect_socket(
+    address: _Address, options: PoolOptions, durations: dict[str, float]
+) -> socket.socket:
+    """Resolve and connect to `address`, see _create_connection."""
+    if not _IS_SYNC:
+        # Resolve and connect in a thread so that the event loop can set up
+        # several connections at once. Copy the context for CSOT.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                contextvars.copy_context().run, _create_connection, address, options, durations
+            ),
+        )
+    return _create_connection(address, options, durations)
+
+
+async def _wrap_socket(
+    ssl_context: Any, sock: socket.socket, host: str, tls_session: Any
+) -> _sslConn:
+    """Wrap `sock` with `ssl_context` and run the TLS handshake."""
+    # We have to pass hostname / ip address to wrap_socket
+    # to use SSLContext.check_hostname.
+    server_hostname = host if HAS_SNI else None
+    if not _IS_SYNC:
+        if hasattr(ssl_context, "a_wrap_socket"):
+            return await ssl_context.a_wrap_socket(
+                sock, server_hostname=server_hostname, session=tls_session
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                ssl_context.wrap_socket,
+                sock,
+                server_hostname=server_hostname,
+                session=tls_session,
+            ),
+        )
+    return ssl_context.wrap_socket(sock, server_hostname=server_hostname, session=tls_session)
+
+
+async def _configured_conn(
+    address: _Address,
+    options: PoolOptions,
+    tls_session: Any,
+    durations: dict[str, float],
+) -> _AsyncSocketType:
+    """Given (host, port) and PoolOptions, return the configured socket of a
+    new pool connection, see _configured_socket.
+
+    Asyncio clients hand the socket over to the event loop, unless TLS is
+    provided by PyOpenSSL which asyncio's TLS transport does not support.
+    """
+    if not _IS_SYNC:
+        ssl_context = options._ssl_context
+        if ssl_context is None or isinstance(ssl_context, ssl.SSLContext):
+            sock = await _connect_socket(address, options, durations)
+            host = address[0]
+            start = time.monotonic()
+            try:
+                interface = await async_create_interface(
+                    sock,
+                    ssl_context,
+                    host if ssl_context is not None and HAS_SNI else None,
+                    options.socket_timeout,
+                    options.connect_timeout,
+                )
+            except _CertificateError:
+                sock.close()
+                raise
+            except (OSError, SSLError) as exc:
+                sock.close()
+                if ssl_context is None:
+                    raise
+                details = _get_timeout_details(options)
+                _raise_connection_failure(
+                    address, exc, "SSL handshake failed: ", timeout_details=details
+                )
+            if ssl_context is None:
+                return interface
+            if (
+                ssl_context.verify_mode
+                and not ssl_context.check_hostname
+                and not options.tls_allow_invalid_hostnames
+            ):
+                try:
+                    ssl.match_hostname(interface.getpeercert(), hostname=host)
+                except _CertificateError:
+                    interface.close()
+                    raise
+            durations["tls"] = time.monotonic() - start
+            return interface
+
+    return await _configured_socket(address, options, tls_session, durations)
+
+
 async def _configured_socket(
-    address: _Address, options: PoolOptions
-) -> Union[socket.socket, _sslConn]:
+    address: _Address,
+    options: PoolOptions,
+    tls_session: Any = None,
+    durations: Optional[dict[str, float]] = None,
+) -> _SocketType:
     """Given (host, port) and PoolOptions, return a configured socket.
 
     Can raise socket.error, ConnectionFailure, or _CertificateError.
 
-    Sets socket's SSL and timeout options.
+    Sets socket's SSL and timeout options. When `tls_session` is given the
+    TLS handshake attempts to resume it. The time spent in each phase is
+    recorded in `durations`.
     """
-    sock = _create_connection(address, options)
+    if durations is None:
+        durations = {}
+    sock = await _connect_socket(address, options, durations)
     ssl_context = options._ssl_context
 
     if ssl_context is None:
@@ -871,30 +1021,9 @@ async def _configured_socket(
         return sock
 
     host = address[0]
+    start = time.monotonic()
     try:
-        # We have to pass hostname / ip address to wrap_socket
-        # to use SSLContext.check_hostname.
-        if HAS_SNI:
-            if _IS_SYNC:
-                ssl_sock = ssl_context.wrap_socket(sock, server_hostname=host)
-            else:
-                if hasattr(ssl_context, "a_wrap_socket"):
-                    ssl_sock = await ssl_context.a_wrap_socket(sock, server_hostname=host)  # type: ignore[assignment, misc]
-                else:
-                    loop = asyncio.get_running_loop()
-                    ssl_sock = await loop.run_in_executor(
-                        None,
-                        functools.partial(ssl_context.wrap_socket, sock, server_hostname=host),  # type: ignore[assignment, misc]
-                    )
-        else:
-            if _IS_SYNC:
-                ssl_sock = ssl_context.wrap_socket(sock)
-            else:
-                if hasattr(ssl_context, "a_wrap_socket"):
-                    ssl_sock = await ssl_context.a_wrap_socket(sock)  # type: ignore[assignment, misc]
-                else:
-                    loop = asyncio.get_running_loop()
-                    ssl_sock = await loop.run_in_executor(None, ssl_context.wrap_socket, sock)  # type: ignore[assignment, misc]
+        ssl_sock = await _wrap_socket(ssl_context, sock, host, tls_session)
     except _CertificateError:
         sock.close()
         # Raise _CertificateError directly like we do after match_hostname
@@ -918,6 +1047,7 @@ async def _configured_socket(
             ssl_sock.close()
             raise
 
+    durations["tls"] = time.monotonic() - start
     ssl_sock.settimeout(options.socket_timeout)
     return ssl_sock
 
@@ -928,6 +1058,63 @@ class _PoolClosedError(PyMongoError):
     """
 
 
+class _WarmupRateLimiter:
+    """Limits how many connections per second a pool opens to reach
+    minPoolSize, allowing bursts of up to one second's worth.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.allowance = self.capacity
+        self.updated = time.monotonic()
+
+    def acquire(self, count: int) -> int:
+        """Take up to `count` connections from the allowance and return how
+        many may be opened now.
+        """
+        now = time.monotonic()
+        self.allowance = min(self.capacity, self.allowance + (now - self.updated) * self.rate)
+        self.updated = now
+        granted = min(count, int(self.allowance))
+        self.allowance -= granted
+        return granted
+
+    def release(self, count: int) -> None:
+        """Give back connections that were acquired but not opened."""
+        self.allowance = min(self.capacity, self.allowance + count)
+
+
+class _TLSSessionCache:
+    """The most recent TLS session of a server, which new connections to the
+    server attempt to resume instead of doing a full TLS handshake.
+
+    Asyncio's TLS transport cannot resume sessions, so connections made with
+    it always do a full TLS handshake.
+    """
+
+    def __init__(self) -> None:
+        self.session: Any = None
+
+    @staticmethod
+    def session_reused(sock: _AsyncSocketType) -> Optional[bool]:
+        """Whether the TLS handshake of a new connection resumed a session, or
+        None if the connection does not use TLS.
+        """
+        resumed = getattr(sock, "session_reused", None)
+        return None if resumed is None else bool(resumed)
+
+    def update(self, sock: _AsyncSocketType) -> None:
+        """Remember the session of a connection that has completed its setup.
+
+        TLS 1.3 servers send session tickets after the handshake, so the
+        resumable session is only available once data has been read.
+        """
+        session = getattr(sock, "session", None)
+        if session is not None:
+            self.session = session
+
+
 class _PoolGeneration:
     def __init__(self) -> None:
         # Maps service_id to generation.
@@ -1003,6 +1190,9 @@ class Pool:
         # recent reset and close them.
         # self.generation = 0
         self.gen = _PoolGeneration()
+        # Kept across resets so that reconnecting after a reset or failover
+        # resumes TLS sessions.
+        self.tls_sessions = _TLSSessionCache()
         self.pid = os.getpid()
         self.address = address
         self.opts = options
@@ -1029,6 +1219,9 @@ class Pool:
         self._max_connecting_cond = _ACondition(threading.Condition(self.lock))  # type: ignore[arg-type]
         self._max_connecting = self.opts.max_connecting
         self._pending = 0
+        self._warmup_limiter: Optional[_WarmupRateLimiter] = None
+        if self.opts.min_pool_warmup_rate is not None:
+            self._warmup_limiter = _WarmupRateLimiter(self.opts.min_pool_warmup_rate)
         self._client_id = client_id
         if self.enabled_for_cmap:
             assert self.opts._event_listeners is not None
@@ -1202,40 +1395,108 @@ class Pool:
 
         while True:
             async with self.size_cond:
-                # There are enough sockets in the pool.
-                if len(self.conns) + self.active_sockets >= self.opts.min_pool_size:
-                    return
-                if self.requests >= self.opts.min_pool_size:
+                needed = self.opts.min_pool_size - max(
+                    len(self.conns) + self.active_sockets, self.requests
+                )
+            # Open up to maxConnecting connections at once so that the pool
+            # refills quickly, e.g. after a failover cleared it.
+            count = min(needed, self._max_connecting)
+            if count > 0 and self._warmup_limiter is not None:
+                async with self.lock:
+                    count = self._warmup_limiter.acquire(count)
+            if count <= 0:
+                return
+            if count == 1:
+                added = await self._add_min_pool_conn(reference_generation)
+                if not added:
+                    await self._release_warmup(1)
                     return
-                self.requests += 1
-            incremented = False
+                continue
+            results = await self._add_min_pool_conns(reference_generation, count)
+            await self._release_warmup(results.count(False))
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            if not all(results):
+                return
+
+    async def _add_min_pool_conns(
+        self, reference_generation: int, count: int
+    ) -> list[Union[bool, BaseException]]:
+        """Add `count` connections towards minPoolSize at once. Returns the
+        result of _add_min_pool_conn, or the error it raised, for each.
+        """
+        if not _IS_SYNC:
+            return await asyncio.gather(
+                *[self._add_min_pool_conn(reference_generation) for _ in range(count)],
+                return_exceptions=True,
+            )
+        # Copy the context for CSOT.
+        futures = [
+            _CONNECT_EXECUTOR.submit(
+                contextvars.copy_context().run, self._add_min_pool_conn, reference_generation
+            )
+            for _ in range(count)
+        ]
+        results: list[Union[bool, BaseException]] = []
+        for future in futures:
             try:
+                results.append(future.result())
+            except BaseException as exc:
+                results.append(exc)
+        return results
+
+    async def _release_warmup(self, count: int) -> None:
+        if count and self._warmup_limiter is not None:
+            async with self.lock:
+                self._warmup_limiter.release(count)
+
+    async def _add_min_pool_conn(self, reference_generation: int) -> bool:
+        """Add one connection towards minPoolSize. Returns False once no more
+        connections should be added.
+        """
+        async with self.size_cond:
+            # There are enough sockets in the pool.
+            if len(self.conns) + self.active_sockets >= self.opts.min_pool_size:
+                return False
+            if self.requests >= self.opts.min_pool_size:
+                return False
+            self.requests += 1
+        incremented = False
+        try:
+            async with self._max_connecting_cond:
+                # If maxConnecting connections are already being created
+                # by this pool then try again later instead of waiting.
+                if self._pending >= self._max_connecting:
+                    return False
+                self._pending += 1
+                incremented = True
+            conn = await self.connect()
+            async with self.lock:
+                # Close connection and return if the pool was reset during
+                # socket creation or while acquiring the pool lock.
+                if self.gen.get_overall() != reference_generation:
+                    conn.close_conn(ConnectionClosedReason.STALE)
+                    return False
+                self.conns.appendleft(conn)
+                self.active_contexts.discard(conn.cancel_context)
+                connections = len(self.conns) + self.active_sockets
+            if self.enabled_for_cmap:
+                assert self.opts._event_listeners is not None
+                self.opts._event_listeners.publish_pool_warmup_progress(
+                    self.address, connections, self.opts.min_pool_size
+                )
+            return True
+        finally:
+            if incremented:
+                # Notify after adding the socket to the pool.
                 async with self._max_connecting_cond:
-                    # If maxConnecting connections are already being created
-                    # by this pool then try again later instead of waiting.
-                    if self._pending >= self._max_connecting:
-                        return
-                    self._pending += 1
-                    incremented = True
-                conn = await self.connect()
-                async with self.lock:
-                    # Close connection and return if the pool was reset during
-                    # socket creation or while acquiring the pool lock.
-                    if self.gen.get_overall() != reference_generation:
-                        conn.close_conn(ConnectionClosedReason.STALE)
-                        return
-                    self.conns.appendleft(conn)
-                    self.active_contexts.discard(conn.cancel_context)
-            finally:
-                if incremented:
-                    # Notify after adding the socket to the pool.
-                    async with self._max_connecting_cond:
-                        self._pending -= 1
-                        self._max_connecting_cond.notify()
+                    self._pending -= 1
+                    self._max_connecting_cond.notify()
 
-                async with self.size_cond:
-                    self.requests -= 1
-                    self.size_cond.notify()
+            async with self.size_cond:
+                self.requests -= 1
+                self.size_cond.notify()
 
     async def connect(self, handler: Optional[_MongoClientErrorHandler] = None) -> AsyncConnection:
         """Connect to Mongo and return a new AsyncConnection.
@@ -1263,8 +1524,12 @@ class Pool:
                 driverConnectionId=conn_id,
             )
 
+        connect_started_time = time.monotonic()
         try:
-            sock = await _configured_socket(self.address, self.opts)
+            durations: dict[str, float] = {}
+            sock = await _configured_conn(
+                self.address, self.opts, self.tls_sessions.session, durations
+            )
         except BaseException as error:
             if self.enabled_for_cmap:
                 assert listeners is not None
@@ -1289,11 +1554,17 @@ class Pool:
             raise
 
         conn = AsyncConnection(sock, self, self.address, conn_id)  # type: ignore[arg-type]
+        conn.tls_session_resumed = self.tls_sessions.session_reused(sock)
+        if conn.tls_session_resumed is not None:
+            self.opts._metrics.tls_handshake(self.address, conn.tls_session_resumed)
+        conn.handshake_durations = durations
         async with self.lock:
             self.active_contexts.add(conn.cancel_context)
         try:
             if self.handshake:
+                start = time.monotonic()
                 await conn.hello()
+                durations["hello"] = time.monotonic() - start
                 self.is_writable = conn.is_writable
             if handler:
                 handler.contribute_socket(conn, completed_handshake=False)
@@ -1303,6 +1574,11 @@ class Pool:
             conn.close_conn(ConnectionClosedReason.ERROR)
             raise
 
+        if conn.tls_session_resumed is not None:
+            self.tls_sessions.update(sock)
+        if self.handshake:
+            duration = time.monotonic() - connect_started_time
+            self.opts._metrics.connection_setup(self.address, duration)
         return conn
 
     @contextlib.asynccontextmanager
@@ -1326,6 +1602,7 @@ class Pool:
         """
         listeners = self.opts._event_listeners
         checkout_started_time = time.monotonic()
+        checkout_started_ns = time.perf_counter_ns()
         if self.enabled_for_cmap:
             assert listeners is not None
             listeners.publish_connection_check_out_started(self.address)
@@ -1338,9 +1615,16 @@ class Pool:
                 serverPort=self.address[1],
             )
 
-        conn = await self._get_conn(checkout_started_time, handler=handler)
+        with _span(self.opts._tracer, "connection checkout") as span:
+            if span is not None:
+                _set_address(span, self.address)
+            conn = await self._get_conn(checkout_started_time, handler=handler)
+            if span is not None:
+                span.set_attribute("pymongo.connection_id", conn.id)
 
         duration = time.monotonic() - checkout_started_time
+        self.opts._metrics.checkout(self.address, duration)
+        _record_phase("checkout", checkout_started_ns)
         if self.enabled_for_cmap:
             assert listeners is not None
             listeners.publish_connection_checked_out(self.address, conn.id, duration)
@@ -176,6 +176,8 @@ class Topology:
         self._pid: Optional[int] = None
         self._max_cluster_time: Optional[ClusterTime] = None
         self._session_pool = _ServerSessionPool()
+        # Set by the client to run update_pool() soon.
+        self._wake_pool_maintenance: Optional[Callable[[], None]] = None
 
         if self._publish_server or self._publish_tp:
             assert self._events is not None
@@ -474,6 +476,17 @@ class Topology:
             server = self._servers.get(server_description.address)
             if server:
                 await server.pool.ready()
+            # Start warming up the pool of a new primary or secondary now,
+            # instead of on the next periodic pool update.
+            if (
+                self._wake_pool_maintenance is not None
+                and self._settings.pool_options.min_pool_size
+                and (
+                    (server_description.is_writable and not sd_old.is_writable)
+                    or (server_description.is_readable and not sd_old.is_readable)
+                )
+            ):
+                self._wake_pool_maintenance()
 
         suppress_event = sd_old == server_description
         if self._publish_server and not suppress_event:
@@ -667,8 +680,8 @@ class Topology:
         # Remove any stale sockets and add new sockets if pool is too small.
         servers = []
         async with self._lock:
-            # Only update pools for data-bearing servers.
-            for sd in self.data_bearing_servers():
+            # Only update pools for data-bearing servers, primaries first.
+            for sd in sorted(self.data_bearing_servers(), key=lambda sd: not sd.is_writable):
                 server = self._servers[sd.address]
                 servers.append((server, server.pool.gen.get_overall()))
 
@@ -747,7 +760,7 @@ class Topology:
     def description(self) -> TopologyDescription:
         return self._description
 
-    def pop_all_sessions(self) -> list[_ServerSession]:
+    def pop_all_sessions(self) -> list[Mapping[str, Any]]:
         """Pop all session ids from the pool."""
         return self._session_pool.pop_all()
 
@@ -758,6 +771,10 @@ class Topology:
     def return_server_session(self, server_session: _ServerSession) -> None:
         self._session_pool.return_server_session(server_session)
 
+    def clear_stale_sessions(self) -> None:
+        """Discard the pooled sessions that have timed out."""
+        self._session_pool.clear_stale(self._description.logical_session_timeout_minutes)
+
     def _new_selection(self) -> Selection:
         """A Selection object, initially including all known servers.
 
@@ -0,0 +1,151 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License.  You
+# may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.  See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""Statistics about the cleanup of cursors and server sessions by a client.
+
+.. versionadded:: 4.9
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from pymongo.lock import _create_lock
+
+__all__ = ["CleanupStats"]
+
+
+class CleanupStats:
+    """A snapshot of the killCursors and endSessions commands sent by a
+    client.
+
+    Cursors that are garbage collected before they are exhausted are queued
+    and killed in the background, several at a time. Latencies are measured
+    in seconds from the time a cursor is queued to the time the killCursors
+    command that killed it completes.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = (
+        "queue_depth",
+        "max_queue_depth",
+        "cursors_killed",
+        "kill_cursors_commands",
+        "total_kill_cursors_latency",
+        "max_kill_cursors_latency",
+        "sessions_ended",
+        "end_sessions_commands",
+        "end_sessions_time",
+    )
+
+    def __init__(
+        self,
+        queue_depth: int,
+        max_queue_depth: int,
+        cursors_killed: int,
+        kill_cursors_commands: int,
+        total_kill_cursors_latency: float,
+        max_kill_cursors_latency: float,
+        sessions_ended: int,
+        end_sessions_commands: int,
+        end_sessions_time: float,
+    ) -> None:
+        #: The number of cursors currently waiting to be killed.
+        self.queue_depth = queue_depth
+        #: The largest number of cursors that have waited to be killed at once.
+        self.max_queue_depth = max_queue_depth
+        #: The number of queued cursors killed.
+        self.cursors_killed = cursors_killed
+        #: The number of killCursors commands sent for queued cursors.
+        self.kill_cursors_commands = kill_cursors_commands
+        #: The sum of the latencies of every killed cursor.
+        self.total_kill_cursors_latency = total_kill_cursors_latency
+        #: The longest latency of a killed cursor.
+        self.max_kill_cursors_latency = max_kill_cursors_latency
+        #: The number of server sessions ended when the client was closed.
+        self.sessions_ended = sessions_ended
+        #: The number of endSessions commands sent.
+        self.end_sessions_commands = end_sessions_commands
+        #: Seconds spent sending endSessions commands.
+        self.end_sessions_time = end_sessions_time
+
+    @property
+    def average_kill_cursors_latency(self) -> Optional[float]:
+        """The average latency of a killed cursor, or ``None`` if no queued
+        cursor has been killed.
+        """
+        if not self.cursors_killed:
+            return None
+        return self.total_kill_cursors_latency / self.cursors_killed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(queue_depth={self.queue_depth!r}, "
+            f"max_queue_depth={self.max_queue_depth!r}, "
+            f"cursors_killed={self.cursors_killed!r}, "
+            f"kill_cursors_commands={self.kill_cursors_commands!r}, "
+            f"average_kill_cursors_latency={self.average_kill_cursors_latency!r}, "
+            f"max_kill_cursors_latency={self.max_kill_cursors_latency!r}, "
+            f"sessions_ended={self.sessions_ended!r}, "
+            f"end_sessions_commands={self.end_sessions_commands!r})"
+        )
+
+
+class _CleanupMetrics:
+    """Records the cleanup work done by a client."""
+
+    def __init__(self) -> None:
+        self._lock = _create_lock()
+        self.max_queue_depth = 0
+        self.cursors_killed = 0
+        self.kill_cursors_commands = 0
+        self.total_kill_cursors_latency = 0.0
+        self.max_kill_cursors_latency = 0.0
+        self.sessions_ended = 0
+        self.end_sessions_commands = 0
+        self.end_sessions_time = 0.0
+
+    def queued(self, queue_depth: int) -> None:
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
+    def cursors_killed_after(self, latencies: list[float]) -> None:
+        """Record a killCursors command that killed cursors queued
+        `latencies` seconds ago.
+        """
+        with self._lock:
+            self.kill_cursors_commands += 1
+            self.cursors_killed += len(latencies)
+            self.total_kill_cursors_latency += sum(latencies)
+            self.max_kill_cursors_latency = max(self.max_kill_cursors_latency, *latencies)
+
+    def sessions_ended_in(self, sessions: int, commands: int, duration: float) -> None:
+        with self._lock:
+            self.sessions_ended += sessions
+            self.end_sessions_commands += commands
+            self.end_sessions_time += duration
+
+    def stats(self, queue_depth: int) -> CleanupStats:
+        with self._lock:
+            return CleanupStats(
+                queue_depth,
+                self.max_queue_depth,
+                self.cursors_killed,
+                self.kill_cursors_commands,
+                self.total_kill_cursors_latency,
+                self.max_kill_cursors_latency,
+                self.sessions_ended,
+                self.end_sessions_commands,
+                self.end_sessions_time,
+            )
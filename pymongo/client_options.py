@@ -25,6 +25,7 @@ from pymongo import common
 from pymongo.compression_support import CompressionSettings
 from pymongo.errors import ConfigurationError
 from pymongo.monitoring import _EventListener, _EventListeners
+from pymongo.ocsp_cache import _DEFAULT_OCSP_CACHE_SIZE
 from pymongo.pool_options import PoolOptions
 from pymongo.read_concern import ReadConcern
 from pymongo.read_preferences import (
@@ -97,6 +98,8 @@ def _parse_ssl_options(options: Mapping[str, Any]) -> tuple[Optional[SSLContext]
     allow_invalid_certificates = options.get("tlsallowinvalidcertificates", False)
     allow_invalid_hostnames = options.get("tlsallowinvalidhostnames", False)
     disable_ocsp_endpoint_check = options.get("tlsdisableocspendpointcheck", False)
+    ocsp_cache_size = options.get("tlsocspcachesize", _DEFAULT_OCSP_CACHE_SIZE)
+    ocsp_cache_file = options.get("tlsocspcachefile")
 
     enabled_tls_opts = []
     for opt in (
@@ -138,6 +141,8 @@ def _parse_ssl_options(options: Mapping[str, Any]) -> tuple[Optional[SSLContext]
             allow_invalid_certificates,
             allow_invalid_hostnames,
             disable_ocsp_endpoint_check,
+            ocsp_cache_size,
+            ocsp_cache_file,
         )
         return ctx, allow_invalid_hostnames
     return None, allow_invalid_hostnames
@@ -165,11 +170,17 @@ def _parse_pool_options(
     driver = options.get("driver")
     server_api = options.get("server_api")
     compression_settings = CompressionSettings(
-        options.get("compressors", []), options.get("zlibcompressionlevel", -1)
+        options.get("compressors", []),
+        options.get("zlibcompressionlevel", -1),
+        options.get("compressionminsize", 0),
+        options.get("adaptivecompression", False),
     )
     ssl_context, tls_allow_invalid_hostnames = _parse_ssl_options(options)
     load_balanced = options.get("loadbalanced")
     max_connecting = options.get("maxconnecting", common.MAX_CONNECTING)
+    min_pool_warmup_rate = options.get("minpoolwarmuprate")
+    slow_operation_threshold = options.get("slowoperationthresholdms")
+    tracer = options.get("tracer")
     return PoolOptions(
         max_pool_size,
         min_pool_size,
@@ -179,7 +190,7 @@ def _parse_pool_options(
         wait_queue_timeout,
         ssl_context,
         tls_allow_invalid_hostnames,
-        _EventListeners(event_listeners),
+        _EventListeners(event_listeners, options.get("eventqueuesize")),
         appname,
         driver,
         compression_settings,
@@ -188,6 +199,9 @@ def _parse_pool_options(
         load_balanced=load_balanced,
         credentials=credentials,
         is_sync=is_sync,
+        min_pool_warmup_rate=min_pool_warmup_rate,
+        slow_operation_threshold=slow_operation_threshold,
+        tracer=tracer,
     )
 
 
@@ -232,6 +246,7 @@ class ClientOptions:
         self.__server_monitoring_mode = options.get(
             "servermonitoringmode", common.SERVER_MONITORING_MODE
         )
+        self.__max_cursor_buffer_bytes = options.get("maxcursorbufferbytes", 0)
 
     @property
     def _options(self) -> Mapping[str, Any]:
@@ -343,3 +358,11 @@ class ClientOptions:
         .. versionadded:: 4.5
         """
         return self.__server_monitoring_mode
+
+    @property
+    def max_cursor_buffer_bytes(self) -> int:
+        """The configured maxCursorBufferBytes option.
+
+        .. versionadded:: 4.9
+        """
+        return self.__max_cursor_buffer_bytes
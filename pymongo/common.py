@@ -78,9 +78,20 @@ HEARTBEAT_FREQUENCY = 10
 # See MongoClient._process_kill_cursors.
 KILL_CURSOR_FREQUENCY = 1
 
+# Minimum time between two rounds of killCursors when cursors are closed
+# in quick succession, in seconds. Cursors closed within this window are
+# killed together. The cleanup executor otherwise sleeps until a cursor is
+# closed. See MongoClient._process_cleanup.
+MIN_CURSOR_CLEANUP_INTERVAL = 0.05
+
 # Frequency to process events queue, in seconds.
 EVENTS_QUEUE_FREQUENCY = 1
 
+# Minimum time between two deliveries of events queued by a client with the
+# eventQueueSize option, in seconds. Events published within this window are
+# delivered together.
+MIN_EVENT_QUEUE_INTERVAL = 0.01
+
 # How long to wait, in seconds, for a suitable server to be found before
 # aborting an operation. For example, if the client attempts an insert
 # during a replica set election, SERVER_SELECTION_TIMEOUT governs the
@@ -133,6 +144,9 @@ UNAUTHORIZED_CODES: Sequence[int] = (13, 16547, 16548)
 # From the driver sessions spec.
 _MAX_END_SESSIONS = 10000
 
+# Maximum number of cursors to kill in a single killCursors command.
+_MAX_KILL_CURSORS = 10000
+
 # Default value for srvServiceName
 SRV_SERVICE_NAME = "mongodb"
 
@@ -511,6 +525,15 @@ def validate_type_registry(option: Any, value: Any) -> Optional[TypeRegistry]:
     return value
 
 
+def validate_tracer_or_none(option: Any, value: Any) -> Any:
+    """Validate the tracer option, an OpenTelemetry compatible tracer."""
+    if value is not None and not callable(getattr(value, "start_as_current_span", None)):
+        raise TypeError(
+            f"{option} must have a start_as_current_span method, like an OpenTelemetry Tracer"
+        )
+    return value
+
+
 def validate_list(option: str, value: Any) -> list:
     """Validates that 'value' is a list."""
     if not isinstance(value, list):
@@ -728,12 +751,20 @@ URI_OPTIONS_VALIDATOR_MAP: dict[str, Callable[[Any, Any], Any]] = {
 # Dictionary where keys are the names of URI options specific to pymongo,
 # and values are functions that validate user-input values for those options.
 NONSPEC_OPTIONS_VALIDATOR_MAP: dict[str, Callable[[Any, Any], Any]] = {
+    "adaptivecompression": validate_boolean_or_string,
+    "compressionminsize": validate_non_negative_integer,
     "connect": validate_boolean_or_string,
     "driver": validate_driver_or_none,
+    "eventqueuesize": validate_positive_integer,
+    "maxcursorbufferbytes": validate_non_negative_integer,
     "server_api": validate_server_api_or_none,
     "fsync": validate_boolean_or_string,
     "minpoolsize": validate_non_negative_integer,
+    "minpoolwarmuprate": validate_positive_float,
+    "slowoperationthresholdms": validate_timeoutms,
     "tlscrlfile": validate_readable,
+    "tlsocspcachefile": validate_string_or_none,
+    "tlsocspcachesize": validate_positive_integer,
     "tz_aware": validate_boolean_or_string,
     "unicode_decode_error_handler": validate_unicode_decode_error_handler,
     "uuidrepresentation": validate_uuid_representation,
@@ -754,6 +785,7 @@ KW_VALIDATORS: dict[str, Callable[[Any, Any], Any]] = {
     "username": validate_string_or_none,
     "password": validate_string_or_none,
     "server_selector": validate_is_callable_or_none,
+    "tracer": validate_tracer_or_none,
     "auto_encryption_opts": validate_auto_encryption_opts_or_none,
     "authoidcallowedhosts": validate_list,
 }
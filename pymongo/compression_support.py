@@ -13,11 +13,16 @@
 # limitations under the License.
 from __future__ import annotations
 
+import abc
+import threading
+import time
 import warnings
 from typing import Any, Iterable, Optional, Union
 
 from pymongo.hello import HelloCompat
 from pymongo.helpers_shared import _SENSITIVE_COMMANDS
+from pymongo.lock import _create_lock
+from pymongo.metrics import CompressionStats
 
 _SUPPORTED_COMPRESSORS = {"snappy", "zlib", "zstd"}
 _NO_COMPRESSION = {HelloCompat.CMD, HelloCompat.LEGACY_CMD}
@@ -98,61 +103,236 @@ def validate_zlib_compression_level(option: str, value: Any) -> int:
 
 
 class CompressionSettings:
-    def __init__(self, compressors: list[str], zlib_compression_level: int):
+    def __init__(
+        self,
+        compressors: list[str],
+        zlib_compression_level: int,
+        min_size: int = 0,
+        adaptive: bool = False,
+    ):
         self.compressors = compressors
         self.zlib_compression_level = zlib_compression_level
+        self.min_size = min_size
+        self.adaptive = adaptive
+        # Shared by every connection created with these settings.
+        self.command_ratios = _CommandCompressionRatios() if adaptive else None
+        self.metrics = _CompressionMetrics()
 
     def get_compression_context(
         self, compressors: Optional[list[str]]
     ) -> Union[SnappyContext, ZlibContext, ZstdContext, None]:
+        ctx: Union[SnappyContext, ZlibContext, ZstdContext]
         if compressors:
             chosen = compressors[0]
             if chosen == "snappy":
-                return SnappyContext()
+                ctx = SnappyContext()
             elif chosen == "zlib":
-                return ZlibContext(self.zlib_compression_level)
+                ctx = ZlibContext(self.zlib_compression_level)
             elif chosen == "zstd":
-                return ZstdContext()
-            return None
+                ctx = ZstdContext()
+            else:
+                return None
+            ctx.min_size = self.min_size
+            ctx.command_ratios = self.command_ratios
+            ctx.metrics = self.metrics
+            return ctx
         return None
 
 
-class SnappyContext:
+class _CommandCompressionRatios:
+    """Tracks the compression ratio achieved for each command name.
+
+    Commands whose messages do not shrink by at least :attr:`min_savings` are
+    sent uncompressed, except for one message in every :attr:`probe_interval`
+    which is still compressed so that a change in the data is noticed.
+
+    Updates from concurrent connections may race; a lost update only delays
+    the decision by a message.
+    """
+
+    # Messages of a command compressed before its ratio is trusted.
+    warmup = 8
+    # Compress one in this many messages of a command that is being skipped.
+    probe_interval = 64
+    # Fraction of the message size that compression must save.
+    min_savings = 0.1
+    # Weight of the newest sample in the moving average.
+    alpha = 0.25
+
+    def __init__(self) -> None:
+        # Maps a command name to [average ratio, samples, messages skipped].
+        self._commands: dict[str, list[Any]] = {}
+
+    def should_compress(self, name: str) -> bool:
+        entry = self._commands.get(name)
+        if entry is None or entry[1] < self.warmup or entry[0] <= 1 - self.min_savings:
+            return True
+        entry[2] += 1
+        if entry[2] >= self.probe_interval:
+            entry[2] = 0
+            return True
+        return False
+
+    def record(self, name: str, size: int, compressed_size: int) -> None:
+        ratio = compressed_size / size if size else 1.0
+        entry = self._commands.get(name)
+        if entry is None:
+            self._commands[name] = [ratio, 1, 0]
+        else:
+            entry[0] += self.alpha * (ratio - entry[0])
+            entry[1] += 1
+
+    def ratio(self, name: str) -> Optional[float]:
+        """The average compressed size of `name` messages divided by their uncompressed size."""
+        entry = self._commands.get(name)
+        return entry[0] if entry else None
+
+
+class _CompressionMetrics:
+    """Counts the messages compressed and decompressed by the connections of
+    a client.
+    """
+
+    def __init__(self) -> None:
+        self._lock = _create_lock()
+        self._messages_compressed = 0
+        self._messages_not_compressed = 0
+        self._bytes_before_compression = 0
+        self._bytes_after_compression = 0
+        self._compression_time = 0.0
+        self._messages_decompressed = 0
+        self._bytes_before_decompression = 0
+        self._bytes_after_decompression = 0
+        self._decompression_time = 0.0
+
+    def not_compressed(self) -> None:
+        with self._lock:
+            self._messages_not_compressed += 1
+
+    def compressed(self, size: int, compressed_size: int, seconds: float) -> None:
+        with self._lock:
+            self._messages_compressed += 1
+            self._bytes_before_compression += size
+            self._bytes_after_compression += compressed_size
+            self._compression_time += seconds
+
+    def decompressed(self, size: int, decompressed_size: int, seconds: float) -> None:
+        with self._lock:
+            self._messages_decompressed += 1
+            self._bytes_before_decompression += size
+            self._bytes_after_decompression += decompressed_size
+            self._decompression_time += seconds
+
+    def stats(self) -> CompressionStats:
+        with self._lock:
+            return CompressionStats(
+                self._messages_compressed,
+                self._messages_not_compressed,
+                self._bytes_before_compression,
+                self._bytes_after_compression,
+                self._compression_time,
+                self._messages_decompressed,
+                self._bytes_before_decompression,
+                self._bytes_after_decompression,
+                self._decompression_time,
+            )
+
+
+class _CompressionContext(abc.ABC):
+    """Compresses messages and decompresses replies for a single connection.
+
+    A connection is only used by one operation at a time, so any compressor
+    state kept by a context is never shared between threads or tasks.
+    """
+
+    compressor_id: int
+    # Messages smaller than this many bytes are sent uncompressed.
+    min_size = 0
+    command_ratios: Optional[_CommandCompressionRatios] = None
+
+    def __init__(self) -> None:
+        # Replaced by the metrics of the client, see get_compression_context.
+        self.metrics = _CompressionMetrics()
+
+    def should_compress(self, size: int, name: Optional[str] = None) -> bool:
+        """Whether a `size` byte message for the command `name` is worth compressing."""
+        if size < self.min_size or (
+            name is not None
+            and self.command_ratios is not None
+            and not self.command_ratios.should_compress(name)
+        ):
+            self.metrics.not_compressed()
+            return False
+        return True
+
+    def compress(self, data: bytes, name: Optional[str] = None) -> bytes:
+        start = time.thread_time()
+        compressed = self._compress(data)
+        self.metrics.compressed(len(data), len(compressed), time.thread_time() - start)
+        if name is not None and self.command_ratios is not None:
+            self.command_ratios.record(name, len(data), len(compressed))
+        return compressed
+
+    def decompress(self, data: bytes) -> bytes:
+        start = time.thread_time()
+        decompressed = self._decompress(data)
+        self.metrics.decompressed(len(data), len(decompressed), time.thread_time() - start)
+        return decompressed
+
+    @abc.abstractmethod
+    def _compress(self, data: bytes) -> bytes:
+        ...
+
+    def _decompress(self, data: bytes) -> bytes:
+        return _decompress(data, self.compressor_id)
+
+
+class SnappyContext(_CompressionContext):
     compressor_id = 1
 
-    @staticmethod
-    def compress(data: bytes) -> bytes:
+    def _compress(self, data: bytes) -> bytes:
         import snappy
 
         return snappy.compress(data)
 
 
-class ZlibContext:
+class ZlibContext(_CompressionContext):
     compressor_id = 2
 
     def __init__(self, level: int):
+        super().__init__()
         self.level = level
 
-    def compress(self, data: bytes) -> bytes:
+    def _compress(self, data: bytes) -> bytes:
         import zlib
 
         return zlib.compress(data, self.level)
 
 
-class ZstdContext:
+class ZstdContext(_CompressionContext):
     compressor_id = 3
 
-    @staticmethod
-    def compress(data: bytes) -> bytes:
-        # ZstdCompressor is not thread safe.
-        # TODO: Use a pool?
-
+    def __init__(self) -> None:
+        super().__init__()
+        # ZstdCompressor and ZstdDecompressor are not thread safe but are
+        # reused for every message on this context's connection.
         import zstandard
 
-        return zstandard.ZstdCompressor().compress(data)
+        self._compressor = zstandard.ZstdCompressor()
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def _compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
 
+    def _decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
 
-def decompress(data: bytes, compressor_id: int) -> bytes:
+
+# Per thread ZstdDecompressor for replies decompressed without a context.
+_zstd_local = threading.local()
+
+
+def _decompress(data: bytes, compressor_id: int) -> bytes:
     if compressor_id == SnappyContext.compressor_id:
         # python-snappy doesn't support the buffer interface.
         # https://github.com/andrix/python-snappy/issues/65
@@ -166,10 +346,24 @@ def decompress(data: bytes, compressor_id: int) -> bytes:
 
         return zlib.decompress(data)
     elif compressor_id == ZstdContext.compressor_id:
-        # ZstdDecompressor is not thread safe.
-        # TODO: Use a pool?
-        import zstandard
+        decompressor = getattr(_zstd_local, "decompressor", None)
+        if decompressor is None:
+            import zstandard
 
-        return zstandard.ZstdDecompressor().decompress(data)
+            decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
     else:
         raise ValueError("Unknown compressorId %d" % (compressor_id,))
+
+
+def decompress(
+    data: bytes,
+    compressor_id: int,
+    ctx: Union[SnappyContext, ZlibContext, ZstdContext, None] = None,
+) -> bytes:
+    """Decompress a reply, using the connection's compression context `ctx`
+    when it matches the reply's compressor.
+    """
+    if ctx is not None and ctx.compressor_id == compressor_id:
+        return ctx.decompress(data)
+    return _decompress(data, compressor_id)
@@ -20,4 +20,4 @@ from pymongo.synchronous.cursor import *  # noqa: F403
 from pymongo.synchronous.cursor import __doc__ as original_doc
 
 __doc__ = original_doc
-__all__ = ["Cursor", "CursorType", "RawBatchCursor"]  # noqa: F405
+__all__ = ["Cursor", "CursorBufferStats", "CursorType", "RawBatchCursor"]  # noqa: F405
@@ -16,7 +16,18 @@
 """Constants and types shared across all cursor classes."""
 from __future__ import annotations
 
-from typing import Any, Mapping, Sequence, Tuple, Union
+import math
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+from bson import _UNPACK_INT_FROM, decode_iter
+from bson.codec_options import CodecOptions
+from pymongo.helpers_shared import _SharedExecutor
+from pymongo.lock import _create_lock
+
+if TYPE_CHECKING:
+    from pymongo.typings import _DocumentOut
 
 # These errors mean that the server has already killed the cursor so there is
 # no need to send killCursors.
@@ -92,3 +103,252 @@ _Sort = Union[
     Sequence[Union[str, Tuple[str, Union[int, str, Mapping[str, Any]]]]], Mapping[str, Any]
 ]
 _Hint = Union[str, _Sort]
+
+
+# The default bound on the documents in each batch of an adaptive cursor,
+# which matches the size of the batches returned by the server by default.
+_DEFAULT_MAX_BATCH_BYTES = 16 * 1024 * 1024
+
+
+def _validate_adaptive_batch_size(
+    max_batch_bytes: int, min_batch_size: int, max_batch_size: int
+) -> Tuple[int, int, int]:
+    """Validate the arguments of ``adaptive_batch_size``."""
+    for name, value in (
+        ("max_batch_bytes", max_batch_bytes),
+        ("min_batch_size", min_batch_size),
+        ("max_batch_size", max_batch_size),
+    ):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"{name} must be an integer")
+    if max_batch_bytes < 1:
+        raise ValueError("max_batch_bytes must be >= 1")
+    if min_batch_size < 1:
+        raise ValueError("min_batch_size must be >= 1")
+    if max_batch_size < 0:
+        raise ValueError("max_batch_size must be >= 0")
+    if max_batch_size and max_batch_size < min_batch_size:
+        raise ValueError("max_batch_size must be >= min_batch_size")
+    return max_batch_bytes, min_batch_size, max_batch_size
+
+
+class _BatchSizeTuner:
+    """Chooses the batch size of each getMore of a cursor.
+
+    Each batch should hold enough documents to keep the application busy
+    for several round trips, so that the time spent waiting for getMores is
+    small, but no more than that, and never more than `max_batch_bytes`
+    of documents. The batch size changes by at most a factor of two per
+    getMore.
+    """
+
+    # Aim to spend at most this fraction of the time consuming a batch on
+    # the round trip of the next getMore.
+    _ROUND_TRIP_FRACTION = 0.25
+    # The weight of the newest sample in the moving averages.
+    _WEIGHT = 0.5
+
+    def __init__(self, max_batch_bytes: int, min_batch_size: int, max_batch_size: int) -> None:
+        self.max_batch_bytes = max_batch_bytes
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        # Moving averages of the size of each document in bytes, the round
+        # trip time of each batch in seconds, and the number of documents
+        # consumed by the application per second.
+        self.document_size: Optional[float] = None
+        self.round_trip_time: Optional[float] = None
+        self.consume_rate: Optional[float] = None
+        self._last_batch_size = 0
+        self._delivered_at: Optional[float] = None
+        self._delivered_count = 0
+
+    def copy(self) -> _BatchSizeTuner:
+        """A tuner with the same bounds and no samples."""
+        return _BatchSizeTuner(self.max_batch_bytes, self.min_batch_size, self.max_batch_size)
+
+    def _average(self, average: Optional[float], sample: float) -> float:
+        if average is None:
+            return sample
+        return average + self._WEIGHT * (sample - average)
+
+    def received(self, count: int, size: int, round_trip_time: Optional[timedelta]) -> None:
+        """Record a batch of `count` documents in a reply of `size` bytes."""
+        if count:
+            self.document_size = self._average(self.document_size, size / count)
+            self._last_batch_size = count
+        if round_trip_time is not None:
+            self.round_trip_time = self._average(
+                self.round_trip_time, round_trip_time.total_seconds()
+            )
+
+    def delivered(self, count: int) -> None:
+        """Record that a batch of `count` documents is ready for the application."""
+        self._delivered_at = time.monotonic()
+        self._delivered_count = count
+
+    def drained(self) -> None:
+        """Record that the application has consumed the last delivered batch."""
+        if self._delivered_at is None or not self._delivered_count:
+            return
+        elapsed = time.monotonic() - self._delivered_at
+        self._delivered_at = None
+        # A batch consumed faster than the clock can measure has no rate.
+        if elapsed <= 0:
+            return
+        self.consume_rate = self._average(self.consume_rate, self._delivered_count / elapsed)
+
+    def batch_size(self, default: int) -> int:
+        """The batch size of the next getMore, or `default` until the first
+        batch has been received.
+        """
+        if self.document_size is None:
+            return default
+        target = float("inf")
+        if self.consume_rate is not None and self.round_trip_time is not None:
+            target = self.consume_rate * self.round_trip_time / self._ROUND_TRIP_FRACTION
+        if self._last_batch_size:
+            target = min(max(target, self._last_batch_size / 2), self._last_batch_size * 2)
+        target = min(target, self.max_batch_bytes / max(self.document_size, 1.0))
+        if self.max_batch_size:
+            target = min(target, self.max_batch_size)
+        if not math.isfinite(target):
+            return default
+        return max(self.min_batch_size, int(target))
+
+
+class CursorBufferStats:
+    """A snapshot of the memory held in batches of results by the cursors of
+    a client.
+
+    Sizes are the size in bytes of the BSON of each batch, as received from
+    the server. Decoded documents typically use several times as much memory.
+    See the ``maxCursorBufferBytes`` option of
+    :class:`~pymongo.mongo_client.MongoClient`.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("decoded_bytes", "raw_bytes", "raw_batches", "max_buffer_bytes")
+
+    def __init__(
+        self, decoded_bytes: int, raw_bytes: int, raw_batches: int, max_buffer_bytes: int
+    ) -> None:
+        #: The size of the batches currently held as decoded documents.
+        self.decoded_bytes = decoded_bytes
+        #: The size of the batches currently held as raw BSON.
+        self.raw_bytes = raw_bytes
+        #: The number of batches that have been held as raw BSON and decoded
+        #: one document at a time because they did not fit in the budget.
+        self.raw_batches = raw_batches
+        #: The configured ``maxCursorBufferBytes``, or ``0`` for no limit.
+        self.max_buffer_bytes = max_buffer_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(decoded_bytes={self.decoded_bytes!r}, "
+            f"raw_bytes={self.raw_bytes!r}, raw_batches={self.raw_batches!r}, "
+            f"max_buffer_bytes={self.max_buffer_bytes!r})"
+        )
+
+
+class _CursorBuffer:
+    """Tracks the batches held by the cursors of a client against the
+    client's ``maxCursorBufferBytes`` budget.
+    """
+
+    def __init__(self, max_buffer_bytes: int) -> None:
+        self.max_buffer_bytes = max_buffer_bytes
+        self._lock = _create_lock()
+        self.decoded_bytes = 0
+        self.raw_bytes = 0
+        self.raw_batches = 0
+
+    def fits(self, size: int, max_cursor_bytes: int) -> bool:
+        """Can a batch of `size` bytes be decoded without exceeding the
+        budget of the client or a cursor's `max_cursor_bytes`?
+        """
+        if max_cursor_bytes and size > max_cursor_bytes:
+            return False
+        return not self.max_buffer_bytes or self.decoded_bytes + size <= self.max_buffer_bytes
+
+    def acquire(self, size: int, raw: bool, lazy: bool) -> None:
+        with self._lock:
+            if lazy:
+                self.raw_batches += 1
+            if raw:
+                self.raw_bytes += size
+            else:
+                self.decoded_bytes += size
+
+    def release(self, size: int, raw: bool) -> None:
+        with self._lock:
+            if raw:
+                self.raw_bytes -= size
+            else:
+                self.decoded_bytes -= size
+
+    def stats(self) -> CursorBufferStats:
+        return CursorBufferStats(
+            self.decoded_bytes, self.raw_bytes, self.raw_batches, self.max_buffer_bytes
+        )
+
+
+class _LazyBatch:
+    """A batch of documents held as a stream of raw BSON documents and
+    decoded one at a time, with the parts of the deque interface used by
+    cursors.
+    """
+
+    __slots__ = ("_data", "_position", "_count", "_docs", "_codec_options")
+
+    def __init__(self, data: bytes, codec_options: CodecOptions) -> None:
+        self._data = data
+        self._position = 0
+        self._codec_options = codec_options
+        count = position = 0
+        while position < len(data):
+            position += _UNPACK_INT_FROM(data, position)[0]
+            count += 1
+        self._count = count
+        self._docs = decode_iter(data, codec_options)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def popleft(self) -> Any:
+        if not self._count:
+            raise IndexError("pop from an empty batch")
+        doc = next(self._docs)
+        self._position += _UNPACK_INT_FROM(self._data, self._position)[0]
+        self._count -= 1
+        return doc
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode the remaining documents without consuming them."""
+        return decode_iter(self._data[self._position :], self._codec_options)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._data = b""
+        self._position = 0
+        self._docs = iter(())
+
+
+def _decoded_reply(reply: _DocumentOut) -> _DocumentOut:
+    """A find or getMore reply with its batch decoded into a list, for
+    listeners and logs.
+
+    A batch held as a _LazyBatch is consumed by its cursor, so the reply that
+    is published gets a copy of the reply with a decoded list instead.
+    """
+    cursor = reply.get("cursor")
+    if isinstance(cursor, Mapping):
+        for name in ("firstBatch", "nextBatch"):
+            batch = cursor.get(name)
+            if isinstance(batch, _LazyBatch):
+                return {**reply, "cursor": {**cursor, name: list(batch)}}
+    return reply
+
+
+# Runs the getMores prefetched by synchronous cursors.
+_PREFETCH_EXECUTOR = _SharedExecutor("pymongo-getmore")
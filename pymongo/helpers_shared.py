@@ -15,12 +15,15 @@
 """Bits and pieces used by the driver that don't really fit elsewhere."""
 from __future__ import annotations
 
+import os
 import sys
 import traceback
 from collections import abc
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Container,
     Iterable,
     Mapping,
@@ -43,6 +46,7 @@ from pymongo.errors import (
     _wtimeout_error,
 )
 from pymongo.hello import HelloCompat
+from pymongo.lock import _create_lock
 
 if TYPE_CHECKING:
     from pymongo.cursor_shared import _Hint
@@ -325,3 +329,26 @@ def _handle_exception() -> None:
             pass
         finally:
             del einfo
+
+
+class _SharedExecutor:
+    """A thread pool shared by all clients, created when first used.
+
+    The thread pool bounds the number of threads running tasks. A new pool is
+    created after a fork because the threads of the parent's pool do not
+    exist in the child.
+    """
+
+    def __init__(self, thread_name_prefix: str):
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = _create_lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(thread_name_prefix=self._thread_name_prefix)
+                self._pid = os.getpid()
+            executor = self._executor
+        return executor.submit(fn, *args)
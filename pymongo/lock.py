@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import os
 import threading
 import time
@@ -44,27 +45,80 @@ def _release_locks() -> None:
 
 
 class _ALock:
+    """An asyncio-aware wrapper around a :class:`threading.Lock`.
+
+    Tasks that find the lock held are parked on event loop futures in a FIFO
+    queue and woken one at a time by :meth:`release`, so that waiting for the
+    lock never spins the event loop.
+    """
+
     def __init__(self, lock: threading.Lock) -> None:
         self._lock = lock
+        # FIFO queue of (loop, future) pairs, one per task waiting for the lock.
+        self._waiters: collections.deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = collections.deque()
+        # Guards _waiters so that a release cannot miss a task that is about
+        # to wait. Never held across an await.
+        self._waiters_lock = _create_lock()
 
     def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
         return self._lock.acquire(blocking=blocking, timeout=timeout)
 
     async def a_acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(blocking=False):
+            return True
+        if not blocking:
+            return False
         if timeout > 0:
-            tstart = time.monotonic()
+            deadline = time.monotonic() + timeout
+        loop = asyncio.get_running_loop()
+        retry = False
         while True:
-            acquired = self._lock.acquire(blocking=False)
-            if acquired:
-                return True
-            if timeout > 0 and (time.monotonic() - tstart) > timeout:
-                return False
-            if not blocking:
-                return False
-            await asyncio.sleep(0)
+            with self._waiters_lock:
+                # Try again under the guard, the lock may have been released
+                # before this task was queued.
+                if self._lock.acquire(blocking=False):
+                    return True
+                fut = loop.create_future()
+                # A woken task that lost the lock to another thread keeps its
+                # place at the front of the queue.
+                if retry:
+                    self._waiters.appendleft((loop, fut))
+                else:
+                    self._waiters.append((loop, fut))
+            remaining = None
+            if timeout > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    fut.cancel()
+                    return False
+            try:
+                await asyncio.wait_for(fut, remaining)
+            except BaseException as exc:
+                # Pass along a wakeup that arrived, or was in flight, as the
+                # wait was interrupted so that it is not lost.
+                if (fut.done() and not fut.cancelled()) or not self._lock.locked():
+                    self._wake_next()
+                if isinstance(exc, asyncio.TimeoutError):
+                    return False
+                raise
+            retry = True
 
     def release(self) -> None:
         self._lock.release()
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        """Wake the first task waiting for the lock."""
+        with self._waiters_lock:
+            while self._waiters:
+                loop, fut = self._waiters.popleft()
+                # Skip waiters that timed out or were cancelled.
+                if fut.done():
+                    continue
+                if _wake(loop, fut):
+                    return
 
     async def __aenter__(self) -> _ALock:
         await self.a_acquire()
@@ -82,50 +136,96 @@ class _ALock:
 
 
 class _ACondition:
+    """An asyncio-aware wrapper around a :class:`threading.Condition`.
+
+    The wrapped condition's lock, an :class:`_ALock`, provides mutual
+    exclusion and queues the tasks waiting to acquire it, while waiters are
+    parked on event loop futures in a FIFO queue so that :meth:`wait` never
+    blocks the event loop.
+    """
+
     def __init__(self, condition: threading.Condition) -> None:
         self._condition = condition
+        self._lock: _ALock = condition._lock  # type: ignore[attr-defined]
+        # FIFO queue of (loop, future) pairs, one per waiting task.
+        self._waiters: collections.deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = collections.deque()
 
     async def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
-        if timeout > 0:
-            tstart = time.monotonic()
-        while True:
-            acquired = self._condition.acquire(blocking=False)
-            if acquired:
-                return True
-            if timeout > 0 and (time.monotonic() - tstart) > timeout:
-                return False
-            if not blocking:
-                return False
-            await asyncio.sleep(0)
+        return await self._lock.a_acquire(blocking, timeout)
 
     async def wait(self, timeout: Optional[float] = None) -> bool:
-        if timeout is not None:
-            tstart = time.monotonic()
-        while True:
-            notified = self._condition.wait(0.001)
-            if notified:
-                return True
-            if timeout is not None and (time.monotonic() - tstart) > timeout:
-                return False
+        """Wait until notified or until a timeout occurs.
+
+        Must be called with the lock held. The lock is released while waiting
+        and re-acquired before returning, even if the wait is cancelled.
+
+        :return: ``True`` if notified, ``False`` if the timeout expired.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._waiters.append((loop, fut))
+        self.release()
+        try:
+            try:
+                try:
+                    await asyncio.wait_for(fut, timeout)
+                    return True
+                except asyncio.TimeoutError:
+                    return False
+            finally:
+                # Must re-acquire the lock even if the wait is cancelled.
+                cancelled = False
+                while True:
+                    try:
+                        await self.acquire()
+                        break
+                    except asyncio.CancelledError:
+                        cancelled = True
+                if cancelled:
+                    raise asyncio.CancelledError
+        except BaseException:
+            # The wait may have been interrupted after this task was notified,
+            # pass the notification along so that it is not lost.
+            if fut.done() and not fut.cancelled():
+                self.notify(1)
+            raise
 
     async def wait_for(self, predicate: Callable, timeout: Optional[float] = None) -> bool:
         if timeout is not None:
-            tstart = time.monotonic()
-        while True:
-            notified = self._condition.wait_for(predicate, 0.001)
-            if notified:
-                return True
-            if timeout is not None and (time.monotonic() - tstart) > timeout:
-                return False
+            deadline = time.monotonic() + timeout
+        result = predicate()
+        while not result:
+            if timeout is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await self.wait(remaining)
+            else:
+                await self.wait()
+            result = predicate()
+        return result
 
     def notify(self, n: int = 1) -> None:
-        self._condition.notify(n)
+        """Wake up to `n` waiting tasks in FIFO order.
+
+        Must be called with the lock held.
+        """
+        woken = 0
+        while self._waiters and woken < n:
+            loop, fut = self._waiters.popleft()
+            # Skip waiters that timed out or were cancelled.
+            if fut.done():
+                continue
+            if _wake(loop, fut):
+                woken += 1
 
     def notify_all(self) -> None:
-        self._condition.notify_all()
+        self.notify(len(self._waiters))
 
     def release(self) -> None:
-        self._condition.release()
+        self._lock.release()
 
     async def __aenter__(self) -> _ACondition:
         await self.acquire()
@@ -140,3 +240,30 @@ class _ACondition:
 
     def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
         self.release()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _wake(loop: asyncio.AbstractEventLoop, fut: asyncio.Future) -> bool:
+    """Complete the future of a waiting task, from any thread.
+
+    Returns False if the task's event loop is closed.
+    """
+    if _running_loop() is loop:
+        fut.set_result(True)
+        return True
+    try:
+        loop.call_soon_threadsafe(_set_future_result, fut)
+    except RuntimeError:
+        return False
+    return True
+
+
+def _set_future_result(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(True)
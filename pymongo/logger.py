@@ -17,7 +17,7 @@ import enum
 import logging
 import os
 import warnings
-from typing import Any
+from typing import Any, Optional
 
 from bson import UuidRepresentation, json_util
 from bson.json_util import JSONOptions, _truncate_documents
@@ -96,7 +96,41 @@ _VERBOSE_CONNECTION_ERROR_REASONS = {
 }
 
 
+def _env_number(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _command_sampled(fields: dict[str, Any]) -> bool:
+    """Whether to log a command message, given the sampling configured with
+    the MONGODB_LOG_COMMAND_SAMPLE_RATE and MONGODB_LOG_COMMAND_SLOW_MS
+    environment variables.
+    """
+    # Keep 1 in N commands. Every message for a command has the same requestId.
+    rate = _env_number("MONGODB_LOG_COMMAND_SAMPLE_RATE")
+    if rate is not None and rate > 1 and fields.get("requestId", 0) % int(rate):
+        return False
+    # Keep only commands that took at least this long, which is unknown when
+    # they start.
+    slow_ms = _env_number("MONGODB_LOG_COMMAND_SLOW_MS")
+    if slow_ms is not None:
+        duration = fields.get("durationMS")
+        if duration is None:
+            return False
+        if hasattr(duration, "total_seconds"):
+            duration = duration.total_seconds() * 1000
+        return duration >= slow_ms
+    return True
+
+
 def _debug_log(logger: logging.Logger, **fields: Any) -> None:
+    if logger is _COMMAND_LOGGER and not _command_sampled(fields):
+        return
     logger.debug(LogMessage(**fields))
 
 
@@ -117,19 +151,27 @@ def _log_or_warn(logger: logging.Logger, message: str) -> None:
 
 
 class LogMessage:
-    __slots__ = ("_kwargs", "_redacted")
+    """The fields of a structured log message, serialized to JSON only when a
+    handler formats the record.
+    """
+
+    __slots__ = ("_kwargs", "_redacted", "_str")
 
     def __init__(self, **kwargs: Any):
         self._kwargs = kwargs
         self._redacted = False
+        self._str: Optional[str] = None
 
     def __str__(self) -> str:
-        self._redact()
-        return "%s" % (
-            json_util.dumps(
-                self._kwargs, json_options=_JSON_OPTIONS, default=lambda o: o.__repr__()
+        # Serialize once, however many handlers format the record.
+        if self._str is None:
+            self._redact()
+            self._str = "%s" % (
+                json_util.dumps(
+                    self._kwargs, json_options=_JSON_OPTIONS, default=lambda o: o.__repr__()
+                )
             )
-        )
+        return self._str
 
     def _is_sensitive(self, doc_name: str) -> bool:
         is_speculative_authenticate = (
@@ -154,6 +196,8 @@ class LogMessage:
             self._kwargs["durationMS"] = self._kwargs["durationMS"].total_seconds() * 1000
         if "serviceId" in self._kwargs:
             self._kwargs["serviceId"] = str(self._kwargs["serviceId"])
+        if "timings" in self._kwargs:
+            self._kwargs["timings"] = self._kwargs["timings"].as_dict()
         document_length = int(os.getenv("MONGOB_LOG_MAX_DOCUMENT_LENGTH", _DEFAULT_DOCUMENT_LENGTH))
         if document_length < 0:
             document_length = _DEFAULT_DOCUMENT_LENGTH
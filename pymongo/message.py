@@ -288,10 +288,20 @@ _COMPRESSION_HEADER_SIZE = 25
 
 
 def _compress(
-    operation: int, data: bytes, ctx: Union[SnappyContext, ZlibContext, ZstdContext]
+    operation: int,
+    data: bytes,
+    ctx: Union[SnappyContext, ZlibContext, ZstdContext],
+    name: Optional[str] = None,
 ) -> tuple[int, bytes]:
-    """Takes message data, compresses it, and adds an OP_COMPRESSED header."""
-    compressed = ctx.compress(data)
+    """Takes message data, compresses it, and adds an OP_COMPRESSED header.
+
+    Messages that `ctx` decides are not worth compressing, because they are
+    smaller than compressionMinSize or because command `name` does not
+    compress well, get a plain message header instead.
+    """
+    if not ctx.should_compress(len(data), name):
+        return __pack_message(operation, data)
+    compressed = ctx.compress(data, name)
     request_id = _randint()
 
     header = _pack_compression_header(
@@ -363,10 +373,11 @@ def _op_msg_compressed(
     docs: Optional[list[Mapping[str, Any]]],
     opts: CodecOptions,
     ctx: Union[SnappyContext, ZlibContext, ZstdContext],
+    name: Optional[str] = None,
 ) -> tuple[int, bytes, int, int]:
     """Internal OP_MSG message helper."""
     msg, total_size, max_bson_size = _op_msg_no_header(flags, command, identifier, docs, opts)
-    rid, msg = _compress(2013, msg, ctx)
+    rid, msg = _compress(2013, msg, ctx, name)
     return rid, msg, total_size, max_bson_size
 
 
@@ -411,7 +422,7 @@ def _op_msg(
         docs = None
     try:
         if ctx:
-            return _op_msg_compressed(flags, command, identifier, docs, opts, ctx)
+            return _op_msg_compressed(flags, command, identifier, docs, opts, ctx, name)
         return _op_msg_uncompressed(flags, command, identifier, docs, opts)
     finally:
         # Add the field back to the command.
@@ -865,7 +876,7 @@ def _batched_op_msg_compressed(
     data, to_send = _encode_batched_op_msg(operation, command, docs, ack, opts, ctx)
 
     assert ctx.conn.compression_context is not None
-    request_id, msg = _compress(2013, data, ctx.conn.compression_context)
+    request_id, msg = _compress(2013, data, ctx.conn.compression_context, ctx.name)
     return request_id, msg, to_send
 
 
@@ -1187,7 +1198,7 @@ def _client_batched_op_msg_compressed(
     )
 
     assert ctx.conn.compression_context is not None
-    request_id, msg = _compress(2013, data, ctx.conn.compression_context)
+    request_id, msg = _compress(2013, data, ctx.conn.compression_context, ctx.name)
     return request_id, msg, to_send_ops, to_send_ns
 
 
@@ -0,0 +1,478 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License.  You
+# may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.  See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""Latency histograms and slow operation timings recorded by a client.
+
+.. versionadded:: 4.9
+"""
+from __future__ import annotations
+
+import math
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Optional
+
+from pymongo.lock import _create_lock
+
+if TYPE_CHECKING:
+    from pymongo.cleanup import CleanupStats
+    from pymongo.cursor_shared import CursorBufferStats
+    from pymongo.monitoring import EventQueueStats
+    from pymongo.ocsp_cache import OCSPCacheStats
+    from pymongo.typings import _Address
+
+__all__ = [
+    "LatencyHistogram",
+    "ClientMetrics",
+    "CompressionStats",
+    "OperationTimings",
+    "TLSHandshakeStats",
+]
+
+# Each power of two is split into this many buckets, which bounds the
+# error of a percentile to about 3% of its value.
+_SUB_BUCKETS = 32
+
+# Latencies are recorded in whole microseconds, up to about 12 days.
+_MAX_BUCKET = 40 * _SUB_BUCKETS
+
+
+# The steps of a command timed by network.command and Server.run_operation,
+# in order.
+_COMMAND_PHASES = ("encode", "send", "receive", "decode")
+
+# The steps of the current operation recorded outside of its command, in
+# nanoseconds: server selection, connection checkout and decompression. Only
+# set while a client samples slow operations.
+_PENDING_PHASES: ContextVar[Optional[dict[str, int]]] = ContextVar("PENDING_PHASES", default=None)
+
+
+def _record_phase(phase: str, started: int) -> None:
+    """Add the time since `started`, from time.perf_counter_ns(), to a step of
+    the current operation.
+    """
+    phases = _PENDING_PHASES.get()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0) + time.perf_counter_ns() - started
+
+
+def _bucket(seconds: float) -> int:
+    """The index of the bucket holding a latency of `seconds`."""
+    micros = seconds * 1e6
+    if micros < 1:
+        return 0
+    # micros == mantissa * 2**exponent with 0.5 <= mantissa < 1.
+    mantissa, exponent = math.frexp(micros)
+    index = (exponent - 1) * _SUB_BUCKETS + int((mantissa * 2 - 1) * _SUB_BUCKETS)
+    return min(index, _MAX_BUCKET)
+
+
+def _bucket_upper_bound(index: int) -> float:
+    """The smallest latency, in seconds, above the bucket at `index`."""
+    exponent, sub_bucket = divmod(index, _SUB_BUCKETS)
+    return math.ldexp(1 + (sub_bucket + 1) / _SUB_BUCKETS, exponent) / 1e6
+
+
+class LatencyHistogram:
+    """A snapshot of the latencies, in seconds, of one kind of event.
+
+    Latencies are counted in buckets whose width grows with their value, so
+    that percentiles are accurate to within about 3%.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_counts")
+
+    def __init__(
+        self, count: int, total: float, min: float, max: float, counts: dict[int, int]
+    ) -> None:
+        #: The number of latencies recorded.
+        self.count = count
+        #: The sum of the latencies recorded.
+        self.total = total
+        #: The smallest latency recorded.
+        self.min = min
+        #: The largest latency recorded.
+        self.max = max
+        self._counts = counts
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The average latency, or ``None`` if none were recorded."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    @property
+    def buckets(self) -> list[tuple[float, int]]:
+        """The non-empty buckets of this histogram, in ascending order, as
+        ``(upper_bound, count)`` pairs.
+        """
+        return [(_bucket_upper_bound(i), self._counts[i]) for i in sorted(self._counts)]
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """The latency below which `percent` percent of the latencies fall,
+        for example ``percentile(99)``, or ``None`` if none were recorded.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for upper_bound, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return max(self.min, min(upper_bound, self.max))
+        return self.max
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count!r}, mean={self.mean!r}, "
+            f"p50={self.percentile(50)!r}, p99={self.percentile(99)!r}, max={self.max!r})"
+        )
+
+
+class OperationTimings:
+    """The seconds that a slow command spent in each step, from selecting a
+    server to decoding the reply.
+
+    Available as :attr:`~pymongo.monitoring.CommandSucceededEvent.timings`
+    and :attr:`~pymongo.monitoring.CommandFailedEvent.timings` for commands
+    that took at least ``slowOperationThresholdMS``.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("selection", "checkout", "encode", "send", "receive", "decompress", "decode")
+
+    def __init__(self, phases: dict[str, int]) -> None:
+        #: Selecting a server, including waiting for a suitable server.
+        self.selection = phases.get("selection", 0) / 1e9
+        #: Checking out a connection, including waiting for and opening one.
+        self.checkout = phases.get("checkout", 0) / 1e9
+        #: Building and encoding the command.
+        self.encode = phases.get("encode", 0) / 1e9
+        #: Writing the command to the socket.
+        self.send = phases.get("send", 0) / 1e9
+        #: Waiting for the server to run the command and reading its reply.
+        #: The driver cannot tell the server's execution time apart from the
+        #: network time.
+        self.receive = phases.get("receive", 0) / 1e9
+        #: Decompressing the reply.
+        self.decompress = phases.get("decompress", 0) / 1e9
+        #: Decoding the reply and checking it for errors.
+        self.decode = phases.get("decode", 0) / 1e9
+
+    @property
+    def total(self) -> float:
+        """The sum of all the steps."""
+        return sum(self.as_dict().values())
+
+    def as_dict(self) -> dict[str, float]:
+        """The seconds spent in each step, keyed by the step's name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"{self.__class__.__name__}({phases})"
+
+
+class CompressionStats:
+    """A snapshot of the wire protocol messages compressed and decompressed
+    by the connections of a client.
+
+    Times are the CPU time, measured with :func:`time.thread_time`, of the
+    threads that compressed or decompressed the messages.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = (
+        "messages_compressed",
+        "messages_not_compressed",
+        "bytes_before_compression",
+        "bytes_after_compression",
+        "compression_time",
+        "messages_decompressed",
+        "bytes_before_decompression",
+        "bytes_after_decompression",
+        "decompression_time",
+    )
+
+    def __init__(
+        self,
+        messages_compressed: int,
+        messages_not_compressed: int,
+        bytes_before_compression: int,
+        bytes_after_compression: int,
+        compression_time: float,
+        messages_decompressed: int,
+        bytes_before_decompression: int,
+        bytes_after_decompression: int,
+        decompression_time: float,
+    ) -> None:
+        #: The number of messages compressed.
+        self.messages_compressed = messages_compressed
+        #: The number of messages sent uncompressed because of the
+        #: ``compressionMinSize`` or ``adaptiveCompression`` options.
+        self.messages_not_compressed = messages_not_compressed
+        #: The size of the compressed messages before compression.
+        self.bytes_before_compression = bytes_before_compression
+        #: The size of the compressed messages after compression.
+        self.bytes_after_compression = bytes_after_compression
+        #: Seconds spent compressing messages.
+        self.compression_time = compression_time
+        #: The number of compressed replies decompressed.
+        self.messages_decompressed = messages_decompressed
+        #: The size of the compressed replies.
+        self.bytes_before_decompression = bytes_before_decompression
+        #: The size of the compressed replies after decompression.
+        self.bytes_after_decompression = bytes_after_decompression
+        #: Seconds spent decompressing replies.
+        self.decompression_time = decompression_time
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """The uncompressed size of the compressed messages divided by their
+        compressed size, or ``None`` if no message was compressed.
+        """
+        if not self.bytes_after_compression:
+            return None
+        return self.bytes_before_compression / self.bytes_after_compression
+
+    @property
+    def decompression_ratio(self) -> Optional[float]:
+        """The decompressed size of the compressed replies divided by their
+        compressed size, or ``None`` if no reply was decompressed.
+        """
+        if not self.bytes_before_decompression:
+            return None
+        return self.bytes_after_decompression / self.bytes_before_decompression
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__),
+        )
+
+
+class TLSHandshakeStats:
+    """The TLS handshakes of the new connections to a server.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("handshakes", "resumed")
+
+    def __init__(self, handshakes: int, resumed: int) -> None:
+        #: The number of TLS handshakes.
+        self.handshakes = handshakes
+        #: The number of those handshakes that resumed a previous TLS session
+        #: instead of doing a full handshake.
+        self.resumed = resumed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(handshakes={self.handshakes!r}, resumed={self.resumed!r})"
+        )
+
+
+class _Histogram:
+    """Records latencies. Not thread safe, see _ClientMetrics."""
+
+    __slots__ = ("count", "total", "min", "max", "counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.counts: dict[int, int] = {}
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        index = _bucket(seconds)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def snapshot(self) -> LatencyHistogram:
+        return LatencyHistogram(
+            self.count, self.total, self.min if self.count else 0.0, self.max, dict(self.counts)
+        )
+
+
+class ClientMetrics:
+    """A snapshot of the latencies recorded by a client, along with its
+    other statistics.
+
+    Returned by :meth:`~pymongo.mongo_client.MongoClient.metrics`.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = (
+        "commands",
+        "checkout",
+        "connection_setup",
+        "tls_handshakes",
+        "compression",
+        "cleanup",
+        "cursor_buffer",
+        "event_queue",
+        "ocsp_cache",
+    )
+
+    def __init__(
+        self,
+        commands: dict[tuple[str, _Address, str], LatencyHistogram],
+        checkout: dict[_Address, LatencyHistogram],
+        connection_setup: dict[_Address, LatencyHistogram],
+        tls_handshakes: dict[_Address, TLSHandshakeStats],
+        compression: CompressionStats,
+        cleanup: CleanupStats,
+        cursor_buffer: CursorBufferStats,
+        event_queue: Optional[EventQueueStats],
+        ocsp_cache: Optional[OCSPCacheStats],
+    ) -> None:
+        #: Command latencies, from sending a command to decoding its reply,
+        #: keyed by ``(command_name, address, outcome)``. The outcome is
+        #: ``"succeeded"`` or ``"failed"``.
+        self.commands = commands
+        #: The time spent checking out a connection from each server's pool,
+        #: including waiting for and opening connections.
+        self.checkout = checkout
+        #: The time spent opening each server's connections, from creating
+        #: the socket to the end of authentication.
+        self.connection_setup = connection_setup
+        #: The TLS handshakes of each server's new connections, see
+        #: :class:`TLSHandshakeStats`. Connections that do not use TLS are not
+        #: counted.
+        self.tls_handshakes = tls_handshakes
+        #: The messages compressed and decompressed by every connection, see
+        #: :class:`CompressionStats`.
+        self.compression = compression
+        #: See :attr:`~pymongo.mongo_client.MongoClient.cleanup_stats`.
+        self.cleanup = cleanup
+        #: See :attr:`~pymongo.mongo_client.MongoClient.cursor_buffer_stats`.
+        self.cursor_buffer = cursor_buffer
+        #: See :attr:`~pymongo.mongo_client.MongoClient.event_queue_stats`.
+        self.event_queue = event_queue
+        #: See :attr:`~pymongo.mongo_client.MongoClient.ocsp_cache_stats`.
+        self.ocsp_cache = ocsp_cache
+
+    def command(self, name: str, outcome: str = "succeeded") -> LatencyHistogram:
+        """The latencies of the `name` command with `outcome` on every
+        server, combined.
+        """
+        return _merge(
+            h for (cmd, _, result), h in self.commands.items() if cmd == name and result == outcome
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(commands={self.commands!r}, checkout={self.checkout!r}, "
+            f"connection_setup={self.connection_setup!r})"
+        )
+
+
+def _merge(histograms: Any) -> LatencyHistogram:
+    merged = _Histogram()
+    for histogram in histograms:
+        merged.count += histogram.count
+        merged.total += histogram.total
+        merged.min = min(merged.min, histogram.min)
+        merged.max = max(merged.max, histogram.max)
+        for index, count in histogram._counts.items():
+            merged.counts[index] = merged.counts.get(index, 0) + count
+    return merged.snapshot()
+
+
+class _ClientMetrics:
+    """The latency histograms of a client, shared by its pools."""
+
+    def __init__(self, slow_operation_threshold: Optional[float] = None) -> None:
+        self.slow_operation_threshold = slow_operation_threshold
+        self._lock = _create_lock()
+        self._commands: dict[tuple[str, _Address, str], _Histogram] = {}
+        self._checkout: dict[_Address, _Histogram] = {}
+        self._connection_setup: dict[_Address, _Histogram] = {}
+        # Maps each address to [handshakes, resumed].
+        self._tls_handshakes: dict[_Address, list[int]] = {}
+
+    def _record(self, histograms: dict, key: Any, seconds: float) -> None:
+        with self._lock:
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram()
+            histogram.record(seconds)
+
+    def command(self, name: str, address: _Address, succeeded: bool, seconds: float) -> None:
+        outcome = "succeeded" if succeeded else "failed"
+        self._record(self._commands, (name, address, outcome), seconds)
+
+    def checkout(self, address: _Address, seconds: float) -> None:
+        self._record(self._checkout, address, seconds)
+
+    def connection_setup(self, address: _Address, seconds: float) -> None:
+        self._record(self._connection_setup, address, seconds)
+
+    def tls_handshake(self, address: _Address, resumed: bool) -> None:
+        with self._lock:
+            counts = self._tls_handshakes.setdefault(address, [0, 0])
+            counts[0] += 1
+            if resumed:
+                counts[1] += 1
+
+    def start_operation(self) -> None:
+        """Start recording the steps of an operation, before selecting a
+        server, when slow operations are sampled.
+        """
+        if self.slow_operation_threshold is not None:
+            _PENDING_PHASES.set({})
+
+    def slow_operation(self, seconds: float, marks: list[int]) -> Optional[OperationTimings]:
+        """The timings of a command that took `seconds`, if it is slow.
+
+        `marks` holds the time.perf_counter_ns() at the start of the command
+        and at the end of each of the _COMMAND_PHASES it completed. Ends the
+        operation started by start_operation().
+        """
+        phases = _PENDING_PHASES.get()
+        if phases is not None:
+            _PENDING_PHASES.set(None)
+        threshold = self.slow_operation_threshold
+        if threshold is None or seconds < threshold:
+            return None
+        phases = dict(phases or {})
+        for phase, start, end in zip(_COMMAND_PHASES, marks, marks[1:]):
+            phases[phase] = end - start
+        if "receive" in phases:
+            # Replies are decompressed as they are received.
+            phases["receive"] = max(0, phases["receive"] - phases.get("decompress", 0))
+        return OperationTimings(phases)
+
+    def snapshot(self) -> tuple[dict, dict, dict, dict]:
+        with self._lock:
+            return (
+                {k: h.snapshot() for k, h in self._commands.items()},
+                {k: h.snapshot() for k, h in self._checkout.items()},
+                {k: h.snapshot() for k, h in self._connection_setup.items()},
+                {k: TLSHandshakeStats(*counts) for k, counts in self._tls_handshakes.items()},
+            )
@@ -181,6 +181,16 @@ will not add that listener to existing client instances.
   return. Care must be taken to ensure that your event handlers are efficient
   enough to not adversely affect overall application performance.
 
+Alternatively, a client created with the ``eventQueueSize`` option delivers
+command and connection pool events from a background thread (or an asyncio
+task for :class:`~pymongo.asynchronous.mongo_client.AsyncMongoClient`)
+instead. Events wait in a queue of at most ``eventQueueSize`` events and are
+delivered in batches, in the order they were published, shortly after the
+operation that published them. When the queue is full the oldest event is
+dropped. See :attr:`~pymongo.mongo_client.MongoClient.event_queue_stats`::
+
+    client = MongoClient(event_listeners=[CommandLogger()], eventQueueSize=10000)
+
 .. warning:: The command documents published through this API are *not* copies.
   If you intend to modify them in any way you must copy them in your event
   handler first.
@@ -189,17 +199,19 @@ will not add that listener to existing client instances.
 from __future__ import annotations
 
 import datetime
-from collections import abc, namedtuple
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence
+from collections import abc, deque, namedtuple
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence
 
 from bson.objectid import ObjectId
 from pymongo.hello import Hello, HelloCompat
 from pymongo.helpers_shared import _SENSITIVE_COMMANDS, _handle_exception
+from pymongo.lock import _create_lock
 from pymongo.typings import _Address, _DocumentOut
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
+    from pymongo.metrics import OperationTimings
     from pymongo.server_description import ServerDescription
     from pymongo.topology_description import TopologyDescription
 
@@ -264,6 +276,12 @@ class ConnectionPoolListener(_EventListener):
     :class:`ConnectionCheckedOutEvent`,
     and :class:`ConnectionCheckedInEvent`.
 
+    Also handles :class:`PoolWarmupProgressEvent`, which is specific to
+    PyMongo.
+
+    .. versionchanged:: 4.9
+       Added :meth:`pool_warmup_progress`.
+
     .. versionadded:: 3.9
     """
 
@@ -370,6 +388,17 @@ class ConnectionPoolListener(_EventListener):
         """
         raise NotImplementedError
 
+    def pool_warmup_progress(self, event: PoolWarmupProgressEvent) -> None:
+        """Handle a :class:`PoolWarmupProgressEvent`.
+
+        Emitted each time a connection Pool below ``minPoolSize`` opens a
+        connection in the background. Does nothing unless overridden.
+
+        :param event: An instance of :class:`PoolWarmupProgressEvent`.
+
+        .. versionadded:: 4.9
+        """
+
 
 class ServerHeartbeatListener(_EventListener):
     """Abstract base class for server heartbeat listeners.
@@ -676,9 +705,13 @@ class CommandSucceededEvent(_CommandEvent):
     :param operation_id: An optional identifier for a series of related events.
     :param service_id: The service_id this command was sent to, or ``None``.
     :param database_name: The database this command was sent to, or ``""``.
+    :param timings: The time this command spent in each step, if it was slow.
+
+    .. versionchanged:: 4.9
+       Added the ``timings`` attribute.
     """
 
-    __slots__ = ("__duration_micros", "__reply")
+    __slots__ = ("__duration_micros", "__reply", "__timings")
 
     def __init__(
         self,
@@ -691,6 +724,7 @@ class CommandSucceededEvent(_CommandEvent):
         service_id: Optional[ObjectId] = None,
         database_name: str = "",
         server_connection_id: Optional[int] = None,
+        timings: Optional[OperationTimings] = None,
     ) -> None:
         super().__init__(
             command_name,
@@ -702,6 +736,7 @@ class CommandSucceededEvent(_CommandEvent):
             server_connection_id=server_connection_id,
         )
         self.__duration_micros = _to_micros(duration)
+        self.__timings = timings
         cmd_name = command_name.lower()
         if cmd_name in _SENSITIVE_COMMANDS or _is_speculative_authenticate(cmd_name, reply):
             self.__reply: _DocumentOut = {}
@@ -718,6 +753,16 @@ class CommandSucceededEvent(_CommandEvent):
         """The server failure document for this operation."""
         return self.__reply
 
+    @property
+    def timings(self) -> Optional[OperationTimings]:
+        """The time this command spent in each step, from selecting a server
+        to decoding the reply, or ``None`` unless it took at least the
+        client's ``slowOperationThresholdMS``.
+
+        .. versionadded:: 4.9
+        """
+        return self.__timings
+
     def __repr__(self) -> str:
         return (
             "<{} {} db: {!r}, command: {!r}, operation_id: {}, duration_micros: {}, service_id: {}, server_connection_id: {}>"
@@ -745,9 +790,13 @@ class CommandFailedEvent(_CommandEvent):
     :param operation_id: An optional identifier for a series of related events.
     :param service_id: The service_id this command was sent to, or ``None``.
     :param database_name: The database this command was sent to, or ``""``.
+    :param timings: The time this command spent in each step, if it was slow.
+
+    .. versionchanged:: 4.9
+       Added the ``timings`` attribute.
     """
 
-    __slots__ = ("__duration_micros", "__failure")
+    __slots__ = ("__duration_micros", "__failure", "__timings")
 
     def __init__(
         self,
@@ -760,6 +809,7 @@ class CommandFailedEvent(_CommandEvent):
         service_id: Optional[ObjectId] = None,
         database_name: str = "",
         server_connection_id: Optional[int] = None,
+        timings: Optional[OperationTimings] = None,
     ) -> None:
         super().__init__(
             command_name,
@@ -771,6 +821,7 @@ class CommandFailedEvent(_CommandEvent):
             server_connection_id=server_connection_id,
         )
         self.__duration_micros = _to_micros(duration)
+        self.__timings = timings
         self.__failure = failure
 
     @property
@@ -783,6 +834,16 @@ class CommandFailedEvent(_CommandEvent):
         """The server failure document for this operation."""
         return self.__failure
 
+    @property
+    def timings(self) -> Optional[OperationTimings]:
+        """The time this command spent in each step, from selecting a server
+        to decoding the reply, or ``None`` unless it took at least the
+        client's ``slowOperationThresholdMS``.
+
+        .. versionadded:: 4.9
+        """
+        return self.__timings
+
     def __repr__(self) -> str:
         return (
             "<{} {} db: {!r}, command: {!r}, operation_id: {}, duration_micros: {}, "
@@ -855,6 +916,50 @@ class PoolReadyEvent(_PoolEvent):
     __slots__ = ()
 
 
+class PoolWarmupProgressEvent(_PoolEvent):
+    """Published when a Connection Pool below ``minPoolSize`` has opened a
+    connection in the background.
+
+    :param address: The address (host, port) pair of the server this Pool is
+       attempting to connect to.
+    :param connections: The number of connections in the Pool, including
+       those checked out.
+    :param target: The ``minPoolSize`` the Pool is warming up to.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("__connections", "__target")
+
+    def __init__(self, address: _Address, connections: int, target: int) -> None:
+        super().__init__(address)
+        self.__connections = connections
+        self.__target = target
+
+    @property
+    def connections(self) -> int:
+        """The number of connections in the Pool, including those checked
+        out.
+        """
+        return self.__connections
+
+    @property
+    def target(self) -> int:
+        """The ``minPoolSize`` the Pool is warming up to."""
+        return self.__target
+
+    @property
+    def complete(self) -> bool:
+        """Whether the Pool has reached ``minPoolSize``."""
+        return self.__connections >= self.__target
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.address!r}, {self.__connections!r}, "
+            f"{self.__target!r})"
+        )
+
+
 class PoolClearedEvent(_PoolEvent):
     """Published when a Connection Pool is cleared.
 
@@ -1032,11 +1137,54 @@ class ConnectionReadyEvent(_ConnectionDurationEvent):
     :param address: The address (host, port) pair of the server this
        Connection is attempting to connect to.
     :param connection_id: The integer ID of the Connection in this Pool.
+    :param tls_session_resumed: Whether the TLS handshake resumed a session,
+       or ``None`` if the Connection does not use TLS.
+    :param handshake_durations: The time spent in each phase of the
+       Connection's setup.
+
+    .. versionchanged:: 4.9
+       Added the ``tls_session_resumed`` and ``handshake_durations``
+       attributes.
 
     .. versionadded:: 3.9
     """
 
-    __slots__ = ()
+    __slots__ = ("__tls_session_resumed", "__handshake_durations")
+
+    def __init__(
+        self,
+        address: _Address,
+        connection_id: int,
+        duration: Optional[float],
+        tls_session_resumed: Optional[bool] = None,
+        handshake_durations: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        super().__init__(address, connection_id, duration)
+        self.__tls_session_resumed = tls_session_resumed
+        self.__handshake_durations = handshake_durations or {}
+
+    @property
+    def tls_session_resumed(self) -> Optional[bool]:
+        """Whether the TLS handshake resumed a previous TLS session instead of
+        doing a full handshake, or ``None`` if the Connection does not use
+        TLS.
+
+        .. versionadded:: 4.9
+        """
+        return self.__tls_session_resumed
+
+    @property
+    def handshake_durations(self) -> Mapping[str, float]:
+        """The seconds spent in each phase of this Connection's setup.
+
+        Keys are ``"dns"`` (resolving the server's address), ``"tcp"``
+        (opening the TCP connection), ``"tls"`` (the TLS handshake),
+        ``"hello"`` (the MongoDB handshake), and ``"auth"``
+        (authentication). Phases that did not take place are omitted.
+
+        .. versionadded:: 4.9
+        """
+        return self.__handshake_durations
 
 
 class ConnectionClosedEvent(_ConnectionIdEvent):
@@ -1431,15 +1579,125 @@ class ServerHeartbeatFailedEvent(_ServerHeartbeatEvent):
         )
 
 
+class EventQueueStats:
+    """A snapshot of the queue of events delivered to listeners in the
+    background.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("queued", "delivered", "dropped", "batches", "pending", "max_size")
+
+    def __init__(
+        self, queued: int, delivered: int, dropped: int, batches: int, pending: int, max_size: int
+    ) -> None:
+        #: The number of events published.
+        self.queued = queued
+        #: The number of events delivered to listeners.
+        self.delivered = delivered
+        #: The number of events dropped because the queue was full.
+        self.dropped = dropped
+        #: The number of batches of events delivered.
+        self.batches = batches
+        #: The number of events waiting to be delivered.
+        self.pending = pending
+        #: The maximum number of events that can wait to be delivered.
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(queued={self.queued!r}, delivered={self.delivered!r}, "
+            f"dropped={self.dropped!r}, batches={self.batches!r}, pending={self.pending!r}, "
+            f"max_size={self.max_size!r})"
+        )
+
+
+class _EventQueue:
+    """A bounded queue of events waiting to be delivered in the background.
+
+    Publishing never blocks: once `max_size` events are waiting the oldest
+    is dropped. Events are delivered by one thread at a time, in the order
+    they were published.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._events: deque = deque()
+        self._lock = _create_lock()
+        self._deliver_lock = _create_lock()
+        self.queued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.batches = 0
+        # Set by the client to deliver events soon.
+        self.wake: Optional[Callable[[], None]] = None
+
+    def put(self, listeners: list, method: str, event: Any) -> None:
+        with self._lock:
+            self.queued += 1
+            if len(self._events) >= self.max_size:
+                self._events.popleft()
+                self.dropped += 1
+            self._events.append((listeners, method, event))
+            was_empty = len(self._events) == 1
+        if was_empty and self.wake is not None:
+            self.wake()
+
+    def deliver(self, batch_size: int = 1000) -> int:
+        """Deliver waiting events to their listeners in batches of up to
+        `batch_size`. Returns the number of events delivered.
+        """
+        delivered = 0
+        with self._deliver_lock:
+            while True:
+                with self._lock:
+                    count = min(batch_size, len(self._events))
+                    if not count:
+                        return delivered
+                    batch = [self._events.popleft() for _ in range(count)]
+                for listeners, method, event in batch:
+                    for subscriber in listeners:
+                        try:
+                            getattr(subscriber, method)(event)
+                        except Exception:
+                            _handle_exception()
+                with self._lock:
+                    self.delivered += count
+                    self.batches += 1
+                delivered += count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+    def stats(self) -> EventQueueStats:
+        with self._lock:
+            return EventQueueStats(
+                self.queued,
+                self.delivered,
+                self.dropped,
+                self.batches,
+                len(self._events),
+                self.max_size,
+            )
+
+
 class _EventListeners:
     """Configure event listeners for a client instance.
 
     Any event listeners registered globally are included by default.
 
     :param listeners: A list of event listeners.
+    :param queue_size: When set, command and connection pool events are
+        queued, up to this many, and delivered in the background.
     """
 
-    def __init__(self, listeners: Optional[Sequence[_EventListener]]):
+    def __init__(
+        self, listeners: Optional[Sequence[_EventListener]], queue_size: Optional[int] = None
+    ):
+        self.queue: Optional[_EventQueue] = None
+        if queue_size is not None:
+            self.queue = _EventQueue(queue_size)
         self.__command_listeners = _LISTENERS.command_listeners[:]
         self.__server_listeners = _LISTENERS.server_listeners[:]
         lst = _LISTENERS.server_heartbeat_listeners
@@ -1489,6 +1747,16 @@ class _EventListeners:
         """Are any ConnectionPoolListener instances registered?"""
         return self.__enabled_for_cmap
 
+    def __dispatch(self, listeners: list, method: str, event: Any) -> None:
+        if self.queue is not None:
+            self.queue.put(listeners, method, event)
+            return
+        for subscriber in listeners:
+            try:
+                getattr(subscriber, method)(event)
+            except Exception:
+                _handle_exception()
+
     def event_listeners(self) -> list[_EventListeners]:
         """List of registered event listeners."""
         return (
@@ -1531,11 +1799,7 @@ class _EventListeners:
             service_id=service_id,
             server_connection_id=server_connection_id,
         )
-        for subscriber in self.__command_listeners:
-            try:
-                subscriber.started(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__command_listeners, "started", event)
 
     def publish_command_success(
         self,
@@ -1549,6 +1813,7 @@ class _EventListeners:
         service_id: Optional[ObjectId] = None,
         speculative_hello: bool = False,
         database_name: str = "",
+        timings: Optional[OperationTimings] = None,
     ) -> None:
         """Publish a CommandSucceededEvent to all command listeners.
 
@@ -1562,6 +1827,8 @@ class _EventListeners:
         :param service_id: The service_id this command was sent to, or ``None``.
         :param speculative_hello: Was the command sent with speculative auth?
         :param database_name: The database this command was sent to, or ``""``.
+        :param timings: The time the command spent in each step, if it was
+            slow.
         """
         if op_id is None:
             op_id = request_id
@@ -1579,12 +1846,9 @@ class _EventListeners:
             service_id,
             database_name=database_name,
             server_connection_id=server_connection_id,
+            timings=timings,
         )
-        for subscriber in self.__command_listeners:
-            try:
-                subscriber.succeeded(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__command_listeners, "succeeded", event)
 
     def publish_command_failure(
         self,
@@ -1597,6 +1861,7 @@ class _EventListeners:
         op_id: Optional[int] = None,
         service_id: Optional[ObjectId] = None,
         database_name: str = "",
+        timings: Optional[OperationTimings] = None,
     ) -> None:
         """Publish a CommandFailedEvent to all command listeners.
 
@@ -1610,6 +1875,8 @@ class _EventListeners:
         :param op_id: The (optional) operation id for this operation.
         :param service_id: The service_id this command was sent to, or ``None``.
         :param database_name: The database this command was sent to, or ``""``.
+        :param timings: The time the command spent in each step, if it was
+            slow.
         """
         if op_id is None:
             op_id = request_id
@@ -1623,12 +1890,9 @@ class _EventListeners:
             service_id=service_id,
             database_name=database_name,
             server_connection_id=server_connection_id,
+            timings=timings,
         )
-        for subscriber in self.__command_listeners:
-            try:
-                subscriber.failed(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__command_listeners, "failed", event)
 
     def publish_server_heartbeat_started(self, connection_id: _Address, awaited: bool) -> None:
         """Publish a ServerHeartbeatStartedEvent to all server heartbeat
@@ -1783,20 +2047,19 @@ class _EventListeners:
     def publish_pool_created(self, address: _Address, options: dict[str, Any]) -> None:
         """Publish a :class:`PoolCreatedEvent` to all pool listeners."""
         event = PoolCreatedEvent(address, options)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.pool_created(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "pool_created", event)
 
     def publish_pool_ready(self, address: _Address) -> None:
         """Publish a :class:`PoolReadyEvent` to all pool listeners."""
         event = PoolReadyEvent(address)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.pool_ready(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "pool_ready", event)
+
+    def publish_pool_warmup_progress(
+        self, address: _Address, connections: int, target: int
+    ) -> None:
+        """Publish a :class:`PoolWarmupProgressEvent` to all pool listeners."""
+        event = PoolWarmupProgressEvent(address, connections, target)
+        self.__dispatch(self.__cmap_listeners, "pool_warmup_progress", event)
 
     def publish_pool_cleared(
         self,
@@ -1806,64 +2069,47 @@ class _EventListeners:
     ) -> None:
         """Publish a :class:`PoolClearedEvent` to all pool listeners."""
         event = PoolClearedEvent(address, service_id, interrupt_connections)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.pool_cleared(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "pool_cleared", event)
 
     def publish_pool_closed(self, address: _Address) -> None:
         """Publish a :class:`PoolClosedEvent` to all pool listeners."""
         event = PoolClosedEvent(address)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.pool_closed(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "pool_closed", event)
 
     def publish_connection_created(self, address: _Address, connection_id: int) -> None:
         """Publish a :class:`ConnectionCreatedEvent` to all connection
         listeners.
         """
         event = ConnectionCreatedEvent(address, connection_id)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_created(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_created", event)
 
     def publish_connection_ready(
-        self, address: _Address, connection_id: int, duration: float
+        self,
+        address: _Address,
+        connection_id: int,
+        duration: float,
+        tls_session_resumed: Optional[bool] = None,
+        handshake_durations: Optional[Mapping[str, float]] = None,
     ) -> None:
         """Publish a :class:`ConnectionReadyEvent` to all connection listeners."""
-        event = ConnectionReadyEvent(address, connection_id, duration)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_ready(event)
-            except Exception:
-                _handle_exception()
+        event = ConnectionReadyEvent(
+            address, connection_id, duration, tls_session_resumed, handshake_durations
+        )
+        self.__dispatch(self.__cmap_listeners, "connection_ready", event)
 
     def publish_connection_closed(self, address: _Address, connection_id: int, reason: str) -> None:
         """Publish a :class:`ConnectionClosedEvent` to all connection
         listeners.
         """
         event = ConnectionClosedEvent(address, connection_id, reason)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_closed(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_closed", event)
 
     def publish_connection_check_out_started(self, address: _Address) -> None:
         """Publish a :class:`ConnectionCheckOutStartedEvent` to all connection
         listeners.
         """
         event = ConnectionCheckOutStartedEvent(address)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_check_out_started(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_check_out_started", event)
 
     def publish_connection_check_out_failed(
         self, address: _Address, reason: str, duration: float
@@ -1872,11 +2118,7 @@ class _EventListeners:
         listeners.
         """
         event = ConnectionCheckOutFailedEvent(address, reason, duration)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_check_out_failed(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_check_out_failed", event)
 
     def publish_connection_checked_out(
         self, address: _Address, connection_id: int, duration: float
@@ -1885,19 +2127,11 @@ class _EventListeners:
         listeners.
         """
         event = ConnectionCheckedOutEvent(address, connection_id, duration)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_checked_out(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_checked_out", event)
 
     def publish_connection_checked_in(self, address: _Address, connection_id: int) -> None:
         """Publish a :class:`ConnectionCheckedInEvent` to all connection
         listeners.
         """
         event = ConnectionCheckedInEvent(address, connection_id)
-        for subscriber in self.__cmap_listeners:
-            try:
-                subscriber.connection_checked_in(event)
-            except Exception:
-                _handle_exception()
+        self.__dispatch(self.__cmap_listeners, "connection_checked_in", event)
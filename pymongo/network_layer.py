@@ -16,15 +16,30 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import socket
 import struct
 import sys
-from asyncio import AbstractEventLoop, Future
+import time
+from asyncio import AbstractEventLoop, BaseTransport, BufferedProtocol, Future, Transport
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Optional,
+    Tuple,
+    TypeVar,
     Union,
 )
 
 from pymongo import ssl_support
+from pymongo.common import MAX_MESSAGE_SIZE
+from pymongo.errors import ProtocolError, _OperationCancelled
+
+if TYPE_CHECKING:
+    from ssl import SSLContext, SSLSession
+
+    from pymongo.asynchronous.pool import _CancellationContext
 
 try:
     from ssl import SSLError, SSLSocket
@@ -54,11 +69,16 @@ except ImportError:
 _UNPACK_HEADER = struct.Struct("<iiii").unpack
 _UNPACK_COMPRESSION_HEADER = struct.Struct("<iiB").unpack
 _POLL_TIMEOUT = 0.5
+_T = TypeVar("_T")
 # Errors raised by sockets (and TLS sockets) when in non-blocking mode.
 BLOCKING_IO_ERRORS = (BlockingIOError, BLOCKING_IO_LOOKUP_ERROR, *ssl_support.BLOCKING_IO_ERRORS)
 
 
-async def async_sendall(sock: Union[socket.socket, _sslConn], buf: bytes) -> None:
+async def async_sendall(sock: _AsyncSocketType, buf: bytes) -> None:
+    if isinstance(sock, AsyncNetworkingInterface):
+        interface: AsyncNetworkingInterface = sock
+        await interface.sendall(buf)
+        return
     timeout = sock.gettimeout()
     sock.settimeout(0.0)
     loop = asyncio.get_event_loop()
@@ -125,5 +145,395 @@ async def _async_sendall_ssl_windows(sock: Union[socket.socket, _sslConn], buf:
         total_sent += sent
 
 
-def sendall(sock: Union[socket.socket, _sslConn], buf: bytes) -> None:
+def sendall(sock: _SocketType, buf: bytes) -> None:
     sock.sendall(buf)
+
+
+# Size of the receive buffer that small messages are read into before being
+# split into frames. Larger messages are read directly into a buffer of the
+# exact message size.
+_RECEIVE_BUFFER_SIZE = 64 * 1024
+
+# A complete wire protocol message: (length, request_id, response_to, op_code, body).
+_Message = Tuple[int, int, int, int, memoryview]
+
+# Bounds on the per-connection buffer that replies are read into from a
+# blocking socket. Larger messages get a buffer of their own, which is
+# released once the next message has been read.
+_MIN_SOCKET_BUFFER_SIZE = 16 * 1024
+_MAX_SOCKET_BUFFER_SIZE = 1024 * 1024
+
+
+def _exported(buf: bytearray) -> bool:
+    """Is a memoryview of `buf` alive?"""
+    # A bytearray cannot be resized while a memoryview of it is alive.
+    try:
+        buf.append(0)
+    except BufferError:
+        return True
+    del buf[-1]
+    return False
+
+
+class _ReceiveBuffer:
+    """A reusable buffer for the messages read from a connection's socket.
+
+    Bytes are received into the free space after ``end``, possibly past the
+    message currently being read, and handed out as memoryviews of the
+    buffer. Space before ``start`` is only written to again once no view of
+    the buffer is alive; while the caller holds on to an earlier reply, the
+    unread bytes are copied to a new buffer instead.
+    """
+
+    __slots__ = ("buf", "start", "end")
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+        self.start = 0
+        self.end = 0
+
+    @property
+    def buffered(self) -> int:
+        """The number of received bytes that have not been consumed."""
+        return self.end - self.start
+
+    def reserve(self, length: int) -> memoryview:
+        """Make room to receive the rest of a `length` byte message.
+
+        Returns a view of the whole buffer; received data must be written
+        at ``end``.
+        """
+        size = len(self.buf)
+        fits = self.start + length <= size
+        if fits and (self.start < self.end or not self.start):
+            return memoryview(self.buf)
+        exported = _exported(self.buf)
+        if fits and exported:
+            # Keep appending after the views that are still in use.
+            return memoryview(self.buf)
+        if length > size:
+            size = max(length, min(size * 2, _MAX_SOCKET_BUFFER_SIZE), _MIN_SOCKET_BUFFER_SIZE)
+        elif size > _MAX_SOCKET_BUFFER_SIZE and length <= _MAX_SOCKET_BUFFER_SIZE:
+            size = _MAX_SOCKET_BUFFER_SIZE
+        pending = self.buf[self.start : self.end]
+        if size != len(self.buf) or exported:
+            self.buf = bytearray(size)
+        self.buf[: len(pending)] = pending
+        self.start, self.end = 0, len(pending)
+        return memoryview(self.buf)
+
+    def consume(self, length: int) -> memoryview:
+        """Return a view of the next `length` received bytes."""
+        start = self.start
+        self.start += length
+        return memoryview(self.buf)[start : self.start]
+
+
+class PyMongoProtocol(BufferedProtocol):
+    """An :class:`asyncio.BufferedProtocol` that frames wire protocol messages.
+
+    Data is read by the event loop directly into preallocated buffers: small
+    messages are views of a shared receive buffer and messages larger than
+    that buffer are read straight into a buffer of their exact size. The
+    receive buffer is only written to again once no view of it is alive;
+    until then the unread bytes are moved to a new buffer when it is full.
+    """
+
+    def __init__(self, buffer_size: int = _RECEIVE_BUFFER_SIZE) -> None:
+        self.transport: Optional[Transport] = None
+        self.max_message_size = MAX_MESSAGE_SIZE
+        self._buffer = bytearray(buffer_size)
+        # Unparsed data in the receive buffer is self._buffer[self._start:self._end].
+        self._start = 0
+        self._end = 0
+        # Set while reading the body of a message too large for self._buffer.
+        self._header: Optional[Tuple[int, int, int, int]] = None
+        self._large_body: Optional[memoryview] = None
+        self._large_read = 0
+        self._messages: collections.deque[_Message] = collections.deque()
+        self._read_waiter: Optional[Future] = None
+        self._drain_waiter: Optional[Future] = None
+        self._paused = False
+        self._exc: Optional[BaseException] = None
+
+    def connection_made(self, transport: BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._large_body is not None:
+            return self._large_body[self._large_read :]
+        if self._end == len(self._buffer):
+            # Move the partial message to the front of the buffer, or of a
+            # new buffer while messages delivered from this one are in use.
+            remaining = self._end - self._start
+            pending = self._buffer[self._start : self._end]
+            if _exported(self._buffer):
+                self._buffer = bytearray(len(self._buffer))
+            self._buffer[:remaining] = pending
+            self._start, self._end = 0, remaining
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        if self._large_body is not None:
+            self._large_read += nbytes
+            if self._large_read == len(self._large_body):
+                assert self._header is not None
+                self._deliver((*self._header, self._large_body))
+                self._header = None
+                self._large_body = None
+            return
+        self._end += nbytes
+        try:
+            self._process_buffer()
+        except ProtocolError as exc:
+            self._exc = exc
+            self._wake_reader()
+            assert self.transport is not None
+            self.transport.abort()
+
+    def _process_buffer(self) -> None:
+        view = memoryview(self._buffer)
+        while self._end - self._start >= 16:
+            length, request_id, response_to, op_code = _UNPACK_HEADER(
+                view[self._start : self._start + 16]
+            )
+            if length <= 16:
+                raise ProtocolError(
+                    f"Message length ({length!r}) not longer than standard message header size (16)"
+                )
+            if length > self.max_message_size:
+                raise ProtocolError(
+                    f"Message length ({length!r}) is larger than server max "
+                    f"message size ({self.max_message_size!r})"
+                )
+            available = self._end - self._start
+            if available >= length:
+                body = view[self._start + 16 : self._start + length]
+                self._start += length
+                self._deliver((length, request_id, response_to, op_code, body))
+            elif length > len(self._buffer):
+                # Read the rest of this message directly into its own buffer.
+                body = memoryview(bytearray(length - 16))
+                received = available - 16
+                body[:received] = view[self._start + 16 : self._end]
+                self._header = (length, request_id, response_to, op_code)
+                self._large_body = body
+                self._large_read = received
+                self._start = self._end
+                return
+            else:
+                break
+
+    def _deliver(self, message: _Message) -> None:
+        self._messages.append(message)
+        self._wake_reader()
+
+    def _wake_reader(self) -> None:
+        waiter = self._read_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def read(self, timeout: Optional[float]) -> Optional[_Message]:
+        """Return the next complete message, or None if `timeout` expires first."""
+        if not self._messages and self._exc is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._read_waiter = waiter
+            try:
+                await asyncio.wait([waiter], timeout=timeout)
+            finally:
+                self._read_waiter = None
+                if not waiter.done():
+                    waiter.cancel()
+        if self._messages:
+            return self._messages.popleft()
+        if self._exc is not None:
+            raise self._exc
+        return None
+
+    async def write(self, buf: bytes, timeout: Optional[float]) -> None:
+        if self._exc is not None:
+            raise self._exc
+        assert self.transport is not None
+        if self.transport.is_closing():
+            raise OSError("connection closed")
+        self.transport.write(buf)
+        if not self._paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiter = waiter
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout("timed out") from None
+        finally:
+            self._drain_waiter = None
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def eof_received(self) -> bool:
+        # Returning False closes the transport, which calls connection_lost.
+        return False
+
+    def connection_lost(self, exc: Optional[BaseException]) -> None:
+        self._exc = exc or OSError("connection closed")
+        self._wake_reader()
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(self._exc)
+
+
+class AsyncNetworkingInterface:
+    """A socket-like wrapper around an asyncio transport and its PyMongoProtocol.
+
+    The transport owns the underlying socket, so the socket timeout is tracked
+    here and applied to each read and write instead. A transport is bound to
+    the event loop that created it: I/O requested from any other loop (such as
+    a background executor's) is run on the owning loop.
+    """
+
+    def __init__(
+        self, transport: Transport, protocol: PyMongoProtocol, loop: AbstractEventLoop
+    ) -> None:
+        self.transport = transport
+        self.protocol = protocol
+        self.loop = loop
+        self._timeout: Optional[float] = None
+
+    def gettimeout(self) -> Optional[float]:
+        return self._timeout
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        self._timeout = timeout
+
+    def fileno(self) -> int:
+        sock = self.transport.get_extra_info("socket")
+        if sock is None:
+            return -1
+        return sock.fileno()
+
+    def getpeercert(self) -> Any:
+        return self.transport.get_extra_info("peercert")
+
+    @property
+    def session(self) -> Optional[SSLSession]:
+        ssl_object = self.transport.get_extra_info("ssl_object")
+        return ssl_object.session if ssl_object is not None else None
+
+    @property
+    def session_reused(self) -> Optional[bool]:
+        """Whether the TLS handshake resumed a session, None without TLS."""
+        ssl_object = self.transport.get_extra_info("ssl_object")
+        return ssl_object.session_reused if ssl_object is not None else None
+
+    def is_closing(self) -> bool:
+        return self.loop.is_closed() or self.transport.is_closing()
+
+    def close(self) -> None:
+        if _running_loop() is self.loop:
+            self.transport.abort()
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.transport.abort)
+        else:
+            # The transport's callbacks can no longer run, shut the socket down directly.
+            sock = self.transport.get_extra_info("socket")
+            if sock is not None:
+                sock.shutdown(socket.SHUT_RDWR)
+
+    async def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await `coro` on the event loop that owns this transport."""
+        if _running_loop() is self.loop:
+            return await coro
+        try:
+            fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        except RuntimeError:
+            coro.close()
+            raise OSError("connection closed: event loop is closed") from None
+        return await asyncio.wrap_future(fut)
+
+    async def sendall(self, buf: bytes) -> None:
+        await self.run(self.protocol.write(buf, self._timeout))
+
+
+# The socket of a connection: a blocking socket for synchronous clients, or
+# also an asyncio transport for asynchronous ones.
+_SocketType = Union[socket.socket, _sslConn]
+_AsyncSocketType = Union[socket.socket, _sslConn, AsyncNetworkingInterface]
+
+
+def _running_loop() -> Optional[AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def async_create_interface(
+    sock: socket.socket,
+    ssl_context: Optional[SSLContext],
+    server_hostname: Optional[str],
+    timeout: Optional[float],
+    handshake_timeout: Optional[float],
+) -> AsyncNetworkingInterface:
+    """Hand a connected socket over to the event loop, optionally upgrading it to TLS.
+
+    Can raise socket.error or ssl.SSLError.
+    """
+    loop = asyncio.get_running_loop()
+    sock.setblocking(False)
+    transport, protocol = await loop.create_connection(PyMongoProtocol, sock=sock)
+    if ssl_context is not None:
+        try:
+            tls_transport = await loop.start_tls(
+                transport,
+                protocol,
+                ssl_context,
+                server_hostname=server_hostname,
+                ssl_handshake_timeout=handshake_timeout,
+            )
+        except asyncio.TimeoutError:
+            transport.abort()
+            raise socket.timeout("timed out") from None
+        except BaseException:
+            transport.abort()
+            raise
+        transport = tls_transport  # type: ignore[assignment]
+        # start_tls doesn't call connection_made again, so the protocol would
+        # otherwise keep writing to the underlying plaintext transport.
+        protocol.transport = transport
+    interface = AsyncNetworkingInterface(transport, protocol, loop)
+    interface.settimeout(timeout)
+    return interface
+
+
+async def async_read_message(
+    interface: AsyncNetworkingInterface,
+    deadline: Optional[float],
+    cancel_context: _CancellationContext,
+    max_message_size: int = MAX_MESSAGE_SIZE,
+) -> _Message:
+    """Wait for the next complete message, a timeout, or a cancel."""
+    protocol = interface.protocol
+    protocol.max_message_size = max_message_size
+    while True:
+        if cancel_context.cancelled:
+            raise _OperationCancelled("operation cancelled")
+        # Wake up every 500ms to check for cancellation.
+        if deadline:
+            remaining = deadline - time.monotonic()
+            timeout = max(min(remaining, _POLL_TIMEOUT), 0)
+        else:
+            timeout = _POLL_TIMEOUT
+        message = await interface.run(protocol.read(timeout))
+        if message is not None:
+            return message
+        if cancel_context.cancelled:
+            raise _OperationCancelled("operation cancelled")
+        if deadline and time.monotonic() >= deadline:
+            raise socket.timeout("timed out")
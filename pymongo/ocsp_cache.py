@@ -12,20 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Utilities for caching OCSP responses."""
+"""Utilities for caching OCSP responses.
+
+Responses are cached in memory by each client, in a least recently used
+cache of ``tlsOCSPCacheSize`` entries. When the ``tlsOCSPCacheFile`` option
+is set, responses are also stored in a SQLite database at that path, which
+is shared by every process that uses the same file. This allows new
+processes to skip the OCSP requests already made by other processes while
+their responses are valid. Responses read from the file are verified against
+the issuer again before they are used.
+
+.. versionadded:: 4.9
+"""
 
 from __future__ import annotations
 
-from collections import namedtuple
+import os
+from collections import OrderedDict, namedtuple
 from datetime import datetime as _datetime
 from datetime import timezone
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from pymongo.lock import _create_lock
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from cryptography.x509.ocsp import OCSPRequest, OCSPResponse
 
+__all__ = ["OCSPCacheStats"]
+
+# The default maximum number of responses cached in memory.
+_DEFAULT_OCSP_CACHE_SIZE = 1000
+
 
 def _next_update(value: OCSPResponse) -> Optional[_datetime]:
     """Compat helper to return the response's next_update_utc."""
@@ -43,17 +62,166 @@ def _this_update(value: OCSPResponse) -> Optional[_datetime]:
     return value.this_update
 
 
+def _timestamp(value: _datetime) -> float:
+    """POSIX timestamp of a datetime, naive datetimes are in UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class OCSPCacheStats:
+    """A snapshot of the OCSP response cache of a client.
+
+    See the ``tlsOCSPCacheSize`` and ``tlsOCSPCacheFile`` options of
+    :class:`~pymongo.mongo_client.MongoClient`.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("size", "max_size", "hits", "misses", "evictions", "file_hits", "file_errors")
+
+    def __init__(
+        self,
+        size: int,
+        max_size: int,
+        hits: int,
+        misses: int,
+        evictions: int,
+        file_hits: int,
+        file_errors: int,
+    ) -> None:
+        #: The number of responses cached in memory.
+        self.size = size
+        #: The maximum number of responses cached in memory.
+        self.max_size = max_size
+        #: The number of lookups answered by a valid cached response, from
+        #: memory or from the cache file.
+        self.hits = hits
+        #: The number of lookups that required a request to an OCSP
+        #: responder.
+        self.misses = misses
+        #: The number of valid responses dropped from memory to make room
+        #: for newer ones.
+        self.evictions = evictions
+        #: The number of hits answered by the cache file.
+        self.file_hits = file_hits
+        #: The number of errors reading or writing the cache file. Errors
+        #: are otherwise ignored, lookups are treated as misses.
+        self.file_errors = file_errors
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """The fraction of lookups answered by the cache."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return None
+        return self.hits / lookups
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(size={self.size!r}, max_size={self.max_size!r}, "
+            f"hits={self.hits!r}, misses={self.misses!r}, evictions={self.evictions!r}, "
+            f"file_hits={self.file_hits!r}, file_errors={self.file_errors!r})"
+        )
+
+
+class _OCSPFileStore:
+    """OCSP responses stored in a SQLite database shared between processes.
+
+    SQLite locks the database file, so that any number of processes can
+    read and write the store concurrently. Callers must serialize access
+    from threads in one process.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self.path = path
+        self._timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Don't use a connection inherited from the parent after a fork.
+        if self._conn is None or self._pid != os.getpid():
+            import sqlite3
+
+            # Only the owner may read or write the responses, SQLite creates
+            # its journal files with the same permissions.
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+            conn = sqlite3.connect(self.path, timeout=self._timeout, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ocsp_responses "
+                    "(key TEXT PRIMARY KEY, response BLOB NOT NULL, next_update REAL NOT NULL)"
+                )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The stored response for `key`, unless its nextUpdate has passed."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT response FROM ocsp_responses WHERE key = ? AND next_update > ?",
+                (key, _datetime.now(tz=timezone.utc).timestamp()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def put(self, key: str, response: bytes, next_update: _datetime) -> None:
+        """Store a response, unless a response with a later nextUpdate is
+        already stored, and drop the expired responses.
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "DELETE FROM ocsp_responses WHERE next_update <= ?",
+                (_datetime.now(tz=timezone.utc).timestamp(),),
+            )
+            conn.execute(
+                "INSERT INTO ocsp_responses (key, response, next_update) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET response = excluded.response, "
+                "next_update = excluded.next_update "
+                "WHERE excluded.next_update > ocsp_responses.next_update",
+                (key, response, _timestamp(next_update)),
+            )
+
+    def delete(self, key: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM ocsp_responses WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
 class _OCSPCache:
-    """A cache for OCSP responses."""
+    """A cache for OCSP responses.
+
+    Keeps up to `max_size` responses in memory, evicting the least recently
+    used, and optionally stores responses in a :class:`_OCSPFileStore`.
+    """
 
     CACHE_KEY_TYPE = namedtuple(  # type: ignore
         "OcspResponseCacheKey",
         ["hash_algorithm", "issuer_name_hash", "issuer_key_hash", "serial_number"],
     )
 
-    def __init__(self) -> None:
-        self._data: dict[Any, OCSPResponse] = {}
-        # Hold this lock when accessing _data.
+    def __init__(
+        self, max_size: int = _DEFAULT_OCSP_CACHE_SIZE, store: Optional[_OCSPFileStore] = None
+    ) -> None:
+        self._data: OrderedDict[Any, OCSPResponse] = OrderedDict()
+        self.max_size = max_size
+        self.store = store
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._file_hits = 0
+        self._file_errors = 0
+        # Hold this lock when accessing _data, the counters, or the store.
         self._lock = _create_lock()
 
     def _get_cache_key(self, ocsp_request: OCSPRequest) -> CACHE_KEY_TYPE:
@@ -64,6 +232,31 @@ class _OCSPCache:
             serial_number=ocsp_request.serial_number,
         )
 
+    @staticmethod
+    def _store_key(cache_key: CACHE_KEY_TYPE) -> str:
+        return (
+            f"{cache_key.hash_algorithm}:{cache_key.issuer_name_hash.hex()}:"
+            f"{cache_key.issuer_key_hash.hex()}:{cache_key.serial_number}"
+        )
+
+    def _dumps(self, value: OCSPResponse) -> bytes:
+        from cryptography.hazmat.primitives.serialization import Encoding
+
+        return value.public_bytes(Encoding.DER)
+
+    def _loads(self, data: bytes) -> OCSPResponse:
+        from cryptography.x509.ocsp import load_der_ocsp_response
+
+        return load_der_ocsp_response(data)
+
+    def _store_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call `func` to access the store, counting and ignoring errors."""
+        try:
+            return func(*args)
+        except Exception:
+            self._file_errors += 1
+            return None
+
     def __setitem__(self, key: OCSPRequest, value: OCSPResponse) -> None:
         """Add/update a cache entry.
 
@@ -81,6 +274,8 @@ class _OCSPCache:
             next_update = _next_update(value)
             if next_update is None:
                 self._data.pop(cache_key, None)
+                if self.store is not None:
+                    self._store_call(self.store.delete, self._store_key(cache_key))
                 return
 
             this_update = _this_update(value)
@@ -97,35 +292,92 @@ class _OCSPCache:
             # Cache new response OR update cached response if new response
             # has longer validity.
             cached_value = self._data.get(cache_key, None)
-            if cached_value is None:
-                self._data[cache_key] = value
-                return
-            cached_next_update = _next_update(cached_value)
-            if cached_next_update is not None and cached_next_update < next_update:
-                self._data[cache_key] = value
+            if cached_value is not None:
+                cached_next_update = _next_update(cached_value)
+                if cached_next_update is None or cached_next_update >= next_update:
+                    return
+            self._insert(cache_key, value)
+            store = self.store
+            if store is not None:
+                self._store_call(
+                    lambda: store.put(self._store_key(cache_key), self._dumps(value), next_update)
+                )
 
     def __getitem__(self, item: OCSPRequest) -> OCSPResponse:
-        """Get a cache entry if it exists.
+        """Get a cache entry if it exists in memory.
 
         'item' is of type cryptography.x509.ocsp.OCSPRequest
 
+        Raises KeyError if the item is not in the cache.
+        """
+        return self.get_verified(item, None)
+
+    def get_verified(
+        self, item: OCSPRequest, verify: Optional[Callable[[OCSPResponse], bool]]
+    ) -> OCSPResponse:
+        """Get a cache entry from memory or, when `verify` is given, from the
+        store.
+
+        Responses in the store may have been written by anyone with access to
+        the file, so they are only used, and cached in memory, once `verify`
+        accepts them.
+
         Raises KeyError if the item is not in the cache.
         """
         with self._lock:
             cache_key = self._get_cache_key(item)
-            value = self._data[cache_key]
+            value = self._data.get(cache_key)
+            if value is not None:
+                if self._is_valid(value):
+                    self._data.move_to_end(cache_key)
+                    self._hits += 1
+                    return value
+                self._data.pop(cache_key, None)
 
-            # Return cached response if it is still valid.
-            this_update = _this_update(value)
-            next_update = _next_update(value)
-            assert this_update is not None
-            assert next_update is not None
-            now = _datetime.now(tz=timezone.utc)
-            if this_update.tzinfo is None:
-                # Make naive to match cryptography.
-                now = now.replace(tzinfo=None)
-            if this_update <= now < next_update:
-                return value
+            # Another process may have stored a response.
+            if self.store is not None and verify is not None:
+                data = self._store_call(self.store.get, self._store_key(cache_key))
+                value = self._store_call(self._loads, data) if data else None
+                if value is not None and self._is_valid(value) and verify(value):
+                    self._insert(cache_key, value)
+                    self._hits += 1
+                    self._file_hits += 1
+                    return value
 
-            self._data.pop(cache_key, None)
+            self._misses += 1
             raise KeyError(cache_key)
+
+    def _insert(self, cache_key: CACHE_KEY_TYPE, value: OCSPResponse) -> None:
+        """Cache a response as the most recently used, evicting the least
+        recently used responses over the size limit.
+        """
+        self._data[cache_key] = value
+        self._data.move_to_end(cache_key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    @staticmethod
+    def _is_valid(value: OCSPResponse) -> bool:
+        """Is the current time between the response's thisUpdate and nextUpdate?"""
+        this_update = _this_update(value)
+        next_update = _next_update(value)
+        if this_update is None or next_update is None:
+            return False
+        now = _datetime.now(tz=timezone.utc)
+        if this_update.tzinfo is None:
+            # Make naive to match cryptography.
+            now = now.replace(tzinfo=None)
+        return this_update <= now < next_update
+
+    def stats(self) -> OCSPCacheStats:
+        with self._lock:
+            return OCSPCacheStats(
+                len(self._data),
+                self.max_size,
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._file_hits,
+                self._file_errors,
+            )
@@ -293,12 +293,34 @@ def _verify_response(issuer: Certificate, response: OCSPResponse) -> int:
     return 1
 
 
+def _check_response(
+    ocsp_request: OCSPRequest, issuer: Certificate, ocsp_response: OCSPResponse
+) -> bool:
+    """Is `ocsp_response` a valid, successful response to `ocsp_request`?"""
+    _LOGGER.debug("OCSP response status: %r", ocsp_response.response_status)
+    if ocsp_response.response_status != _OCSPResponseStatus.SUCCESSFUL:
+        return False
+    # RFC6960, Section 3.2, Number 1. Only relevant if we need to
+    # talk to the responder directly, or read the response from the
+    # tlsOCSPCacheFile.
+    # Accessing response.serial_number raises if response status is not
+    # SUCCESSFUL.
+    if ocsp_response.serial_number != ocsp_request.serial_number:
+        _LOGGER.debug("Response serial number does not match request")
+        return False
+    # Returns False if the response failed verification.
+    return bool(_verify_response(issuer, ocsp_response))
+
+
 def _get_ocsp_response(
     cert: Certificate, issuer: Certificate, uri: Union[str, bytes], ocsp_response_cache: _OCSPCache
 ) -> Optional[OCSPResponse]:
     ocsp_request = _build_ocsp_request(cert, issuer)
     try:
-        ocsp_response = ocsp_response_cache[ocsp_request]
+        # Responses read from the tlsOCSPCacheFile are verified again.
+        ocsp_response = ocsp_response_cache.get_verified(
+            ocsp_request, lambda response: _check_response(ocsp_request, issuer, response)
+        )
         _LOGGER.debug("Using cached OCSP response.")
     except KeyError:
         # CSOT: use the configured timeout or 5 seconds, whichever is smaller.
@@ -319,18 +341,7 @@ def _get_ocsp_response(
             _LOGGER.debug("HTTP request returned %d", response.status_code)
             return None
         ocsp_response = _load_der_ocsp_response(response.content)
-        _LOGGER.debug("OCSP response status: %r", ocsp_response.response_status)
-        if ocsp_response.response_status != _OCSPResponseStatus.SUCCESSFUL:
-            return None
-        # RFC6960, Section 3.2, Number 1. Only relevant if we need to
-        # talk to the responder directly.
-        # Accessing response.serial_number raises if response status is not
-        # SUCCESSFUL.
-        if ocsp_response.serial_number != ocsp_request.serial_number:
-            _LOGGER.debug("Response serial number does not match request")
-            return None
-        if not _verify_response(issuer, ocsp_response):
-            # The response failed verification.
+        if not _check_response(ocsp_request, issuer, ocsp_response):
             return None
         _LOGGER.debug("Caching OCSP response.")
         ocsp_response_cache[ocsp_request] = ocsp_response
@@ -34,6 +34,7 @@ from pymongo.common import (
     MIN_POOL_SIZE,
     WAIT_QUEUE_TIMEOUT,
 )
+from pymongo.metrics import _ClientMetrics
 
 if TYPE_CHECKING:
     from pymongo.auth_shared import MongoCredential
@@ -310,6 +311,10 @@ class PoolOptions:
         "__server_api",
         "__load_balanced",
         "__credentials",
+        "__min_pool_warmup_rate",
+        "__slow_operation_threshold",
+        "__tracer",
+        "__metrics",
     )
 
     def __init__(
@@ -332,6 +337,9 @@ class PoolOptions:
         load_balanced: Optional[bool] = None,
         credentials: Optional[MongoCredential] = None,
         is_sync: Optional[bool] = True,
+        min_pool_warmup_rate: Optional[float] = None,
+        slow_operation_threshold: Optional[float] = None,
+        tracer: Optional[Any] = None,
     ):
         self.__max_pool_size = max_pool_size
         self.__min_pool_size = min_pool_size
@@ -350,6 +358,10 @@ class PoolOptions:
         self.__server_api = server_api
         self.__load_balanced = load_balanced
         self.__credentials = credentials
+        self.__min_pool_warmup_rate = min_pool_warmup_rate
+        self.__slow_operation_threshold = slow_operation_threshold
+        self.__tracer = tracer
+        self.__metrics = _ClientMetrics(slow_operation_threshold)
         self.__metadata = copy.deepcopy(_METADATA)
 
         if appname:
@@ -388,6 +400,11 @@ class PoolOptions:
 
         _truncate_metadata(self.__metadata)
 
+    @property
+    def _metrics(self) -> _ClientMetrics:
+        """The latency histograms shared by the pools of a client."""
+        return self.__metrics
+
     @property
     def _credentials(self) -> Optional[MongoCredential]:
         """A :class:`~pymongo.auth.MongoCredentials` instance or None."""
@@ -399,7 +416,7 @@ class PoolOptions:
 
         Added for CMAP's :class:`PoolCreatedEvent`.
         """
-        opts = {}
+        opts: dict[str, Any] = {}
         if self.__max_pool_size != MAX_POOL_SIZE:
             opts["maxPoolSize"] = self.__max_pool_size
         if self.__min_pool_size != MIN_POOL_SIZE:
@@ -412,6 +429,10 @@ class PoolOptions:
             opts["waitQueueTimeoutMS"] = self.__wait_queue_timeout * 1000
         if self.__max_connecting != MAX_CONNECTING:
             opts["maxConnecting"] = self.__max_connecting
+        if self.__min_pool_warmup_rate is not None:
+            opts["minPoolWarmupRate"] = self.__min_pool_warmup_rate
+        if self.__slow_operation_threshold is not None:
+            opts["slowOperationThresholdMS"] = self.__slow_operation_threshold * 1000
         return opts
 
     @property
@@ -443,6 +464,21 @@ class PoolOptions:
         """
         return self.__max_connecting
 
+    @property
+    def min_pool_warmup_rate(self) -> Optional[float]:
+        """The maximum number of connections per second that the pool opens
+        in the background to reach ``min_pool_size``. Defaults to `None` (no
+        limit).
+        """
+        return self.__min_pool_warmup_rate
+
+    @property
+    def slow_operation_threshold(self) -> Optional[float]:
+        """The duration in seconds from which commands record how long they
+        spent in each step. Defaults to `None` (never).
+        """
+        return self.__slow_operation_threshold
+
     @property
     def pause_enabled(self) -> bool:
         return self.__pause_enabled
@@ -487,6 +523,11 @@ class PoolOptions:
         """An instance of pymongo.monitoring._EventListeners."""
         return self.__event_listeners
 
+    @property
+    def _tracer(self) -> Optional[Any]:
+        """The tracer that records spans for operations, or None."""
+        return self.__tracer
+
     @property
     def appname(self) -> Optional[str]:
         """The application name, for sending with hello in server handshake."""
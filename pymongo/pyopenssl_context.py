@@ -52,6 +52,14 @@ try:
 except ImportError:
     _HAVE_CERTIFI = False
 
+try:
+    # PyOpenSSL has no public API for SSL_session_reused.
+    from OpenSSL._util import lib as _lib  # type:ignore[import]
+
+    _SSL_session_reused = getattr(_lib, "SSL_session_reused", None)
+except ImportError:
+    _SSL_session_reused = None
+
 PROTOCOL_SSLv23 = _SSL.SSLv23_METHOD
 # Always available
 OP_NO_SSLv2 = _SSL.OP_NO_SSLv2
@@ -141,6 +149,21 @@ class _sslConn(_SSL.Connection):
     def do_handshake(self, *args: Any, **kwargs: Any) -> None:
         return self._call(super().do_handshake, *args, **kwargs)
 
+    @property
+    def session(self) -> Optional[_SSL.Session]:
+        return self.get_session()
+
+    @property
+    def session_reused(self) -> bool:
+        """Whether the TLS handshake resumed a session.
+
+        Always False when the installed PyOpenSSL does not expose
+        SSL_session_reused.
+        """
+        if _SSL_session_reused is None:
+            return False
+        return bool(_SSL_session_reused(self._ssl))
+
     def recv(self, *args: Any, **kwargs: Any) -> bytes:
         try:
             return self._call(super().recv, *args, **kwargs)
@@ -263,6 +286,14 @@ class SSLContext:
 
     check_ocsp_endpoint = property(__get_check_ocsp_endpoint, __set_check_ocsp_endpoint)
 
+    def __get_ocsp_response_cache(self) -> _OCSPCache:
+        return self._callback_data.ocsp_response_cache
+
+    def __set_ocsp_response_cache(self, value: _OCSPCache) -> None:
+        self._callback_data.ocsp_response_cache = value
+
+    ocsp_response_cache = property(__get_ocsp_response_cache, __set_ocsp_response_cache)
+
     def __get_options(self) -> None:
         # Calling set_options adds the option to the existing bitmask and
         # returns the new bitmask.
@@ -19,6 +19,7 @@ import warnings
 from typing import Optional
 
 from pymongo.errors import ConfigurationError
+from pymongo.ocsp_cache import _DEFAULT_OCSP_CACHE_SIZE, _OCSPCache, _OCSPFileStore
 
 HAVE_SSL = True
 
@@ -65,6 +66,8 @@ if HAVE_SSL:
         allow_invalid_certificates: bool,
         allow_invalid_hostnames: bool,
         disable_ocsp_endpoint_check: bool,
+        ocsp_cache_size: int = _DEFAULT_OCSP_CACHE_SIZE,
+        ocsp_cache_file: Optional[str] = None,
     ) -> _ssl.SSLContext:
         """Create and return an SSLContext object."""
         verify_mode = CERT_NONE if allow_invalid_certificates else CERT_REQUIRED
@@ -75,6 +78,9 @@ if HAVE_SSL:
             ctx.check_hostname = False
         if hasattr(ctx, "check_ocsp_endpoint"):
             ctx.check_ocsp_endpoint = not disable_ocsp_endpoint_check
+        if hasattr(ctx, "ocsp_response_cache"):
+            store = _OCSPFileStore(ocsp_cache_file) if ocsp_cache_file else None
+            ctx.ocsp_response_cache = _OCSPCache(ocsp_cache_size, store)
         if hasattr(ctx, "options"):
             # Explicitly disable SSLv2, SSLv3 and TLS compression. Note that
             # up to date versions of MongoDB 2.4 and above already disable
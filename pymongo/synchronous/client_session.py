@@ -136,6 +136,9 @@ Classes
 from __future__ import annotations
 
 import collections
+import itertools
+import os
+import threading
 import time
 import uuid
 from collections.abc import Mapping as _Mapping
@@ -144,6 +147,7 @@ from typing import (
     Any,
     Callable,
     ContextManager,
+    Iterator,
     Mapping,
     MutableMapping,
     NoReturn,
@@ -1102,62 +1106,111 @@ class _ServerSession:
         self._transaction_id += 1
 
 
-class _ServerSessionPool(collections.deque):
+# The maximum number of shards in a server session pool.
+_MAX_SESSION_POOL_SHARDS = 16
+
+
+class _ServerSessionPool:
     """Pool of _ServerSession objects.
 
+    Sessions are kept in several deques, or shards, and each thread checks
+    out and returns sessions through its own shard so that concurrent
+    threads rarely touch the same deque. Appending and popping from a deque
+    is atomic, so the pool takes no locks. Stale sessions are cleared by
+    :meth:`clear_stale`, which the client calls periodically, rather than on
+    every checkout.
+
     This class is thread-safe.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
+    def __init__(self, num_shards: Optional[int] = None):
+        if num_shards is None:
+            num_shards = min(os.cpu_count() or 1, _MAX_SESSION_POOL_SHARDS)
+        self._shards: tuple[collections.deque[_ServerSession], ...] = tuple(
+            collections.deque() for _ in range(num_shards)
+        )
+        self._shard_ids = itertools.count()
+        self._local = threading.local()
         self.generation = 0
 
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[_ServerSession]:
+        for shard in self._shards:
+            yield from list(shard)
+
+    def _shard(self) -> collections.deque[_ServerSession]:
+        try:
+            shard_id = self._local.shard_id
+        except AttributeError:
+            # Assign shards to threads in turn, thread idents are not evenly
+            # distributed.
+            shard_id = self._local.shard_id = next(self._shard_ids) % len(self._shards)
+        return self._shards[shard_id]
+
     def reset(self) -> None:
         self.generation += 1
-        self.clear()
+        for shard in self._shards:
+            shard.clear()
 
-    def pop_all(self) -> list[_ServerSession]:
-        ids = []
-        while True:
-            try:
-                ids.append(self.pop().session_id)
-            except IndexError:
-                break
+    def pop_all(self) -> list[Mapping[str, Any]]:
+        ids: list[Mapping[str, Any]] = []
+        for shard in self._shards:
+            while True:
+                try:
+                    ids.append(shard.pop().session_id)
+                except IndexError:
+                    break
         return ids
 
     def get_server_session(self, session_timeout_minutes: Optional[int]) -> _ServerSession:
-        # Although the Driver Sessions Spec says we only clear stale sessions
-        # in return_server_session, PyMongo can't take a lock when returning
-        # sessions from a __del__ method (like in Cursor.__die), so it can't
-        # clear stale sessions there. In case many sessions were returned via
-        # __del__, check for stale sessions here too.
-        self._clear_stale(session_timeout_minutes)
+        # Prefer this thread's shard, then take a session from another shard
+        # before starting a new one.
+        s = self._pop_fresh(self._shard(), session_timeout_minutes)
+        if s is not None:
+            return s
+        for shard in self._shards:
+            s = self._pop_fresh(shard, session_timeout_minutes)
+            if s is not None:
+                return s
 
+        return _ServerSession(self.generation)
+
+    @staticmethod
+    def _pop_fresh(
+        shard: collections.deque[_ServerSession], session_timeout_minutes: Optional[int]
+    ) -> Optional[_ServerSession]:
         # The most recently used sessions are on the left.
         while True:
             try:
-                s = self.popleft()
+                s = shard.popleft()
             except IndexError:
-                break
+                return None
             if not s.timed_out(session_timeout_minutes):
                 return s
 
-        return _ServerSession(self.generation)
-
     def return_server_session(self, server_session: _ServerSession) -> None:
         # Discard sessions from an old pool to avoid duplicate sessions in the
         # child process after a fork.
         if server_session.generation == self.generation and not server_session.dirty:
-            self.appendleft(server_session)
+            self._shard().appendleft(server_session)
 
-    def _clear_stale(self, session_timeout_minutes: Optional[int]) -> None:
-        # Clear stale sessions. The least recently used are on the right.
-        while True:
-            try:
-                s = self.pop()
-            except IndexError:
-                break
-            if not s.timed_out(session_timeout_minutes):
-                self.append(s)
-                # The remaining sessions also haven't timed out.
-                break
+    def clear_stale(self, session_timeout_minutes: Optional[int]) -> None:
+        """Discard the sessions that have timed out.
+
+        PyMongo can't take a lock when returning sessions from a __del__
+        method (like in Cursor.__die), so stale sessions are cleared
+        periodically instead of in return_server_session.
+        """
+        for shard in self._shards:
+            # The least recently used are on the right.
+            while True:
+                try:
+                    s = shard.pop()
+                except IndexError:
+                    break
+                if not s.timed_out(session_timeout_minutes):
+                    shard.append(s)
+                    # The remaining sessions also haven't timed out.
+                    break
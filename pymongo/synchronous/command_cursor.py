@@ -15,6 +15,7 @@
 """CommandCursor class to iterate over command results."""
 from __future__ import annotations
 
+import functools
 from collections import deque
 from typing import (
     TYPE_CHECKING,
@@ -29,7 +30,13 @@ from typing import (
 )
 
 from bson import CodecOptions, _convert_raw_document_lists_to_streams
-from pymongo.cursor_shared import _CURSOR_CLOSED_ERRORS
+from pymongo.cursor_shared import (
+    _CURSOR_CLOSED_ERRORS,
+    _DEFAULT_MAX_BATCH_BYTES,
+    _BatchSizeTuner,
+    _LazyBatch,
+    _validate_adaptive_batch_size,
+)
 from pymongo.errors import ConnectionFailure, InvalidOperation, OperationFailure
 from pymongo.message import (
     _CursorAddress,
@@ -38,8 +45,16 @@ from pymongo.message import (
     _OpReply,
     _RawBatchGetMore,
 )
-from pymongo.response import PinnedResponse
-from pymongo.synchronous.cursor import _ConnectionManager
+from pymongo.response import PinnedResponse, Response
+from pymongo.synchronous.cursor import (
+    _ConnectionManager,
+    _GetMorePrefetcher,
+    _acquire_prefetched,
+    _batch_memory,
+    _release_prefetched,
+    _response_size,
+    _unpack_lazy_response,
+)
 from pymongo.typings import _Address, _DocumentOut, _DocumentType
 
 if TYPE_CHECKING:
@@ -54,6 +69,8 @@ class CommandCursor(Generic[_DocumentType]):
     """A cursor / iterator over command cursors."""
 
     _getmore_class = _GetMore
+    # Whether the batches of this cursor are raw BSON.
+    _holds_raw_batches = False
 
     def __init__(
         self,
@@ -68,9 +85,17 @@ class CommandCursor(Generic[_DocumentType]):
     ) -> None:
         """Create a new command cursor."""
         self._sock_mgr: Any = None
+        self._prefetcher: Optional[_GetMorePrefetcher] = None
+        self._prefetch_batches = 0
+        self._batch_tuner: Optional[_BatchSizeTuner] = None
+        self._max_buffer_bytes = 0
+        # The size of the getMore batch in self._data, counted against the
+        # client's maxCursorBufferBytes.
+        self._batch_bytes = 0
+        self._batch_raw = False
         self._collection: Collection[_DocumentType] = collection
         self._id = cursor_info["id"]
-        self._data = deque(cursor_info["firstBatch"])
+        self._data: Union[deque, _LazyBatch] = deque(cursor_info["firstBatch"])
         self._postbatchresumetoken: Optional[Mapping[str, Any]] = cursor_info.get(
             "postBatchResumeToken"
         )
@@ -95,6 +120,8 @@ class CommandCursor(Generic[_DocumentType]):
             raise TypeError("max_await_time_ms must be an integer or None")
 
     def __del__(self) -> None:
+        if getattr(self, "_batch_bytes", 0):
+            self._release_batch()
         self._die_no_lock()
 
     def batch_size(self, batch_size: int) -> CommandCursor[_DocumentType]:
@@ -120,6 +147,97 @@ class CommandCursor(Generic[_DocumentType]):
         self._batch_size = batch_size == 1 and 2 or batch_size
         return self
 
+    def prefetch(self, batches: int = 1) -> CommandCursor[_DocumentType]:
+        """Send the getMore for the next `batches` batches of results while
+        the application is still iterating over the current batch.
+
+        Each prefetched getMore runs in the background on a connection checked
+        out from the pool (or on the cursor's pinned connection). Prefetched
+        batches are held in memory until they are iterated, and count against
+        the client's ``maxCursorBufferBytes`` budget from the time they are
+        received. Closing the cursor waits for a getMore that is already
+        running. Prefetching is ignored for cursors created with an explicit
+        `session`, since a :class:`~pymongo.client_session.ClientSession`
+        must not be used concurrently.
+
+        Raises :exc:`TypeError` if `batches` is not an integer.
+        Raises :exc:`ValueError` if `batches` is less than ``0``.
+
+        :param batches: The number of batches to request ahead of the
+            application. ``0`` disables prefetching.
+
+        .. versionadded:: 4.9
+        """
+        if not isinstance(batches, int):
+            raise TypeError("batches must be an integer")
+        if batches < 0:
+            raise ValueError("batches must be >= 0")
+
+        self._prefetch_batches = batches
+        if self._prefetcher is not None:
+            self._prefetcher.depth = batches
+        # The first batch was returned by the command that created the cursor.
+        self._maybe_prefetch()
+        return self
+
+    def adaptive_batch_size(
+        self,
+        max_batch_bytes: int = _DEFAULT_MAX_BATCH_BYTES,
+        min_batch_size: int = 1,
+        max_batch_size: int = 0,
+    ) -> CommandCursor[_DocumentType]:
+        """Choose the batch size of each getMore from the size of the
+        documents returned so far, the round trip time of each batch and how
+        quickly the application consumes them.
+
+        See :meth:`~pymongo.cursor.Cursor.adaptive_batch_size`.
+        Until the first getMore has returned, :meth:`batch_size` is used.
+
+        Raises :exc:`TypeError` if an argument is not an integer.
+        Raises :exc:`ValueError` if `max_batch_bytes` or `min_batch_size` is
+        less than ``1``, or if `max_batch_size` is negative or less than
+        `min_batch_size`.
+
+        :param max_batch_bytes: The approximate maximum size in bytes of the
+            documents requested by each getMore.
+        :param min_batch_size: The minimum number of documents requested by
+            each getMore.
+        :param max_batch_size: The maximum number of documents requested by
+            each getMore. ``0`` means no maximum.
+
+        .. versionadded:: 4.9
+        """
+        self._batch_tuner = _BatchSizeTuner(
+            *_validate_adaptive_batch_size(max_batch_bytes, min_batch_size, max_batch_size)
+        )
+        # The first batch was returned by the command that created the cursor.
+        self._batch_tuner.delivered(len(self._data))
+        return self
+
+    def max_buffer_bytes(self, max_bytes: int) -> CommandCursor[_DocumentType]:
+        """Limits the memory used by each batch of results held by this
+        cursor.
+
+        See :meth:`~pymongo.cursor.Cursor.max_buffer_bytes`.
+        The first batch, returned by the command that created the cursor, is
+        always decoded.
+
+        Raises :exc:`TypeError` if `max_bytes` is not an integer.
+        Raises :exc:`ValueError` if `max_bytes` is less than ``0``.
+
+        :param max_bytes: The size in bytes of the BSON of the largest batch
+            to decode at once. ``0`` means no limit.
+
+        .. versionadded:: 4.9
+        """
+        if not isinstance(max_bytes, int):
+            raise TypeError("max_bytes must be an integer")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+
+        self._max_buffer_bytes = max_bytes
+        return self
+
     def _has_next(self) -> bool:
         """Returns `True` if the cursor has documents remaining from the
         previous batch.
@@ -155,8 +273,44 @@ class CommandCursor(Generic[_DocumentType]):
         user_fields: Optional[Mapping[str, Any]] = None,
         legacy_response: bool = False,
     ) -> Sequence[_DocumentOut]:
+        if (
+            user_fields
+            and isinstance(response, _OpMsg)
+            and not self._collection.database.client._cursor_buffer.fits(
+                len(response.payload_document), self._max_buffer_bytes
+            )
+        ):
+            return _unpack_lazy_response(response, codec_options, user_fields)
         return response.unpack_response(cursor_id, codec_options, user_fields, legacy_response)
 
+    def _hold_batch(
+        self, documents: Sequence[Any], response: Response, prefetched: bool = False
+    ) -> None:
+        """Make `documents` the current batch and account for its memory.
+
+        The memory of a prefetched batch was counted when it was decoded.
+        """
+        self._release_batch()
+        if isinstance(documents, _LazyBatch):
+            self._data = documents
+        else:
+            self._data = deque(documents)
+        self._batch_bytes, self._batch_raw = _batch_memory(
+            documents, response, self._holds_raw_batches
+        )
+        if self._batch_bytes and not prefetched:
+            self._collection.database.client._cursor_buffer.acquire(
+                self._batch_bytes, self._batch_raw, isinstance(documents, _LazyBatch)
+            )
+
+    def _release_batch(self) -> None:
+        """Stop accounting for the memory of the current batch."""
+        if self._batch_bytes:
+            self._collection.database.client._cursor_buffer.release(
+                self._batch_bytes, self._batch_raw
+            )
+            self._batch_bytes = 0
+
     @property
     def alive(self) -> bool:
         """Does this cursor have the potential to return more data?
@@ -213,15 +367,30 @@ class CommandCursor(Generic[_DocumentType]):
     def _die_no_lock(self) -> None:
         """Closes this cursor without acquiring a lock."""
         cursor_id, address = self._prepare_to_die()
-        self._collection.database.client._cleanup_cursor_no_lock(
-            cursor_id, address, self._sock_mgr, self._session, self._explicit_session
+        cleanup = functools.partial(
+            self._collection.database.client._cleanup_cursor_no_lock,
+            cursor_id,
+            address,
+            self._sock_mgr,
+            self._session,
+            self._explicit_session,
         )
+        if self._prefetcher is not None:
+            # Kill the cursor and release its session only once the
+            # getMores that are in flight are done with them.
+            prefetcher, self._prefetcher = self._prefetcher, None
+            prefetcher.stop_no_wait(cleanup)
+        else:
+            cleanup()
         if not self._explicit_session:
             self._session = None
         self._sock_mgr = None
 
     def _die_lock(self) -> None:
         """Closes this cursor."""
+        if self._prefetcher is not None:
+            prefetcher, self._prefetcher = self._prefetcher, None
+            prefetcher.stop()
         cursor_id, address = self._prepare_to_die()
         self._collection.database.client._cleanup_cursor_lock(
             cursor_id,
@@ -247,9 +416,14 @@ class CommandCursor(Generic[_DocumentType]):
         """Send a getmore message and handle the response."""
         client = self._collection.database.client
         try:
-            response = client._run_operation(
-                operation, self._unpack_response, address=self._address
-            )
+            response = None
+            if self._prefetcher and self._prefetcher.pending:
+                response = self._prefetcher.next()
+            prefetched = response is not None
+            if response is None:
+                response = client._run_operation(
+                    operation, self._unpack_response, address=self._address
+                )
         except OperationFailure as exc:
             if exc.code in _CURSOR_CLOSED_ERRORS:
                 # Don't send killCursors because the cursor is already closed.
@@ -285,7 +459,9 @@ class CommandCursor(Generic[_DocumentType]):
 
         if self._id == 0:
             self.close()
-        self._data = deque(documents)
+        self._hold_batch(documents, response, prefetched)
+        if self._batch_tuner is not None:
+            self._batch_tuner.received(len(self._data), _response_size(response), response.duration)
 
     def _refresh(self) -> int:
         """Refreshes the cursor with more data from the server.
@@ -294,33 +470,75 @@ class CommandCursor(Generic[_DocumentType]):
         self._data is already non-empty. Raises OperationFailure when the
         cursor cannot be refreshed due to an error on the query.
         """
-        if len(self._data) or self._killed:
+        if len(self._data):
             return len(self._data)
+        # The application has consumed the previous batch.
+        self._release_batch()
+        if self._killed:
+            return 0
 
         if self._id:  # Get More
-            dbname, collname = self._ns.split(".", 1)
-            read_pref = self._collection._read_preference_for(self.session)
-            self._send_message(
-                self._getmore_class(
-                    dbname,
-                    collname,
-                    self._batch_size,
-                    self._id,
-                    self._collection.codec_options,
-                    read_pref,
-                    self._session,
-                    self._collection.database.client,
-                    self._max_await_time_ms,
-                    self._sock_mgr,
-                    False,
-                    self._comment,
-                )
-            )
+            if self._batch_tuner is not None:
+                self._batch_tuner.drained()
+            self._send_message(self._get_more())
+            if self._batch_tuner is not None:
+                self._batch_tuner.delivered(len(self._data))
+            self._maybe_prefetch()
         else:  # Cursor id is zero nothing else to return
             self._die_lock()
 
         return len(self._data)
 
+    def _get_more(self) -> _GetMore:
+        dbname, collname = self._ns.split(".", 1)
+        read_pref = self._collection._read_preference_for(self.session)
+        return self._getmore_class(
+            dbname,
+            collname,
+            self._batch_tuner.batch_size(self._batch_size)
+            if self._batch_tuner is not None
+            else self._batch_size,
+            self._id,
+            self._collection.codec_options,
+            read_pref,
+            self._session,
+            self._collection.database.client,
+            self._max_await_time_ms,
+            self._sock_mgr,
+            False,
+            self._comment,
+        )
+
+    def _run_get_more(self) -> Response:
+        client = self._collection.database.client
+        response = client._run_operation(
+            self._get_more(), self._unpack_response, address=self._address
+        )
+        _acquire_prefetched(client._cursor_buffer, self._holds_raw_batches, response)
+        return response
+
+    def _maybe_prefetch(self) -> None:
+        """Start prefetching the next batches, if enabled for this cursor."""
+        if (
+            not self._prefetch_batches
+            or not self._id
+            or self._killed
+            # The application's session must not be used concurrently, so
+            # getMores that use it are never sent in the background.
+            or self._explicit_session
+        ):
+            return
+        if self._prefetcher is None:
+            self._prefetcher = _GetMorePrefetcher(
+                self._prefetch_batches,
+                functools.partial(
+                    _release_prefetched,
+                    self._collection.database.client._cursor_buffer,
+                    self._holds_raw_batches,
+                ),
+            )
+        self._prefetcher.fill(self._run_get_more)
+
     def __iter__(self) -> Iterator[_DocumentType]:
         return self
 
@@ -357,6 +575,8 @@ class CommandCursor(Generic[_DocumentType]):
             else:
                 for _ in range(min(len(self._data), total)):
                     result.append(self._data.popleft())
+            if not self._data:
+                self._release_batch()
             return True
         else:
             return False
@@ -416,6 +636,7 @@ class CommandCursor(Generic[_DocumentType]):
 
 class RawBatchCommandCursor(CommandCursor[_DocumentType]):
     _getmore_class = _RawBatchGetMore
+    _holds_raw_batches = True
 
     def __init__(
         self,
@@ -43,6 +43,7 @@ from pymongo.errors import (
 )
 from pymongo.logger import _COMMAND_LOGGER, _CommandStatusMessage, _debug_log
 from pymongo.message import _UNPACK_REPLY, _OpMsg, _OpReply
+from pymongo.metrics import _record_phase
 from pymongo.monitoring import _is_speculative_authenticate
 from pymongo.network_layer import (
     _POLL_TIMEOUT,
@@ -52,6 +53,7 @@ from pymongo.network_layer import (
     sendall,
 )
 from pymongo.socket_checker import _errno_from_exception
+from pymongo.tracing import _set_command_attributes, _span
 
 if TYPE_CHECKING:
     from bson import CodecOptions
@@ -138,6 +140,8 @@ def command(
 
     publish = listeners is not None and listeners.enabled_for_commands
     start = datetime.datetime.now()
+    # The end of each step of the command, for slow operation timings.
+    marks = [time.perf_counter_ns()]
     if publish:
         speculative_hello = _is_speculative_authenticate(name, spec)
 
@@ -169,6 +173,7 @@ def command(
 
     if max_bson_size is not None and size > max_bson_size + message._COMMAND_OVERHEAD:
         message._raise_document_too_large(name, size, max_bson_size + message._COMMAND_OVERHEAD)
+    marks.append(time.perf_counter_ns())
     if client is not None:
         if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
             _debug_log(
@@ -198,69 +203,86 @@ def command(
             service_id=conn.service_id,
         )
 
-    try:
-        sendall(conn.conn, msg)
-        if use_op_msg and unacknowledged:
-            # Unacknowledged, fake a successful command response.
-            reply = None
-            response_doc: _DocumentOut = {"ok": 1}
-        else:
-            reply = receive_message(conn, request_id)
-            conn.more_to_come = reply.more_to_come
-            unpacked_docs = reply.unpack_response(
-                codec_options=codec_options, user_fields=user_fields
-            )
-
-            response_doc = unpacked_docs[0]
-            if client:
-                client._process_response(response_doc, session)
-            if check:
-                helpers_shared._check_command_response(
-                    response_doc,
-                    conn.max_wire_version,
-                    allowable_errors,
-                    parse_write_concern_error=parse_write_concern_error,
+    tracer = conn.opts._tracer if client is not None else None
+    with _span(tracer, name) as span:
+        if span is not None:
+            _set_command_attributes(span, name, dbname, request_id, conn)
+        try:
+            sendall(conn.conn, msg)
+            marks.append(time.perf_counter_ns())
+            if use_op_msg and unacknowledged:
+                # Unacknowledged, fake a successful command response.
+                reply = None
+                response_doc: _DocumentOut = {"ok": 1}
+            else:
+                reply = receive_message(conn, request_id)
+                marks.append(time.perf_counter_ns())
+                conn.more_to_come = reply.more_to_come
+                unpacked_docs = reply.unpack_response(
+                    codec_options=codec_options, user_fields=user_fields
                 )
-    except Exception as exc:
-        duration = datetime.datetime.now() - start
-        if isinstance(exc, (NotPrimaryError, OperationFailure)):
-            failure: _DocumentOut = exc.details  # type: ignore[assignment]
-        else:
-            failure = message._convert_exception(exc)
-        if client is not None:
-            if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
-                _debug_log(
-                    _COMMAND_LOGGER,
-                    clientId=client._topology_settings._topology_id,
-                    message=_CommandStatusMessage.FAILED,
-                    durationMS=duration,
-                    failure=failure,
-                    commandName=next(iter(spec)),
-                    databaseName=dbname,
-                    requestId=request_id,
-                    operationId=request_id,
-                    driverConnectionId=conn.id,
-                    serverConnectionId=conn.server_connection_id,
-                    serverHost=conn.address[0],
-                    serverPort=conn.address[1],
-                    serviceId=conn.service_id,
-                    isServerSideError=isinstance(exc, OperationFailure),
+
+                response_doc = unpacked_docs[0]
+                if client:
+                    client._process_response(response_doc, session)
+                if check:
+                    helpers_shared._check_command_response(
+                        response_doc,
+                        conn.max_wire_version,
+                        allowable_errors,
+                        parse_write_concern_error=parse_write_concern_error,
+                    )
+                marks.append(time.perf_counter_ns())
+        except Exception as exc:
+            duration = datetime.datetime.now() - start
+            conn.opts._metrics.command(name, conn.address, False, duration.total_seconds())
+            timings = None
+            if client is not None:
+                timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
+            if isinstance(exc, (NotPrimaryError, OperationFailure)):
+                failure: _DocumentOut = exc.details  # type: ignore[assignment]
+            else:
+                failure = message._convert_exception(exc)
+            if client is not None:
+                if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
+                    _debug_log(
+                        _COMMAND_LOGGER,
+                        clientId=client._topology_settings._topology_id,
+                        message=_CommandStatusMessage.FAILED,
+                        durationMS=duration,
+                        failure=failure,
+                        commandName=next(iter(spec)),
+                        databaseName=dbname,
+                        requestId=request_id,
+                        operationId=request_id,
+                        driverConnectionId=conn.id,
+                        serverConnectionId=conn.server_connection_id,
+                        serverHost=conn.address[0],
+                        serverPort=conn.address[1],
+                        serviceId=conn.service_id,
+                        isServerSideError=isinstance(exc, OperationFailure),
+                        timings=timings,
+                    )
+            if publish:
+                assert listeners is not None
+                assert address is not None
+                listeners.publish_command_failure(
+                    duration,
+                    failure,
+                    name,
+                    request_id,
+                    address,
+                    conn.server_connection_id,
+                    service_id=conn.service_id,
+                    database_name=dbname,
+                    timings=timings,
                 )
-        if publish:
-            assert listeners is not None
-            assert address is not None
-            listeners.publish_command_failure(
-                duration,
-                failure,
-                name,
-                request_id,
-                address,
-                conn.server_connection_id,
-                service_id=conn.service_id,
-                database_name=dbname,
-            )
-        raise
+            raise
     duration = datetime.datetime.now() - start
+    conn.opts._metrics.command(name, conn.address, True, duration.total_seconds())
+    timings = None
+    if client is not None:
+        timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
     if client is not None:
         if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
             _debug_log(
@@ -279,6 +301,7 @@ def command(
                 serverPort=conn.address[1],
                 serviceId=conn.service_id,
                 speculative_authenticate="speculativeAuthenticate" in orig,
+                timings=timings,
             )
     if publish:
         assert listeners is not None
@@ -293,6 +316,7 @@ def command(
             service_id=conn.service_id,
             speculative_hello=speculative_hello,
             database_name=dbname,
+            timings=timings,
         )
 
     if client and client._encrypter and reply:
@@ -331,11 +355,15 @@ def receive_message(
             f"Message length ({length!r}) is larger than server max "
             f"message size ({max_message_size!r})"
         )
+    data: Union[bytes, memoryview]
     if op_code == 2012:
         op_code, _, compressor_id = _UNPACK_COMPRESSION_HEADER(
             _receive_data_on_socket(conn, 9, deadline)
         )
-        data = decompress(_receive_data_on_socket(conn, length - 25, deadline), compressor_id)
+        compressed = _receive_data_on_socket(conn, length - 25, deadline)
+        started = time.perf_counter_ns()
+        data = decompress(compressed, compressor_id, conn.compression_context)
+        _record_phase("decompress", started)
     else:
         data = _receive_data_on_socket(conn, length - 16, deadline)
 
@@ -382,10 +410,13 @@ def wait_for_read(conn: Connection, deadline: Optional[float]) -> None:
 
 
 def _receive_data_on_socket(conn: Connection, length: int, deadline: Optional[float]) -> memoryview:
-    buf = bytearray(length)
-    mv = memoryview(buf)
-    bytes_read = 0
-    while bytes_read < length:
+    receive_buffer = conn.receive_buffer
+    if receive_buffer.buffered >= length:
+        return receive_buffer.consume(length)
+    mv = receive_buffer.reserve(length)
+    # Read as much as the buffer can hold so that the header and the body of
+    # a reply usually arrive in a single recv.
+    while receive_buffer.buffered < length:
         try:
             wait_for_read(conn, deadline)
             # CSOT: Update timeout. When the timeout has expired perform one
@@ -393,7 +424,7 @@ def _receive_data_on_socket(conn: Connection, length: int, deadline: Optional[fl
             # the response is actually already buffered on the client.
             if _csot.get_timeout() and deadline is not None:
                 conn.set_conn_timeout(max(deadline - time.monotonic(), 0))
-            chunk_length = conn.conn.recv_into(mv[bytes_read:])
+            chunk_length = conn.conn.recv_into(mv[receive_buffer.end :])
         except BLOCKING_IO_ERRORS:
             raise socket.timeout("timed out") from None
         except OSError as exc:
@@ -403,6 +434,6 @@ def _receive_data_on_socket(conn: Connection, length: int, deadline: Optional[fl
         if chunk_length == 0:
             raise OSError("connection closed")
 
-        bytes_read += chunk_length
+        receive_buffer.end += chunk_length
 
-    return mv
+    return receive_buffer.consume(length)
@@ -0,0 +1,402 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scan a collection with several concurrent partitioned queries."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import queue
+import threading
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Mapping,
+    Optional,
+)
+
+from bson import _UNPACK_INT_FROM
+from bson.datetime_ms import DatetimeMS
+from bson.decimal128 import Decimal128
+from bson.objectid import ObjectId
+from pymongo.typings import _DocumentType
+
+if TYPE_CHECKING:
+    from pymongo.synchronous.collection import Collection
+
+_IS_SYNC = True
+
+# Number of sampled _id values per partition used to choose split points.
+_SAMPLES_PER_PARTITION = 20
+
+_SPLIT_METHODS = ("sample", "minmax")
+
+
+class PartitionStats:
+    """Progress and throughput of one partition of a parallel scan.
+
+    .. versionadded:: 4.9
+    """
+
+    __slots__ = ("index", "lower", "upper", "documents", "batches", "done", "_start", "_end")
+
+    def __init__(self, index: int, lower: Any, upper: Any) -> None:
+        #: The position of this partition in the scan.
+        self.index = index
+        #: The inclusive lower ``_id`` bound of this partition, or ``None``
+        #: for the first partition, which also reads the documents whose
+        #: ``_id`` has another BSON type than the split points.
+        self.lower = lower
+        #: The exclusive upper ``_id`` bound of this partition, or ``None``
+        #: for the last partition.
+        self.upper = upper
+        #: The number of documents read by this partition so far.
+        self.documents = 0
+        #: The number of batches read by this partition so far.
+        self.batches = 0
+        #: Whether this partition has been read completely.
+        self.done = False
+        self._start: Optional[float] = None
+        self._end: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds this partition has been running, or ran for once done."""
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else time.monotonic()
+        return end - self._start
+
+    @property
+    def documents_per_second(self) -> Optional[float]:
+        """The rate at which this partition has read documents."""
+        elapsed = self.elapsed
+        if not elapsed:
+            return None
+        return self.documents / elapsed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(index={self.index!r}, lower={self.lower!r}, "
+            f"upper={self.upper!r}, documents={self.documents!r}, batches={self.batches!r}, "
+            f"elapsed={self.elapsed!r}, done={self.done!r})"
+        )
+
+
+class _PartitionDone:
+    """Queued by a partition once it has finished, successfully or not."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[Exception]) -> None:
+        self.error = error
+
+
+def _count_raw_documents(data: bytes) -> int:
+    count = position = 0
+    end = len(data)
+    while position < end:
+        position += _UNPACK_INT_FROM(data, position)[0]
+        count += 1
+    return count
+
+
+def _bson_type(value: Any) -> Optional[str]:
+    """The ``$type`` alias of the _id values a range query on `value` can match."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, Decimal128)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    if isinstance(value, (datetime.datetime, DatetimeMS)):
+        return "date"
+    return None
+
+
+def _interpolate(lower: Any, upper: Any, num_partitions: int) -> Optional[list[Any]]:
+    """Evenly spaced split points between two _id values, if their type allows it."""
+    if isinstance(lower, ObjectId) and isinstance(upper, ObjectId):
+        start = lower.generation_time
+        step = (upper.generation_time - start) / num_partitions
+        return [ObjectId.from_datetime(start + step * i) for i in range(1, num_partitions)]
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (lower, upper)):
+        step = (upper - lower) / num_partitions
+        points = [lower + step * i for i in range(1, num_partitions)]
+        if isinstance(lower, int) and isinstance(upper, int):
+            return [int(p) for p in points]
+        return points
+    if isinstance(lower, datetime.datetime) and isinstance(upper, datetime.datetime):
+        step = (upper - lower) / num_partitions
+        return [lower + step * i for i in range(1, num_partitions)]
+    return None
+
+
+def _split_points(collection: Collection, num_partitions: int, split_method: str) -> list[Any]:
+    """Choose the ``_id`` values that divide `collection` into partitions."""
+    if num_partitions == 1:
+        return []
+    points = None
+    if split_method == "minmax":
+        bounds = []
+        for direction in (1, -1):
+            docs = collection.find({}, {"_id": 1}).sort("_id", direction).limit(1).to_list()
+            if not docs:
+                return []
+            bounds.append(docs[0]["_id"])
+        points = _interpolate(bounds[0], bounds[1], num_partitions)
+    if points is None:
+        pipeline = [
+            {"$sample": {"size": num_partitions * _SAMPLES_PER_PARTITION}},
+            {"$project": {"_id": 1}},
+            {"$sort": {"_id": 1}},
+        ]
+        ids = [doc["_id"] for doc in (collection.aggregate(pipeline)).to_list()]
+        if not ids:
+            return []
+        points = [ids[len(ids) * i // num_partitions] for i in range(1, num_partitions)]
+    # Range queries only compare values of the same BSON type, so the split
+    # points must all share one.
+    id_type = _bson_type(points[0])
+    if id_type is None or any(_bson_type(point) != id_type for point in points):
+        return []
+    # Drop duplicate split points, which would create empty partitions.
+    unique: list[Any] = []
+    for point in points:
+        if not unique or unique[-1] != point:
+            unique.append(point)
+    return unique
+
+
+# Seconds a partition waits for room in the queue before checking whether
+# its scan was abandoned.
+_PUT_INTERVAL = 0.5
+
+
+class _PartitionReader:
+    """Reads the partitions of a scan into the scan's queue.
+
+    Partitions reference this object instead of the scan, so that a scan the
+    application stops iterating without closing it can be freed. The scan
+    then marks its reader abandoned, and the partitions close their cursors
+    instead of waiting for room in the queue forever.
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        filter: Optional[Mapping[str, Any]],
+        projection: Any,
+        raw_batches: bool,
+        batch_size: int,
+        max_queued_batches: int,
+    ) -> None:
+        self._collection = collection
+        self._filter = filter
+        self._projection = projection
+        self._raw_batches = raw_batches
+        self._batch_size = batch_size
+        # A queue.Queue read by threads, or an asyncio.Queue read by tasks.
+        self.queue: Any
+        if _IS_SYNC:
+            self.queue = queue.Queue(max_queued_batches)
+        else:
+            self.queue = asyncio.Queue(max_queued_batches)
+        # Set once the scan is closed, partitions stop reading.
+        self.closed = False
+        # Set once the scan is freed, nothing reads the queue anymore.
+        self.abandoned = False
+
+    def partition_filter(self, stats: PartitionStats) -> Optional[Mapping[str, Any]]:
+        bounds = {}
+        if stats.lower is not None:
+            bounds["$gte"] = stats.lower
+        if stats.upper is not None:
+            bounds["$lt"] = stats.upper
+        if not bounds:
+            return self._filter
+        id_filter: Mapping[str, Any] = {"_id": bounds}
+        if stats.lower is None:
+            # The range queries only match _id values of the split points'
+            # BSON type, the first partition also reads every other type.
+            id_filter = {"$or": [id_filter, {"_id": {"$not": {"$type": _bson_type(stats.upper)}}}]}
+        if not self._filter:
+            return id_filter
+        return {"$and": [self._filter, id_filter]}
+
+    def scan_partition(self, stats: PartitionStats) -> None:
+        stats._start = time.monotonic()
+        error = None
+        try:
+            spec = self.partition_filter(stats)
+            if self._raw_batches:
+                cursor: Any = self._collection.find_raw_batches(
+                    spec, self._projection, batch_size=self._batch_size
+                )
+            else:
+                cursor = self._collection.find(spec, self._projection, batch_size=self._batch_size)
+            try:
+                while not self.closed:
+                    if self._raw_batches:
+                        try:
+                            batch: Any = cursor.next()
+                        except StopIteration:
+                            break
+                        count = _count_raw_documents(batch)
+                    else:
+                        batch = []
+                        if not cursor._next_batch(batch):
+                            break
+                        count = len(batch)
+                    stats.documents += count
+                    stats.batches += 1
+                    if not self._put(batch):
+                        break
+            finally:
+                cursor.close()
+        except Exception as exc:
+            error = exc
+        finally:
+            stats._end = time.monotonic()
+            stats.done = error is None and not self.closed
+            self._put(_PartitionDone(error))
+
+    def _put(self, item: Any) -> bool:
+        """Queue `item`, unless the scan is abandoned first."""
+        while not self.abandoned:
+            try:
+                self.queue.put(item, timeout=_PUT_INTERVAL)
+                return True
+            except (queue.Full, asyncio.TimeoutError):
+                pass
+        return False
+
+
+class ParallelScan(Generic[_DocumentType]):
+    """A scan over the documents of a collection, read by
+    several concurrent partitioned queries.
+
+    Should not be created directly by application developers - see
+    :meth:`~pymongo.collection.Collection.parallel_scan` instead.
+
+    .. versionadded:: 4.9
+    """
+
+    def __init__(
+        self,
+        collection: Collection[_DocumentType],
+        split_points: list[Any],
+        filter: Optional[Mapping[str, Any]],
+        projection: Any,
+        raw_batches: bool,
+        batch_size: int,
+        max_queued_batches: int,
+    ) -> None:
+        self._reader = _PartitionReader(
+            collection, filter, projection, raw_batches, batch_size, max_queued_batches
+        )
+        self._queue = self._reader.queue
+        self._raw_batches = raw_batches
+        self._data: deque = deque()
+        bounds = [None, *split_points, None]
+        self._partitions = [
+            PartitionStats(i, bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)
+        ]
+        self._running = len(self._partitions)
+        self._workers: list[Any] = []
+        # Partitions run in threads when synchronous and in tasks otherwise.
+        scan_partition: Any = self._reader.scan_partition
+        if _IS_SYNC:
+            for stats in self._partitions:
+                thread = threading.Thread(target=scan_partition, args=(stats,), daemon=True)
+                thread.start()
+                self._workers.append(thread)
+        else:
+            for stats in self._partitions:
+                self._workers.append(asyncio.create_task(scan_partition(stats)))
+
+    def __del__(self) -> None:
+        # Stop the partitions of a scan that was not closed.
+        self._reader.closed = True
+        self._reader.abandoned = True
+
+    @property
+    def partitions(self) -> list[PartitionStats]:
+        """A :class:`PartitionStats` for each partition of this scan."""
+        return self._partitions
+
+    @property
+    def alive(self) -> bool:
+        """Does this scan have the potential to return more data?"""
+        return bool(self._data) or (self._running > 0 and not self._reader.closed)
+
+    def next(self) -> Any:
+        """Advance the scan.
+
+        Returns the next document, or the next raw batch of BSON documents
+        when the scan was created with ``raw_batches=True``. Documents are
+        returned in no particular order.
+        """
+        while True:
+            if self._data:
+                return self._data.popleft()
+            if not self._running or self._reader.closed:
+                raise StopIteration
+            item = self._queue.get()
+            if isinstance(item, _PartitionDone):
+                self._running -= 1
+                if item.error is not None:
+                    self.close()
+                    raise item.error
+            elif self._raw_batches:
+                return item
+            else:
+                self._data.extend(item)
+
+    def close(self) -> None:
+        """Stop all partitions and wait for them to close their cursors."""
+        self._reader.closed = True
+        self._data.clear()
+        # Drain the queue so that partitions blocked on a full queue see
+        # that the scan is closed.
+        while self._running:
+            if isinstance(self._queue.get(), _PartitionDone):
+                self._running -= 1
+
+    def __iter__(self) -> ParallelScan[_DocumentType]:
+        return self
+
+    def __next__(self) -> Any:
+        return self.next()
+
+    def __enter__(self) -> ParallelScan[_DocumentType]:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def to_list(self, length: Optional[int] = None) -> list:
+        """Read up to `length` documents (or raw batches) from this scan into a list."""
+        res: list = []
+        while length is None or len(res) < length:
+            try:
+                res.append(self.next())
+            except StopIteration:
+                break
+        return res
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import asyncio
+import queue
 import sys
 import threading
 import time
@@ -170,14 +171,73 @@ class PeriodicExecutor:
             if self._skip_sleep:
                 self._skip_sleep = False
             else:
-                deadline = time.monotonic() + self._interval
-                while not self._stopped and time.monotonic() < deadline:
-                    time.sleep(self._min_interval)
-                    if self._event:
-                        break  # Early wake.
+                self._sleep()
 
             self._event = False
 
+    def _sleep(self) -> None:
+        """Sleep until `interval` seconds have passed or `wake` is called."""
+        deadline = time.monotonic() + self._interval
+        while not self._stopped and time.monotonic() < deadline:
+            time.sleep(self._min_interval)
+            if self._event:
+                break  # Early wake.
+
+
+class WakeableExecutor(PeriodicExecutor):
+    """A PeriodicExecutor that waits to be woken instead of checking every
+    `min_interval` seconds whether it was.
+
+    `wake` and `close` never block: they put an item in a queue.SimpleQueue,
+    or with asyncio set an asyncio.Event through the executor's event loop
+    with call_soon_threadsafe. Both are safe to call from destructors and
+    weakref callbacks, see "periodic_executor.rst" in this repository.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        min_interval: float,
+        target: Any,
+        name: Optional[str] = None,
+    ):
+        super().__init__(interval, min_interval, target, name)
+        self._wakeups: queue.SimpleQueue = queue.SimpleQueue()
+
+    def close(self, dummy: Any = None) -> None:
+        super().close(dummy)
+        self._notify()
+
+    def wake(self) -> None:
+        if not self._event:
+            self._event = True
+            self._notify()
+
+    def _notify(self) -> None:
+        self._wakeups.put(None)
+
+    def _sleep(self) -> None:
+        # Calls are still at least min_interval seconds apart.
+        time.sleep(self._min_interval)
+        timeout = self._interval - self._min_interval
+        if not self._stopped and not self._event and timeout > 0:
+            self._wait_for_wakeup(timeout)
+        # Discard the other wakeups, the target is about to run.
+        self._clear_wakeups()
+
+    def _wait_for_wakeup(self, timeout: float) -> None:
+        try:
+            self._wakeups.get(timeout=timeout)
+        except queue.Empty:
+            pass
+
+    def _clear_wakeups(self) -> None:
+        while True:
+            try:
+                self._wakeups.get_nowait()
+            except queue.Empty:
+                break
+
 
 # _EXECUTORS has a weakref to each running PeriodicExecutor. Once started,
 # an executor is kept alive by a strong reference from its thread and perhaps
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -27,6 +28,7 @@ from typing import (
 )
 
 from bson import _decode_all_selective
+from pymongo.cursor_shared import _decoded_reply
 from pymongo.errors import NotPrimaryError, OperationFailure
 from pymongo.helpers_shared import _check_command_response
 from pymongo.logger import (
@@ -39,6 +41,7 @@ from pymongo.logger import (
 from pymongo.message import _convert_exception, _GetMore, _OpMsg, _Query
 from pymongo.response import PinnedResponse, Response
 from pymongo.synchronous.helpers import _handle_reauth
+from pymongo.tracing import _set_command_attributes, _set_returned_rows, _span
 
 if TYPE_CHECKING:
     from queue import Queue
@@ -160,6 +163,8 @@ class Server:
         assert listeners is not None
         publish = listeners.enabled_for_commands
         start = datetime.now()
+        # The end of each step of the command, for slow operation timings.
+        marks = [time.perf_counter_ns()]
 
         use_cmd = operation.use_command(conn)
         more_to_come = operation.conn_mgr and operation.conn_mgr.more_to_come
@@ -169,6 +174,7 @@ class Server:
         else:
             message = operation.get_message(read_preference, conn, use_cmd)
             request_id, data, max_doc_size = self._split_message(message)
+        marks.append(time.perf_counter_ns())
 
         if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
             _debug_log(
@@ -200,73 +206,92 @@ class Server:
                 service_id=conn.service_id,
             )
 
-        try:
-            if more_to_come:
-                reply = conn.receive_message(None)
-            else:
-                conn.send_message(data, max_doc_size)
-                reply = conn.receive_message(request_id)
-
-            # Unpack and check for command errors.
-            if use_cmd:
-                user_fields = _CURSOR_DOC_FIELDS
-                legacy_response = False
-            else:
-                user_fields = None
-                legacy_response = True
-            docs = unpack_res(
-                reply,
-                operation.cursor_id,
-                operation.codec_options,
-                legacy_response=legacy_response,
-                user_fields=user_fields,
-            )
-            if use_cmd:
-                first = docs[0]
-                operation.client._process_response(first, operation.session)  # type: ignore[misc, arg-type]
-                _check_command_response(first, conn.max_wire_version)
-        except Exception as exc:
-            duration = datetime.now() - start
-            if isinstance(exc, (NotPrimaryError, OperationFailure)):
-                failure: _DocumentOut = exc.details  # type: ignore[assignment]
-            else:
-                failure = _convert_exception(exc)
-            if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
-                _debug_log(
-                    _COMMAND_LOGGER,
-                    clientId=client._topology_settings._topology_id,
-                    message=_CommandStatusMessage.FAILED,
-                    durationMS=duration,
-                    failure=failure,
-                    commandName=next(iter(cmd)),
-                    databaseName=dbn,
-                    requestId=request_id,
-                    operationId=request_id,
-                    driverConnectionId=conn.id,
-                    serverConnectionId=conn.server_connection_id,
-                    serverHost=conn.address[0],
-                    serverPort=conn.address[1],
-                    serviceId=conn.service_id,
-                    isServerSideError=isinstance(exc, OperationFailure),
+        with _span(conn.opts._tracer, operation.name) as span:
+            if span is not None:
+                _set_command_attributes(span, operation.name, dbn, request_id, conn)
+            try:
+                if more_to_come:
+                    marks.append(time.perf_counter_ns())
+                    reply = conn.receive_message(None)
+                else:
+                    conn.send_message(data, max_doc_size)
+                    marks.append(time.perf_counter_ns())
+                    reply = conn.receive_message(request_id)
+                marks.append(time.perf_counter_ns())
+
+                # Unpack and check for command errors.
+                if use_cmd:
+                    user_fields = _CURSOR_DOC_FIELDS
+                    legacy_response = False
+                else:
+                    user_fields = None
+                    legacy_response = True
+                docs = unpack_res(
+                    reply,
+                    operation.cursor_id,
+                    operation.codec_options,
+                    legacy_response=legacy_response,
+                    user_fields=user_fields,
                 )
-            if publish:
-                assert listeners is not None
-                listeners.publish_command_failure(
-                    duration,
-                    failure,
-                    operation.name,
-                    request_id,
-                    conn.address,
-                    conn.server_connection_id,
-                    service_id=conn.service_id,
-                    database_name=dbn,
+                if use_cmd:
+                    first = docs[0]
+                    operation.client._process_response(first, operation.session)  # type: ignore[misc, arg-type]
+                    _check_command_response(first, conn.max_wire_version)
+                marks.append(time.perf_counter_ns())
+                if span is not None:
+                    _set_returned_rows(span, docs, use_cmd)
+            except Exception as exc:
+                duration = datetime.now() - start
+                conn.opts._metrics.command(
+                    operation.name, conn.address, False, duration.total_seconds()
                 )
-            raise
+                timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
+                if isinstance(exc, (NotPrimaryError, OperationFailure)):
+                    failure: _DocumentOut = exc.details  # type: ignore[assignment]
+                else:
+                    failure = _convert_exception(exc)
+                if _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
+                    _debug_log(
+                        _COMMAND_LOGGER,
+                        clientId=client._topology_settings._topology_id,
+                        message=_CommandStatusMessage.FAILED,
+                        durationMS=duration,
+                        failure=failure,
+                        commandName=next(iter(cmd)),
+                        databaseName=dbn,
+                        requestId=request_id,
+                        operationId=request_id,
+                        driverConnectionId=conn.id,
+                        serverConnectionId=conn.server_connection_id,
+                        serverHost=conn.address[0],
+                        serverPort=conn.address[1],
+                        serviceId=conn.service_id,
+                        isServerSideError=isinstance(exc, OperationFailure),
+                        timings=timings,
+                    )
+                if publish:
+                    assert listeners is not None
+                    listeners.publish_command_failure(
+                        duration,
+                        failure,
+                        operation.name,
+                        request_id,
+                        conn.address,
+                        conn.server_connection_id,
+                        service_id=conn.service_id,
+                        database_name=dbn,
+                        timings=timings,
+                    )
+                raise
         duration = datetime.now() - start
+        conn.opts._metrics.command(operation.name, conn.address, True, duration.total_seconds())
+        timings = conn.opts._metrics.slow_operation(duration.total_seconds(), marks)
         # Must publish in find / getMore / explain command response
         # format.
         if use_cmd:
             res = docs[0]
+            if publish or _COMMAND_LOGGER.isEnabledFor(logging.DEBUG):
+                res = _decoded_reply(res)
         elif operation.name == "explain":
             res = docs[0] if docs else {}
         else:
@@ -291,6 +316,7 @@ class Server:
                 serverHost=conn.address[0],
                 serverPort=conn.address[1],
                 serviceId=conn.service_id,
+                timings=timings,
             )
         if publish:
             assert listeners is not None
@@ -303,6 +329,7 @@ class Server:
                 conn.server_connection_id,
                 service_id=conn.service_id,
                 database_name=dbn,
+                timings=timings,
             )
 
         # Decrypt response.
@@ -0,0 +1,107 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License.  You
+# may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.  See the License for the specific language governing
+# permissions and limitations under the License.
+
+"""Tracing spans for driver operations.
+
+PyMongo can record `OpenTelemetry <https://opentelemetry.io>`_ spans for the
+operations it runs. PyMongo does not depend on OpenTelemetry: pass any tracer
+that implements OpenTelemetry's ``Tracer.start_as_current_span`` method as
+the ``tracer`` keyword argument to
+:class:`~pymongo.mongo_client.MongoClient`::
+
+    from opentelemetry import trace
+
+    client = MongoClient(tracer=trace.get_tracer("pymongo"))
+
+Each operation records these spans, nested in the application's current
+span:
+
+- ``<operation>``, for example ``find`` or ``insert``: the whole operation,
+  including its retries. Each retry adds a ``retry`` event with the
+  ``pymongo.retry_attempt`` and ``exception.type`` attributes.
+
+  - ``server selection``: selecting a server, with the ``server.address``
+    and ``server.port`` attributes of the selected server.
+  - ``connection checkout``: checking out a connection from the server's
+    pool, including opening a new connection, with the ``server.address``,
+    ``server.port`` and ``pymongo.connection_id`` attributes.
+  - ``<command>``, for example ``find`` or ``getMore``: sending the command
+    and receiving its reply, with the ``db.system``, ``db.namespace``,
+    ``db.operation.name``, ``server.address``, ``server.port``,
+    ``pymongo.connection_id``, ``pymongo.request_id`` and, when known,
+    ``pymongo.server_connection_id`` attributes. Commands run by a cursor
+    also have the ``db.response.returned_rows`` attribute: the number of
+    documents in the batch.
+
+Operations that are not retried, such as
+:meth:`~pymongo.database.Database.command`, do not record an operation span.
+Errors are recorded on the span they leave, following the tracer's
+``start_as_current_span`` defaults.
+
+When no tracer is configured, which is the default, the cost of tracing is a
+check for ``None`` at each step.
+
+.. versionadded:: 4.9
+"""
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING, Any, ContextManager, Optional
+
+from pymongo.cursor_shared import _LazyBatch
+
+if TYPE_CHECKING:
+    from pymongo.typings import _Address
+
+_NO_SPAN: ContextManager[Any] = contextlib.nullcontext()
+
+
+def _span(tracer: Optional[Any], name: str) -> ContextManager[Any]:
+    """Start a span as the current span, or do nothing when `tracer` is None.
+
+    The span is ``None`` when tracing is disabled, callers only build its
+    attributes otherwise.
+    """
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_as_current_span(name)
+
+
+def _set_address(span: Any, address: _Address) -> None:
+    span.set_attribute("server.address", address[0])
+    if address[1] is not None:
+        span.set_attribute("server.port", address[1])
+
+
+def _set_command_attributes(span: Any, name: str, dbname: str, request_id: int, conn: Any) -> None:
+    span.set_attribute("db.system", "mongodb")
+    span.set_attribute("db.namespace", dbname)
+    span.set_attribute("db.operation.name", name)
+    _set_address(span, conn.address)
+    span.set_attribute("pymongo.connection_id", conn.id)
+    span.set_attribute("pymongo.request_id", request_id)
+    if conn.server_connection_id is not None:
+        span.set_attribute("pymongo.server_connection_id", conn.server_connection_id)
+
+
+def _set_returned_rows(span: Any, docs: Any, use_cmd: bool) -> None:
+    """Count the documents in a batch returned to a cursor."""
+    if use_cmd:
+        cursor = docs[0].get("cursor", {})
+        docs = cursor.get("firstBatch", cursor.get("nextBatch"))
+    if isinstance(docs, _LazyBatch):
+        span.set_attribute("db.response.returned_rows", len(docs))
+    # Raw batches are a single stream of documents that is not decoded.
+    elif isinstance(docs, list) and not (docs and isinstance(docs[0], (bytes, memoryview))):
+        span.set_attribute("db.response.returned_rows", len(docs))
@@ -43,7 +43,7 @@ from test.utils import (
     wait_until,
 )
 
-from bson import encode
+from bson import compile_encoder, decode_all, encode
 from bson.codec_options import CodecOptions
 from bson.objectid import ObjectId
 from bson.raw_bson import RawBSONDocument
@@ -826,6 +826,38 @@ class AsyncTestCollection(AsyncIntegrationTest):
         result = await coll.insert_many(gen())
         self.assertEqual(5, len(result.inserted_ids))
 
+    async def test_insert_many_encoder(self):
+        coll = self.db.test
+        await coll.delete_many({})
+        encoder = compile_encoder(["a", "b"])
+        docs: list = [{"a": i, "b": str(i)} for i in range(5)] + [{"c": 1}]
+        result = await coll.insert_many(docs, encoder=encoder)
+        self.assertEqual(6, len(result.inserted_ids))
+        for doc in docs:
+            self.assertEqual(doc, await coll.find_one({"_id": doc["_id"]}))
+
+    async def test_parallel_scan(self):
+        coll = self.db.test
+        await coll.drop()
+        await coll.insert_many([{"_id": i, "x": i % 2} for i in range(1000)])
+        for split_method in ("sample", "minmax"):
+            async with await coll.parallel_scan(
+                4, batch_size=50, split_method=split_method
+            ) as scan:
+                ids = sorted([doc["_id"] async for doc in scan])
+            self.assertEqual(ids, list(range(1000)))
+            self.assertEqual(sum(p.documents for p in scan.partitions), 1000)
+            self.assertTrue(all(p.done for p in scan.partitions))
+
+        scan = await coll.parallel_scan(3, {"x": 1}, {"_id": 1}, raw_batches=True)
+        docs = [doc for batch in await scan.to_list() for doc in decode_all(batch)]
+        self.assertEqual(sorted(doc["_id"] for doc in docs), list(range(1, 1000, 2)))
+
+        scan = await coll.parallel_scan(4, batch_size=10, max_queued_batches=1)
+        await scan.next()
+        await scan.close()
+        self.assertFalse(scan.alive)
+
     async def test_insert_many_invalid(self):
         db = self.db
 
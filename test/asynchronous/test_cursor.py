@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import copy
+import datetime
 import gc
 import itertools
 import random
@@ -23,28 +24,42 @@ import re
 import sys
 import threading
 import time
+from types import SimpleNamespace
 from typing import Any
 
 import pymongo
 
 sys.path[0:0] = [""]
 
-from test.asynchronous import AsyncIntegrationTest, async_client_context, unittest
+from test.asynchronous import (
+    AsyncIntegrationTest,
+    AsyncUnitTest,
+    async_client_context,
+    unittest,
+)
 from test.utils import (
     AllowListEventListener,
     EventListener,
     OvertCommandListener,
     async_rs_or_single_client,
+    async_wait_until,
     ignore_deprecations,
     wait_until,
 )
 
-from bson import decode_all
+from bson import CodecOptions, decode_all, encode
 from bson.code import Code
+from bson.son import SON
 from pymongo import ASCENDING, DESCENDING
-from pymongo.asynchronous.cursor import AsyncCursor, CursorType
+from pymongo.asynchronous.cursor import (
+    AsyncCursor,
+    CursorType,
+    _GetMorePrefetcher,
+    _response_cursor_id,
+)
 from pymongo.asynchronous.helpers import anext
 from pymongo.collation import Collation
+from pymongo.cursor_shared import _BatchSizeTuner, _CursorBuffer, _LazyBatch
 from pymongo.errors import ExecutionTimeout, InvalidOperation, OperationFailure
 from pymongo.operations import _IndexList
 from pymongo.read_concern import ReadConcern
@@ -1396,6 +1411,140 @@ class TestCursor(AsyncIntegrationTest):
             docs = await c.to_list()
         self.assertGreaterEqual(len(docs), 1)
 
+    async def test_prefetch(self):
+        db = self.db
+        await db.test.drop()
+        await db.test.insert_many([{"x": x} for x in range(100)])
+
+        with self.assertRaises(TypeError):
+            db.test.find().prefetch("1")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            db.test.find().prefetch(-1)
+        with self.assertRaises(ValueError):
+            db.test.find(prefetch_batches=-1)
+
+        for cursor in [
+            db.test.find(batch_size=3, prefetch=True),
+            db.test.find(batch_size=3, prefetch_batches=4),
+            db.test.find(batch_size=3).prefetch(2).sort("x"),
+        ]:
+            self.assertEqual(sorted([doc["x"] async for doc in cursor]), list(range(100)))
+            self.assertFalse(cursor.alive)
+
+        cursor = db.test.find(batch_size=3, limit=10, prefetch_batches=4)
+        self.assertEqual(len(await cursor.to_list()), 10)
+
+        cursor = db.test.find(batch_size=3, prefetch_batches=4)
+        await cursor.next()
+        await cursor.close()
+        self.assertFalse(cursor.alive)
+
+        cursor = (await db.test.aggregate([], batchSize=3)).prefetch(4)
+        self.assertEqual(len(await cursor.to_list()), 100)
+
+    @async_client_context.require_sessions
+    async def test_prefetch_explicit_session(self):
+        db = self.db
+        await db.test.drop()
+        await db.test.insert_many([{"x": x} for x in range(10)])
+
+        async with self.client.start_session() as session:
+            cursor = db.test.find(batch_size=3, prefetch_batches=4, session=session)
+            await cursor.next()
+            # getMores that use the application's session are never sent
+            # in the background.
+            self.assertIsNone(cursor._prefetcher)
+            self.assertEqual(len(await cursor.to_list()), 9)
+            self.assertIsNone(cursor._prefetcher)
+
+            cursor = (await db.test.aggregate([], batchSize=3, session=session)).prefetch(4)
+            self.assertEqual(len(await cursor.to_list()), 10)
+            self.assertIsNone(cursor._prefetcher)
+
+    async def test_adaptive_batch_size(self):
+        db = self.db
+        await db.test.drop()
+        await db.test.insert_many([{"x": x} for x in range(100)])
+
+        with self.assertRaises(TypeError):
+            db.test.find().adaptive_batch_size("1")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            db.test.find().adaptive_batch_size(min_batch_size=0)
+        with self.assertRaises(ValueError):
+            db.test.find().adaptive_batch_size(min_batch_size=10, max_batch_size=5)
+        with self.assertRaises(TypeError):
+            db.test.find(adaptive_batch_size=1)  # type: ignore[arg-type]
+
+        for cursor in [
+            db.test.find(batch_size=3, adaptive_batch_size=True),
+            db.test.find(batch_size=3).adaptive_batch_size(max_batch_size=10),
+            db.test.find(batch_size=3, prefetch=True).adaptive_batch_size(),
+        ]:
+            self.assertEqual(sorted([doc["x"] async for doc in cursor]), list(range(100)))
+            self.assertFalse(cursor.alive)
+
+        cursor = db.test.find(batch_size=3, limit=10, adaptive_batch_size=True)
+        self.assertEqual(len(await cursor.to_list()), 10)
+
+        cursor = (await db.test.aggregate([], batchSize=3)).adaptive_batch_size()
+        self.assertEqual(len(await cursor.to_list()), 100)
+
+    async def test_max_buffer_bytes(self):
+        db = self.db
+        await db.test.drop()
+        await db.test.insert_many([{"x": x} for x in range(100)])
+
+        with self.assertRaises(TypeError):
+            db.test.find().max_buffer_bytes("1")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            db.test.find().max_buffer_bytes(-1)
+        with self.assertRaises(ValueError):
+            db.test.find(max_buffer_bytes=-1)
+
+        client = self.client
+        for cursor in [
+            db.test.find(batch_size=10, max_buffer_bytes=1),
+            db.test.find(batch_size=10).max_buffer_bytes(1).sort("x"),
+        ]:
+            self.assertEqual(sorted([doc["x"] async for doc in cursor]), list(range(100)))
+            self.assertEqual(client.cursor_buffer_stats.raw_bytes, 0)
+
+        cursor = db.test.find(batch_size=10, max_buffer_bytes=1)
+        await cursor.next()
+        self.assertGreater(client.cursor_buffer_stats.raw_bytes, 0)
+        self.assertEqual(len(await cursor.to_list()), 99)
+
+        cursor = (await db.test.aggregate([], batchSize=10)).max_buffer_bytes(1)
+        self.assertEqual(len(await cursor.to_list()), 100)
+
+    async def test_max_buffer_bytes_prefetch(self):
+        db = self.db
+        await db.test.drop()
+        await db.test.insert_many([{"x": x} for x in range(100)])
+
+        client = self.client
+        cursor = db.test.find(batch_size=10, prefetch_batches=4, max_buffer_bytes=1)
+        await cursor.next()
+        batch_bytes = client.cursor_buffer_stats.raw_bytes
+        self.assertGreater(batch_bytes, 0)
+
+        async def prefetched():
+            return client.cursor_buffer_stats.raw_bytes == 5 * batch_bytes
+
+        # Prefetched batches count against the budget once they are decoded.
+        await async_wait_until(prefetched, "count the prefetched batches")
+        await cursor.close()
+        self.assertEqual(client.cursor_buffer_stats.raw_bytes, 0)
+
+        cursor = db.test.find(batch_size=10, prefetch_batches=4, max_buffer_bytes=1)
+        self.assertEqual(len(await cursor.to_list()), 100)
+        self.assertEqual(client.cursor_buffer_stats.raw_bytes, 0)
+
+        cursor = (await db.test.aggregate([], batchSize=10)).max_buffer_bytes(1).prefetch(4)
+        await cursor.next()
+        await cursor.close()
+        self.assertEqual(client.cursor_buffer_stats.raw_bytes, 0)
+
     async def test_to_list_empty(self):
         c = self.db.does_not_exist.find()
         docs = await c.to_list()
@@ -1807,5 +1956,171 @@ class TestRawBatchCommandCursor(AsyncIntegrationTest):
             self.assertEqual(cmd.command["$db"], "pymongo_test")
 
 
+class TestGetMorePrefetcher(AsyncUnitTest):
+    def _response(self, cursor_id):
+        return SimpleNamespace(from_command=True, docs=[{"cursor": {"id": cursor_id}}])
+
+    async def test_getmores_run_in_order(self):
+        cursor_ids = [1, 1, 0]
+        started = []
+
+        async def run_getmore():
+            started.append(len(started))
+            return self._response(cursor_ids[len(started) - 1])
+
+        prefetcher = _GetMorePrefetcher(4)
+        prefetcher.fill(run_getmore)
+        responses = [await prefetcher.next() for _ in range(4)]
+        # The getMore after the last batch is skipped.
+        self.assertEqual([_response_cursor_id(r) for r in responses[:3]], cursor_ids)
+        self.assertIsNone(responses[3])
+        self.assertEqual(started, [0, 1, 2])
+        self.assertFalse(prefetcher.pending)
+
+    async def test_stop_discards_responses(self):
+        discarded: list = []
+
+        async def run_getmore():
+            return self._response(1)
+
+        async def done():
+            return all(p.done() for p in pending)
+
+        async def all_discarded():
+            return len(discarded) == 3
+
+        prefetcher = _GetMorePrefetcher(3, discarded.append)
+        prefetcher.fill(run_getmore)  # type: ignore[arg-type]
+        pending = list(prefetcher._pending)
+        await async_wait_until(done, "run the getMores")
+        response = await prefetcher.next()
+        await prefetcher.stop()
+        self.assertEqual(len(discarded), 2)
+        self.assertFalse(any(r is response for r in discarded))
+
+        discarded.clear()
+        prefetcher = _GetMorePrefetcher(3, discarded.append)
+        prefetcher.fill(run_getmore)  # type: ignore[arg-type]
+        pending = list(prefetcher._pending)
+        await async_wait_until(done, "run the getMores")
+        prefetcher.stop_no_wait(lambda: None)
+        await async_wait_until(all_discarded, "discard the responses")
+
+    async def test_waiting_getmores_do_not_hold_a_thread(self):
+        if not _IS_SYNC:
+            self.skipTest("Only synchronous cursors run getMores on threads")
+        release = threading.Event()
+
+        def run_getmore():
+            release.wait()
+            return self._response(1)
+
+        prefetcher = _GetMorePrefetcher(3)
+        prefetcher.fill(run_getmore)  # type: ignore[arg-type]
+        self.assertFalse(prefetcher._pending[1].running())
+        self.assertFalse(prefetcher._pending[2].running())
+        release.set()
+        await prefetcher.stop()
+
+
+class TestBatchSizeTuner(unittest.TestCase):
+    def test_default_until_first_batch(self):
+        tuner = _BatchSizeTuner(1000, 1, 0)
+        self.assertEqual(tuner.batch_size(0), 0)
+        self.assertEqual(tuner.batch_size(7), 7)
+
+    def test_grows_for_fast_consumer(self):
+        tuner = _BatchSizeTuner(1 << 20, 1, 0)
+        sizes = []
+        count = 10
+        for _ in range(5):
+            tuner.received(count, count * 100, datetime.timedelta(milliseconds=10))
+            tuner.delivered(count)
+            tuner.drained()
+            count = tuner.batch_size(10)
+            sizes.append(count)
+        # Doubling each time, never by more.
+        self.assertEqual(sizes, [20, 40, 80, 160, 320])
+
+    def test_shrinks_for_slow_consumer(self):
+        tuner = _BatchSizeTuner(1 << 20, 5, 0)
+        tuner.received(1000, 1000, datetime.timedelta(milliseconds=1))
+        tuner.consume_rate = 10.0
+        self.assertEqual(tuner.batch_size(0), 500)
+        tuner.received(8, 8, datetime.timedelta(milliseconds=1))
+        self.assertEqual(tuner.batch_size(0), 5)
+
+    def test_unmeasurable_samples(self):
+        tuner = _BatchSizeTuner(1 << 20, 1, 0)
+        tuner.received(10, 1000, datetime.timedelta(0))
+        tuner.delivered(10)
+        # A batch consumed before the clock advanced.
+        tuner._delivered_at = time.monotonic() + 60
+        tuner.drained()
+        self.assertIsNone(tuner.consume_rate)
+        tuner.consume_rate = float("inf")
+        self.assertEqual(tuner.batch_size(7), 7)
+
+    def test_bounds(self):
+        tuner = _BatchSizeTuner(1000, 1, 0)
+        tuner.received(100, 10000, datetime.timedelta(milliseconds=10))
+        self.assertEqual(tuner.batch_size(0), 10)
+        tuner = _BatchSizeTuner(1 << 20, 1, 30)
+        tuner.received(100, 100, datetime.timedelta(milliseconds=10))
+        self.assertEqual(tuner.batch_size(0), 30)
+
+    def test_copy(self):
+        tuner = _BatchSizeTuner(1000, 2, 50)
+        tuner.received(10, 100, None)
+        copy = tuner.copy()
+        self.assertIsNone(copy.document_size)
+        self.assertEqual(
+            (copy.max_batch_bytes, copy.min_batch_size, copy.max_batch_size), (1000, 2, 50)
+        )
+
+
+class TestCursorBuffer(unittest.TestCase):
+    def test_lazy_batch(self):
+        docs = [{"i": i, "s": "x" * i} for i in range(5)]
+        batch = _LazyBatch(b"".join(encode(doc) for doc in docs), CodecOptions(SON))
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.popleft(), docs[0])
+        self.assertIsInstance(batch.popleft(), SON)
+        # Iterating does not consume the batch.
+        self.assertEqual(list(batch), docs[2:])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual([batch.popleft() for _ in range(3)], docs[2:])
+        self.assertFalse(batch)
+        with self.assertRaises(IndexError):
+            batch.popleft()
+
+    def test_lazy_batch_clear(self):
+        batch = _LazyBatch(encode({"a": 1}) * 3, CodecOptions())
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(list(batch), [])
+        self.assertEqual(len(_LazyBatch(b"", CodecOptions())), 0)
+
+    def test_budget(self):
+        buffer = _CursorBuffer(100)
+        self.assertTrue(buffer.fits(100, 0))
+        self.assertFalse(buffer.fits(101, 0))
+        self.assertFalse(buffer.fits(50, 40))
+        buffer.acquire(60, False, False)
+        self.assertFalse(buffer.fits(50, 0))
+        buffer.acquire(50, True, True)
+        stats = buffer.stats()
+        self.assertEqual(
+            (stats.decoded_bytes, stats.raw_bytes, stats.raw_batches, stats.max_buffer_bytes),
+            (60, 50, 1, 100),
+        )
+        buffer.release(60, False)
+        buffer.release(50, True)
+        self.assertTrue(buffer.fits(100, 0))
+        self.assertIn("raw_batches=1", repr(buffer.stats()))
+        # No client limit.
+        self.assertTrue(_CursorBuffer(0).fits(1 << 30, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
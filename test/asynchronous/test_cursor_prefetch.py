@@ -0,0 +1,53 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for prefetching getMores on asyncio cursors."""
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+sys.path[0:0] = [""]
+
+from test import unittest
+from test.asynchronous import AsyncUnitTest
+
+from pymongo.asynchronous.cursor import _GetMorePrefetcher
+
+_IS_SYNC = False
+
+
+class TestGetMorePrefetcher(AsyncUnitTest):
+    def _response(self, cursor_id):
+        return SimpleNamespace(from_command=True, docs=[{"cursor": {"id": cursor_id}}])
+
+    async def test_stop_can_be_cancelled(self):
+        release = asyncio.Event()
+
+        async def run_getmore():
+            await release.wait()
+            return self._response(0)
+
+        prefetcher = _GetMorePrefetcher(1)
+        prefetcher.fill(run_getmore)  # type: ignore[arg-type]
+        stopping = asyncio.ensure_future(prefetcher.stop())
+        await asyncio.sleep(0)
+        stopping.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await stopping
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the asyncio-aware lock primitives in pymongo.lock."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+
+sys.path[0:0] = [""]
+
+from test import unittest
+from test.asynchronous import AsyncUnitTest
+
+from pymongo.lock import _ACondition, _ALock, _create_lock
+
+_IS_SYNC = False
+
+
+class TestACondition(AsyncUnitTest):
+    def _make_cond(self) -> _ACondition:
+        return _ACondition(threading.Condition(_ALock(_create_lock())))  # type: ignore[arg-type]
+
+    async def test_wait_timeout(self):
+        cond = self._make_cond()
+        async with cond:
+            start = time.monotonic()
+            self.assertFalse(await cond.wait(0.05))
+            self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertEqual(len([w for w in cond._waiters if not w[1].done()]), 0)
+
+    async def test_wait_does_not_block_event_loop(self):
+        cond = self._make_cond()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        try:
+            async with cond:
+                await cond.wait(0.1)
+        finally:
+            task.cancel()
+        # The old polling implementation blocked the loop for the entire wait.
+        self.assertGreater(ticks, 10)
+
+    async def test_notify_fifo(self):
+        cond = self._make_cond()
+        order = []
+
+        async def waiter(i):
+            async with cond:
+                self.assertTrue(await cond.wait())
+                order.append(i)
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(waiter(i)))
+            # Let each waiter enqueue itself before starting the next.
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        for _ in range(5):
+            async with cond:
+                cond.notify()
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    async def test_notify_all(self):
+        cond = self._make_cond()
+        woken = 0
+
+        async def waiter():
+            nonlocal woken
+            async with cond:
+                if await cond.wait(5):
+                    woken += 1
+
+        tasks = [asyncio.create_task(waiter()) for _ in range(1000)]
+        await asyncio.sleep(0.05)
+        async with cond:
+            cond.notify_all()
+        await asyncio.gather(*tasks)
+        self.assertEqual(woken, 1000)
+
+    async def test_notify_skips_timed_out_waiters(self):
+        cond = self._make_cond()
+        async with cond:
+            self.assertFalse(await cond.wait(0.01))
+        result = []
+
+        async def waiter():
+            async with cond:
+                result.append(await cond.wait(5))
+
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01)
+        async with cond:
+            cond.notify()
+        await task
+        self.assertEqual(result, [True])
+
+    async def test_notify_skips_cancelled_waiters(self):
+        cond = self._make_cond()
+        result = []
+
+        async def waiter():
+            async with cond:
+                result.append(await cond.wait(5))
+
+        first = asyncio.create_task(waiter())
+        second = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        async with cond:
+            cond.notify()
+        await second
+        self.assertEqual(result, [True])
+
+    async def test_wait_for(self):
+        cond = self._make_cond()
+        state = {"ready": False}
+
+        async def setter():
+            await asyncio.sleep(0.01)
+            async with cond:
+                state["ready"] = True
+                cond.notify_all()
+
+        task = asyncio.create_task(setter())
+        async with cond:
+            self.assertTrue(await cond.wait_for(lambda: state["ready"], 5))
+        await task
+        async with cond:
+            self.assertFalse(await cond.wait_for(lambda: False, 0.01))
+
+    async def test_acquire_queues_waiters_in_fifo_order(self):
+        cond = self._make_cond()
+        order = []
+
+        async def acquirer(i):
+            async with cond:
+                order.append(i)
+
+        async with cond:
+            tasks = [asyncio.create_task(acquirer(i)) for i in range(5)]
+            await asyncio.sleep(0.01)
+            # Waiting tasks are parked instead of polling the lock.
+            self.assertEqual(len(cond._lock._waiters), 5)
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, list(range(5)))
+        self.assertEqual(len(cond._lock._waiters), 0)
+
+    async def test_acquire_timeout(self):
+        cond = self._make_cond()
+        async with cond:
+            task = asyncio.create_task(cond.acquire(timeout=0.05))
+            self.assertFalse(await task)
+        self.assertTrue(await cond.acquire(blocking=False))
+        cond.release()
+
+    async def test_acquire_woken_by_release_from_thread(self):
+        lock = _ALock(_create_lock())
+        lock.acquire()
+        timer = threading.Timer(0.05, lock.release)
+        timer.start()
+        self.assertTrue(await lock.a_acquire(timeout=5))
+        lock.release()
+        timer.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
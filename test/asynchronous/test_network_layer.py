@@ -0,0 +1,327 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the asyncio protocol based network layer and socket receive buffer."""
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import ssl
+import struct
+import sys
+import threading
+import time
+
+sys.path[0:0] = [""]
+
+from test import unittest
+from test.asynchronous import AsyncUnitTest
+from test.helpers import CERT_PATH
+
+from bson import encode
+from pymongo.asynchronous.network import receive_message
+from pymongo.asynchronous.pool import _CancellationContext
+from pymongo.errors import ProtocolError, _OperationCancelled
+from pymongo.network_layer import (
+    _MAX_SOCKET_BUFFER_SIZE,
+    PyMongoProtocol,
+    _ReceiveBuffer,
+    async_create_interface,
+    async_read_message,
+)
+from pymongo.socket_checker import SocketChecker
+
+_IS_SYNC = False
+
+
+def _frame(body: bytes, request_id: int = 1, response_to: int = 0, op_code: int = 2013) -> bytes:
+    return struct.pack("<iiii", 16 + len(body), request_id, response_to, op_code) + body
+
+
+def _feed(protocol: PyMongoProtocol, data: bytes, chunk_size: int) -> None:
+    view = memoryview(data)
+    while view:
+        buf = protocol.get_buffer(-1)
+        n = min(len(buf), chunk_size, len(view))
+        buf[:n] = view[:n]
+        protocol.buffer_updated(n)
+        view = view[n:]
+
+
+class TestPyMongoProtocol(AsyncUnitTest):
+    async def test_multiple_messages_in_one_read(self):
+        protocol = PyMongoProtocol()
+        _feed(protocol, _frame(b"a" * 10, 1) + _frame(b"b" * 20, 2), 1 << 20)
+        first = await protocol.read(0)
+        second = await protocol.read(0)
+        assert first is not None and second is not None
+        self.assertEqual(first[1], 1)
+        self.assertEqual(bytes(first[4]), b"a" * 10)
+        self.assertEqual(second[1], 2)
+        self.assertEqual(bytes(second[4]), b"b" * 20)
+        self.assertIsNone(await protocol.read(0))
+
+    async def test_message_split_across_reads(self):
+        protocol = PyMongoProtocol(buffer_size=64)
+        body = bytes(range(50))
+        _feed(protocol, _frame(body) * 5, 7)
+        for _ in range(5):
+            message = await protocol.read(0)
+            assert message is not None
+            self.assertEqual(bytes(message[4]), body)
+
+    async def test_messages_are_views_of_the_buffer(self):
+        protocol = PyMongoProtocol(buffer_size=64)
+        bodies = [bytes([i]) * 10 for i in range(10)]
+        _feed(protocol, b"".join(_frame(body, i) for i, body in enumerate(bodies)), 7)
+        messages = [await protocol.read(0) for _ in bodies]
+        # Held messages survive the buffer filling up, without being copied.
+        for message, body in zip(messages, bodies):
+            assert message is not None
+            self.assertIsInstance(message[4].obj, bytearray)
+            self.assertEqual(bytes(message[4]), body)
+
+    async def test_message_larger_than_buffer(self):
+        protocol = PyMongoProtocol(buffer_size=64)
+        body = b"x" * 1000
+        _feed(protocol, _frame(body, 3) + _frame(b"small", 4), 100)
+        large = await protocol.read(0)
+        small = await protocol.read(0)
+        assert large is not None and small is not None
+        self.assertEqual(large[0], 1016)
+        self.assertEqual(bytes(large[4]), body)
+        self.assertEqual(bytes(small[4]), b"small")
+
+    async def test_invalid_message_length(self):
+        protocol = PyMongoProtocol()
+        protocol.max_message_size = 100
+
+        class FakeTransport:
+            aborted = False
+
+            def abort(self):
+                self.aborted = True
+
+        transport = FakeTransport()
+        protocol.connection_made(transport)  # type: ignore[arg-type]
+        _feed(protocol, _frame(b"x" * 200), 1 << 20)
+        self.assertTrue(transport.aborted)
+        with self.assertRaises(ProtocolError):
+            await protocol.read(0)
+
+    async def test_connection_lost_wakes_reader(self):
+        protocol = PyMongoProtocol()
+        task = asyncio.create_task(protocol.read(5))
+        await asyncio.sleep(0)
+        protocol.connection_lost(None)
+        with self.assertRaises(OSError):
+            await task
+
+
+class TestAsyncNetworkingInterface(AsyncUnitTest):
+    async def asyncSetUp(self):
+        async def handle(reader, writer):
+            try:
+                while True:
+                    header = await reader.readexactly(16)
+                    length, request_id, _, op_code = struct.unpack("<iiii", header)
+                    body = await reader.readexactly(length - 16)
+                    writer.write(_frame(body, request_id + 1, request_id, op_code))
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        self.handle = handle
+        self.server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        self.address = self.server.sockets[0].getsockname()[:2]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _connect(self, ssl_context=None):
+        sock = socket.create_connection(self.address)
+        return await async_create_interface(sock, ssl_context, None, 5.0, 5.0)
+
+    async def test_round_trip(self):
+        interface = await self._connect()
+        try:
+            for i in range(10):
+                body = b"y" * (i * 10000 + 1)
+                await interface.sendall(_frame(body, i))
+                length, _, response_to, _, data = await async_read_message(
+                    interface, None, _CancellationContext()
+                )
+                self.assertEqual(response_to, i)
+                self.assertEqual(length, 16 + len(body))
+                self.assertEqual(bytes(data), body)
+        finally:
+            interface.close()
+
+    async def test_tls_round_trip(self):
+        self.server.close()
+        await self.server.wait_closed()
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(os.path.join(CERT_PATH, "server.pem"))
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0, ssl=server_context)
+        self.address = self.server.sockets[0].getsockname()[:2]
+        client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        client_context.load_verify_locations(os.path.join(CERT_PATH, "ca.pem"))
+        client_context.check_hostname = False
+        interface = await self._connect(client_context)
+        try:
+            self.assertIsNotNone(interface.getpeercert())
+            await interface.sendall(_frame(b"secret", 5))
+            _, _, response_to, _, data = await async_read_message(
+                interface, None, _CancellationContext()
+            )
+            self.assertEqual(response_to, 5)
+            self.assertEqual(bytes(data), b"secret")
+        finally:
+            interface.close()
+
+    async def test_read_timeout(self):
+        interface = await self._connect()
+        try:
+            with self.assertRaises(socket.timeout):
+                await async_read_message(interface, time.monotonic() + 0.05, _CancellationContext())
+        finally:
+            interface.close()
+
+    async def test_read_cancelled(self):
+        interface = await self._connect()
+        try:
+            context = _CancellationContext()
+            context.cancel()
+            with self.assertRaises(_OperationCancelled):
+                await async_read_message(interface, None, context)
+        finally:
+            interface.close()
+
+    async def test_round_trip_from_another_event_loop(self):
+        interface = await self._connect()
+        result = []
+
+        async def other_loop():
+            await interface.sendall(_frame(b"other", 7))
+            message = await async_read_message(interface, None, _CancellationContext())
+            result.append(bytes(message[4]))
+
+        try:
+            thread = threading.Thread(target=asyncio.run, args=(other_loop(),))
+            thread.start()
+            while thread.is_alive():
+                await asyncio.sleep(0.01)
+            self.assertEqual(result, [b"other"])
+        finally:
+            interface.close()
+
+    async def test_closed(self):
+        interface = await self._connect()
+        self.assertFalse(interface.is_closing())
+        interface.close()
+        self.assertTrue(interface.is_closing())
+
+
+def _op_msg_reply(doc: dict, response_to: int) -> bytes:
+    return _frame(struct.pack("<IB", 0, 0) + encode(doc), 1, response_to)
+
+
+class _SocketConnection:
+    """The parts of a connection used to receive messages from a socket."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.conn = sock
+        self.receive_buffer = _ReceiveBuffer()
+        self.socket_checker = SocketChecker()
+        self.cancel_context = _CancellationContext()
+        self.compression_context = None
+
+    def set_conn_timeout(self, timeout):
+        self.conn.settimeout(timeout)
+
+
+class TestReceiveBuffer(AsyncUnitTest):
+    def setUp(self):
+        self.server, client = socket.socketpair()
+        client.settimeout(5)
+        self.conn = _SocketConnection(client)
+
+    def tearDown(self):
+        self.server.close()
+        self.conn.conn.close()
+
+    async def test_messages_in_one_recv(self):
+        self.server.sendall(_op_msg_reply({"n": 1}, 1) + _op_msg_reply({"n": 2}, 2))
+        first = await receive_message(self.conn, 1)  # type: ignore[arg-type]
+        second = await receive_message(self.conn, 2)  # type: ignore[arg-type]
+        self.assertEqual(first.unpack_response()[0]["n"], 1)
+        self.assertEqual(second.unpack_response()[0]["n"], 2)
+        self.assertEqual(self.conn.receive_buffer.buffered, 0)
+
+    async def test_buffer_reused(self):
+        buf = None
+        for i in range(20):
+            self.server.sendall(_op_msg_reply({"i": i}, i))
+            reply = await receive_message(self.conn, i)  # type: ignore[arg-type]
+            self.assertEqual(reply.unpack_response()[0]["i"], i)
+            del reply
+            if buf is None:
+                buf = self.conn.receive_buffer.buf
+            self.assertIs(self.conn.receive_buffer.buf, buf)
+
+    async def test_retained_reply_not_overwritten(self):
+        replies = []
+        for i in range(200):
+            self.server.sendall(_op_msg_reply({"x": "x" * (i * 50)}, i))
+            replies.append(await receive_message(self.conn, i))  # type: ignore[arg-type]
+        for i, reply in enumerate(replies):
+            self.assertEqual(reply.unpack_response()[0]["x"], "x" * (i * 50))
+
+    async def test_large_message(self):
+        doc = {"x": b"y" * (_MAX_SOCKET_BUFFER_SIZE * 2)}
+        thread = threading.Thread(target=self.server.sendall, args=(_op_msg_reply(doc, 1),))
+        thread.start()
+        reply = await receive_message(self.conn, 1)  # type: ignore[arg-type]
+        thread.join()
+        self.assertEqual(reply.unpack_response()[0]["x"], doc["x"])
+        del reply
+        self.server.sendall(_op_msg_reply({"n": 1}, 2))
+        await receive_message(self.conn, 2)  # type: ignore[arg-type]
+        self.assertEqual(len(self.conn.receive_buffer.buf), _MAX_SOCKET_BUFFER_SIZE)
+
+    async def test_message_split_across_recvs(self):
+        data = _op_msg_reply({"x": "z" * 1000}, 1)
+
+        def send_slowly():
+            for i in range(0, len(data), 100):
+                self.server.sendall(data[i : i + 100])
+                time.sleep(0.001)
+
+        thread = threading.Thread(target=send_slowly)
+        thread.start()
+        reply = await receive_message(self.conn, 1)  # type: ignore[arg-type]
+        thread.join()
+        self.assertEqual(reply.unpack_response()[0]["x"], "z" * 1000)
+
+    async def test_connection_closed(self):
+        self.server.sendall(_op_msg_reply({"n": 1}, 1)[:20])
+        self.server.close()
+        with self.assertRaises(OSError):
+            await receive_message(self.conn, 1)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
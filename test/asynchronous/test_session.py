@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import copy
 import sys
+import threading
 import time
 from io import BytesIO
 from typing import Any, Callable, List, Set, Tuple
@@ -45,6 +46,7 @@ from test.utils import (
 from bson import DBRef
 from gridfs.asynchronous.grid_file import AsyncGridFS, AsyncGridFSBucket
 from pymongo import ASCENDING, AsyncMongoClient, monitoring
+from pymongo.asynchronous.client_session import _ServerSessionPool
 from pymongo.asynchronous.command_cursor import AsyncCommandCursor
 from pymongo.asynchronous.cursor import AsyncCursor
 from pymongo.asynchronous.helpers import anext
@@ -831,6 +833,82 @@ class TestSession(AsyncIntegrationTest):
             self.assertRaises(TypeError, lambda: copy.copy(s))
 
 
+class TestServerSessionPool(AsyncUnitTest):
+    def _run_in_thread(self, target):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    def test_threads_use_own_shard(self):
+        pool = _ServerSessionPool(num_shards=2)
+        a = pool.get_server_session(30)
+        pool.return_server_session(a)
+        sessions = []
+
+        def check_out_two():
+            sessions.append(pool.get_server_session(30))
+            sessions.append(pool.get_server_session(30))
+            for s in sessions:
+                pool.return_server_session(s)
+
+        # The other thread takes the session from this thread's shard once
+        # its own shard is empty.
+        self._run_in_thread(check_out_two)
+        self.assertIs(sessions[0], a)
+        self.assertIsNot(sessions[1], a)
+        self.assertEqual(len(pool), 2)
+        # Sessions returned by the other thread stay in its shard.
+        self.assertEqual([len(shard) for shard in pool._shards], [0, 2])
+        self.assertEqual(len(list(pool)), 2)
+        self.assertEqual(len(pool.pop_all()), 2)
+        self.assertEqual(len(pool), 0)
+
+    def test_concurrent_checkouts(self):
+        pool = _ServerSessionPool(num_shards=4)
+        lock = threading.Lock()
+        in_use: Set[int] = set()
+        errors = []
+
+        def check_out():
+            for _ in range(1000):
+                s = pool.get_server_session(30)
+                with lock:
+                    if id(s) in in_use:
+                        errors.append(s)
+                    in_use.add(id(s))
+                with lock:
+                    in_use.discard(id(s))
+                pool.return_server_session(s)
+
+        threads = [threading.Thread(target=check_out) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(pool), 16)
+
+    def test_clear_stale(self):
+        pool = _ServerSessionPool(num_shards=1)
+        stale = pool.get_server_session(30)
+        fresh = pool.get_server_session(30)
+        pool.return_server_session(stale)
+        pool.return_server_session(fresh)
+        stale.last_use -= 3600
+        pool.clear_stale(30)
+        self.assertEqual(list(pool), [fresh])
+        # Stale sessions are also skipped at checkout.
+        fresh.last_use -= 3600
+        self.assertIsNot(pool.get_server_session(30), fresh)
+
+    def test_reset(self):
+        pool = _ServerSessionPool()
+        s = pool.get_server_session(30)
+        pool.reset()
+        pool.return_server_session(s)
+        self.assertEqual(len(pool), 0)
+
+
 class TestCausalConsistency(AsyncUnitTest):
     listener: SessionTestListener
     client: AsyncMongoClient
@@ -0,0 +1,179 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test connection setup timings and minPoolSize refills against a mock server."""
+from __future__ import annotations
+
+import time
+import unittest
+import warnings
+from test.utils import CMAPListener, EventListener, wait_until
+
+import pytest
+
+try:
+    from mockupdb import MockupDB, OpMsg
+
+    _HAVE_MOCKUPDB = True
+except ImportError:
+    _HAVE_MOCKUPDB = False
+
+
+from pymongo import MongoClient
+from pymongo.monitoring import (
+    ConnectionCreatedEvent,
+    ConnectionReadyEvent,
+    PoolWarmupProgressEvent,
+)
+from pymongo.read_preferences import ReadPreference
+
+pytestmark = pytest.mark.mockupdb
+
+
+class _SlowCreateListener(CMAPListener):
+    """Delays each connection after it is created."""
+
+    def connection_created(self, event):
+        super().connection_created(event)
+        time.sleep(0.2)
+
+
+class _WarmupListener(CMAPListener):
+    def __init__(self):
+        super().__init__()
+        self.times = []
+
+    def pool_warmup_progress(self, event):
+        self.times.append(time.monotonic())
+        self.add_event(event)
+
+
+class TestConnectionSetup(unittest.TestCase):
+    def _server(self, **kwargs):
+        server = MockupDB(auto_ismaster={"maxWireVersion": 20}, **kwargs)
+        server.autoresponds("ping")
+        with warnings.catch_warnings():
+            # MockupDB uses the deprecated ssl.wrap_socket().
+            warnings.simplefilter("ignore", DeprecationWarning)
+            server.run()
+        self.addCleanup(server.stop)
+        return server
+
+    def _durations(self, server, **kwargs):
+        listener = CMAPListener()
+        client = MongoClient(server.uri, event_listeners=[listener], **kwargs)
+        self.addCleanup(client.close)
+        client.admin.command("ping")
+        (event,) = listener.events_by_type(ConnectionReadyEvent)
+        for duration in event.handshake_durations.values():
+            self.assertGreaterEqual(duration, 0)
+        return event.handshake_durations
+
+    def test_handshake_durations(self):
+        durations = self._durations(self._server())
+        self.assertEqual(set(durations), {"dns", "tcp", "hello"})
+
+    def test_metrics(self):
+        server = self._server()
+        client = MongoClient(server.uri)
+        self.addCleanup(client.close)
+        for _ in range(3):
+            client.admin.command("ping")
+        metrics = client.metrics()
+        address = (server.host, server.port)
+        self.assertEqual(metrics.commands[("ping", address, "succeeded")].count, 3)
+        self.assertEqual(metrics.command("ping").count, 3)
+        self.assertEqual(metrics.checkout[address].count, 3)
+        self.assertEqual(metrics.connection_setup[address].count, 1)
+
+    def test_slow_operation_timings(self):
+        server = self._server()
+        server.autoresponds(OpMsg({"find": "coll"}), cursor={"id": 0, "firstBatch": [{"_id": 1}]})
+        listener = EventListener()
+        client = MongoClient(server.uri, event_listeners=[listener], slowOperationThresholdMS=0)
+        self.addCleanup(client.close)
+        client.admin.command("ping", read_preference=ReadPreference.PRIMARY_PREFERRED)
+        self.assertEqual(list(client.db.coll.find()), [{"_id": 1}])
+        for event in listener.succeeded_events:
+            timings = event.timings
+            self.assertIsNotNone(timings, event.command_name)
+            for name, seconds in timings.as_dict().items():
+                self.assertGreaterEqual(seconds, 0, name)
+            self.assertGreater(timings.selection, 0)
+            self.assertGreater(timings.checkout, 0)
+            self.assertGreater(timings.receive, 0)
+            # Selection and checkout happen before the command starts.
+            self.assertLessEqual(
+                timings.total - timings.selection - timings.checkout,
+                event.duration_micros / 1e6,
+            )
+
+    def test_slow_operation_threshold(self):
+        server = self._server()
+        listener = EventListener()
+        client = MongoClient(server.uri, event_listeners=[listener], slowOperationThresholdMS=10000)
+        self.addCleanup(client.close)
+        client.admin.command("ping")
+        (event,) = listener.succeeded_events
+        self.assertIsNone(event.timings)
+
+    def test_handshake_durations_with_tls(self):
+        durations = self._durations(self._server(ssl=True), tlsAllowInvalidCertificates=True)
+        self.assertEqual(set(durations), {"dns", "tcp", "tls", "hello"})
+
+    def test_min_pool_size_opens_connections_in_parallel(self):
+        server = self._server()
+        listener = _SlowCreateListener()
+        client = MongoClient(server.uri, event_listeners=[listener], minPoolSize=4, maxConnecting=2)
+        self.addCleanup(client.close)
+        wait_until(
+            lambda: len(listener.events_by_type(ConnectionReadyEvent)) == 4,
+            "open minPoolSize connections",
+        )
+        # Connections are created in pairs: a second connection is created
+        # before the first one is ready.
+        names = [
+            type(e).__name__
+            for e in listener.events
+            if isinstance(e, (ConnectionCreatedEvent, ConnectionReadyEvent))
+        ]
+        self.assertEqual(names[:2], ["ConnectionCreatedEvent"] * 2)
+        self.assertEqual(len(listener.events_by_type(ConnectionCreatedEvent)), 4)
+
+    def test_min_pool_warmup_rate(self):
+        server = self._server()
+        listener = _WarmupListener()
+        client = MongoClient(
+            server.uri,
+            event_listeners=[listener],
+            minPoolSize=4,
+            maxConnecting=4,
+            minPoolWarmupRate=2,
+        )
+        self.addCleanup(client.close)
+        wait_until(
+            lambda: len(listener.events_by_type(PoolWarmupProgressEvent)) == 4,
+            "warm up the pool",
+        )
+        events = listener.events_by_type(PoolWarmupProgressEvent)
+        self.assertEqual([e.connections for e in events], [1, 2, 3, 4])
+        self.assertEqual({e.target for e in events}, {4})
+        self.assertEqual([e.complete for e in events], [False, False, False, True])
+        # Two connections are opened at once, the other two a second later.
+        self.assertGreater(listener.times[2] - listener.times[1], 0.5)
+        self.assertLess(listener.times[1] - listener.times[0], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,8 +15,10 @@
 """Test PyMongo cursor does not set exhaustAllowed automatically (PYTHON-4007)."""
 from __future__ import annotations
 
+import gc
 import unittest
 from test import PyMongoTestCase
+from test.utils import EventListener, wait_until
 
 import pytest
 
@@ -69,6 +71,208 @@ class TestCursor(unittest.TestCase):
                 request.replies({"cursor": {"id": cursor_id, "nextBatch": [{}]}})
 
 
+class TestCursorPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.client = MongoClient(self.server.uri)
+        self.addCleanup(self.client.close)
+
+    def test_prefetch_batches(self):
+        cursor = self.client.db.coll.find(batch_size=2, prefetch_batches=2)
+        with going(next, cursor) as doc:
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{"i": 0}, {"i": 1}]}}
+            )
+        self.assertEqual(doc(), {"i": 0})
+        # Both getMores are sent before the first batch has been consumed.
+        self.server.receives(OpMsg({"getMore": 123, "batchSize": 2})).reply(
+            {"cursor": {"id": 123, "nextBatch": [{"i": 2}, {"i": 3}]}}
+        )
+        self.server.receives(OpMsg({"getMore": 123, "batchSize": 2})).reply(
+            {"cursor": {"id": 0, "nextBatch": [{"i": 4}]}}
+        )
+        self.assertEqual([d["i"] for d in cursor], [1, 2, 3, 4])
+        self.assertFalse(cursor.alive)
+
+    def test_prefetch_close(self):
+        cursor = self.client.db.coll.find(prefetch=True)
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{}, {}]}}
+            )
+        self.server.receives(OpMsg({"getMore": 123})).reply(
+            {"cursor": {"id": 123, "nextBatch": [{}]}}
+        )
+        with going(cursor.close):
+            self.server.receives(OpMsg({"killCursors": "coll", "cursors": [123]})).ok()
+
+    def test_prefetch_in_flight_when_abandoned(self):
+        cursor = self.client.db.coll.find(prefetch=True)
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{}, {}]}}
+            )
+        getmore = self.server.receives(OpMsg({"getMore": 123}))
+        cursor._die_no_lock()
+        # The cursor is killed only once the getMore in flight is done.
+        with self.assertRaises(AssertionError):
+            self.server.receives(timeout=0.5)
+        getmore.reply({"cursor": {"id": 123, "nextBatch": [{}]}})
+        self.server.receives(OpMsg({"killCursors": "coll", "cursors": [123]})).ok()
+
+    def test_prefetch_error(self):
+        cursor = self.client.db.coll.find(prefetch=True)
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{}]}}
+            )
+        self.server.receives(OpMsg({"getMore": 123})).command_err(
+            code=43, errmsg="cursor not found"
+        )
+        # The error is raised when the application reaches the batch.
+        with self.assertRaises(OperationFailure):
+            next(cursor)
+
+
+class TestCursorAdaptiveBatchSize(unittest.TestCase):
+    def setUp(self):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.client = MongoClient(self.server.uri)
+        self.addCleanup(self.client.close)
+
+    def test_batch_size_grows(self):
+        cursor = self.client.db.coll.find(batch_size=2).adaptive_batch_size(max_batch_size=6)
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll", "batchSize": 2})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{}, {}]}}
+            )
+        next(cursor)
+        # The application consumes each batch far faster than a round trip.
+        for batch_size in (4, 6):
+            with going(next, cursor):
+                self.server.receives(OpMsg({"getMore": 123, "batchSize": batch_size})).reply(
+                    {"cursor": {"id": 123, "nextBatch": [{}] * batch_size}}
+                )
+            for _ in range(batch_size - 1):
+                next(cursor)
+        with going(next, cursor):
+            self.server.receives(OpMsg({"getMore": 123, "batchSize": 6})).reply(
+                {"cursor": {"id": 0, "nextBatch": [{}]}}
+            )
+        self.assertFalse(cursor.alive)
+
+
+class TestCursorBufferBudget(unittest.TestCase):
+    def setUp(self):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.client = MongoClient(self.server.uri, maxCursorBufferBytes=200)
+        self.addCleanup(self.client.close)
+
+    def test_large_batch_decoded_lazily(self):
+        cursor = self.client.db.coll.find()
+        with going(next, cursor) as doc:
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 123, "firstBatch": [{"i": 0}]}}
+            )
+        self.assertEqual(doc(), {"i": 0})
+        batch = [{"i": i, "s": "x" * 20} for i in range(1, 11)]
+        with going(next, cursor) as doc:
+            self.server.receives(OpMsg({"getMore": 123})).reply(
+                {"cursor": {"id": 0, "nextBatch": batch}}
+            )
+        self.assertEqual(doc(), batch[0])
+        stats = self.client.cursor_buffer_stats
+        self.assertEqual(stats.decoded_bytes, 0)
+        self.assertGreater(stats.raw_bytes, 200)
+        self.assertEqual(stats.raw_batches, 1)
+        self.assertEqual(stats.max_buffer_bytes, 200)
+        self.assertEqual(list(cursor), batch[1:])
+        self.assertEqual(self.client.cursor_buffer_stats.raw_bytes, 0)
+
+    def test_published_reply_is_decoded(self):
+        listener = EventListener()
+        client = MongoClient(self.server.uri, event_listeners=[listener], maxCursorBufferBytes=10)
+        self.addCleanup(client.close)
+        batch = [{"a": i} for i in range(5)]
+        cursor = client.db.coll.find()
+        with going(list, cursor) as docs:
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 0, "firstBatch": batch}}
+            )
+        self.assertEqual(docs(), batch)
+        self.assertEqual(client.cursor_buffer_stats.raw_batches, 1)
+        (event,) = listener.succeeded_events
+        # The listener's copy is not consumed by the cursor.
+        self.assertEqual(event.reply["cursor"]["firstBatch"], batch)
+
+    def test_small_batch_decoded(self):
+        cursor = self.client.db.coll.find()
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 0, "firstBatch": [{"i": 0}, {"i": 1}]}}
+            )
+        self.assertGreater(self.client.cursor_buffer_stats.decoded_bytes, 0)
+        self.assertEqual(list(cursor), [{"i": 1}])
+        self.assertEqual(self.client.cursor_buffer_stats.decoded_bytes, 0)
+        self.assertEqual(self.client.cursor_buffer_stats.raw_batches, 0)
+
+
+class TestCursorCleanup(unittest.TestCase):
+    def _start(self, **hello):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20, **hello})
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.client = MongoClient(self.server.uri)
+        self.addCleanup(self.client.close)
+
+    def test_garbage_collected_cursors_killed_together(self):
+        self._start()
+        cursors = []
+        for cursor_id in (101, 102, 103):
+            cursor = self.client.db.coll.find()
+            with going(next, cursor):
+                self.server.receives(OpMsg({"find": "coll"})).reply(
+                    {"cursor": {"id": cursor_id, "firstBatch": [{}, {}]}}
+                )
+            cursors.append(cursor)
+        del cursor
+        del cursors
+        gc.collect()
+        # Killed well before the periodic tasks run.
+        request = self.server.receives(OpMsg({"killCursors": "coll"}), timeout=0.5)
+        self.assertEqual(sorted(request.doc["cursors"]), [101, 102, 103])
+        request.ok(cursorsKilled=request.doc["cursors"])
+        wait_until(lambda: self.client.cleanup_stats.cursors_killed == 3, "kill cursors")
+        stats = self.client.cleanup_stats
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertEqual(stats.max_queue_depth, 3)
+        self.assertEqual(stats.kill_cursors_commands, 1)
+        self.assertGreater(stats.max_kill_cursors_latency, 0)
+        assert stats.average_kill_cursors_latency is not None
+        self.assertLessEqual(stats.average_kill_cursors_latency, stats.max_kill_cursors_latency)
+
+    def test_end_sessions_on_close(self):
+        self._start(logicalSessionTimeoutMinutes=30)
+        with going(self.client.db.coll.find_one):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                {"cursor": {"id": 0, "firstBatch": []}}
+            )
+        with going(self.client.close):
+            request = self.server.receives()
+            self.assertEqual(request.command_name, "endSessions")
+            self.assertEqual(len(request.doc["endSessions"]), 1)
+            request.ok()
+        stats = self.client.cleanup_stats
+        self.assertEqual(stats.sessions_ended, 1)
+        self.assertEqual(stats.end_sessions_commands, 1)
+
+
 class TestRetryableErrorCodeCatch(PyMongoTestCase):
     def _test_fail_on_operation_failure_with_code(self, code):
         """Test reads on error codes that should not be retried"""
@@ -0,0 +1,170 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test delivering events to listeners in the background."""
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from test.utils import CMAPListener, EventListener, wait_until
+
+import pytest
+
+try:
+    from mockupdb import MockupDB
+
+    _HAVE_MOCKUPDB = True
+except ImportError:
+    _HAVE_MOCKUPDB = False
+
+
+from pymongo import MongoClient
+from pymongo.asynchronous.periodic_executor import WakeableExecutor as AsyncWakeableExecutor
+from pymongo.monitoring import PoolClosedEvent, _EventQueue
+from pymongo.synchronous.periodic_executor import WakeableExecutor
+
+pytestmark = pytest.mark.mockupdb
+
+
+class _SlowListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def started(self, event):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.2)
+        super().started(event)
+
+
+class TestEventQueue(unittest.TestCase):
+    def test_full_queue_drops_oldest(self):
+        queue = _EventQueue(2)
+        listener = EventListener()
+        for i in range(5):
+            queue.put([listener], "started", i)
+        self.assertEqual(queue.deliver(batch_size=1), 2)
+        self.assertEqual(listener.started_events, [3, 4])
+        stats = queue.stats()
+        self.assertEqual(
+            (stats.queued, stats.delivered, stats.dropped, stats.batches, stats.pending),
+            (5, 2, 3, 2, 0),
+        )
+
+    def test_wake(self):
+        queue = _EventQueue(10)
+        wakes = []
+        queue.wake = lambda: wakes.append(1)
+        queue.put([], "started", 1)
+        queue.put([], "started", 2)
+        self.assertEqual(len(wakes), 1)
+        queue.deliver()
+        queue.put([], "started", 3)
+        self.assertEqual(len(wakes), 2)
+
+    def test_deliver_one_thread_at_a_time(self):
+        queue = _EventQueue(10)
+        listener = _SlowListener()
+        queue.put([listener], "started", 1)
+        thread = threading.Thread(target=queue.deliver)
+        thread.start()
+        wait_until(lambda: listener.threads, "start delivering")
+        queue.put([listener], "started", 2)
+        # Waits for the other thread, which delivers both events in order.
+        queue.deliver()
+        self.assertEqual(listener.started_events, [1, 2])
+        self.assertEqual(listener.threads, {thread.ident})
+        thread.join()
+
+    def test_wakeable_executor(self):
+        calls = []
+
+        def target():
+            calls.append(time.monotonic())
+            return True
+
+        executor = WakeableExecutor(interval=30, min_interval=0.01, target=target, name="test")
+        executor.open()
+        self.addCleanup(executor.join, 1)
+        self.addCleanup(executor.close)
+        wait_until(lambda: len(calls) == 1, "run the target")
+        executor.wake()
+        wait_until(lambda: len(calls) == 2, "run the target after wake", timeout=5)
+        # Closing wakes the executor too.
+        start = time.monotonic()
+        executor.close()
+        executor.join(5)
+        self.assertLess(time.monotonic() - start, 4)
+
+    def test_async_wakeable_executor(self):
+        calls = []
+
+        async def target():
+            calls.append(time.monotonic())
+            return True
+
+        executor = AsyncWakeableExecutor(interval=30, min_interval=0.01, target=target, name="test")
+        executor.open()
+        self.addCleanup(executor.join, 1)
+        self.addCleanup(executor.close)
+        wait_until(lambda: len(calls) == 1, "run the target")
+        time.sleep(0.1)
+        # Waiting for a wakeup does not use a thread of the loop's executor.
+        self.assertFalse([t for t in threading.enumerate() if t.name.startswith("asyncio_")])
+        executor.wake()
+        wait_until(lambda: len(calls) == 2, "run the target after wake", timeout=5)
+        start = time.monotonic()
+        executor.close()
+        executor.join(5)
+        self.assertLess(time.monotonic() - start, 4)
+
+    def test_client(self):
+        server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        server.autoresponds("ping")
+        server.run()
+        self.addCleanup(server.stop)
+        listener = _SlowListener()
+        cmap_listener = CMAPListener()
+        client = MongoClient(
+            server.uri, event_listeners=[listener, cmap_listener], eventQueueSize=100
+        )
+        self.addCleanup(client.close)
+        start = time.monotonic()
+        for _ in range(3):
+            client.admin.command("ping")
+        # Operations do not wait for the slow listener.
+        self.assertLess(time.monotonic() - start, 0.4)
+        wait_until(lambda: len(listener.started_events) == 3, "deliver events")
+        self.assertNotIn(threading.get_ident(), listener.threads)
+        stats = client.event_queue_stats
+        assert stats is not None
+        self.assertEqual(stats.dropped, 0)
+        self.assertEqual(stats.max_size, 100)
+        # Events published while closing are delivered by close().
+        client.close()
+        self.assertEqual(len(cmap_listener.events_by_type(PoolClosedEvent)), 1)
+        stats = client.event_queue_stats
+        assert stats is not None
+        self.assertEqual(stats.pending, 0)
+        self.assertEqual(stats.queued, stats.delivered)
+
+    def test_synchronous_by_default(self):
+        client = MongoClient(connect=False)
+        self.addCleanup(client.close)
+        self.assertIsNone(client.event_queue_stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test Collection.parallel_scan against a mock server."""
+from __future__ import annotations
+
+import gc
+import unittest
+from test.utils import wait_until
+
+import pytest
+
+try:
+    from mockupdb import MockupDB
+
+    _HAVE_MOCKUPDB = True
+except ImportError:
+    _HAVE_MOCKUPDB = False
+
+
+from pymongo import MongoClient
+from pymongo.errors import OperationFailure
+
+pytestmark = pytest.mark.mockupdb
+
+_IDS = list(range(100))
+
+
+def _bracket(value):
+    if isinstance(value, (int, float)):
+        return "number"
+    return "string" if isinstance(value, str) else type(value).__name__
+
+
+def _in_bounds(_id, bounds):
+    if "$not" in bounds:
+        return _bracket(_id) != bounds["$not"]["$type"]
+    for op, bound in bounds.items():
+        # Range queries only match values of the bound's BSON type.
+        if _bracket(_id) != _bracket(bound):
+            return False
+        if (op == "$gte" and _id < bound) or (op == "$lt" and _id >= bound):
+            return False
+    return True
+
+
+def _matches(_id, spec):
+    if "$and" in spec:
+        return all(_matches(_id, part) for part in spec["$and"])
+    if "$or" in spec:
+        return any(_matches(_id, part) for part in spec["$or"])
+    return _in_bounds(_id, spec.get("_id", {}))
+
+
+class TestParallelScan(unittest.TestCase):
+    def setUp(self):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        self.server.autoresponds(self._respond)
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.client = MongoClient(self.server.uri)
+        self.addCleanup(self.client.close)
+        self.filters = []
+        self.ids = _IDS
+        # The sampled _id values.
+        self.sample = _IDS[::10]
+
+    def _respond(self, request):
+        if request.command_name == "aggregate":
+            docs = [{"_id": i} for i in self.sample]
+            return request.reply(cursor={"id": 0, "ns": "db.coll", "firstBatch": docs})
+        if request.command_name != "find":
+            return False
+        spec = request["filter"]
+        self.filters.append(spec)
+        if any(part.get("fail") for part in spec.get("$and", [spec])):
+            return request.command_err(code=2, errmsg="bad filter")
+        docs = [{"_id": i} for i in self.ids if _matches(i, spec)]
+        return request.reply(cursor={"id": 0, "ns": "db.coll", "firstBatch": docs})
+
+    def test_parallel_scan(self):
+        with self.client.db.coll.parallel_scan(4) as scan:
+            docs = list(scan)
+        self.assertEqual(sorted(doc["_id"] for doc in docs), _IDS)
+        self.assertEqual(
+            sorted(self.filters, key=str),
+            sorted(
+                [
+                    {"$or": [{"_id": {"$lt": 20}}, {"_id": {"$not": {"$type": "number"}}}]},
+                    {"_id": {"$gte": 20, "$lt": 50}},
+                    {"_id": {"$gte": 50, "$lt": 70}},
+                    {"_id": {"$gte": 70}},
+                ],
+                key=str,
+            ),
+        )
+        self.assertEqual([p.documents for p in scan.partitions], [20, 30, 20, 30])
+        self.assertTrue(all(p.done for p in scan.partitions))
+        self.assertTrue(all(p.documents_per_second for p in scan.partitions))
+
+    def test_other_id_types(self):
+        self.ids = [*_IDS, "a", "b"]
+        with self.client.db.coll.parallel_scan(4) as scan:
+            docs = list(scan)
+        self.assertEqual(len(docs), 102)
+        self.assertEqual(scan.partitions[0].documents, 22)
+
+    def test_mixed_sample(self):
+        self.sample = [0, 50, "a", "b"]
+        scan = self.client.db.coll.parallel_scan(3, {"x": 1})
+        self.assertEqual(len(scan.to_list()), 100)
+        self.assertEqual(self.filters, [{"x": 1}])
+
+    def test_empty_collection(self):
+        self.ids = self.sample = []
+        scan = self.client.db.coll.parallel_scan(4, {"x": 1})
+        self.assertEqual(scan.to_list(), [])
+        self.assertEqual(self.filters, [{"x": 1}])
+
+    def test_single_partition(self):
+        scan = self.client.db.coll.parallel_scan(1, {"x": 1})
+        self.assertEqual(len(scan.to_list()), 100)
+        self.assertEqual(self.filters, [{"x": 1}])
+
+    def test_raw_batches(self):
+        with self.client.db.coll.parallel_scan(2, raw_batches=True) as scan:
+            batches = list(scan)
+        self.assertEqual(len(batches), 2)
+        self.assertTrue(all(isinstance(batch, bytes) for batch in batches))
+        self.assertEqual(sum(p.documents for p in scan.partitions), 100)
+
+    def test_partition_error(self):
+        scan = self.client.db.coll.parallel_scan(2, {"fail": True})
+        with self.assertRaises(OperationFailure):
+            list(scan)
+        self.assertFalse(scan.alive)
+
+    def test_abandoned_scan(self):
+        scan = self.client.db.coll.parallel_scan(4, max_queued_batches=1)
+        next(scan)
+        workers = scan._workers
+        # The partitions stop instead of waiting for room in the queue forever.
+        del scan
+        gc.collect()
+        wait_until(lambda: not any(t.is_alive() for t in workers), "stop the partitions")
+
+    def test_invalid_arguments(self):
+        coll = self.client.db.coll
+        with self.assertRaises(TypeError):
+            coll.parallel_scan("2")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            coll.parallel_scan(0)
+        with self.assertRaises(ValueError):
+            coll.parallel_scan(2, split_method="splitVector")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test TLS session resumption by new pooled connections against a mock server."""
+from __future__ import annotations
+
+import unittest
+import warnings
+from test.utils import CMAPListener
+
+import pytest
+
+try:
+    from mockupdb import MockupDB
+
+    _HAVE_MOCKUPDB = True
+except ImportError:
+    _HAVE_MOCKUPDB = False
+
+
+from pymongo import MongoClient
+from pymongo.monitoring import ConnectionReadyEvent
+
+pytestmark = pytest.mark.mockupdb
+
+
+class TestTLSSessionResumption(unittest.TestCase):
+    def _client(self, server, **kwargs):
+        listener = CMAPListener()
+        client = MongoClient(server.uri, event_listeners=[listener], **kwargs)
+        self.addCleanup(client.close)
+        client.admin.command("ping")
+        return client, listener
+
+    def _reconnect(self, client):
+        pool = next(iter(client._topology._servers.values())).pool
+        pool.reset_without_pause()
+        client.admin.command("ping")
+        return pool
+
+    def _resumed(self, listener):
+        return [e.tls_session_resumed for e in listener.events_by_type(ConnectionReadyEvent)]
+
+    def test_new_connections_resume_session(self):
+        server = MockupDB(ssl=True, auto_ismaster={"maxWireVersion": 20})
+        server.autoresponds("ping")
+        with warnings.catch_warnings():
+            # MockupDB uses the deprecated ssl.wrap_socket().
+            warnings.simplefilter("ignore", DeprecationWarning)
+            server.run()
+        self.addCleanup(server.stop)
+        client, listener = self._client(server, tlsAllowInvalidCertificates=True)
+        self._reconnect(client)
+        self.assertEqual(self._resumed(listener), [False, True])
+        stats = client.metrics().tls_handshakes[(server.host, server.port)]
+        self.assertEqual(stats.handshakes, 2)
+        self.assertEqual(stats.resumed, 1)
+
+    def test_without_tls(self):
+        server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        server.autoresponds("ping")
+        server.run()
+        self.addCleanup(server.stop)
+        client, listener = self._client(server)
+        self._reconnect(client)
+        self.assertEqual(self._resumed(listener), [None, None])
+        self.assertEqual(client.metrics().tls_handshakes, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test tracing spans against a mock server."""
+from __future__ import annotations
+
+import contextlib
+import threading
+import unittest
+
+import pytest
+
+try:
+    from mockupdb import MockupDB, OpMsg, going
+
+    _HAVE_MOCKUPDB = True
+except ImportError:
+    _HAVE_MOCKUPDB = False
+
+
+from pymongo import MongoClient
+
+pytestmark = pytest.mark.mockupdb
+
+
+class _Span:
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.attributes = {}
+        self.events = []
+        self.exception = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_event(self, name, attributes):
+        self.events.append((name, dict(attributes)))
+
+
+class _Tracer:
+    """Records spans like an OpenTelemetry Tracer, without the dependency."""
+
+    def __init__(self):
+        self.spans = []
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name):
+        parent = getattr(self._local, "span", None)
+        span = _Span(name, parent)
+        self.spans.append(span)
+        self._local.span = span
+        try:
+            yield span
+        except BaseException as exc:
+            span.exception = exc
+            raise
+        finally:
+            self._local.span = parent
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.server = MockupDB(auto_ismaster={"maxWireVersion": 20})
+        self.server.run()
+        self.addCleanup(self.server.stop)
+        self.tracer = _Tracer()
+        self.client = MongoClient(self.server.uri, tracer=self.tracer)
+        self.addCleanup(self.client.close)
+        self.address = (self.server.host, self.server.port)
+
+    def test_spans(self):
+        cursor = self.client.db.coll.find()
+        with going(next, cursor):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                cursor={"id": 0, "firstBatch": [{"_id": 1}, {"_id": 2}]}
+            )
+        operation, selection, checkout, command = self.tracer.spans
+        self.assertEqual(operation.name, "find")
+        self.assertIsNone(operation.parent)
+        self.assertEqual(operation.attributes["db.operation.name"], "find")
+        self.assertEqual(operation.events, [])
+        self.assertEqual(
+            [(s.name, s.parent) for s in (selection, checkout, command)],
+            [
+                ("server selection", operation),
+                ("connection checkout", operation),
+                ("find", operation),
+            ],
+        )
+        for span in selection, checkout, command:
+            self.assertEqual(
+                (span.attributes["server.address"], span.attributes["server.port"]), self.address
+            )
+        self.assertIn("pymongo.connection_id", checkout.attributes)
+        self.assertEqual(command.attributes["db.system"], "mongodb")
+        self.assertEqual(command.attributes["db.namespace"], "db")
+        self.assertEqual(command.attributes["db.response.returned_rows"], 2)
+
+    def test_returned_rows_of_lazy_batch(self):
+        tracer = _Tracer()
+        client = MongoClient(self.server.uri, tracer=tracer, maxCursorBufferBytes=10)
+        self.addCleanup(client.close)
+        with going(list, client.db.coll.find()):
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                cursor={"id": 0, "firstBatch": [{"_id": i} for i in range(5)]}
+            )
+        command = tracer.spans[-1]
+        self.assertEqual(command.attributes["db.response.returned_rows"], 5)
+
+    def test_retry_event(self):
+        with going(self.client.db.coll.find_one):
+            self.server.receives(OpMsg({"find": "coll"})).command_err(
+                code=89, errmsg="network timeout"
+            )
+            self.server.receives(OpMsg({"find": "coll"})).reply(
+                cursor={"id": 0, "firstBatch": [{"_id": 1}]}
+            )
+        operation = self.tracer.spans[0]
+        self.assertEqual(
+            operation.events,
+            [("retry", {"pymongo.retry_attempt": 1, "exception.type": "OperationFailure"})],
+        )
+        commands = [s for s in self.tracer.spans if s.name == "find" and s is not operation]
+        self.assertEqual(len(commands), 2)
+        self.assertIsNotNone(commands[0].exception)
+        self.assertIsNone(commands[1].exception)
+        self.assertEqual(len([s for s in self.tracer.spans if s.name == "server selection"]), 2)
+
+    def test_invalid_tracer(self):
+        with self.assertRaises(TypeError):
+            MongoClient(tracer=object(), connect=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,6 +39,7 @@ To run individual benchmarks quickly::
 """
 from __future__ import annotations
 
+import asyncio
 import multiprocessing as mp
 import os
 import sys
@@ -60,13 +61,16 @@ sys.path[0:0] = [""]
 from test import client_context, unittest
 
 from bson import decode, encode, json_util
+from bson.binary import Binary
 from gridfs import GridFSBucket
 from pymongo import (
+    AsyncMongoClient,
     DeleteOne,
     InsertOne,
     MongoClient,
     ReplaceOne,
 )
+from pymongo.monitoring import ConnectionPoolListener
 
 pytestmark = pytest.mark.perf
 
@@ -315,6 +319,52 @@ class TestJsonFullDecoding(JsonDecodingTest, unittest.TestCase):
     dataset = "full_bson.json"
 
 
+class JsonNativeEncodingTest(MicroTest):
+    def setUp(self):
+        super().setUp()
+        self.document = encode(json_util.loads(self.file_data))
+        self.data_size = len(self.document) * NUM_DOCS
+
+    def do_task(self):
+        for _ in range(NUM_DOCS):
+            json_util.bson_to_json(self.document)
+
+
+class JsonNativeDecodingTest(MicroTest):
+    def setUp(self):
+        super().setUp()
+        self.document = self.file_data
+        self.data_size = len(encode(json_util.loads(self.file_data))) * NUM_DOCS
+
+    def do_task(self):
+        for _ in range(NUM_DOCS):
+            json_util.json_to_bson(self.document)
+
+
+class TestJsonNativeFlatEncoding(JsonNativeEncodingTest, unittest.TestCase):
+    dataset = "flat_bson.json"
+
+
+class TestJsonNativeFlatDecoding(JsonNativeDecodingTest, unittest.TestCase):
+    dataset = "flat_bson.json"
+
+
+class TestJsonNativeDeepEncoding(JsonNativeEncodingTest, unittest.TestCase):
+    dataset = "deep_bson.json"
+
+
+class TestJsonNativeDeepDecoding(JsonNativeDecodingTest, unittest.TestCase):
+    dataset = "deep_bson.json"
+
+
+class TestJsonNativeFullEncoding(JsonNativeEncodingTest, unittest.TestCase):
+    dataset = "full_bson.json"
+
+
+class TestJsonNativeFullDecoding(JsonNativeDecodingTest, unittest.TestCase):
+    dataset = "full_bson.json"
+
+
 # SINGLE-DOC BENCHMARKS
 class TestRunCommand(PerformanceTest, unittest.TestCase):
     data_size = len(encode({"hello": True})) * NUM_DOCS
@@ -334,6 +384,95 @@ class TestRunCommand8Threads(TestRunCommand):
     n_threads = 8
 
 
+# ASYNC POOL BENCHMARKS
+class CheckoutDurationListener(ConnectionPoolListener):
+    """Records the duration of each connection checkout."""
+
+    def __init__(self):
+        self.durations: List[float] = []
+
+    def connection_checked_out(self, event):
+        self.durations.append(event.duration)
+
+    def connection_check_out_failed(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+
+class AsyncPoolCheckoutTest(PerformanceTest):
+    """Runs `n_tasks` concurrent commands against a small AsyncMongoClient pool
+    so that nearly every task has to wait in the pool's wait queue.
+    """
+
+    n_tasks: int
+    max_pool_size = 10
+
+    def setUp(self):
+        super().setUp()
+        self.data_size = len(encode({"hello": True})) * self.n_tasks
+        self.listener = CheckoutDurationListener()
+
+    async def _run_tasks(self):
+        client = AsyncMongoClient(
+            **client_context.client_options,
+            maxPoolSize=self.max_pool_size,
+            event_listeners=[self.listener],
+        )
+        try:
+            command = client.perftest.command
+            await asyncio.gather(*[command("hello", True) for _ in range(self.n_tasks)])
+        finally:
+            await client.close()
+
+    def do_task(self):
+        asyncio.run(self._run_tasks())
+
+    def tearDown(self):
+        super().tearDown()
+        durations = sorted(self.listener.durations)
+        if durations:
+            p50 = durations[int(len(durations) * 0.5)]
+            p99 = durations[min(int(len(durations) * 0.99), len(durations) - 1)]
+            print(
+                f"{self.__class__.__name__} checkout latency: p50={p50 * 1000:.3f}ms, "
+                f"p99={p99 * 1000:.3f}ms, max={durations[-1] * 1000:.3f}ms"
+            )
+
+
+class TestAsyncPoolCheckout1kWaiters(AsyncPoolCheckoutTest, unittest.TestCase):
+    n_tasks = 1000
+
+
+class TestAsyncPoolCheckout10kWaiters(AsyncPoolCheckoutTest, unittest.TestCase):
+    n_tasks = 10000
+
+
 class TestDocument(PerformanceTest):
     def setUp(self):
         super().setUp()
@@ -386,6 +525,29 @@ class TestFindOneByID8Threads(TestFindOneByID):
     n_threads = 8
 
 
+class TestFindOneByID64Threads(TestFindOneByID):
+    n_threads = 64
+
+
+class TestServerSessionCheckout64Threads(PerformanceTest, unittest.TestCase):
+    """Checks out and returns server sessions from 64 threads, the session
+    acquisition done by each find_one in TestFindOneByID64Threads.
+    """
+
+    n_threads = 64
+    data_size = len(encode({"lsid": {"id": Binary(bytes(16), 4)}})) * NUM_DOCS
+
+    def setUp(self):
+        super().setUp()
+        self.topology = client_context.client._topology
+
+    def do_task(self):
+        get_server_session = self.topology.get_server_session
+        return_server_session = self.topology.return_server_session
+        for _ in range(NUM_DOCS):
+            return_server_session(get_server_session(30))
+
+
 class SmallDocInsertTest(TestDocument):
     dataset = "small_doc.json"
 
@@ -582,6 +744,21 @@ def read_json_file(filename):
             temp.write("\n")
 
 
+def insert_json_file_streaming(filename):
+    assert proc_client is not None
+    with open(filename, "rb") as data:
+        coll = proc_client.perftest.corpus
+        for batch in json_util.iter_loads(data, raw=True, batch_size=100000):
+            coll.insert_many(batch)
+
+
+def read_json_file_streaming(filename):
+    assert proc_client is not None
+    coll = proc_client.perftest.corpus
+    with tempfile.TemporaryFile(mode="w") as temp:
+        json_util.iter_dumps(coll.find_raw_batches({"file": filename}, {"_id": False}), temp)
+
+
 def insert_gridfs_file(filename):
     assert proc_client is not None
     bucket = GridFSBucket(proc_client.perftest)
@@ -646,6 +823,16 @@ class TestJsonMultiExport(PerformanceTest, unittest.TestCase):
         self.client.drop_database("perftest")
 
 
+class TestJsonMultiStreamingImport(TestJsonMultiImport):
+    def do_task(self):
+        self.mp_map(insert_json_file_streaming, self.files)
+
+
+class TestJsonMultiStreamingExport(TestJsonMultiExport):
+    def do_task(self):
+        self.mp_map(read_json_file_streaming, self.files)
+
+
 class TestGridFsMultiFileUpload(PerformanceTest, unittest.TestCase):
     def setUp(self):
         super().setUp()
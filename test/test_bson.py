@@ -43,8 +43,10 @@ from bson import (
     Regex,
     _array_of_documents_to_buffer,
     _datetime_to_millis,
+    compile_encoder,
     decode,
     decode_all,
+    decode_columns,
     decode_file_iter,
     decode_iter,
     encode,
@@ -60,6 +62,7 @@ from bson.int64 import Int64
 from bson.max_key import MaxKey
 from bson.min_key import MinKey
 from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
 from bson.son import SON
 from bson.timestamp import Timestamp
 from bson.tz_util import FixedOffset, utc
@@ -1472,6 +1475,128 @@ class TestDatetimeConversion(unittest.TestCase):
             _array_of_documents_to_buffer(buf)
 
 
+class TestDecodeColumns(unittest.TestCase):
+    def test_decode_columns(self):
+        oid = ObjectId()
+        when = datetime.datetime(2020, 1, 1, 0, 0, 1)
+        docs = [
+            {"i": 1, "l": Int64(2**40), "d": 1.5, "b": True, "t": when, "o": oid, "s": "skip"},
+            {"i": None, "l": 7, "d": 3, "b": False, "extra": {"i": 5}, "r": Regex("a", "i")},
+            {"d": Int64(-4), "a": [1, 2], "c": Code("f", {"x": 1}), "bin": Binary(b"x", 5)},
+        ]
+        data = b"".join(encode(doc) for doc in docs)
+        columns = decode_columns(
+            data,
+            {
+                "i": "int32",
+                "l": "int64",
+                "d": "double",
+                "b": "bool",
+                "t": "datetime",
+                "o": "objectid",
+            },
+        )
+        self.assertEqual(columns["i"], (array.array("i", [1, 0, 0]), bytearray([0, 1, 1])))
+        self.assertEqual(columns["l"], (array.array("q", [2**40, 7, 0]), bytearray([0, 0, 1])))
+        self.assertEqual(columns["d"], (array.array("d", [1.5, 3.0, -4.0]), bytearray([0, 0, 0])))
+        self.assertEqual(columns["b"], (array.array("B", [1, 0, 0]), bytearray([0, 0, 1])))
+        self.assertEqual(
+            columns["t"],
+            (array.array("q", [_datetime_to_millis(when), 0, 0]), bytearray([0, 1, 1])),
+        )
+        self.assertEqual(columns["o"], (bytearray(oid.binary + bytes(24)), bytearray([0, 1, 1])))
+
+    def test_decode_columns_empty(self):
+        self.assertEqual(
+            decode_columns(b"", {"a": "int64"}), {"a": (array.array("q"), bytearray())}
+        )
+        self.assertEqual(decode_columns(encode({"a": 1}), {}), {})
+
+    def test_decode_columns_buffer_protocol(self):
+        data = encode({"a": 1}) + encode({"a": 2})
+        for buf in (bytearray(data), memoryview(data), array.array("B", data)):
+            self.assertEqual(decode_columns(buf, {"a": "int32"})["a"][0], array.array("i", [1, 2]))
+
+    def test_decode_columns_type_mismatch(self):
+        data = encode({"a": "str"})
+        with self.assertRaisesRegex(TypeError, "field 'a' into column type 'int32'"):
+            decode_columns(data, {"a": "int32"})
+        with self.assertRaises(TypeError):
+            decode_columns(encode({"a": Int64(1)}), {"a": "int32"})
+        with self.assertRaises(ValueError):
+            decode_columns(data, {"a": "string"})
+
+    def test_decode_columns_invalid_bson(self):
+        data = encode({"a": 1, "b": "text"})
+        unknown_type = data.replace(b"\x02b\x00", b"\x20b\x00")
+        for bad in (data[:-1], data + b"\x00", unknown_type):
+            with self.assertRaises(InvalidBSON):
+                decode_columns(bad, {"a": "int32"})
+        # String length running past the end of the document.
+        bad = bytearray(data)
+        bad[data.index(b"text") - 4] = 100
+        with self.assertRaises(InvalidBSON):
+            decode_columns(bytes(bad), {"a": "int32"})
+
+
+class TestCompileEncoder(unittest.TestCase):
+    template = {
+        "int": 1,
+        "long": 2**40,
+        "float": 1.5,
+        "bool": True,
+        "none": None,
+        "str": "text",
+        "doc": {"nested": [1, "two"]},
+        "binary": Binary(b"123", USER_DEFINED_SUBTYPE),
+        "date": datetime.datetime(2020, 1, 1),
+    }
+
+    def test_matches_encode(self):
+        encoder = compile_encoder(self.template)
+        self.assertEqual(encoder.keys, tuple(self.template))
+        docs = [
+            self.template,
+            dict(self.template, _id=ObjectId()),
+            {"_id": 1, **self.template},
+            dict(self.template, int=Int64(1), str=None, doc=SON([("a", 1)])),
+            {"int": 1},
+            {"float": 1.0, "int": 1},
+            SON([("int", 1)]),
+            RawBSONDocument(encode(self.template)),
+        ]
+        for doc in docs:
+            self.assertEqual(encoder.encode(doc), encode(doc))
+
+    def test_keys_template(self):
+        encoder = compile_encoder(["_id", "a", "b"])
+        self.assertEqual(encoder.keys, ("a", "b"))
+        self.assertEqual(encoder.encode({"a": 1, "b": 2}), encode({"a": 1, "b": 2}))
+
+    def test_codec_options(self):
+        value = uuid.uuid4()
+        opts = CodecOptions(uuid_representation=UuidRepresentation.STANDARD)
+        encoder = compile_encoder(["u"])
+        self.assertEqual(
+            encoder.encode({"u": value}, opts), encode({"u": value}, codec_options=opts)
+        )
+        with self.assertRaises(ValueError):
+            encoder.encode({"u": value})
+        with self.assertRaises(TypeError):
+            encoder.encode({"u": 1}, {})  # type: ignore[arg-type]
+
+    def test_errors(self):
+        encoder = compile_encoder(["a"])
+        with self.assertRaises(OverflowError):
+            encoder.encode({"a": 2**64})
+        with self.assertRaises(InvalidDocument):
+            encoder.encode({"a": object()})
+        with self.assertRaises(InvalidDocument):
+            compile_encoder(["a\x00"])
+        with self.assertRaises(InvalidDocument):
+            compile_encoder([1])  # type: ignore[list-item]
+
+
 class TestLongLongToString(unittest.TestCase):
     def test_long_long_to_string(self):
         try:
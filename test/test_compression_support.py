@@ -0,0 +1,177 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the compression_support module."""
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import zlib
+
+sys.path[0:0] = [""]
+
+from test import unittest
+
+from bson import DEFAULT_CODEC_OPTIONS
+from pymongo import MongoClient
+from pymongo.compression_support import (
+    CompressionSettings,
+    ZlibContext,
+    ZstdContext,
+    _CompressionContext,
+    _have_zstd,
+    decompress,
+)
+from pymongo.message import _op_msg
+
+
+def _op_code(msg: bytes) -> int:
+    return struct.unpack_from("<i", msg, 12)[0]
+
+
+class TestCompressionContext(unittest.TestCase):
+    data = b"mongodb" * 1000
+
+    def test_zlib_stats(self):
+        ctx = ZlibContext(6)
+        compressed = ctx.compress(self.data)
+        self.assertEqual(zlib.decompress(compressed), self.data)
+        self.assertEqual(decompress(compressed, ctx.compressor_id, ctx), self.data)
+        stats = ctx.metrics.stats()
+        self.assertEqual(stats.messages_compressed, 1)
+        self.assertEqual(stats.bytes_before_compression, len(self.data))
+        self.assertEqual(stats.bytes_after_compression, len(compressed))
+        self.assertEqual(stats.compression_ratio, len(self.data) / len(compressed))
+        self.assertGreaterEqual(stats.compression_time, 0)
+        self.assertEqual(stats.messages_decompressed, 1)
+        self.assertEqual(stats.bytes_before_decompression, len(compressed))
+        self.assertEqual(stats.bytes_after_decompression, len(self.data))
+        self.assertEqual(stats.decompression_ratio, len(self.data) / len(compressed))
+
+    def test_empty_stats(self):
+        stats = ZlibContext(-1).metrics.stats()
+        self.assertIsNone(stats.compression_ratio)
+        self.assertIsNone(stats.decompression_ratio)
+        self.assertIn("messages_compressed=0", repr(stats))
+
+    def test_abstract_context(self):
+        with self.assertRaises(TypeError):
+            _CompressionContext()  # type: ignore[abstract]
+
+    def test_contexts_share_settings_metrics(self):
+        settings = CompressionSettings(["zlib"], -1)
+        for _ in range(2):
+            ctx = settings.get_compression_context(["zlib"])
+            assert ctx is not None
+            ctx.compress(self.data)
+        self.assertEqual(settings.metrics.stats().messages_compressed, 2)
+
+    def test_decompress_without_matching_context(self):
+        compressed = zlib.compress(self.data)
+        self.assertEqual(decompress(compressed, ZlibContext.compressor_id), self.data)
+        if _have_zstd():
+            ctx = ZstdContext()
+            self.assertEqual(decompress(compressed, ZlibContext.compressor_id, ctx), self.data)
+            self.assertEqual(ctx.metrics.stats().messages_decompressed, 0)
+        with self.assertRaises(ValueError):
+            decompress(compressed, 42)
+
+    @unittest.skipUnless(_have_zstd(), "zstandard is not installed")
+    def test_zstd_reuses_compressor(self):
+        ctx = CompressionSettings(["zstd"], -1).get_compression_context(["zstd"])
+        assert isinstance(ctx, ZstdContext)
+        compressor = ctx._compressor
+        for i in range(3):
+            data = self.data + str(i).encode()
+            compressed = ctx.compress(data)
+            self.assertEqual(decompress(compressed, ctx.compressor_id, ctx), data)
+            self.assertEqual(decompress(compressed, ctx.compressor_id), data)
+        self.assertIs(ctx._compressor, compressor)
+        self.assertEqual(ctx.metrics.stats().messages_compressed, 3)
+        self.assertEqual(ctx.metrics.stats().messages_decompressed, 3)
+
+
+class TestCompressionThreshold(unittest.TestCase):
+    def _context(self, **kwargs):
+        ctx = CompressionSettings(["zlib"], -1, **kwargs).get_compression_context(["zlib"])
+        assert ctx is not None
+        return ctx
+
+    def test_min_size(self):
+        ctx = self._context(min_size=512)
+        _, small, _, _ = _op_msg(
+            0, {"find": "c", "filter": {"_id": 1}}, "db", None, DEFAULT_CODEC_OPTIONS, ctx
+        )
+        self.assertEqual(_op_code(small), 2013)
+        _, large, _, _ = _op_msg(
+            0,
+            {"insert": "c", "documents": [{"x": "a" * 1000}]},
+            "db",
+            None,
+            DEFAULT_CODEC_OPTIONS,
+            ctx,
+        )
+        self.assertEqual(_op_code(large), 2012)
+        self.assertEqual(ctx.metrics.stats().messages_not_compressed, 1)
+        self.assertEqual(ctx.metrics.stats().messages_compressed, 1)
+
+    def test_min_size_zero_compresses_everything(self):
+        ctx = self._context()
+        _, msg, _, _ = _op_msg(0, {"ping": 1}, "admin", None, DEFAULT_CODEC_OPTIONS, ctx)
+        self.assertEqual(_op_code(msg), 2012)
+
+    def test_adaptive(self):
+        settings = CompressionSettings(["zlib"], -1, adaptive=True)
+        ctx = settings.get_compression_context(["zlib"])
+        assert ctx is not None and settings.command_ratios is not None
+        ratios = settings.command_ratios
+        incompressible = {"insert": "c", "documents": [{"x": os.urandom(1000)}]}
+        compressible = {"insert": "c", "documents": [{"x": "a" * 1000}]}
+        op_codes = []
+        for _ in range(ratios.warmup + ratios.probe_interval):
+            _, msg, _, _ = _op_msg(0, dict(incompressible), "db", None, DEFAULT_CODEC_OPTIONS, ctx)
+            op_codes.append(_op_code(msg))
+        # Compressed during warmup, then sampled once per probe interval.
+        self.assertEqual(op_codes[: ratios.warmup], [2012] * ratios.warmup)
+        self.assertEqual(op_codes[ratios.warmup :].count(2012), 1)
+        self.assertGreater(ratios.ratio("insert"), 0.9)
+        # Other commands are tracked separately.
+        _, msg, _, _ = _op_msg(
+            0, {"find": "c", "filter": {"x": "a" * 1000}}, "db", None, DEFAULT_CODEC_OPTIONS, ctx
+        )
+        self.assertEqual(_op_code(msg), 2012)
+        # Settings are shared by every connection's context.
+        other = settings.get_compression_context(["zlib"])
+        assert other is not None
+        _, msg, _, _ = _op_msg(0, dict(compressible), "db", None, DEFAULT_CODEC_OPTIONS, other)
+        self.assertEqual(_op_code(msg), 2013)
+
+    def test_client_options(self):
+        client = MongoClient(
+            "mongodb://localhost/?compressors=zlib&compressionMinSize=256",
+            adaptiveCompression=True,
+            connect=False,
+        )
+        self.addCleanup(client.close)
+        settings = client.options.pool_options._compression_settings
+        assert settings is not None
+        self.assertEqual(settings.min_size, 256)
+        self.assertTrue(settings.adaptive)
+        with self.assertRaises(ValueError):
+            MongoClient(compressionMinSize=-1, connect=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,11 +16,14 @@
 from __future__ import annotations
 
 import datetime
+import io
 import json
+import os
 import re
 import sys
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, List, MutableMapping, Tuple, Type
 
 from bson.codec_options import CodecOptions, DatetimeConversion
@@ -29,6 +32,7 @@ sys.path[0:0] = [""]
 
 from test import IntegrationTest, unittest
 
+import bson
 from bson import EPOCH_AWARE, EPOCH_NAIVE, SON, DatetimeMS, json_util
 from bson.binary import (
     ALL_UUID_REPRESENTATIONS,
@@ -54,6 +58,7 @@ from bson.json_util import (
 from bson.max_key import MaxKey
 from bson.min_key import MinKey
 from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
 from bson.regex import Regex
 from bson.timestamp import Timestamp
 from bson.tz_util import FixedOffset, utc
@@ -617,6 +622,194 @@ class TestJsonUtil(unittest.TestCase):
         self.assertEqual(json_util.dumps(MyBinary(b"bin", USER_DEFINED_SUBTYPE)), expected_json)
 
 
+class TestBSONJSONConversion(unittest.TestCase):
+    doc = {
+        "_id": ObjectId("509b8db456c02c5ab7e63c34"),
+        "int": 1,
+        "long": Int64(2**40),
+        "double": 1.5,
+        "nan": float("nan"),
+        "str": 'caf\xe9 \u2603 \U0001f600 \x00"\\',
+        "list": [1, {"x": None}, []],
+        "bool": True,
+        "date": datetime.datetime(2020, 1, 2, 3, 4, 5, 6000),
+        "old_date": datetime.datetime(1960, 1, 1),
+        "binary": Binary(b"\x00\x01", USER_DEFINED_SUBTYPE),
+        "old_binary": Binary(b"\x00\x01\x02", 2),
+        "bytes": b"bytes",
+        "code": Code("x"),
+        "code_w_scope": Code("y", {"a": 1}),
+        "regex": Regex("a.c", "imx"),
+        "timestamp": Timestamp(5, 6),
+        "decimal": Decimal128("1.23E+5"),
+        "min": MinKey(),
+        "max": MaxKey(),
+    }
+
+    def assertConverted(self, data, json_options):
+        expected = json_util.dumps(bson.decode(data, json_options), json_options=json_options)
+        converted = json_util.bson_to_json(data, json_options)
+        self.assertEqual(converted, expected)
+        try:
+            expected_bson = bson.encode(
+                json_util.loads(converted, json_options=json_options), codec_options=json_options
+            )
+        except TypeError:
+            # For example, a top-level DBRef.
+            self.assertRaises(TypeError, json_util.json_to_bson, converted, json_options)
+            return
+        self.assertEqual(json_util.json_to_bson(converted, json_options), expected_bson)
+        self.assertEqual(json_util.json_to_bson(converted.encode(), json_options), expected_bson)
+
+    def test_conversion(self):
+        data = bson.encode(self.doc)
+        for opts in (
+            RELAXED_JSON_OPTIONS,
+            CANONICAL_JSON_OPTIONS,
+            LEGACY_JSON_OPTIONS,
+            RELAXED_JSON_OPTIONS.with_options(tz_aware=True),
+            RELAXED_JSON_OPTIONS.with_options(tz_aware=True, tzinfo=FixedOffset(60, "+1")),
+            CANONICAL_JSON_OPTIONS.with_options(datetime_conversion=DatetimeConversion.DATETIME_MS),
+            RELAXED_JSON_OPTIONS.with_options(document_class=SON),
+        ):
+            with self.subTest(opts=opts):
+                self.assertConverted(data, opts)
+
+    def test_conversion_corpus(self):
+        corpus = os.path.join(os.path.dirname(os.path.realpath(__file__)), "bson_corpus")
+        for name in sorted(os.listdir(corpus)):
+            with open(os.path.join(corpus, name), encoding="utf-8") as f:
+                spec = json.load(f)
+            for case in spec.get("valid", []):
+                if "canonical_bson" not in case:
+                    continue
+                data = bytes.fromhex(case["canonical_bson"])
+                for opts in (RELAXED_JSON_OPTIONS, CANONICAL_JSON_OPTIONS):
+                    with self.subTest(name=name, description=case["description"]):
+                        try:
+                            bson.decode(data, opts)
+                        except (bson.InvalidBSON, OverflowError):
+                            continue
+                        self.assertConverted(data, opts)
+
+    def test_top_level_id_moved_first(self):
+        self.assertEqual(
+            json_util.json_to_bson('{"a": 1, "_id": 2}'), bson.encode({"_id": 2, "a": 1})
+        )
+
+    def test_duplicate_fields(self):
+        # The last value of a repeated field is kept, in the position of the
+        # first one, like loads does.
+        self.assertEqual(
+            json_util.json_to_bson('{"a": 1, "b": 2, "a": 3}'),
+            bson.encode(SON([("a", 3), ("b", 2)])),
+        )
+        self.assertEqual(
+            json_util.json_to_bson('{"_id": 1, "a": {"b": 2, "b": 3}, "_id": 4}'),
+            bson.encode(SON([("_id", 4), ("a", {"b": 3})])),
+        )
+        data = bson.encode(SON([("a", 1), ("b", 2), ("c", 3)])).replace(b"c\x00", b"a\x00")
+        self.assertEqual(json_util.bson_to_json(data), '{"a": 3, "b": 2}')
+
+    def test_errors(self):
+        with self.assertRaises(bson.InvalidBSON):
+            json_util.bson_to_json(bson.encode({"a": 1})[:-1])
+        # The C extension rejects a UUID that is not 16 bytes.
+        for subtype in (3, 4):
+            data = bson.encode({"u": Binary(b"x" * 15, subtype)})
+            if bson.has_c():
+                with self.assertRaises(bson.InvalidBSON):
+                    bson.decode(data)
+                with self.assertRaises(bson.InvalidBSON):
+                    json_util.bson_to_json(data)
+            else:
+                self.assertEqual(json_util.bson_to_json(data), json_util.dumps(bson.decode(data)))
+        with self.assertRaises(ValueError):
+            json_util.json_to_bson('{"a": }')
+        with self.assertRaises(TypeError):
+            json_util.json_to_bson('{"a": {"$oid": "509b8db456c02c5ab7e63c34", "b": 1}}')
+        with self.assertRaises(TypeError):
+            json_util.json_to_bson("[1, 2]")
+        with self.assertRaises(OverflowError):
+            json_util.json_to_bson('{"a": 18446744073709551616}')
+        with self.assertRaises(bson.InvalidDocument):
+            json_util.json_to_bson('{"a\\u0000": 1}')
+
+
+class TestIterLoadsDumps(unittest.TestCase):
+    docs = [{"_id": i, "x": "x" * i, "date": datetime.datetime(2020, 1, 1)} for i in range(25)]
+
+    def lines(self):
+        return "".join(json_util.dumps(doc) + "\n" for doc in self.docs)
+
+    def test_iter_loads(self):
+        fp = io.StringIO(self.lines() + "\n  \n")
+        self.assertEqual(list(json_util.iter_loads(fp)), self.docs)
+
+    def test_iter_loads_raw(self):
+        fp = io.BytesIO(self.lines().encode())
+        docs = list(json_util.iter_loads(fp, raw=True))
+        self.assertTrue(all(isinstance(doc, RawBSONDocument) for doc in docs))
+        self.assertEqual([doc.raw for doc in docs], [bson.encode(doc) for doc in self.docs])
+        self.assertIsNone(docs[0]["date"].tzinfo)
+
+    def test_iter_loads_raw_json_options(self):
+        fp = io.BytesIO(self.lines().encode())
+        json_options = JSONOptions(tz_aware=True, tzinfo=utc)
+        docs = list(json_util.iter_loads(fp, json_options=json_options, raw=True))
+        for doc, expected in zip(docs, self.docs):
+            self.assertEqual(doc["date"], expected["date"].replace(tzinfo=utc))
+
+    def test_iter_loads_batches(self):
+        batches = list(json_util.iter_loads(io.StringIO(self.lines()), batch_size=10))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(sum(batches, []), self.docs)
+        lines = self.lines().splitlines(keepends=True)
+        batches = list(json_util.iter_loads(lines, max_batch_bytes=len(lines[-1]) * 2))
+        self.assertEqual(sum(batches, []), self.docs)
+        for batch in batches:
+            size = sum(len(json_util.dumps(doc)) + 1 for doc in batch)
+            self.assertLessEqual(size, len(lines[-1]) * 2)
+        # A line longer than max_batch_bytes is a batch of its own.
+        batches = list(json_util.iter_loads(lines, max_batch_bytes=1))
+        self.assertEqual(batches, [[doc] for doc in self.docs])
+
+    def test_iter_loads_executor(self):
+        for executor_class in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_class(2) as executor:
+                for raw in (False, True):
+                    docs = json_util.iter_loads(
+                        io.StringIO(self.lines()),
+                        json_options=CANONICAL_JSON_OPTIONS,
+                        raw=raw,
+                        executor=executor,
+                        chunk_size=3,
+                    )
+                    expected = [
+                        bson.decode(bson.encode(doc), CANONICAL_JSON_OPTIONS) for doc in self.docs
+                    ]
+                    self.assertEqual([dict(doc) for doc in docs], expected)
+
+    def test_iter_loads_error(self):
+        fp = io.StringIO(self.lines() + '{"x": {"$oid": 1}}\n')
+        with self.assertRaises(TypeError):
+            list(json_util.iter_loads(fp))
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ValueError):
+                list(json_util.iter_loads(io.StringIO('{"x": }\n'), executor=executor))
+
+    def test_iter_dumps(self):
+        raw_batch = b"".join(bson.encode(doc) for doc in self.docs[:10])
+        fp = io.StringIO()
+        count = json_util.iter_dumps(
+            [raw_batch, RawBSONDocument(bson.encode(self.docs[10])), *self.docs[11:], b""], fp
+        )
+        self.assertEqual(count, len(self.docs))
+        self.assertEqual(fp.getvalue(), self.lines())
+        fp.seek(0)
+        self.assertEqual(list(json_util.iter_loads(fp)), self.docs)
+
+
 class TestJsonUtilRoundtrip(IntegrationTest):
     def test_cursor(self):
         db = self.db
@@ -13,14 +13,20 @@
 # limitations under the License.
 from __future__ import annotations
 
+import datetime
 import os
-from test import IntegrationTest, unittest
+from test import IntegrationTest, UnitTest, unittest
 from test.utils import single_client
 from unittest.mock import patch
 
 from bson import json_util
 from pymongo.errors import OperationFailure
-from pymongo.logger import _DEFAULT_DOCUMENT_LENGTH
+from pymongo.logger import (
+    _COMMAND_LOGGER,
+    _DEFAULT_DOCUMENT_LENGTH,
+    _CommandStatusMessage,
+    _debug_log,
+)
 
 _IS_SYNC = True
 
@@ -98,5 +104,51 @@ class TestLogger(IntegrationTest):
             self.assertGreater(len(cm.records), 0)
 
 
+class TestLogSampling(UnitTest):
+    def _logged(self, **env):
+        messages = []
+        with patch.dict("os.environ", env):
+            with self.assertLogs("pymongo.command", level="DEBUG") as cm:
+                for request_id in range(10):
+                    _debug_log(
+                        _COMMAND_LOGGER,
+                        message=_CommandStatusMessage.STARTED,
+                        command={"ping": 1},
+                        requestId=request_id,
+                    )
+                    _debug_log(
+                        _COMMAND_LOGGER,
+                        message=_CommandStatusMessage.SUCCEEDED,
+                        durationMS=datetime.timedelta(milliseconds=request_id),
+                        reply={"ok": 1},
+                        requestId=request_id,
+                    )
+                # assertLogs requires at least one record.
+                _COMMAND_LOGGER.debug("done")
+        for record in cm.records[:-1]:
+            log = json_util.loads(record.getMessage())
+            messages.append((log["message"], log["requestId"]))
+        return messages
+
+    def test_sample_rate(self):
+        messages = self._logged(MONGODB_LOG_COMMAND_SAMPLE_RATE="4")
+        self.assertEqual({request_id for _, request_id in messages}, {0, 4, 8})
+        self.assertEqual(len(messages), 6)
+
+    def test_slow_commands(self):
+        messages = self._logged(MONGODB_LOG_COMMAND_SLOW_MS="7.5")
+        self.assertEqual(messages, [("Command succeeded", 8), ("Command succeeded", 9)])
+
+    def test_invalid_settings_are_ignored(self):
+        messages = self._logged(MONGODB_LOG_COMMAND_SAMPLE_RATE="x", MONGODB_LOG_COMMAND_SLOW_MS="")
+        self.assertEqual(len(messages), 20)
+
+    def test_message_serialized_once(self):
+        with self.assertLogs("pymongo.command", level="DEBUG") as cm:
+            _debug_log(_COMMAND_LOGGER, message=_CommandStatusMessage.STARTED, command={"x": 1})
+        message = cm.records[0].msg
+        self.assertIs(str(message), str(message))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,136 @@
+# Copyright 2024-present MongoDB, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the metrics module."""
+from __future__ import annotations
+
+import sys
+
+sys.path[0:0] = [""]
+
+from test import unittest
+
+from pymongo import MongoClient
+from pymongo.metrics import (
+    _bucket,
+    _bucket_upper_bound,
+    _ClientMetrics,
+    _Histogram,
+    _record_phase,
+)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets(self):
+        for seconds in (1e-6, 1.5e-6, 0.001, 0.0123, 1.0, 42.0):
+            index = _bucket(seconds)
+            self.assertLess(seconds, _bucket_upper_bound(index))
+            self.assertGreaterEqual(seconds, _bucket_upper_bound(index - 1))
+            self.assertLess(_bucket_upper_bound(index), seconds * 1.04)
+        self.assertEqual(_bucket(0), 0)
+
+    def test_percentiles(self):
+        histogram = _Histogram()
+        for i in range(1, 1001):
+            histogram.record(i / 10000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot.count, 1000)
+        self.assertEqual(snapshot.min, 0.0001)
+        self.assertEqual(snapshot.max, 0.1)
+        self.assertAlmostEqual(snapshot.mean, 0.05005)
+        self.assertAlmostEqual(snapshot.percentile(50), 0.05, delta=0.05 * 0.04)
+        self.assertAlmostEqual(snapshot.percentile(99), 0.099, delta=0.099 * 0.04)
+        self.assertEqual(snapshot.percentile(100), 0.1)
+        self.assertEqual(sum(count for _, count in snapshot.buckets), 1000)
+        with self.assertRaises(ValueError):
+            snapshot.percentile(101)
+
+    def test_empty(self):
+        snapshot = _Histogram().snapshot()
+        self.assertIsNone(snapshot.mean)
+        self.assertIsNone(snapshot.percentile(50))
+        self.assertEqual(snapshot.buckets, [])
+
+
+class TestClientMetrics(unittest.TestCase):
+    def test_snapshot(self):
+        metrics = _ClientMetrics()
+        metrics.command("find", ("a", 27017), True, 0.001)
+        metrics.command("find", ("b", 27017), True, 0.003)
+        metrics.command("find", ("b", 27017), False, 0.5)
+        metrics.checkout(("a", 27017), 0.0001)
+        metrics.tls_handshake(("a", 27017), False)
+        metrics.tls_handshake(("a", 27017), True)
+        commands, checkout, connection_setup, tls_handshakes = metrics.snapshot()
+        self.assertEqual(
+            set(commands),
+            {
+                ("find", ("a", 27017), "succeeded"),
+                ("find", ("b", 27017), "succeeded"),
+                ("find", ("b", 27017), "failed"),
+            },
+        )
+        self.assertEqual(checkout[("a", 27017)].count, 1)
+        self.assertEqual(connection_setup, {})
+        self.assertEqual(tls_handshakes[("a", 27017)].handshakes, 2)
+        self.assertEqual(tls_handshakes[("a", 27017)].resumed, 1)
+        # Snapshots are not affected by later latencies.
+        metrics.command("find", ("a", 27017), True, 0.002)
+        self.assertEqual(commands[("find", ("a", 27017), "succeeded")].count, 1)
+
+    def test_slow_operation(self):
+        metrics = _ClientMetrics(slow_operation_threshold=0.1)
+        metrics.start_operation()
+        _record_phase("selection", 0)
+        _record_phase("decompress", 0)
+        marks = [0, 1000, 3000, 10000, 11000]
+        self.assertIsNone(metrics.slow_operation(0.05, marks))
+        # The operation ended, its selection time is not reused.
+        timings = metrics.slow_operation(0.2, marks)
+        assert timings is not None
+        self.assertEqual(timings.selection, 0)
+        self.assertEqual(timings.encode, 1e-6)
+        self.assertEqual(timings.send, 2e-6)
+        self.assertEqual(timings.receive, 7e-6)
+        self.assertEqual(timings.decode, 1e-6)
+        self.assertAlmostEqual(timings.total, 11e-6)
+        self.assertEqual(set(timings.as_dict()), set(timings.__slots__))
+
+        metrics.start_operation()
+        _record_phase("selection", 0)
+        timings = metrics.slow_operation(0.2, marks[:3])
+        assert timings is not None
+        self.assertGreater(timings.selection, 0)
+        self.assertEqual(timings.receive, 0)
+
+    def test_slow_operations_disabled(self):
+        metrics = _ClientMetrics()
+        metrics.start_operation()
+        _record_phase("selection", 0)
+        self.assertIsNone(metrics.slow_operation(100, [0, 1]))
+
+    def test_client(self):
+        client = MongoClient(connect=False)
+        self.addCleanup(client.close)
+        metrics = client.metrics()
+        self.assertEqual(metrics.commands, {})
+        self.assertEqual(metrics.command("find").count, 0)
+        self.assertEqual(metrics.cleanup.cursors_killed, 0)
+        self.assertEqual(metrics.compression.messages_compressed, 0)
+        self.assertIsNone(metrics.compression.compression_ratio)
+        self.assertIsNone(metrics.event_queue)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,8 @@ def get_executors(client):
         executors.append(server._monitor._executor)
         executors.append(server._monitor._rtt_monitor._executor)
     executors.append(client._kill_cursors_executor)
+    executors.append(client._cleanup_executor)
+    executors.append(client._event_queue_executor)
     executors.append(client._topology._Topology__events_executor)
     return [e for e in executors if e is not None]
 
@@ -58,7 +60,7 @@ class TestMonitor(IntegrationTest):
     def test_cleanup_executors_on_client_del(self):
         client = create_client()
         executors = get_executors(client)
-        self.assertEqual(len(executors), 4)
+        self.assertEqual(len(executors), 5)
 
         # Each executor stores a weakref to itself in _EXECUTORS.
         executor_refs = [(r, r()._name) for r in _EXECUTORS.copy() if r() in executors]
@@ -72,7 +74,7 @@ class TestMonitor(IntegrationTest):
     def test_cleanup_executors_on_client_close(self):
         client = create_client()
         executors = get_executors(client)
-        self.assertEqual(len(executors), 4)
+        self.assertEqual(len(executors), 5)
 
         client.close()
 
@@ -15,8 +15,12 @@
 """Test the pymongo ocsp_support module."""
 from __future__ import annotations
 
+import os
 import random
+import shutil
+import stat
 import sys
+import tempfile
 from collections import namedtuple
 from datetime import datetime, timedelta, timezone
 from os import urandom
@@ -27,7 +31,7 @@ sys.path[0:0] = [""]
 
 from test import unittest
 
-from pymongo.ocsp_cache import _OCSPCache
+from pymongo.ocsp_cache import _OCSPCache, _OCSPFileStore
 
 
 class TestOcspCache(unittest.TestCase):
@@ -133,6 +137,130 @@ class TestOcspCache(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = self.cache[self._create_mock_request()]
 
+    def test_lru_eviction(self):
+        self.cache = _OCSPCache(max_size=2)
+        requests = [self._create_mock_request() for _ in range(3)]
+        for request in requests[:2]:
+            self.cache[request] = self._create_mock_response(-10, +3600)
+        # Use the first entry so that the second is the least recently used.
+        _ = self.cache[requests[0]]
+        self.cache[requests[2]] = self._create_mock_response(-10, +3600)
+        _ = self.cache[requests[0]]
+        _ = self.cache[requests[2]]
+        with self.assertRaises(KeyError):
+            _ = self.cache[requests[1]]
+        stats = self.cache.stats()
+        self.assertEqual(stats.size, 2)
+        self.assertEqual(stats.max_size, 2)
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.hits, 3)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.hit_ratio, 0.75)
+        self.assertEqual(stats.file_hits, 0)
+
+    def test_empty_stats(self):
+        stats = self.cache.stats()
+        self.assertIsNone(stats.hit_ratio)
+        self.assertIn("hits=0", repr(stats))
+
+
+def _accept(value):
+    return True
+
+
+class _MockOCSPCache(_OCSPCache):
+    """Serializes the mock responses of TestOcspFileStore."""
+
+    def _dumps(self, value):
+        return "|".join(v.isoformat() for v in value).encode()
+
+    def _loads(self, data):
+        this_update, next_update = (datetime.fromisoformat(v) for v in data.decode().split("|"))
+        return TestOcspFileStore.MockOcspResponse(this_update, next_update)
+
+
+class TestOcspFileStore(TestOcspCache):
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.path = os.path.join(tmpdir, "ocsp.db")
+        self.cache = self._create_cache()
+
+    def _create_cache(self, max_size=1000):
+        store = _OCSPFileStore(self.path)
+        self.addCleanup(store.close)
+        return _MockOCSPCache(max_size, store)
+
+    def test_shared_between_caches(self):
+        request = self._create_mock_request()
+        response = self._create_mock_response(-10, +3600)
+        self.cache[request] = response
+        # A new cache, as in another process, reads the stored response.
+        other = self._create_cache()
+        self.assertEqual(other.get_verified(request, _accept), response)
+        self.assertEqual(other[request], response)
+        stats = other.stats()
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.file_hits, 1)
+        self.assertEqual(stats.misses, 0)
+        # Responses with a later nextUpdate replace the stored response.
+        newer = self._create_mock_response(-5, +7200)
+        self.cache[request] = newer
+        self.assertEqual(self._create_cache().get_verified(request, _accept), newer)
+        # Responses with an unset nextUpdate purge the store.
+        self.cache[request] = self._create_mock_response(-5, None)
+        with self.assertRaises(KeyError):
+            _ = self._create_cache().get_verified(request, _accept)
+
+    def test_expired_responses_not_shared(self):
+        request = self._create_mock_request()
+        self.cache[request] = self._create_mock_response(-10, +0.25)
+        sleep(0.5)
+        other = self._create_cache()
+        with self.assertRaises(KeyError):
+            _ = other.get_verified(request, _accept)
+        self.assertEqual(other.stats().misses, 1)
+
+    def test_unverified_responses_not_used(self):
+        request = self._create_mock_request()
+        response = self._create_mock_response(-10, +3600)
+        self.cache[request] = response
+        other = self._create_cache()
+        # Responses in the store are only used once verified.
+        with self.assertRaises(KeyError):
+            _ = other[request]
+        with self.assertRaises(KeyError):
+            _ = other.get_verified(request, lambda value: False)
+        self.assertEqual(other.stats().size, 0)
+        self.assertEqual(other.get_verified(request, _accept), response)
+        self.assertEqual(other.stats().size, 1)
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX file permissions")
+    def test_file_permissions(self):
+        self.cache[self._create_mock_request()] = self._create_mock_response(-10, +3600)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_evicted_responses_read_from_store(self):
+        self.cache = self._create_cache(max_size=1)
+        requests = [self._create_mock_request() for _ in range(2)]
+        for request in requests:
+            self.cache[request] = self._create_mock_response(-10, +3600)
+        _ = self.cache.get_verified(requests[0], _accept)
+        stats = self.cache.stats()
+        self.assertEqual(stats.evictions, 2)
+        self.assertEqual(stats.file_hits, 1)
+
+    def test_store_errors_ignored(self):
+        self.path = os.path.join(self.path, "missing", "ocsp.db")
+        self.cache = self._create_cache()
+        request = self._create_mock_request()
+        response = self._create_mock_response(-10, +3600)
+        self.cache[request] = response
+        self.assertEqual(self.cache[request], response)
+        with self.assertRaises(KeyError):
+            _ = self.cache.get_verified(self._create_mock_request(), _accept)
+        self.assertEqual(self.cache.stats().file_errors, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
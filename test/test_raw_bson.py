@@ -214,5 +214,67 @@ class TestRawBSONDocument(IntegrationTest):
         self.assertEqual(doc["value"].raw, raw_encoded)
 
 
+class TestRawBSONDocumentLazyDecoding(unittest.TestCase):
+    doc = {
+        "_id": 1,
+        "name": "Sherlock",
+        "address": {"street": "Baker Street", "number": {"value": 221, "suffix": "b"}},
+        "cases": [{"name": "A Study in Scarlet"}, {"name": "The Sign of Four"}],
+        "missing": None,
+    }
+
+    def test_getitem(self):
+        raw_doc = RawBSONDocument(encode(self.doc))
+        self.assertEqual(raw_doc["name"], "Sherlock")
+        self.assertIsNone(raw_doc["missing"])
+        self.assertEqual(raw_doc["cases"][1]["name"], "The Sign of Four")
+        self.assertIs(raw_doc["name"], raw_doc["name"])
+        with self.assertRaises(KeyError):
+            raw_doc["does-not-exist"]
+        self.assertEqual(raw_doc.get("does-not-exist", "default"), "default")
+        inflated = dict(RawBSONDocument(encode(self.doc)).items())
+        self.assertEqual({key: raw_doc[key] for key in raw_doc}, inflated)
+
+    def test_embedded_document_shares_buffer(self):
+        bson_bytes = encode(self.doc)
+        raw_doc = RawBSONDocument(bson_bytes)
+        address = raw_doc["address"]
+        self.assertIsInstance(address, RawBSONDocument)
+        self.assertIs(address._RawBSONDocument__buffer, bson_bytes)  # type: ignore[attr-defined]
+        self.assertEqual(address["number"]["value"], 221)
+        self.assertEqual(address.raw, encode(self.doc["address"]))
+        self.assertEqual(address, RawBSONDocument(encode(self.doc["address"])))
+        self.assertEqual(decode(encode({"copy": address})), {"copy": self.doc["address"]})
+
+    def test_keys_without_decoding(self):
+        raw_doc = RawBSONDocument(encode(self.doc))
+        self.assertEqual(list(raw_doc), list(self.doc))
+        self.assertEqual(len(raw_doc), len(self.doc))
+        self.assertIn("missing", raw_doc)
+        self.assertNotIn("street", raw_doc)
+        self.assertIsNone(raw_doc._RawBSONDocument__values)  # type: ignore[attr-defined]
+
+    def test_duplicate_keys(self):
+        raw_doc = RawBSONDocument(encode(SON([("a", 1), ("b", 2)])).replace(b"\x10b", b"\x10a"))
+        self.assertEqual(raw_doc["a"], 2)
+        self.assertEqual(list(raw_doc), ["a"])
+        self.assertEqual(dict(raw_doc.items()), {"a": 2})
+
+    def test_codec_options(self):
+        value = uuid.uuid4()
+        options = CodecOptions(
+            document_class=RawBSONDocument, uuid_representation=UuidRepresentation.STANDARD
+        )
+        raw_doc = RawBSONDocument(encode({"u": {"v": value}}, codec_options=options), options)
+        self.assertEqual(raw_doc["u"]["v"], value)
+
+    def test_invalid_element_length(self):
+        bson_bytes = bytearray(encode({"a": 1, "b": "text"}))
+        bson_bytes[bson_bytes.index(b"text") - 4] = 100
+        raw_doc = RawBSONDocument(bytes(bson_bytes))
+        with self.assertRaises(InvalidBSON):
+            raw_doc["a"]
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,7 @@ from __future__ import annotations
 import re
 from os import listdir
 from pathlib import Path
+from typing import Optional
 
 from unasync import Rule, unasync_files  # type: ignore[import]
 
@@ -33,6 +34,7 @@ replacements = {
     "AsyncCommandCursor": "CommandCursor",
     "AsyncRawBatchCursor": "RawBatchCursor",
     "AsyncRawBatchCommandCursor": "RawBatchCommandCursor",
+    "AsyncParallelScan": "ParallelScan",
     "AsyncClientSession": "ClientSession",
     "AsyncChangeStream": "ChangeStream",
     "AsyncCollectionChangeStream": "CollectionChangeStream",
@@ -103,6 +105,7 @@ replacements = {
     "PyMongo|async": "PyMongo",
     "AsyncTestGridFile": "TestGridFile",
     "AsyncTestGridFileNoConnect": "TestGridFileNoConnect",
+    "_AsyncSocketType": "_SocketType",
 }
 
 docstring_replacements: dict[tuple[str, str], str] = {
@@ -139,7 +142,17 @@ gridfs_files = [
     _gridfs_base + f for f in listdir(_gridfs_base) if (Path(_gridfs_base) / f).is_file()
 ]
 
-test_files = [_test_base + f for f in listdir(_test_base) if (Path(_test_base) / f).is_file()]
+
+def async_only_test(f: str) -> bool:
+    """Return True for async tests that should not be converted to sync."""
+    return f in ["test_cursor_prefetch.py", "test_locks.py", "test_network_layer.py"]
+
+
+test_files = [
+    _test_base + f
+    for f in listdir(_test_base)
+    if (Path(_test_base) / f).is_file() and not async_only_test(f)
+]
 
 sync_files = [
     _pymongo_dest_base + f
@@ -188,6 +201,8 @@ def process_files(files: list[str]) -> None:
             with open(file, "r+") as f:
                 lines = f.readlines()
                 lines = apply_is_sync(lines, file)
+                if file in sync_files:
+                    lines = remove_async_only_blocks(lines)
                 lines = translate_coroutine_types(lines)
                 lines = translate_async_sleeps(lines)
                 if file in docstring_translate_files:
@@ -215,6 +230,33 @@ def apply_is_sync(lines: list[str], file: str) -> list[str]:
     return lines
 
 
+def remove_async_only_blocks(lines: list[str]) -> list[str]:
+    """Remove the ``if not _IS_SYNC:`` blocks, which only run in asynchronous code."""
+    res: list[str] = []
+    block_indent: Optional[int] = None
+    blank: list[str] = []
+    for line in lines:
+        if block_indent is not None:
+            if not line.strip():
+                blank.append(line)
+                continue
+            indent = len(line) - len(line.lstrip())
+            if indent > block_indent:
+                blank.clear()
+                continue
+            if indent == block_indent and line.lstrip().startswith(("elif", "else")):
+                raise ValueError(f"Unsupported branch after an async-only block: {line!r}")
+            block_indent = None
+            res.extend(blank)
+            blank.clear()
+        if line.strip() == "if not _IS_SYNC:":
+            block_indent = len(line) - len(line.lstrip())
+            continue
+        res.append(line)
+    res.extend(blank)
+    return res
+
+
 def translate_coroutine_types(lines: list[str]) -> list[str]:
     coroutine_types = [line for line in lines if "Coroutine[" in line]
     for type in coroutine_types: